@@ -0,0 +1,175 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.bool import FALSE, TRUE
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.default_dict import default_dict_new, default_dict_finalize
+from starkware.cairo.common.dict import DictAccess, dict_read, dict_write
+from starkware.cairo.common.hash import hash2
+from starkware.cairo.common.math import assert_nn
+from starkware.cairo.common.uint256 import Uint256
+
+// Internal dependencies
+from kakarot.constants import Constants
+from kakarot.model import model
+
+// @title Access set related functions.
+// @notice This file contains functions related to the transaction access set, see EIP-2929.
+// @dev The first access to an address or to a storage slot during a transaction is cold, the following
+// @dev ones are warm. The precompiles, the sender, the recipient and the EIP-2930 access list of the
+// @dev transaction are warm from the start.
+// @custom:namespace AccessSet
+// @custom:model model.AccessSet
+namespace AccessSet {
+    // Gas cost of accessing a warm address or storage slot.
+    const GAS_COST_WARM_ACCESS = 100;
+    // Gas cost of accessing a cold address.
+    const GAS_COST_COLD_ADDRESS_ACCESS = 2600;
+    // Gas cost of reading a cold storage slot.
+    const GAS_COST_COLD_SLOAD = 2100;
+    // Intrinsic gas cost of each address of the access list of a transaction, see EIP-2930.
+    const GAS_COST_ACCESS_LIST_ADDRESS = 2400;
+    // Intrinsic gas cost of each storage key of the access list of a transaction, see EIP-2930.
+    const GAS_COST_ACCESS_LIST_STORAGE_KEY = 1900;
+
+    // @notice Initialize the access set, with the precompiles warm.
+    // @return The pointer to the access set.
+    func init() -> model.AccessSet* {
+        alloc_locals;
+        let (dict_start: DictAccess*) = default_dict_new(0);
+        let dict = dict_start;
+        internal.add_precompiles{dict=dict}(Constants.LAST_PRECOMPILE_ADDRESS);
+        return new model.AccessSet(dict_start=dict_start, dict=dict);
+    }
+
+    // @notice Finalizes the access set.
+    // @dev The access set cannot be used anymore after being finalized.
+    // @param self - The pointer to the access set.
+    func finalize{range_check_ptr}(self: model.AccessSet*) {
+        default_dict_finalize(self.dict_start, self.dict, 0);
+        return ();
+    }
+
+    // @notice Add an address to the access set.
+    // @param self - The pointer to the access set.
+    // @param address - The evm address.
+    // @return The new pointer to the access set.
+    // @return TRUE if the address was already warm, FALSE otherwise.
+    func add_address(self: model.AccessSet*, address: felt) -> (
+        self: model.AccessSet*, is_warm: felt
+    ) {
+        alloc_locals;
+        let dict = self.dict;
+        let (is_warm) = dict_read{dict_ptr=dict}(address);
+        dict_write{dict_ptr=dict}(address, TRUE);
+        tempvar new_self = new model.AccessSet(dict_start=self.dict_start, dict=dict);
+        return (new_self, is_warm);
+    }
+
+    // @notice Add a storage slot to the access set.
+    // @param self - The pointer to the access set.
+    // @param address - The evm address of the contract account owning the slot.
+    // @param key - The storage key.
+    // @return The new pointer to the access set.
+    // @return The dict key of the slot.
+    // @return TRUE if the slot was already warm, FALSE otherwise.
+    func add_storage_key{pedersen_ptr: HashBuiltin*}(
+        self: model.AccessSet*, address: felt, key: Uint256
+    ) -> (self: model.AccessSet*, slot_key: felt, is_warm: felt) {
+        alloc_locals;
+        let dict = self.dict;
+        let slot_key = internal.hash_key(address, key);
+        let (is_warm) = dict_read{dict_ptr=dict}(slot_key);
+        dict_write{dict_ptr=dict}(slot_key, TRUE);
+        tempvar new_self = new model.AccessSet(dict_start=self.dict_start, dict=dict);
+        return (new_self, slot_key, is_warm);
+    }
+
+    // @notice Make an address or a storage slot cold again.
+    // @dev Used when the execution context that first accessed it reverts.
+    // @param self - The pointer to the access set.
+    // @param key - The dict key of the address or of the slot.
+    // @return The new pointer to the access set.
+    func remove(self: model.AccessSet*, key: felt) -> model.AccessSet* {
+        let dict = self.dict;
+        dict_write{dict_ptr=dict}(key, FALSE);
+        return new model.AccessSet(dict_start=self.dict_start, dict=dict);
+    }
+
+    // @notice Add the addresses and storage slots of an EIP-2930 access list.
+    // @dev Each entry of the list is an address, followed by the number of its storage keys and by
+    // @dev the keys, as Uint256.
+    // @param self - The pointer to the access set.
+    // @param access_list_len - The length of the access list, in felts.
+    // @param access_list - The access list.
+    // @return The new pointer to the access set.
+    func add_access_list{pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        self: model.AccessSet*, access_list_len: felt, access_list: felt*
+    ) -> model.AccessSet* {
+        alloc_locals;
+        if (access_list_len == 0) {
+            return self;
+        }
+
+        let address = [access_list];
+        let storage_keys_len = [access_list + 1];
+        let entry_len = 2 + storage_keys_len * Uint256.SIZE;
+        with_attr error_message("Kakarot: InvalidAccessList") {
+            assert_nn(access_list_len - entry_len);
+        }
+
+        let (self, _) = add_address(self, address);
+        let self = internal.add_storage_keys(
+            self, address, storage_keys_len, cast(access_list + 2, Uint256*)
+        );
+        return add_access_list(self, access_list_len - entry_len, access_list + entry_len);
+    }
+
+    // @notice Compute the intrinsic gas cost of an EIP-2930 access list.
+    // @dev The access list must have been checked by add_access_list.
+    // @param access_list_len - The length of the access list, in felts.
+    // @param access_list - The access list.
+    // @return The gas cost of the addresses and storage keys of the access list.
+    func access_list_cost(access_list_len: felt, access_list: felt*) -> felt {
+        if (access_list_len == 0) {
+            return 0;
+        }
+
+        let storage_keys_len = [access_list + 1];
+        let entry_len = 2 + storage_keys_len * Uint256.SIZE;
+        let cost = access_list_cost(access_list_len - entry_len, access_list + entry_len);
+        return cost + GAS_COST_ACCESS_LIST_ADDRESS + GAS_COST_ACCESS_LIST_STORAGE_KEY *
+            storage_keys_len;
+    }
+}
+
+namespace internal {
+    // @notice Compute the dict key of a storage slot.
+    func hash_key{pedersen_ptr: HashBuiltin*}(address: felt, key: Uint256) -> felt {
+        let (hash_low) = hash2{hash_ptr=pedersen_ptr}(address, key.low);
+        let (slot_key) = hash2{hash_ptr=pedersen_ptr}(hash_low, key.high);
+        return slot_key;
+    }
+
+    // @notice Add the precompiles from address down to 1.
+    func add_precompiles{dict: DictAccess*}(address: felt) {
+        if (address == 0) {
+            return ();
+        }
+        dict_write{dict_ptr=dict}(address, TRUE);
+        return add_precompiles(address - 1);
+    }
+
+    // @notice Add the storage keys of an access list entry.
+    func add_storage_keys{pedersen_ptr: HashBuiltin*}(
+        self: model.AccessSet*, address: felt, keys_len: felt, keys: Uint256*
+    ) -> model.AccessSet* {
+        if (keys_len == 0) {
+            return self;
+        }
+        let (self, _, _) = AccessSet.add_storage_key(self, address, [keys]);
+        return add_storage_keys(self, address, keys_len - 1, keys + Uint256.SIZE);
+    }
+}
@@ -49,6 +49,35 @@ func bytecode_len{
     return (len=len);
 }
 
+// @notice This function is used to get the keccak hash of the bytecode of the smart contract.
+// @dev Compared to bytecode, it does not read nor hash the code.
+// @return The keccak hash of the bytecode.
+@view
+func code_hash{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() -> (code_hash: Uint256) {
+    let code_hash = ContractAccount.code_hash();
+    return (code_hash=code_hash);
+}
+
+// @notice This function is used to get the valid jump destinations bitmap of the smart contract.
+// @return The bitmap of the valid jump destinations.
+@view
+func valid_jumpdests{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() -> (valid_jumpdests_len: felt, valid_jumpdests: felt*) {
+    return ContractAccount.valid_jumpdests();
+}
+
+// @notice This function is used to get the bytecode and the valid jump destinations bitmap in a single call.
+// @return The bytecode and the bitmap of its valid jump destinations.
+@view
+func bytecode_with_valid_jumpdests{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() -> (bytecode_len: felt, bytecode: felt*, valid_jumpdests_len: felt, valid_jumpdests: felt*) {
+    return ContractAccount.bytecode_with_valid_jumpdests();
+}
+
 // @notice Store a key-value pair
 // @param key: The bytes32 storage key.
 // @param value: The bytes32 stored value.
@@ -68,6 +97,27 @@ func storage{
     return ContractAccount.storage(key);
 }
 
+// @notice Store several key-value pairs in a single call
+// @param keys_len: The number of keys.
+// @param keys: The bytes32 storage keys.
+// @param values_len: The number of values, must be equal to keys_len.
+// @param values: The bytes32 stored values.
+@external
+func write_storage_batch{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(keys_len: felt, keys: Uint256*, values_len: felt, values: Uint256*) {
+    return ContractAccount.write_storage_batch(keys_len, keys, values_len, values);
+}
+
+// @notice Read several storage keys in a single call
+// @return The stored values, 0 for the keys that don't exist.
+@view
+func storage_batch{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(keys_len: felt, keys: Uint256*) -> (values_len: felt, values: Uint256*) {
+    return ContractAccount.storage_batch(keys_len, keys);
+}
+
 // @notice This function is used to initialize the smart contract.
 @external
 func initialize{
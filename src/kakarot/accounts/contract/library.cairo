@@ -7,14 +7,26 @@ from openzeppelin.access.ownable.library import Ownable
 from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.bool import FALSE
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.cairo_keccak.keccak import keccak_bigend, finalize_keccak
 from starkware.cairo.common.math import unsigned_div_rem, split_felt
+from starkware.cairo.common.math_cmp import is_le
 from starkware.cairo.common.registers import get_label_location
 from starkware.cairo.common.uint256 import Uint256
 from starkware.starknet.common.syscalls import deploy as deploy_syscall
 from starkware.starknet.common.syscalls import get_contract_address
-
-from kakarot.constants import native_token_address, registry_address, evm_contract_class_hash
+from starkware.starknet.core.os.contract_address.contract_address import (
+    get_contract_address as compute_contract_address,
+)
+
+from kakarot.constants import (
+    native_token_address,
+    registry_address,
+    evm_contract_class_hash,
+    deployed_accounts,
+)
 from kakarot.interfaces.interfaces import IRegistry
+from kakarot.jumpdest_bitmap import JumpdestBitmap
+from utils.utils import Helpers
 
 // @title SmartContractAccount main library file.
 // @notice This file contains the EVM smart contract account representation logic.
@@ -31,6 +43,24 @@ func bytecode_(index: felt) -> (res: felt) {
 func bytecode_len_() -> (res: felt) {
 }
 
+// Keccak hash of the bytecode, 0 for accounts whose bytecode was written before it was stored
+@storage_var
+func code_hash_() -> (res: Uint256) {
+}
+
+// Number of bytes packed in each bytecode_ felt, 0 for accounts written with the legacy 16 bytes format
+@storage_var
+func bytecode_bytes_per_felt_() -> (res: felt) {
+}
+
+@storage_var
+func valid_jumpdests_(index: felt) -> (res: felt) {
+}
+
+@storage_var
+func valid_jumpdests_len_() -> (res: felt) {
+}
+
 @storage_var
 func storage_(key: Uint256) -> (value: Uint256) {
 }
@@ -47,9 +77,13 @@ func evm_contract_deployed(evm_contract_address: felt, starknet_contract_address
 }
 
 namespace ContractAccount {
-    // Define the number of bytes per felt. Above 16, the following code won't work as it uses unsigned_div_rem
-    // which is bounded by RC_BOUND = 2 ** 128 ~ uint128 ~ bytes16
+    // Define the number of bytes per felt of the legacy bytecode format. Above 16, the legacy loading code won't work
+    // as it uses unsigned_div_rem which is bounded by RC_BOUND = 2 ** 128 ~ uint128 ~ bytes16
     const BYTES_PER_FELT = 16;
+    // Define the number of bytes per felt used to store the bytecode, the largest number of bytes fitting in a felt
+    const PACKED_BYTES_PER_FELT = 31;
+    // Define the 32 upper bits of the evm addresses assigned before addresses were derived from CREATE and CREATE2
+    const LEGACY_ADDRESS_PREFIX = 0xAbdE1007;
 
     // @notice This function is used to initialize the smart contract account.
     // @param kakarot_address: The address of the Kakarot smart contract.
@@ -64,47 +98,63 @@ namespace ContractAccount {
         // Initialize access control.
         Ownable.initializer(kakarot_address);
         // Store the bytecode.
-        internal.write_bytecode(0, bytecode_len, bytecode, 0, BYTES_PER_FELT);
+        bytecode_bytes_per_felt_.write(PACKED_BYTES_PER_FELT);
+        internal.write_bytecode(bytecode_len, bytecode);
         return ();
     }
 
-    // @notice This function is a factory to handle salt and registration of EVM<>Starknet binding.
-    // @param salt: The salt for computing the corresponding EVM address
+    // @notice This function is a factory to handle the deployment and registration of EVM<>Starknet binding.
+    // @dev The evm address is used as the deployment salt, so the starknet address can be derived from it,
+    //      see compute_starknet_address.
+    // @dev An account deployed by a creation that was reverted is registered again instead of being redeployed,
+    //      its code was cleared by Journal.revert.
+    // @param evm_contract_address: The EVM address of the contract, see compute_create_address and compute_create2_address
     func deploy{
         syscall_ptr: felt*,
         pedersen_ptr: HashBuiltin*,
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
-    }(salt: felt) -> (evm_contract_address: felt, starknet_contract_address: felt) {
+    }(evm_contract_address: felt) -> (evm_contract_address: felt, starknet_contract_address: felt) {
         alloc_locals;
 
-        // Prepare constructor data
-        let (local calldata: felt*) = alloc();
-        let (kakarot_address) = get_contract_address();
-        assert [calldata] = kakarot_address;
-        assert [calldata + 1] = 0;
-
-        // Deploy contract account with no bytecode
-        let (class_hash) = evm_contract_class_hash.read();
-        let (starknet_contract_address) = deploy_syscall(
-            class_hash=class_hash,
-            contract_address_salt=salt,
-            constructor_calldata_size=2,
-            constructor_calldata=calldata,
-            deploy_from_zero=FALSE,
-        );
+        let (deployed_account) = deployed_accounts.read(evm_contract_address);
+        local starknet_contract_address;
+        if (deployed_account != 0) {
+            starknet_contract_address = deployed_account;
+
+            tempvar syscall_ptr = syscall_ptr;
+            tempvar pedersen_ptr = pedersen_ptr;
+            tempvar range_check_ptr = range_check_ptr;
+        } else {
+            // Prepare constructor data
+            let (calldata: felt*) = alloc();
+            let (kakarot_address) = get_contract_address();
+            assert [calldata] = kakarot_address;
+            assert [calldata + 1] = 0;
+
+            // Deploy contract account with no bytecode
+            let (class_hash) = evm_contract_class_hash.read();
+            let (new_account) = deploy_syscall(
+                class_hash=class_hash,
+                contract_address_salt=evm_contract_address,
+                constructor_calldata_size=2,
+                constructor_calldata=calldata,
+                deploy_from_zero=FALSE,
+            );
+            deployed_accounts.write(evm_contract_address, new_account);
+            starknet_contract_address = new_account;
 
-        // Generate EVM_contract address from the new cairo contract
-        // TODO: Use RLP to compute proper EVM address, see https://www.evm.codes/#f0
-        let (_, low) = split_felt(starknet_contract_address);
-        local evm_contract_address = 0xAbdE100700000000000000000000000000000000 + low;
+            tempvar syscall_ptr = syscall_ptr;
+            tempvar pedersen_ptr = pedersen_ptr;
+            tempvar range_check_ptr = range_check_ptr;
+        }
 
         evm_contract_deployed.emit(
             evm_contract_address=evm_contract_address,
             starknet_contract_address=starknet_contract_address,
         );
 
-        // Save address of new contracts
+        // Save address of new contracts, still required for the lookups of existing accounts
         let (reg_address) = registry_address.read();
         IRegistry.set_account_entry(
             contract_address=reg_address,
@@ -115,6 +165,90 @@ namespace ContractAccount {
         return (evm_contract_address, starknet_contract_address);
     }
 
+    // @notice Compute the starknet address of the contract account deployed at the given evm address.
+    // @dev Mirrors the deploy_syscall of deploy, no registry lookup is needed.
+    // @param evm_contract_address: The EVM address of the contract.
+    // @return The starknet address of the contract account.
+    func compute_starknet_address{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        evm_contract_address: felt
+    ) -> felt {
+        alloc_locals;
+        let (local calldata: felt*) = alloc();
+        let (kakarot_address) = get_contract_address();
+        assert [calldata] = kakarot_address;
+        assert [calldata + 1] = 0;
+
+        let (class_hash) = evm_contract_class_hash.read();
+        let (starknet_contract_address) = compute_contract_address{hash_ptr=pedersen_ptr}(
+            salt=evm_contract_address,
+            class_hash=class_hash,
+            constructor_calldata_size=2,
+            constructor_calldata=calldata,
+            deployer_address=kakarot_address,
+        );
+        return starknet_contract_address;
+    }
+
+    // @notice Compute the EVM address of a contract created with CREATE, i.e. keccak256(rlp([sender, nonce]))[12:].
+    // @param sender: The EVM address of the creator.
+    // @param nonce: The nonce of the creator.
+    // @return The EVM address of the created contract.
+    func compute_create_address{range_check_ptr, bitwise_ptr: BitwiseBuiltin*, keccak_ptr: felt*}(
+        sender: felt, nonce: felt
+    ) -> felt {
+        alloc_locals;
+        let (local message: felt*) = alloc();
+        // The sender is encoded as a 20 bytes string
+        assert [message + 1] = 0x80 + 20;
+        Helpers.split_word(sender, 20, message + 2);
+        let nonce_len = internal.encode_nonce(nonce, message + 22);
+        // The list prefix, the payload being always shorter than 56 bytes
+        assert [message] = 0xc0 + 21 + nonce_len;
+
+        let hash = internal.keccak(22 + nonce_len, message);
+        let address = internal.hash_to_address(hash);
+        return address;
+    }
+
+    // @notice Compute the EVM address of a contract created with CREATE2,
+    //         i.e. keccak256(0xff ++ sender ++ salt ++ keccak256(init_code))[12:].
+    // @param sender: The EVM address of the creator.
+    // @param salt: The salt given to CREATE2.
+    // @param bytecode_len: The length of the init code.
+    // @param bytecode: The init code.
+    // @return The EVM address of the created contract.
+    func compute_create2_address{range_check_ptr, bitwise_ptr: BitwiseBuiltin*, keccak_ptr: felt*}(
+        sender: felt, salt: Uint256, bytecode_len: felt, bytecode: felt*
+    ) -> felt {
+        alloc_locals;
+        let code_hash = internal.keccak(bytecode_len, bytecode);
+
+        let (local message: felt*) = alloc();
+        assert [message] = 0xff;
+        Helpers.split_word(sender, 20, message + 1);
+        Helpers.split_word_128(salt.high, message + 21);
+        Helpers.split_word_128(salt.low, message + 37);
+        Helpers.split_word_128(code_hash.high, message + 53);
+        Helpers.split_word_128(code_hash.low, message + 69);
+
+        let hash = internal.keccak(85, message);
+        let address = internal.hash_to_address(hash);
+        return address;
+    }
+
+    // @notice Check whether the given evm address was assigned by the former registry based scheme.
+    // @dev These addresses were 0xAbdE1007 followed by the 128 lower bits of the starknet address,
+    //      their starknet address can't be derived and must be looked up in the registry.
+    // @param evm_contract_address: The EVM address of the contract.
+    // @return 1 if the address is a legacy address, 0 otherwise.
+    func is_legacy_address{range_check_ptr}(evm_contract_address: felt) -> felt {
+        let (high, _) = split_felt(evm_contract_address);
+        if (high == LEGACY_ADDRESS_PREFIX) {
+            return 1;
+        }
+        return 0;
+    }
+
     // @notice Store the bytecode of the contract.
     // @param bytecode_len: The length of the bytecode.
     // @param bytecode: The bytecode of the contract.
@@ -124,16 +258,21 @@ namespace ContractAccount {
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
     }(bytecode_len: felt, bytecode: felt*) {
+        alloc_locals;
         // Access control check.
         Ownable.assert_only_owner();
-        // Recursively store the bytecode.
+        // Store the bytecode, 31 bytes per felt.
         bytecode_len_.write(bytecode_len);
-        internal.write_bytecode(
-            index=0,
-            bytecode_len=bytecode_len,
-            bytecode=bytecode,
-            current_felt=0,
-            remaining_shift=BYTES_PER_FELT,
+        bytecode_bytes_per_felt_.write(PACKED_BYTES_PER_FELT);
+        internal.write_bytecode(bytecode_len, bytecode);
+        // Store the code hash so that EXTCODEHASH doesn't need to load and hash the bytecode.
+        let code_hash = internal.compute_code_hash(bytecode_len, bytecode);
+        code_hash_.write(code_hash);
+        // Store the valid jump destinations so that they are not computed at each execution.
+        let (valid_jumpdests_len, valid_jumpdests) = JumpdestBitmap.compute(bytecode_len, bytecode);
+        valid_jumpdests_len_.write(valid_jumpdests_len);
+        internal.write_valid_jumpdests(
+            index=0, valid_jumpdests_len=valid_jumpdests_len, valid_jumpdests=valid_jumpdests
         );
         return ();
     }
@@ -161,20 +300,99 @@ namespace ContractAccount {
         bitwise_ptr: BitwiseBuiltin*,
     }() -> (bytecode_len: felt, bytecode: felt*) {
         alloc_locals;
-        // Read bytecode length from storage.
-        let (bytecode_len) = bytecode_len_.read();
-        // Recursively load bytecode into specified memory location.
-        let bytecode_: felt* = alloc();
-        internal.load_bytecode(
-            index=0,
-            bytecode_len=bytecode_len,
-            bytecode=bytecode_,
-            current_felt=0,
-            remaining_shift=0,
-        );
+        // Read bytecode length and format from storage.
+        let (local bytecode_len) = bytecode_len_.read();
+        let (bytes_per_felt) = bytecode_bytes_per_felt_.read();
+        let (local bytecode_: felt*) = alloc();
+
+        if (bytes_per_felt == 0) {
+            // Bytecode written before the 31 bytes packing, load it byte per byte.
+            internal.load_legacy_bytecode(
+                index=0,
+                bytecode_len=bytecode_len,
+                bytecode=bytecode_,
+                current_felt=0,
+                remaining_shift=0,
+            );
+            return (bytecode_len, bytecode_);
+        }
+
+        internal.load_bytecode(bytecode_len, bytecode_);
         return (bytecode_len, bytecode_);
     }
 
+    // @notice This function is used to get the keccak hash of the bytecode of the smart contract.
+    // @dev Accounts whose bytecode was written before the code hash was stored compute it from the bytecode.
+    // @return code_hash: The keccak hash of the bytecode.
+    func code_hash{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }() -> Uint256 {
+        alloc_locals;
+        let (code_hash) = code_hash_.read();
+        if (code_hash.low + code_hash.high == 0) {
+            let (bytecode_len, bytecode) = ContractAccount.bytecode();
+            let computed_code_hash = internal.compute_code_hash(bytecode_len, bytecode);
+            return computed_code_hash;
+        }
+        return code_hash;
+    }
+
+    // @notice This function is used to get the valid jump destinations bitmap of the smart contract.
+    // @dev Accounts whose bytecode was written before the bitmap was stored compute it from the bytecode.
+    // @return valid_jumpdests_len: The number of felts of the bitmap.
+    // @return valid_jumpdests: The bitmap, see JumpdestBitmap.
+    func valid_jumpdests{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }() -> (valid_jumpdests_len: felt, valid_jumpdests: felt*) {
+        alloc_locals;
+        let (valid_jumpdests_len) = valid_jumpdests_len_.read();
+        if (valid_jumpdests_len == 0) {
+            let (bytecode_len, bytecode) = ContractAccount.bytecode();
+            let (valid_jumpdests_len, valid_jumpdests) = JumpdestBitmap.compute(
+                bytecode_len, bytecode
+            );
+            return (valid_jumpdests_len, valid_jumpdests);
+        }
+        let (valid_jumpdests: felt*) = alloc();
+        internal.load_valid_jumpdests(
+            index=0, valid_jumpdests_len=valid_jumpdests_len, valid_jumpdests=valid_jumpdests
+        );
+        return (valid_jumpdests_len, valid_jumpdests);
+    }
+
+    // @notice This function is used to get both the bytecode and the valid jump destinations of the smart contract.
+    // @return bytecode_len: The length of the bytecode.
+    // @return bytecode: The bytecode of the smart contract.
+    // @return valid_jumpdests_len: The number of felts of the bitmap.
+    // @return valid_jumpdests: The bitmap, see JumpdestBitmap.
+    func bytecode_with_valid_jumpdests{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }() -> (bytecode_len: felt, bytecode: felt*, valid_jumpdests_len: felt, valid_jumpdests: felt*) {
+        alloc_locals;
+        let (local bytecode_len, local bytecode) = ContractAccount.bytecode();
+        let (valid_jumpdests_len) = valid_jumpdests_len_.read();
+        if (valid_jumpdests_len == 0) {
+            let (valid_jumpdests_len, valid_jumpdests) = JumpdestBitmap.compute(
+                bytecode_len, bytecode
+            );
+            return (bytecode_len, bytecode, valid_jumpdests_len, valid_jumpdests);
+        }
+        let (valid_jumpdests: felt*) = alloc();
+        internal.load_valid_jumpdests(
+            index=0, valid_jumpdests_len=valid_jumpdests_len, valid_jumpdests=valid_jumpdests
+        );
+        return (bytecode_len, bytecode, valid_jumpdests_len, valid_jumpdests);
+    }
+
     // @notice This function is used to read the storage at a key.
     // @param key: The key to the stored value .
     // @return value: The store value.
@@ -204,6 +422,44 @@ namespace ContractAccount {
         return ();
     }
 
+    // @notice This function is used to read the storage at several keys in a single call.
+    // @param keys_len: The number of keys to read.
+    // @param keys: The keys to read.
+    // @return values_len: The number of stored values.
+    // @return values: The stored values, in the order of the keys.
+    func storage_batch{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(keys_len: felt, keys: Uint256*) -> (values_len: felt, values: Uint256*) {
+        alloc_locals;
+        let (local values: Uint256*) = alloc();
+        internal.load_storage_batch(keys_len, keys, values);
+        return (keys_len, values);
+    }
+
+    // @notice This function is used to write several values to the storage of the account in a single call.
+    // @param keys_len: The number of keys to write.
+    // @param keys: The keys to write.
+    // @param values_len: The number of values to store.
+    // @param values: The values to store, in the order of the keys.
+    func write_storage_batch{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(keys_len: felt, keys: Uint256*, values_len: felt, values: Uint256*) {
+        // Access control check.
+        Ownable.assert_only_owner();
+        with_attr error_message("Kakarot: keys and values must have the same length") {
+            assert keys_len = values_len;
+        }
+        // Write State
+        internal.write_storage_batch(keys_len, keys, values);
+        return ();
+    }
+
     // @notice This function checks if the account was initialized.
     // @return is_initialized: 1 if the account has been initialized 0 otherwise.
     func is_initialized{
@@ -254,53 +510,99 @@ namespace internal {
     dw 2 ** 112;
     dw 2 ** 120;
 
-    // @notice Store the bytecode of the contract.
-    // @param index: The current free index in the bytecode_ storage.
+    // @notice Store the bytecode of the contract, packing 31 bytes per felt.
+    // @dev Bytes are stored big endian, the last felt holding the remaining bytes, ie. 3 bytes end up
+    //      being stored as 0xabcdef.
     // @param bytecode_len: The length of the bytecode.
     // @param bytecode: The bytecode of the contract.
     func write_bytecode{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
-        index: felt, bytecode_len: felt, bytecode: felt*, current_felt: felt, remaining_shift: felt
+        bytecode_len: felt, bytecode: felt*
     ) {
         alloc_locals;
-
-        if (bytecode_len == 0) {
-            // end of bytecode case, break loop storing latest "pending" packed felt
-            bytecode_.write(index, current_felt);
+        let (local full_felts_len, local remaining) = unsigned_div_rem(
+            bytecode_len, ContractAccount.PACKED_BYTES_PER_FELT
+        );
+        write_full_felts(index=0, felts_len=full_felts_len, bytecode=bytecode);
+        if (remaining == 0) {
             return ();
         }
+        let value = Helpers.load_word(
+            remaining, bytecode + full_felts_len * ContractAccount.PACKED_BYTES_PER_FELT
+        );
+        bytecode_.write(full_felts_len, value);
+        return ();
+    }
 
-        if (remaining_shift == 0) {
-            // end of packed felt case, store current "pending" felt
-            // continue loop with a new current_felt and increament index in bytecode_ storage
-            bytecode_.write(index, current_felt);
-            return write_bytecode(
-                index + 1, bytecode_len, bytecode, 0, ContractAccount.BYTES_PER_FELT
-            );
+    // @notice Store felts_len felts of 31 bytes of the bytecode.
+    // @param index: The current free index in the bytecode_ storage.
+    // @param felts_len: The number of felts to store.
+    // @param bytecode: The remaining bytecode to store.
+    func write_full_felts{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        index: felt, felts_len: felt, bytecode: felt*
+    ) {
+        if (felts_len == 0) {
+            return ();
         }
+        let value = Helpers.load_word(ContractAccount.PACKED_BYTES_PER_FELT, bytecode);
+        bytecode_.write(index, value);
+        return write_full_felts(
+            index + 1, felts_len - 1, bytecode + ContractAccount.PACKED_BYTES_PER_FELT
+        );
+    }
 
-        // retrieve the precomputed pow array
-        let (pow_address) = get_label_location(pow_);
-        let pow = cast(pow_address, felt*);
-
-        // shift the current byte and add it to the current felt
-        // bytes are stored big endian, ie that 3 bytes ends up being stored as a felt whose representation is 0xabcdef000...000
-        // for a given remaining_shift:
-        // current_felt = 0x 12 34 00 00...00 00
-        // bytecode = 0x 56
-        // pow[remaining_shift] * bytecode = 0x 00 00 56 00...00 00
-        // resulting in 0x 12 34 56 00...00 00
-        let current_felt = pow[remaining_shift] * [bytecode] + current_felt;
+    // @notice Load the bytecode of the contract, stored 31 bytes per felt, in the specified array.
+    // @param bytecode_len: The length of the bytecode.
+    // @param bytecode: The array to load the bytecode into.
+    func load_bytecode{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        bytecode_len: felt, bytecode: felt*
+    ) {
+        alloc_locals;
+        let (local full_felts_len, local remaining) = unsigned_div_rem(
+            bytecode_len, ContractAccount.PACKED_BYTES_PER_FELT
+        );
+        load_full_felts(index=0, felts_len=full_felts_len, bytecode=bytecode);
+        if (remaining == 0) {
+            return ();
+        }
+        let (local value) = bytecode_.read(full_felts_len);
+        let dst = bytecode + full_felts_len * ContractAccount.PACKED_BYTES_PER_FELT;
+        let is_short = is_le(remaining, 16);
+        if (is_short != FALSE) {
+            Helpers.split_word(value, remaining, dst);
+            return ();
+        }
+        let (high, local low) = split_felt(value);
+        Helpers.split_word(high, remaining - 16, dst);
+        Helpers.split_word_128(low, dst + remaining - 16);
+        return ();
+    }
 
-        return write_bytecode(
-            index, bytecode_len - 1, bytecode + 1, current_felt, remaining_shift - 1
+    // @notice Load felts_len felts of 31 bytes of the bytecode.
+    // @dev Each felt is split in its 15 high bytes and 16 low bytes rather than byte per byte.
+    // @param index: The current index in the bytecode_ storage.
+    // @param felts_len: The number of felts to load.
+    // @param bytecode: The array to load the bytecode into.
+    func load_full_felts{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        index: felt, felts_len: felt, bytecode: felt*
+    ) {
+        alloc_locals;
+        if (felts_len == 0) {
+            return ();
+        }
+        let (value) = bytecode_.read(index);
+        let (high, local low) = split_felt(value);
+        Helpers.split_word(high, 15, bytecode);
+        Helpers.split_word_128(low, bytecode + 15);
+        return load_full_felts(
+            index + 1, felts_len - 1, bytecode + ContractAccount.PACKED_BYTES_PER_FELT
         );
     }
 
-    // @notice Load the bytecode of the contract in the specified array.
+    // @notice Load the bytecode of the contract stored with the legacy 16 bytes format in the specified array.
     // @param index: The index in the bytecode.
     // @param bytecode_len: The length of the bytecode.
     // @param bytecode: The bytecode of the contract.
-    func load_bytecode{
+    func load_legacy_bytecode{
         syscall_ptr: felt*,
         pedersen_ptr: HashBuiltin*,
         range_check_ptr,
@@ -316,7 +618,7 @@ namespace internal {
         if (remaining_shift == 0) {
             // end of current packed felt, loading next stored felt and increase storage index
             let (current_felt) = bytecode_.read(index);
-            return load_bytecode(
+            return load_legacy_bytecode(
                 index + 1, bytecode_len, bytecode, current_felt, ContractAccount.BYTES_PER_FELT
             );
         }
@@ -331,8 +633,153 @@ namespace internal {
         // add byte to returned array
         assert [bytecode] = current_byte;
 
-        return load_bytecode(
+        return load_legacy_bytecode(
             index, bytecode_len - 1, bytecode + 1, current_felt, remaining_shift - 1
         );
     }
+
+    // @notice Compute the keccak hash of the bytecode in its own keccak segment.
+    // @param bytecode_len: The length of the bytecode.
+    // @param bytecode: The bytecode of the contract.
+    // @return The keccak hash of the bytecode.
+    func compute_code_hash{range_check_ptr, bitwise_ptr: BitwiseBuiltin*}(
+        bytecode_len: felt, bytecode: felt*
+    ) -> Uint256 {
+        alloc_locals;
+        let (keccak_ptr: felt*) = alloc();
+        local keccak_ptr_start: felt* = keccak_ptr;
+
+        with keccak_ptr {
+            let code_hash = keccak(bytecode_len, bytecode);
+
+            finalize_keccak(keccak_ptr_start=keccak_ptr_start, keccak_ptr_end=keccak_ptr);
+        }
+
+        return code_hash;
+    }
+
+    // @notice Compute the keccak hash of an array of bytes.
+    // @dev The keccak segment is finalized by the caller.
+    // @param bytes_len: The number of bytes.
+    // @param bytes: The bytes to hash.
+    // @return The keccak hash of the bytes.
+    func keccak{range_check_ptr, bitwise_ptr: BitwiseBuiltin*, keccak_ptr: felt*}(
+        bytes_len: felt, bytes: felt*
+    ) -> Uint256 {
+        alloc_locals;
+        let (local dest: felt*) = alloc();
+        // convert to little endian
+        Helpers.bytes_to_bytes8_little_endian(
+            bytes_len=bytes_len,
+            bytes=bytes,
+            index=0,
+            size=bytes_len,
+            bytes8=0,
+            bytes8_shift=0,
+            dest=dest,
+            dest_index=0,
+        );
+
+        let (hash) = keccak_bigend(inputs=dest, n_bytes=bytes_len);
+        return hash;
+    }
+
+    // @notice Take the 20 lower bytes of a keccak hash as an evm address.
+    // @param hash: The keccak hash.
+    // @return The evm address.
+    func hash_to_address{range_check_ptr}(hash: Uint256) -> felt {
+        let (_, high) = unsigned_div_rem(hash.high, 2 ** 32);
+        return high * 2 ** 128 + hash.low;
+    }
+
+    // @notice Write the RLP encoding of a nonce.
+    // @param nonce: The nonce to encode.
+    // @param dst: The array to write the encoding into.
+    // @return The number of bytes written.
+    func encode_nonce{range_check_ptr}(nonce: felt, dst: felt*) -> felt {
+        alloc_locals;
+        if (nonce == 0) {
+            assert [dst] = 0x80;
+            return 1;
+        }
+        let is_single_byte = is_le(nonce, 0x7f);
+        if (is_single_byte != FALSE) {
+            assert [dst] = nonce;
+            return 1;
+        }
+        let nonce_len = bytes_used(nonce);
+        assert [dst] = 0x80 + nonce_len;
+        Helpers.split_word(nonce, nonce_len, dst + 1);
+        return nonce_len + 1;
+    }
+
+    // @notice Count the number of bytes used by a value.
+    // @param value: The value, lower than 2 ** 128.
+    // @return The number of bytes of the big endian representation of value without leading zeroes.
+    func bytes_used{range_check_ptr}(value: felt) -> felt {
+        if (value == 0) {
+            return 0;
+        }
+        let (q, _) = unsigned_div_rem(value, 256);
+        let len = bytes_used(q);
+        return len + 1;
+    }
+
+    // @notice Store the valid jump destinations bitmap of the contract.
+    // @param index: The current index in the valid_jumpdests_ storage.
+    // @param valid_jumpdests_len: The number of remaining felts to store.
+    // @param valid_jumpdests: The remaining felts to store.
+    func write_valid_jumpdests{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        index: felt, valid_jumpdests_len: felt, valid_jumpdests: felt*
+    ) {
+        if (valid_jumpdests_len == 0) {
+            return ();
+        }
+        valid_jumpdests_.write(index, [valid_jumpdests]);
+        return write_valid_jumpdests(index + 1, valid_jumpdests_len - 1, valid_jumpdests + 1);
+    }
+
+    // @notice Load the valid jump destinations bitmap of the contract in the specified array.
+    // @param index: The current index in the valid_jumpdests_ storage.
+    // @param valid_jumpdests_len: The number of remaining felts to load.
+    // @param valid_jumpdests: The array to load the felts into.
+    func load_valid_jumpdests{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        index: felt, valid_jumpdests_len: felt, valid_jumpdests: felt*
+    ) {
+        if (valid_jumpdests_len == 0) {
+            return ();
+        }
+        let (value) = valid_jumpdests_.read(index);
+        assert [valid_jumpdests] = value;
+        return load_valid_jumpdests(index + 1, valid_jumpdests_len - 1, valid_jumpdests + 1);
+    }
+
+    // @notice Write the given values at the given keys of the storage.
+    // @param keys_len: The number of remaining keys to write.
+    // @param keys: The remaining keys to write.
+    // @param values: The remaining values to store.
+    func write_storage_batch{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        keys_len: felt, keys: Uint256*, values: Uint256*
+    ) {
+        if (keys_len == 0) {
+            return ();
+        }
+        storage_.write([keys], [values]);
+        return write_storage_batch(keys_len - 1, keys + Uint256.SIZE, values + Uint256.SIZE);
+    }
+
+    // @notice Load the values stored at the given keys of the storage.
+    // @param keys_len: The number of remaining keys to read.
+    // @param keys: The remaining keys to read.
+    // @param values: The array to load the values into.
+    func load_storage_batch{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        keys_len: felt, keys: Uint256*, values: Uint256*
+    ) {
+        if (keys_len == 0) {
+            return ();
+        }
+        let (value) = storage_.read([keys]);
+        assert [values] = value;
+        return load_storage_batch(keys_len - 1, keys + Uint256.SIZE, values + Uint256.SIZE);
+    }
 }
@@ -22,6 +22,12 @@ func evm_contract_class_hash() -> (value: felt) {
 func salt() -> (value: felt) {
 }
 
+// Starknet address of the account deployed for an evm address. A deployment can't be undone, the
+// account of a reverted creation is reused by the next creation at the same evm address.
+@storage_var
+func deployed_accounts(evm_contract_address: felt) -> (starknet_contract_address: felt) {
+}
+
 // @title Constants file.
 // @notice This file contains global constants.
 // @author @abdelhamidbakhta
@@ -6,18 +6,26 @@
 from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.bool import TRUE, FALSE
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
-from starkware.cairo.common.math import assert_le, assert_nn
-from starkware.cairo.common.memcpy import memcpy
+from starkware.cairo.common.cairo_keccak.keccak import finalize_keccak
+from starkware.cairo.common.default_dict import default_dict_new, default_dict_finalize
+from starkware.cairo.common.dict import DictAccess
+from starkware.cairo.common.math_cmp import is_nn_le
 from starkware.cairo.common.registers import get_label_location
+from starkware.cairo.common.uint256 import Uint256
 
 // Internal dependencies
 from utils.utils import Helpers
+from kakarot.accounts.contract.library import ContractAccount
 from kakarot.model import model
 from kakarot.memory import Memory
 from kakarot.stack import Stack
+from kakarot.access_set import AccessSet
+from kakarot.registry_cache import RegistryCache
+from kakarot.storage_cache import StorageCache
 from kakarot.constants import Constants
-from kakarot.constants import registry_address
-from kakarot.interfaces.interfaces import IRegistry, IEvmContract
+from kakarot.interfaces.interfaces import IEvmContract
+from kakarot.journal import Journal
+from kakarot.jumpdest_bitmap import JumpdestBitmap
 
 // @title ExecutionContext related functions.
 // @notice This file contains functions related to the execution context.
@@ -44,7 +52,7 @@ namespace ExecutionContext {
         return ctx;
 
         empty_context:
-        dw 0;  // call_context
+        dw 0;  // environment
         dw 0;  // program_counter
         dw 1;  // stopped
         dw 0;  // return_data
@@ -52,15 +60,9 @@ namespace ExecutionContext {
         dw 0;  // stack
         dw 0;  // memory
         dw 0;  // gas_used
-        dw 0;  // gas_limit
-        dw 0;  // gas_price
-        dw 0;  // starknet_contract_address
-        dw 0;  // evm_contract_address
-        dw 0;  // calling_context
         dw 0;  // sub_context
-        dw 0;  // destroy_contracts_len
-        dw 0;  // destroy_contracts
-        dw 0;  // read only
+        dw 0;  // reverted
+        dw 0;  // cold
     }
 
     // @notice Initialize the execution context.
@@ -80,13 +82,38 @@ namespace ExecutionContext {
 
         let stack: model.Stack* = Stack.init();
         let memory: model.Memory* = Memory.init();
+        let storage_cache: model.StorageCache* = StorageCache.init();
+        let registry_cache: model.RegistryCache* = RegistryCache.init();
+        let access_set: model.AccessSet* = AccessSet.init();
+        let keccak_segment: model.KeccakSegment* = init_keccak_segment();
+        let journal: model.Journal* = Journal.init();
         // Note: calling_context should theoretically take this context as sub_context but this not does really matter
         // so we keep it easier like that.
         let calling_context = init_empty();
         let sub_context = init_empty();
 
-        local ctx: model.ExecutionContext* = new model.ExecutionContext(
+        local environment: model.Environment* = new model.Environment(
             call_context=call_context,
+            gas_limit=gas_limit,
+            gas_price=0,
+            starknet_contract_address=0,
+            evm_contract_address=0,
+            calling_context=calling_context,
+            read_only=FALSE,
+            ret_offset=0,
+            ret_size=0,
+            );
+        local cold: model.ColdState* = new model.ColdState(
+            destroy_contracts_len=0,
+            destroy_contracts=empty_destroy_contracts,
+            storage_cache=storage_cache,
+            registry_cache=registry_cache,
+            access_set=access_set,
+            keccak_segment=keccak_segment,
+            journal=journal,
+            );
+        local ctx: model.ExecutionContext* = new model.ExecutionContext(
+            environment=environment,
             program_counter=initial_pc,
             stopped=FALSE,
             return_data=empty_return_data,
@@ -94,15 +121,9 @@ namespace ExecutionContext {
             stack=stack,
             memory=memory,
             gas_used=gas_used,
-            gas_limit=gas_limit,
-            gas_price=0,
-            starknet_contract_address=0,
-            evm_contract_address=0,
-            calling_context=calling_context,
             sub_context=sub_context,
-            destroy_contracts_len=0,
-            destroy_contracts=empty_destroy_contracts,
-            read_only=FALSE,
+            reverted=FALSE,
+            cold=cold,
             );
         return ctx;
     }
@@ -120,8 +141,8 @@ namespace ExecutionContext {
             return_data=self.return_data,
             return_data_len=self.return_data_len,
             gas_used=self.gas_used,
-            starknet_contract_address=self.starknet_contract_address,
-            evm_contract_address=self.evm_contract_address,
+            starknet_contract_address=self.environment.starknet_contract_address,
+            evm_contract_address=self.environment.evm_contract_address,
             );
     }
 
@@ -132,8 +153,8 @@ namespace ExecutionContext {
     // @param calldata The calldata.
     // @param value The value in wei to be sent to address.
     // @param calling_context A reference to the context of the calling contract. This context stores the return data produced by the called contract in its memory.
-    // @param return_data_len The return_data length.
-    // @param return_data The region where returned data of the contract or precompile is written.
+    // @param ret_offset The offset in the memory of the calling context where the returned data is written.
+    // @param ret_size The maximum size of the returned data written in the memory of the calling context.
     // @param read_only The boolean that determines whether state modifications can be executed from the sub-execution context.
     // @return The initialized execution context.
     func init_at_address{
@@ -148,61 +169,127 @@ namespace ExecutionContext {
         calldata: felt*,
         value: felt,
         calling_context: model.ExecutionContext*,
-        return_data_len: felt,
-        return_data: felt*,
+        ret_offset: felt,
+        ret_size: felt,
         read_only: felt,
     ) -> model.ExecutionContext* {
         alloc_locals;
 
+        let (return_data: felt*) = alloc();
         let (empty_destroy_contracts: felt*) = alloc();
 
         let stack: model.Stack* = Stack.init();
         let memory: model.Memory* = Memory.init();
 
-        // Get the starknet address from the given evm address
-        let (registry_address_) = registry_address.read();
-        let (starknet_contract_address) = IRegistry.get_starknet_contract_address(
-            contract_address=registry_address_, evm_contract_address=address
-        );
+        // The storage and registry caches, the access set and the keccak segment are shared by all the contexts
+        // of the transaction
+        let is_parent_root = is_root(calling_context);
+        // as well as the journal, each context starting at the head of the journal of its calling context
+        if (is_parent_root != FALSE) {
+            let storage_cache = StorageCache.init();
+            let registry_cache = RegistryCache.init();
+            let access_set = AccessSet.init();
+            let keccak_segment = init_keccak_segment();
+            let journal = Journal.init();
+            tempvar storage_cache = storage_cache;
+            tempvar registry_cache = registry_cache;
+            tempvar access_set = access_set;
+            tempvar keccak_segment = keccak_segment;
+            tempvar journal = journal;
+        } else {
+            let journal = Journal.open(calling_context.cold.journal);
+            tempvar storage_cache = calling_context.cold.storage_cache;
+            tempvar registry_cache = calling_context.cold.registry_cache;
+            tempvar access_set = calling_context.cold.access_set;
+            tempvar keccak_segment = calling_context.cold.keccak_segment;
+            tempvar journal = journal;
+        }
+        local storage_cache: model.StorageCache* = storage_cache;
+        local registry_cache: model.RegistryCache* = registry_cache;
+        local access_set: model.AccessSet* = access_set;
+        local keccak_segment: model.KeccakSegment* = keccak_segment;
+        local journal: model.Journal* = journal;
+
+        // Get the starknet address from the given evm address, only legacy accounts need the registry
+        let is_legacy = ContractAccount.is_legacy_address(address);
+        if (is_legacy == FALSE) {
+            let starknet_contract_address = ContractAccount.compute_starknet_address(address);
+            tempvar syscall_ptr = syscall_ptr;
+            tempvar pedersen_ptr = pedersen_ptr;
+            tempvar range_check_ptr = range_check_ptr;
+            tempvar registry_cache = registry_cache;
+            tempvar starknet_contract_address = starknet_contract_address;
+        } else {
+            let (
+                registry_cache, starknet_contract_address
+            ) = RegistryCache.get_starknet_contract_address(registry_cache, address);
+            tempvar syscall_ptr = syscall_ptr;
+            tempvar pedersen_ptr = pedersen_ptr;
+            tempvar range_check_ptr = range_check_ptr;
+            tempvar registry_cache = registry_cache;
+            tempvar starknet_contract_address = starknet_contract_address;
+        }
+        local registry_cache: model.RegistryCache* = registry_cache;
+        local starknet_contract_address = starknet_contract_address;
 
-        // Get the bytecode from the Starknet_contract
-        let (bytecode_len, bytecode) = IEvmContract.bytecode(
-            contract_address=starknet_contract_address
-        );
+        // Get the bytecode and its valid jump destinations from the Starknet_contract
+        let (
+            bytecode_len, bytecode, _, valid_jumpdests
+        ) = IEvmContract.bytecode_with_valid_jumpdests(contract_address=starknet_contract_address);
         local call_context: model.CallContext* = new model.CallContext(
-            bytecode=bytecode, bytecode_len=bytecode_len, calldata=calldata, calldata_len=calldata_len, value=value
+            bytecode=bytecode,
+            bytecode_len=bytecode_len,
+            valid_jumpdests=valid_jumpdests,
+            calldata=calldata,
+            calldata_len=calldata_len,
+            value=value,
             );
 
         let sub_context = init_empty();
 
-        return new model.ExecutionContext(
+        tempvar environment = new model.Environment(
             call_context=call_context,
-            program_counter=0,
-            stopped=FALSE,
-            return_data=return_data,
-            return_data_len=return_data_len,
-            stack=stack,
-            memory=memory,
-            gas_used=0,
             gas_limit=gas_limit,
             gas_price=0,
             starknet_contract_address=starknet_contract_address,
             evm_contract_address=address,
             calling_context=calling_context,
-            sub_context=sub_context,
+            read_only=read_only,
+            ret_offset=ret_offset,
+            ret_size=ret_size,
+            );
+        tempvar cold = new model.ColdState(
             destroy_contracts_len=0,
             destroy_contracts=empty_destroy_contracts,
-            read_only=read_only,
+            storage_cache=storage_cache,
+            registry_cache=registry_cache,
+            access_set=access_set,
+            keccak_segment=keccak_segment,
+            journal=journal,
+            );
+        return new model.ExecutionContext(
+            environment=environment,
+            program_counter=0,
+            stopped=FALSE,
+            return_data=return_data,
+            return_data_len=0,
+            stack=stack,
+            memory=memory,
+            gas_used=0,
+            sub_context=sub_context,
+            reverted=FALSE,
+            cold=cold,
             );
     }
 
     // @notice Compute the intrinsic gas cost of the current transaction.
     // @dev Computes with the intrinsic gas cost based on per transaction constant and cost of input data (16 gas per non-zero byte and 4 gas per zero byte).
+    // @dev The cost of the access list of the transaction is given by AccessSet.access_list_cost.
     // @param self The execution context.
     // @return intrinsic gas cost.
     func compute_intrinsic_gas_cost(self: model.ExecutionContext*) -> felt {
-        let calldata = self.call_context.calldata;
-        let calldata_len = self.call_context.calldata_len;
+        let calldata = self.environment.call_context.calldata;
+        let calldata_len = self.environment.call_context.calldata_len;
         let count = Helpers.count_nonzeroes(nonzeroes=0, idx=0, arr_len=calldata_len, arr=calldata);
         let zeroes = calldata_len - count.nonzeroes;
         let calldata_cost = zeroes * 4 + count.nonzeroes * 16;
@@ -223,7 +310,8 @@ namespace ExecutionContext {
     // @param self The pointer to the execution context.
     // @return TRUE if the execution context is root, FALSE otherwise.
     func is_root(self: model.ExecutionContext*) -> felt {
-        if (cast(self.calling_context, felt) == 0) {
+        // Only the empty context, see init_empty, has no environment and thus no calling context
+        if (cast(self.environment, felt) == 0) {
             return TRUE;
         }
         return FALSE;
@@ -246,7 +334,7 @@ namespace ExecutionContext {
     // @return The pointer to the updated execution context.
     func stop(self: model.ExecutionContext*) -> model.ExecutionContext* {
         return new model.ExecutionContext(
-            call_context=self.call_context,
+            environment=self.environment,
             program_counter=self.program_counter,
             stopped=TRUE,
             return_data=self.return_data,
@@ -254,91 +342,103 @@ namespace ExecutionContext {
             stack=self.stack,
             memory=self.memory,
             gas_used=self.gas_used,
-            gas_limit=self.gas_limit,
-            gas_price=self.gas_price,
-            starknet_contract_address=self.starknet_contract_address,
-            evm_contract_address=self.evm_contract_address,
-            calling_context=self.calling_context,
             sub_context=self.sub_context,
-            destroy_contracts_len=self.destroy_contracts_len,
-            destroy_contracts=self.destroy_contracts,
-            read_only=self.read_only,
+            reverted=self.reverted,
+            cold=self.cold,
             );
     }
 
-    // @notice Read and return data from bytecode.
-    // @dev The data is read from the bytecode from the current program counter.
+    // @notice Stop the current execution context with a REVERT.
+    // @dev The state changes recorded in its journal are undone when its calling context resumes.
     // @param self The pointer to the execution context.
-    // @param len The size of the data to read.
     // @return The pointer to the updated execution context.
-    // @return The data read from the bytecode.
-    func read_code(self: model.ExecutionContext*, len: felt) -> (
-        self: model.ExecutionContext*, output: felt*
-    ) {
-        alloc_locals;
-        // Get current pc value
-        let pc = self.program_counter;
-        let (output: felt*) = alloc();
-        // Copy code slice
-        memcpy(dst=output, src=self.call_context.bytecode + pc, len=len);
-        // Move program counter
-        let self = ExecutionContext.increment_program_counter(self=self, inc_value=len);
-        return (self=self, output=output);
+    func revert(self: model.ExecutionContext*) -> model.ExecutionContext* {
+        return new model.ExecutionContext(
+            environment=self.environment,
+            program_counter=self.program_counter,
+            stopped=TRUE,
+            return_data=self.return_data,
+            return_data_len=self.return_data_len,
+            stack=self.stack,
+            memory=self.memory,
+            gas_used=self.gas_used,
+            sub_context=self.sub_context,
+            reverted=TRUE,
+            cold=self.cold,
+            );
     }
 
-    // @notice Update the stack of the current execution context.
-    // @dev The stack is updated with the given stack.
+    // @notice Stop the current execution context as it used more gas than its gas limit.
+    // @dev All the gas of the context is consumed, no data is returned and its state changes are
+    // @dev undone as for a REVERT.
+    // @param self The pointer to the execution context.
+    // @return The pointer to the updated execution context.
+    func out_of_gas(self: model.ExecutionContext*) -> model.ExecutionContext* {
+        return new model.ExecutionContext(
+            environment=self.environment,
+            program_counter=self.program_counter,
+            stopped=TRUE,
+            return_data=self.return_data,
+            return_data_len=0,
+            stack=self.stack,
+            memory=self.memory,
+            gas_used=self.environment.gas_limit,
+            sub_context=self.sub_context,
+            reverted=TRUE,
+            cold=self.cold,
+            );
+    }
+
+    // @notice Apply the changes made by an instruction to the execution context.
+    // @dev A single context is built instead of one per updated field.
     // @param self The pointer to the execution context.
     // @param stack The pointer to the new stack.
-    func update_stack(
-        self: model.ExecutionContext*, new_stack: model.Stack*
+    // @param memory The pointer to the new memory.
+    // @param pc_inc The value to increment the program counter with.
+    // @param gas_inc The value to increment the gas used with.
+    // @return The pointer to the updated execution context.
+    func apply_changes(
+        self: model.ExecutionContext*,
+        stack: model.Stack*,
+        memory: model.Memory*,
+        pc_inc: felt,
+        gas_inc: felt,
     ) -> model.ExecutionContext* {
         return new model.ExecutionContext(
-            call_context=self.call_context,
-            program_counter=self.program_counter,
+            environment=self.environment,
+            program_counter=self.program_counter + pc_inc,
             stopped=self.stopped,
             return_data=self.return_data,
             return_data_len=self.return_data_len,
-            stack=new_stack,
-            memory=self.memory,
-            gas_used=self.gas_used,
-            gas_limit=self.gas_limit,
-            gas_price=self.gas_price,
-            starknet_contract_address=self.starknet_contract_address,
-            evm_contract_address=self.evm_contract_address,
-            calling_context=self.calling_context,
+            stack=stack,
+            memory=memory,
+            gas_used=self.gas_used + gas_inc,
             sub_context=self.sub_context,
-            destroy_contracts_len=self.destroy_contracts_len,
-            destroy_contracts=self.destroy_contracts,
-            read_only=self.read_only,
+            reverted=self.reverted,
+            cold=self.cold,
             );
     }
 
-    // @notice Update the memory of the current execution context.
-    // @dev The memory is updated with the given memory.
+    // @notice Update the cold state of the current execution context.
+    // @dev Used by the functions updating the fields that are not changed by each instruction.
     // @param self The pointer to the execution context.
-    // @param memory The pointer to the new memory.
-    func update_memory(
-        self: model.ExecutionContext*, new_memory: model.Memory*
+    // @param cold The pointer to the new cold state.
+    // @return The pointer to the updated execution context.
+    func update_cold(
+        self: model.ExecutionContext*, cold: model.ColdState*
     ) -> model.ExecutionContext* {
         return new model.ExecutionContext(
-            call_context=self.call_context,
+            environment=self.environment,
             program_counter=self.program_counter,
             stopped=self.stopped,
             return_data=self.return_data,
             return_data_len=self.return_data_len,
             stack=self.stack,
-            memory=new_memory,
+            memory=self.memory,
             gas_used=self.gas_used,
-            gas_limit=self.gas_limit,
-            gas_price=self.gas_price,
-            starknet_contract_address=self.starknet_contract_address,
-            evm_contract_address=self.evm_contract_address,
-            calling_context=self.calling_context,
             sub_context=self.sub_context,
-            destroy_contracts_len=self.destroy_contracts_len,
-            destroy_contracts=self.destroy_contracts,
-            read_only=self.read_only,
+            reverted=self.reverted,
+            cold=cold,
             );
     }
 
@@ -355,7 +455,7 @@ namespace ExecutionContext {
         self: model.ExecutionContext*, new_return_data_len: felt, new_return_data: felt*
     ) -> model.ExecutionContext* {
         return new model.ExecutionContext(
-            call_context=self.call_context,
+            environment=self.environment,
             program_counter=self.program_counter,
             stopped=self.stopped,
             return_data=new_return_data,
@@ -363,102 +463,197 @@ namespace ExecutionContext {
             stack=self.stack,
             memory=self.memory,
             gas_used=self.gas_used,
-            gas_limit=self.gas_limit,
-            gas_price=self.gas_price,
-            starknet_contract_address=self.starknet_contract_address,
-            evm_contract_address=self.evm_contract_address,
-            calling_context=self.calling_context,
             sub_context=self.sub_context,
-            destroy_contracts_len=self.destroy_contracts_len,
-            destroy_contracts=self.destroy_contracts,
-            read_only=self.read_only,
+            reverted=self.reverted,
+            cold=self.cold,
             );
     }
 
-    // @notice Increment the program counter.
-    // @dev The program counter is incremented by the given value.
+    // @notice Update the storage cache of the current execution context.
+    // @dev Used to record the storage slots read and written by the context.
     // @param self The pointer to the execution context.
-    // @param inc_value The value to increment the program counter with.
+    // @param storage_cache The pointer to the new storage cache.
     // @return The pointer to the updated execution context.
-    func increment_program_counter(
-        self: model.ExecutionContext*, inc_value: felt
+    func update_storage_cache(
+        self: model.ExecutionContext*, storage_cache: model.StorageCache*
     ) -> model.ExecutionContext* {
-        return new model.ExecutionContext(
-            call_context=self.call_context,
-            program_counter=self.program_counter + inc_value,
-            stopped=self.stopped,
-            return_data=self.return_data,
-            return_data_len=self.return_data_len,
-            stack=self.stack,
-            memory=self.memory,
-            gas_used=self.gas_used,
-            gas_limit=self.gas_limit,
-            gas_price=self.gas_price,
-            starknet_contract_address=self.starknet_contract_address,
-            evm_contract_address=self.evm_contract_address,
-            calling_context=self.calling_context,
-            sub_context=self.sub_context,
-            destroy_contracts_len=self.destroy_contracts_len,
-            destroy_contracts=self.destroy_contracts,
-            read_only=self.read_only,
+        tempvar cold = new model.ColdState(
+            destroy_contracts_len=self.cold.destroy_contracts_len,
+            destroy_contracts=self.cold.destroy_contracts,
+            storage_cache=storage_cache,
+            registry_cache=self.cold.registry_cache,
+            access_set=self.cold.access_set,
+            keccak_segment=self.cold.keccak_segment,
+            journal=self.cold.journal,
             );
+        return update_cold(self, cold);
     }
 
-    // @notice Increment the gas used.
-    // @dev The gas used is incremented by the given value.
+    // @notice Update the registry cache of the current execution context.
+    // @dev Used to record the registry lookups of the context.
     // @param self The pointer to the execution context.
-    // @param inc_value The value to increment the gas used with.
+    // @param registry_cache The pointer to the new registry cache.
     // @return The pointer to the updated execution context.
-    func increment_gas_used(
-        self: model.ExecutionContext*, inc_value: felt
+    func update_registry_cache(
+        self: model.ExecutionContext*, registry_cache: model.RegistryCache*
     ) -> model.ExecutionContext* {
-        return new model.ExecutionContext(
-            call_context=self.call_context,
-            program_counter=self.program_counter,
-            stopped=self.stopped,
-            return_data=self.return_data,
-            return_data_len=self.return_data_len,
-            stack=self.stack,
-            memory=self.memory,
-            gas_used=self.gas_used + inc_value,
-            gas_limit=self.gas_limit,
-            gas_price=self.gas_price,
-            starknet_contract_address=self.starknet_contract_address,
-            evm_contract_address=self.evm_contract_address,
-            calling_context=self.calling_context,
-            sub_context=self.sub_context,
-            destroy_contracts_len=self.destroy_contracts_len,
-            destroy_contracts=self.destroy_contracts,
-            read_only=self.read_only,
+        tempvar cold = new model.ColdState(
+            destroy_contracts_len=self.cold.destroy_contracts_len,
+            destroy_contracts=self.cold.destroy_contracts,
+            storage_cache=self.cold.storage_cache,
+            registry_cache=registry_cache,
+            access_set=self.cold.access_set,
+            keccak_segment=self.cold.keccak_segment,
+            journal=self.cold.journal,
             );
+        return update_cold(self, cold);
     }
 
-    // @notice Update the child context of the current execution context.
-    // @dev The sub_context is updated with the given context.
+    // @notice Update the access set of the current execution context.
+    // @dev Used to record the addresses and storage slots accessed by the context.
     // @param self The pointer to the execution context.
-    // @param memory The pointer to the child context.
-    func update_sub_context(
-        self: model.ExecutionContext*, sub_context: model.ExecutionContext*
+    // @param access_set The pointer to the new access set.
+    // @return The pointer to the updated execution context.
+    func update_access_set(
+        self: model.ExecutionContext*, access_set: model.AccessSet*
     ) -> model.ExecutionContext* {
-        return new model.ExecutionContext(
-            call_context=self.call_context,
-            program_counter=self.program_counter,
-            stopped=self.stopped,
-            return_data=self.return_data,
-            return_data_len=self.return_data_len,
-            stack=self.stack,
-            memory=self.memory,
-            gas_used=self.gas_used,
-            gas_limit=self.gas_limit,
-            gas_price=self.gas_price,
-            starknet_contract_address=self.starknet_contract_address,
-            evm_contract_address=self.evm_contract_address,
-            calling_context=self.calling_context,
-            sub_context=sub_context,
-            destroy_contracts_len=self.destroy_contracts_len,
-            destroy_contracts=self.destroy_contracts,
-            read_only=self.read_only,
+        tempvar cold = new model.ColdState(
+            destroy_contracts_len=self.cold.destroy_contracts_len,
+            destroy_contracts=self.cold.destroy_contracts,
+            storage_cache=self.cold.storage_cache,
+            registry_cache=self.cold.registry_cache,
+            access_set=access_set,
+            keccak_segment=self.cold.keccak_segment,
+            journal=self.cold.journal,
             );
+        return update_cold(self, cold);
+    }
+
+    // @notice Update the journal of the current execution context.
+    // @dev Used to record a state change.
+    // @param self The pointer to the execution context.
+    // @param journal The pointer to the new journal.
+    // @return The pointer to the updated execution context.
+    func update_journal(
+        self: model.ExecutionContext*, journal: model.Journal*
+    ) -> model.ExecutionContext* {
+        tempvar cold = new model.ColdState(
+            destroy_contracts_len=self.cold.destroy_contracts_len,
+            destroy_contracts=self.cold.destroy_contracts,
+            storage_cache=self.cold.storage_cache,
+            registry_cache=self.cold.registry_cache,
+            access_set=self.cold.access_set,
+            keccak_segment=self.cold.keccak_segment,
+            journal=journal,
+            );
+        return update_cold(self, cold);
+    }
+
+    // @notice Mark an address as accessed by the current execution context, see EIP-2929.
+    // @dev The first access is journaled, so that the address is cold again if the context reverts.
+    // @param self The pointer to the execution context.
+    // @param address The evm address.
+    // @return The pointer to the updated execution context.
+    // @return The gas cost of the access, depending on whether the address was warm or cold.
+    func access_address(self: model.ExecutionContext*, address: felt) -> (
+        self: model.ExecutionContext*, gas_cost: felt
+    ) {
+        alloc_locals;
+        let (access_set, is_warm) = AccessSet.add_address(self.cold.access_set, address);
+        let self = update_access_set(self, access_set);
+        if (is_warm != FALSE) {
+            return (self, AccessSet.GAS_COST_WARM_ACCESS);
+        }
+
+        let journal = Journal.record_access(self.cold.journal, address);
+        let self = update_journal(self, journal);
+        return (self, AccessSet.GAS_COST_COLD_ADDRESS_ACCESS);
+    }
+
+    // @notice Mark a storage slot of the current contract as accessed, see EIP-2929.
+    // @dev The first access is journaled, so that the slot is cold again if the context reverts.
+    // @param self The pointer to the execution context.
+    // @param key The storage key.
+    // @return The pointer to the updated execution context.
+    // @return The gas cost of reading the slot, depending on whether it was warm or cold.
+    func access_storage_key{pedersen_ptr: HashBuiltin*}(
+        self: model.ExecutionContext*, key: Uint256
+    ) -> (self: model.ExecutionContext*, gas_cost: felt) {
+        alloc_locals;
+        let (access_set, slot_key, is_warm) = AccessSet.add_storage_key(
+            self.cold.access_set, self.environment.evm_contract_address, key
+        );
+        let self = update_access_set(self, access_set);
+        if (is_warm != FALSE) {
+            return (self, AccessSet.GAS_COST_WARM_ACCESS);
+        }
+
+        let journal = Journal.record_access(self.cold.journal, slot_key);
+        let self = update_journal(self, journal);
+        return (self, AccessSet.GAS_COST_COLD_SLOAD);
+    }
+
+    // @notice Update the keccak segment of the current execution context.
+    // @dev Used to record the keccak computations of the context.
+    // @param self The pointer to the execution context.
+    // @param keccak_segment The pointer to the new keccak segment.
+    // @return The pointer to the updated execution context.
+    func update_keccak_segment(
+        self: model.ExecutionContext*, keccak_segment: model.KeccakSegment*
+    ) -> model.ExecutionContext* {
+        tempvar cold = new model.ColdState(
+            destroy_contracts_len=self.cold.destroy_contracts_len,
+            destroy_contracts=self.cold.destroy_contracts,
+            storage_cache=self.cold.storage_cache,
+            registry_cache=self.cold.registry_cache,
+            access_set=self.cold.access_set,
+            keccak_segment=keccak_segment,
+            journal=self.cold.journal,
+            );
+        return update_cold(self, cold);
+    }
+
+    // @notice Update the end of the keccak segment after keccak computations.
+    // @param self The pointer to the execution context.
+    // @param keccak_ptr The new end of the keccak segment.
+    // @return The pointer to the updated execution context.
+    func update_keccak_ptr(
+        self: model.ExecutionContext*, keccak_ptr: felt*
+    ) -> model.ExecutionContext* {
+        tempvar keccak_segment = new model.KeccakSegment(
+            keccak_ptr_start=self.cold.keccak_segment.keccak_ptr_start,
+            keccak_ptr=keccak_ptr,
+            memo_start=self.cold.keccak_segment.memo_start,
+            memo=self.cold.keccak_segment.memo,
+            );
+        return update_keccak_segment(self, keccak_segment);
+    }
+
+    // @notice Initialize the keccak segment of a transaction.
+    // @return The pointer to the keccak segment.
+    func init_keccak_segment() -> model.KeccakSegment* {
+        alloc_locals;
+        let (local keccak_ptr: felt*) = alloc();
+        let (memo_start: DictAccess*) = default_dict_new(0);
+        return new model.KeccakSegment(
+            keccak_ptr_start=keccak_ptr, keccak_ptr=keccak_ptr, memo_start=memo_start, memo=memo_start
+            );
+    }
+
+    // @notice Finalize the keccak segment of the transaction.
+    // @dev Verifies all the keccak computations of the transaction at once.
+    // @param self The pointer to the execution context.
+    func finalize_keccak_segment{range_check_ptr, bitwise_ptr: BitwiseBuiltin*}(
+        self: model.ExecutionContext*
+    ) {
+        alloc_locals;
+        let keccak_segment = self.cold.keccak_segment;
+        default_dict_finalize(keccak_segment.memo_start, keccak_segment.memo, 0);
+        finalize_keccak(
+            keccak_ptr_start=keccak_segment.keccak_ptr_start,
+            keccak_ptr_end=keccak_segment.keccak_ptr,
+        );
+        return ();
     }
 
     // @notice Update the starknet and evm contract addresses.
@@ -470,41 +665,19 @@ namespace ExecutionContext {
     func update_addresses(
         self: model.ExecutionContext*, starknet_contract_address: felt, evm_contract_address: felt
     ) -> model.ExecutionContext* {
-        return new model.ExecutionContext(
-            call_context=self.call_context,
-            program_counter=self.program_counter,
-            stopped=self.stopped,
-            return_data=self.return_data,
-            return_data_len=self.return_data_len,
-            stack=self.stack,
-            memory=self.memory,
-            gas_used=self.gas_used,
-            gas_limit=self.gas_limit,
-            gas_price=self.gas_price,
+        tempvar environment = new model.Environment(
+            call_context=self.environment.call_context,
+            gas_limit=self.environment.gas_limit,
+            gas_price=self.environment.gas_price,
             starknet_contract_address=starknet_contract_address,
             evm_contract_address=evm_contract_address,
-            calling_context=self.calling_context,
-            sub_context=self.sub_context,
-            destroy_contracts_len=self.destroy_contracts_len,
-            destroy_contracts=self.destroy_contracts,
-            read_only=self.read_only,
+            calling_context=self.environment.calling_context,
+            read_only=self.environment.read_only,
+            ret_offset=self.environment.ret_offset,
+            ret_size=self.environment.ret_size,
             );
-    }
-
-    // @notice Update the array of contracts to destroy.
-    // @param self The pointer to the execution context.
-    // @param destroy_contracts_len Array length of destroy_contracts to add.
-    // @param destroy_contracts The pointer to the new array of contracts to destroy.
-    func push_to_destroy_contracts(
-        self: model.ExecutionContext*, destroy_contracts_len: felt, destroy_contracts: felt*
-    ) -> model.ExecutionContext* {
-        Helpers.fill_array(
-            fill_len=destroy_contracts_len,
-            input_arr=destroy_contracts,
-            output_arr=self.destroy_contracts + self.destroy_contracts_len,
-        );
         return new model.ExecutionContext(
-            call_context=self.call_context,
+            environment=environment,
             program_counter=self.program_counter,
             stopped=self.stopped,
             return_data=self.return_data,
@@ -512,15 +685,9 @@ namespace ExecutionContext {
             stack=self.stack,
             memory=self.memory,
             gas_used=self.gas_used,
-            gas_limit=self.gas_limit,
-            gas_price=self.gas_price,
-            starknet_contract_address=self.starknet_contract_address,
-            evm_contract_address=self.evm_contract_address,
-            calling_context=self.calling_context,
             sub_context=self.sub_context,
-            destroy_contracts_len=self.destroy_contracts_len + destroy_contracts_len,
-            destroy_contracts=self.destroy_contracts,
-            read_only=self.read_only,
+            reverted=self.reverted,
+            cold=self.cold,
             );
     }
 
@@ -530,9 +697,18 @@ namespace ExecutionContext {
     func push_to_destroy_contract(
         self: model.ExecutionContext*, destroy_contract: felt
     ) -> model.ExecutionContext* {
-        assert [self.destroy_contracts + self.destroy_contracts_len] = destroy_contract;
+        assert [self.cold.destroy_contracts + self.cold.destroy_contracts_len] = destroy_contract;
+        tempvar cold = new model.ColdState(
+            destroy_contracts_len=self.cold.destroy_contracts_len + 1,
+            destroy_contracts=self.cold.destroy_contracts,
+            storage_cache=self.cold.storage_cache,
+            registry_cache=self.cold.registry_cache,
+            access_set=self.cold.access_set,
+            keccak_segment=self.cold.keccak_segment,
+            journal=self.cold.journal,
+            );
         return new model.ExecutionContext(
-            call_context=self.call_context,
+            environment=self.environment,
             program_counter=self.program_counter,
             stopped=TRUE,
             return_data=self.return_data,
@@ -540,15 +716,9 @@ namespace ExecutionContext {
             stack=self.stack,
             memory=self.memory,
             gas_used=self.gas_used,
-            gas_limit=self.gas_limit,
-            gas_price=self.gas_price,
-            starknet_contract_address=self.starknet_contract_address,
-            evm_contract_address=self.evm_contract_address,
-            calling_context=self.calling_context,
             sub_context=self.sub_context,
-            destroy_contracts_len=self.destroy_contracts_len + 1,
-            destroy_contracts=self.destroy_contracts,
-            read_only=self.read_only,
+            reverted=self.reverted,
+            cold=cold,
             );
     }
 
@@ -563,24 +733,41 @@ namespace ExecutionContext {
 
     // @notice Update the program counter.
     // @dev The program counter is updated to a given value. This is only ever called by JUMP or JUMPI
+    // @dev A sub context jumping outside of the code or to something other than a JUMPDEST reverts,
+    // @dev consuming all its gas. Such a jump in the root context fails the whole transaction.
     // @param self The pointer to the execution context.
     // @param new_pc_offset The value to update the program counter by.
     // @return The pointer to the updated execution context.
-    func update_program_counter{range_check_ptr}(
+    func update_program_counter{range_check_ptr, bitwise_ptr: BitwiseBuiltin*}(
         self: model.ExecutionContext*, new_pc_offset: felt
     ) -> model.ExecutionContext* {
         alloc_locals;
-        // Revert if new_value points outside of the code range
-        with_attr error_message("Kakarot: new pc target out of range") {
-            assert_nn(new_pc_offset);
-            assert_le(new_pc_offset, self.call_context.bytecode_len - 1);
+        // Halt if new_value points outside of the code range
+        let is_in_range = is_nn_le(new_pc_offset, self.environment.call_context.bytecode_len - 1);
+        if (is_in_range == FALSE) {
+            let is_parent_root = is_root(self.environment.calling_context);
+            with_attr error_message("Kakarot: new pc target out of range") {
+                assert is_parent_root = FALSE;
+            }
+            let ctx = out_of_gas(self);
+            return ctx;
         }
 
-        // Revert if new pc_offset points to something other then JUMPDEST
-        check_jumpdest(self=self, pc_location=new_pc_offset);
+        // Halt if new pc_offset points to something other then JUMPDEST
+        let is_valid = JumpdestBitmap.is_valid(
+            self.environment.call_context.valid_jumpdests, new_pc_offset
+        );
+        if (is_valid == FALSE) {
+            let is_parent_root = is_root(self.environment.calling_context);
+            with_attr error_message("Kakarot: JUMPed to pc offset is not JUMPDEST") {
+                assert is_parent_root = FALSE;
+            }
+            let ctx = out_of_gas(self);
+            return ctx;
+        }
 
         return new model.ExecutionContext(
-            call_context=self.call_context,
+            environment=self.environment,
             program_counter=new_pc_offset,
             stopped=self.stopped,
             return_data=self.return_data,
@@ -588,34 +775,10 @@ namespace ExecutionContext {
             stack=self.stack,
             memory=self.memory,
             gas_used=self.gas_used,
-            gas_limit=self.gas_limit,
-            gas_price=self.gas_price,
-            starknet_contract_address=self.starknet_contract_address,
-            evm_contract_address=self.evm_contract_address,
-            calling_context=self.calling_context,
             sub_context=self.sub_context,
-            destroy_contracts_len=self.destroy_contracts_len,
-            destroy_contracts=self.destroy_contracts,
-            read_only=self.read_only,
+            reverted=self.reverted,
+            cold=self.cold,
             );
     }
 
-    // @notice Check if location is a valid Jump destination
-    // @dev Extract the byte that the current pc is pointing to and revert if it is not a JUMPDEST operation.
-    // @param self The pointer to the execution context
-    // @param pc_location location to check
-    func check_jumpdest(self: model.ExecutionContext*, pc_location: felt) {
-        alloc_locals;
-        let (local output: felt*) = alloc();
-
-        // Copy bytecode slice
-        memcpy(dst=output, src=self.call_context.bytecode + pc_location, len=1);
-
-        // Revert if current pc location is not JUMPDEST
-        with_attr error_message("Kakarot: JUMPed to pc offset is not JUMPDEST") {
-            assert [output] = 0x5b;
-        }
-
-        return ();
-    }
 }
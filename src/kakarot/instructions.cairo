@@ -7,7 +7,7 @@ from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
 from starkware.cairo.common.invoke import invoke
 from starkware.cairo.common.math import assert_nn
-from starkware.cairo.common.math_cmp import is_le
+from starkware.cairo.common.math_cmp import is_le, is_nn_le
 from starkware.cairo.common.memcpy import memcpy
 from starkware.cairo.common.bool import FALSE
 from starkware.cairo.common.registers import get_ap
@@ -33,10 +33,14 @@ from kakarot.instructions.system_operations import (
     SelfDestructHelper,
 )
 from kakarot.interfaces.interfaces import IEvmContract
+from kakarot.journal import Journal
 from kakarot.memory import Memory
 from kakarot.model import model
 from kakarot.precompiles.precompiles import Precompiles
 from kakarot.stack import Stack
+from kakarot.access_set import AccessSet
+from kakarot.registry_cache import RegistryCache
+from kakarot.storage_cache import StorageCache
 
 // @title EVM instructions processing.
 // @notice This file contains functions related to the processing of EVM instructions.
@@ -59,12 +63,20 @@ namespace EVMInstructions {
         let pc = ctx.program_counter;
         local opcode;
 
-        let is_pc_ge_code_len = is_le(ctx.call_context.bytecode_len, pc);
+        let is_pc_ge_code_len = is_le(ctx.environment.call_context.bytecode_len, pc);
 
         if (is_pc_ge_code_len != FALSE) {
             assert opcode = 0;
         } else {
-            assert opcode = [ctx.call_context.bytecode + pc];
+            assert opcode = [ctx.environment.call_context.bytecode + pc];
+        }
+
+        // Halt before executing an opcode that would underflow or overflow the stack
+        let (min_len_16bytes, span_len_16bytes) = stack_bounds(opcode);
+        let is_in_bounds = is_nn_le(ctx.stack.len_16bytes - min_len_16bytes, span_len_16bytes);
+        if (is_in_bounds == FALSE) {
+            let ctx = stack_error(ctx, min_len_16bytes);
+            return ctx;
         }
 
         // Compute the corresponding offset in the jump table:
@@ -72,7 +84,7 @@ namespace EVMInstructions {
         tempvar offset = 1 + 3 * opcode;
 
         // move program counter + 1 after opcode is read
-        let ctx = ExecutionContext.increment_program_counter(self=ctx, inc_value=1);
+        let ctx = ExecutionContext.apply_changes(ctx, ctx.stack, ctx.memory, 1, 0);
 
         // Prepare arguments
         [ap] = syscall_ptr, ap++;
@@ -598,6 +610,8 @@ namespace EVMInstructions {
     }
 
     // @notice Iteratively decode and execute the bytecode of an ExecutionContext
+    // @dev Opcodes are executed by run_until_stopped, the calling context is only
+    // @dev looked at once the current context is stopped.
     // @param ctx The pointer to the execution context.
     // @return The pointer to the updated execution context.
     func run{
@@ -607,46 +621,664 @@ namespace EVMInstructions {
         bitwise_ptr: BitwiseBuiltin*,
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
         alloc_locals;
-        // Decode and execute
-        let ctx: model.ExecutionContext* = decode_and_execute(ctx=ctx);
+        // Decode and execute until the context stops
+        let ctx: model.ExecutionContext* = run_until_stopped(ctx=ctx);
 
-        // Check if execution should be stopped
-        let stopped: felt = ExecutionContext.is_stopped(self=ctx);
-        let is_parent_root: felt = ExecutionContext.is_root(self=ctx.calling_context);
+        let is_parent_root: felt = ExecutionContext.is_root(self=ctx.environment.calling_context);
 
         // Terminate execution
-        if (stopped != FALSE) {
-            if (is_parent_root != FALSE) {
-                if (ctx.destroy_contracts_len != 0) {
-                    let ctx = SelfDestructHelper.finalize(ctx);
-                    return ctx;
-                }
+        if (is_parent_root != FALSE) {
+            // Write the storage updates and make the transfers of the whole transaction
+            StorageCache.commit(ctx.cold.storage_cache);
+            Journal.commit(ctx.cold.journal);
+            RegistryCache.finalize(ctx.cold.registry_cache);
+            AccessSet.finalize(ctx.cold.access_set);
+            ExecutionContext.finalize_keccak_segment(ctx);
+            if (ctx.cold.destroy_contracts_len != 0) {
+                let ctx = SelfDestructHelper.finalize(ctx);
                 return ctx;
-            } else {
-                let is_precompile = Precompiles.is_precompile(address=ctx.evm_contract_address);
-                if (is_precompile != FALSE) {
-                    let ctx = CallHelper.finalize_calling_context(ctx);
-                    return run(ctx=ctx);
-                }
-                let (bytecode_len) = IEvmContract.bytecode_len(
-                    contract_address=ctx.starknet_contract_address
-                );
-                if (bytecode_len == 0) {
-                    let ctx = CreateHelper.finalize_calling_context(ctx);
-                    return run(ctx=ctx);
-                } else {
-                    let ctx = CallHelper.finalize_calling_context(ctx);
-                    return run(ctx=ctx);
-                }
             }
+            return ctx;
+        }
+
+        // Go back to the calling context
+        let is_precompile = Precompiles.is_precompile(address=ctx.environment.evm_contract_address);
+        if (is_precompile != FALSE) {
+            let ctx = CallHelper.finalize_calling_context(ctx);
+            return run(ctx=ctx);
+        }
+        let (bytecode_len) = IEvmContract.bytecode_len(
+            contract_address=ctx.environment.starknet_contract_address
+        );
+        if (bytecode_len == 0) {
+            let ctx = CreateHelper.finalize_calling_context(ctx);
+            return run(ctx=ctx);
+        } else {
+            let ctx = CallHelper.finalize_calling_context(ctx);
+            return run(ctx=ctx);
+        }
+    }
+
+    // @notice Decode and execute opcodes until the execution context is stopped.
+    // @dev This is a loop rather than a recursion: the implicit arguments and the context
+    // @dev returned by decode_and_execute are left on top of the stack and directly used as
+    // @dev the arguments of the gas check, and then of the next call.
+    // @param ctx The pointer to the execution context.
+    // @return The pointer to the stopped execution context.
+    func run_until_stopped{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
+        // Loop state: [ap - 5] to [ap - 1] hold the arguments of decode_and_execute.
+        [ap] = syscall_ptr, ap++;
+        [ap] = pedersen_ptr, ap++;
+        [ap] = range_check_ptr, ap++;
+        [ap] = bitwise_ptr, ap++;
+        [ap] = ctx, ap++;
+
+        loop:
+        call decode_and_execute;
+        call check_gas;
+        let ctx = cast([ap - 1], model.ExecutionContext*);
+        tempvar stopped = ctx.stopped;
+        jmp end if stopped != 0;
+
+        // Copy the returned values back on top of the stack for the next iteration.
+        [ap] = [ap - 6], ap++;
+        [ap] = [ap - 6], ap++;
+        [ap] = [ap - 6], ap++;
+        [ap] = [ap - 6], ap++;
+        [ap] = [ap - 6], ap++;
+        jmp loop;
+
+        end:
+        let syscall_ptr = cast([ap - 6], felt*);
+        let pedersen_ptr = cast([ap - 5], HashBuiltin*);
+        let range_check_ptr = [ap - 4];
+        let bitwise_ptr = cast([ap - 3], BitwiseBuiltin*);
+        let ctx = cast([ap - 2], model.ExecutionContext*);
+        return ctx;
+    }
+
+    // @notice Halt the execution context if it used more gas than its gas limit.
+    // @dev An out of gas sub context reverts, consuming all its gas. As for a REVERT, running out
+    // @dev of gas in the root context fails the whole transaction.
+    // @param ctx The pointer to the execution context.
+    // @return The pointer to the execution context, stopped if it ran out of gas.
+    func check_gas{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
+        let is_out_of_gas = is_le(ctx.environment.gas_limit + 1, ctx.gas_used);
+        if (is_out_of_gas == FALSE) {
+            return ctx;
+        }
+
+        let is_parent_root = ExecutionContext.is_root(ctx.environment.calling_context);
+        with_attr error_message("Kakarot: OutOfGas") {
+            assert is_parent_root = FALSE;
+        }
+        let ctx = ExecutionContext.out_of_gas(ctx);
+        return ctx;
+    }
+
+    // @notice Halt the execution context on a stack underflow or overflow.
+    // @dev A sub context reverts, consuming all its gas. A stack error in the root context fails
+    // @dev the whole transaction.
+    // @param ctx The pointer to the execution context.
+    // @param min_len_16bytes The minimal stack size of the opcode, see stack_bounds.
+    // @return The pointer to the stopped execution context.
+    func stack_error{range_check_ptr}(
+        ctx: model.ExecutionContext*, min_len_16bytes: felt
+    ) -> model.ExecutionContext* {
+        let is_parent_root = ExecutionContext.is_root(ctx.environment.calling_context);
+        if (is_parent_root == FALSE) {
+            let ctx = ExecutionContext.out_of_gas(ctx);
+            return ctx;
+        }
+
+        let is_underflow = is_le(ctx.stack.len_16bytes + 1, min_len_16bytes);
+        with_attr error_message("Kakarot: StackUnderflow") {
+            assert is_underflow = FALSE;
         }
+        with_attr error_message("Kakarot: StackOverflow") {
+            assert 0 = 1;
+        }
+        return ctx;
+    }
 
-        // Continue execution
-        return run(ctx=ctx);
+    // @notice Return the stack sizes, in 16 bytes units, for which an opcode neither underflows
+    // @notice nor overflows the stack.
+    // @dev The minimal size is twice the number of stack inputs. The maximal size leaves room
+    // @dev for the words pushed on top of the inputs within the 1024 words limit.
+    // @param opcode The opcode.
+    // @return The minimal stack size and the number of allowed sizes above it.
+    func stack_bounds(opcode: felt) -> (min_len_16bytes: felt, span_len_16bytes: felt) {
+        let (stack_bounds_address) = get_label_location(stack_bounds_table);
+        return (stack_bounds_address[2 * opcode], stack_bounds_address[2 * opcode + 1]);
+
+        stack_bounds_table:
+        dw 0;  // 0x0 STOP
+        dw 2048;
+        dw 4;  // 0x1 ADD
+        dw 2044;
+        dw 4;  // 0x2 MUL
+        dw 2044;
+        dw 4;  // 0x3 SUB
+        dw 2044;
+        dw 4;  // 0x4 DIV
+        dw 2044;
+        dw 4;  // 0x5 SDIV
+        dw 2044;
+        dw 4;  // 0x6 MOD
+        dw 2044;
+        dw 4;  // 0x7 SMOD
+        dw 2044;
+        dw 6;  // 0x8 ADDMOD
+        dw 2042;
+        dw 6;  // 0x9 MULMOD
+        dw 2042;
+        dw 4;  // 0xa EXP
+        dw 2044;
+        dw 4;  // 0xb SIGNEXTEND
+        dw 2044;
+        dw 0;  // 0xc unknown
+        dw 2048;
+        dw 0;  // 0xd unknown
+        dw 2048;
+        dw 0;  // 0xe unknown
+        dw 2048;
+        dw 0;  // 0xf unknown
+        dw 2048;
+        dw 4;  // 0x10 LT
+        dw 2044;
+        dw 4;  // 0x11 GT
+        dw 2044;
+        dw 4;  // 0x12 SLT
+        dw 2044;
+        dw 4;  // 0x13 SGT
+        dw 2044;
+        dw 4;  // 0x14 EQ
+        dw 2044;
+        dw 2;  // 0x15 ISZERO
+        dw 2046;
+        dw 4;  // 0x16 AND
+        dw 2044;
+        dw 4;  // 0x17 OR
+        dw 2044;
+        dw 4;  // 0x18 XOR
+        dw 2044;
+        dw 2;  // 0x19 NOT
+        dw 2046;
+        dw 4;  // 0x1a BYTE
+        dw 2044;
+        dw 4;  // 0x1b SHL
+        dw 2044;
+        dw 4;  // 0x1c SHR
+        dw 2044;
+        dw 4;  // 0x1d SAR
+        dw 2044;
+        dw 0;  // 0x1e unknown
+        dw 2048;
+        dw 0;  // 0x1f unknown
+        dw 2048;
+        dw 4;  // 0x20 SHA3
+        dw 2044;
+        dw 0;  // 0x21 unknown
+        dw 2048;
+        dw 0;  // 0x22 unknown
+        dw 2048;
+        dw 0;  // 0x23 unknown
+        dw 2048;
+        dw 0;  // 0x24 unknown
+        dw 2048;
+        dw 0;  // 0x25 unknown
+        dw 2048;
+        dw 0;  // 0x26 unknown
+        dw 2048;
+        dw 0;  // 0x27 unknown
+        dw 2048;
+        dw 0;  // 0x28 unknown
+        dw 2048;
+        dw 0;  // 0x29 unknown
+        dw 2048;
+        dw 0;  // 0x2a unknown
+        dw 2048;
+        dw 0;  // 0x2b unknown
+        dw 2048;
+        dw 0;  // 0x2c unknown
+        dw 2048;
+        dw 0;  // 0x2d unknown
+        dw 2048;
+        dw 0;  // 0x2e unknown
+        dw 2048;
+        dw 0;  // 0x2f unknown
+        dw 2048;
+        dw 0;  // 0x30 ADDRESS
+        dw 2046;
+        dw 2;  // 0x31 BALANCE
+        dw 2046;
+        dw 0;  // 0x32 ORIGIN
+        dw 2046;
+        dw 0;  // 0x33 CALLER
+        dw 2046;
+        dw 0;  // 0x34 CALLVALUE
+        dw 2046;
+        dw 2;  // 0x35 CALLDATALOAD
+        dw 2046;
+        dw 0;  // 0x36 CALLDATASIZE
+        dw 2046;
+        dw 6;  // 0x37 CALLDATACOPY
+        dw 2042;
+        dw 0;  // 0x38 CODESIZE
+        dw 2046;
+        dw 6;  // 0x39 CODECOPY
+        dw 2042;
+        dw 0;  // 0x3a GASPRICE
+        dw 2046;
+        dw 2;  // 0x3b EXTCODESIZE
+        dw 2046;
+        dw 8;  // 0x3c EXTCODECOPY
+        dw 2040;
+        dw 0;  // 0x3d RETURNDATASIZE
+        dw 2046;
+        dw 6;  // 0x3e RETURNDATACOPY
+        dw 2042;
+        dw 2;  // 0x3f EXTCODEHASH
+        dw 2046;
+        dw 2;  // 0x40 BLOCKHASH
+        dw 2046;
+        dw 0;  // 0x41 COINBASE
+        dw 2046;
+        dw 0;  // 0x42 TIMESTAMP
+        dw 2046;
+        dw 0;  // 0x43 NUMBER
+        dw 2046;
+        dw 0;  // 0x44 DIFFICULTY
+        dw 2046;
+        dw 0;  // 0x45 GASLIMIT
+        dw 2046;
+        dw 0;  // 0x46 CHAINID
+        dw 2046;
+        dw 0;  // 0x47 SELFBALANCE
+        dw 2046;
+        dw 0;  // 0x48 BASEFEE
+        dw 2046;
+        dw 0;  // 0x49 unknown
+        dw 2048;
+        dw 0;  // 0x4a unknown
+        dw 2048;
+        dw 0;  // 0x4b unknown
+        dw 2048;
+        dw 0;  // 0x4c unknown
+        dw 2048;
+        dw 0;  // 0x4d unknown
+        dw 2048;
+        dw 0;  // 0x4e unknown
+        dw 2048;
+        dw 0;  // 0x4f unknown
+        dw 2048;
+        dw 2;  // 0x50 POP
+        dw 2046;
+        dw 2;  // 0x51 MLOAD
+        dw 2046;
+        dw 4;  // 0x52 MSTORE
+        dw 2044;
+        dw 4;  // 0x53 MSTORE8
+        dw 2044;
+        dw 2;  // 0x54 SLOAD
+        dw 2046;
+        dw 4;  // 0x55 SSTORE
+        dw 2044;
+        dw 2;  // 0x56 JUMP
+        dw 2046;
+        dw 4;  // 0x57 JUMPI
+        dw 2044;
+        dw 0;  // 0x58 PC
+        dw 2046;
+        dw 0;  // 0x59 MSIZE
+        dw 2046;
+        dw 0;  // 0x5a GAS
+        dw 2046;
+        dw 0;  // 0x5b JUMPDEST
+        dw 2048;
+        dw 0;  // 0x5c unknown
+        dw 2048;
+        dw 0;  // 0x5d unknown
+        dw 2048;
+        dw 0;  // 0x5e unknown
+        dw 2048;
+        dw 0;  // 0x5f unknown
+        dw 2048;
+        dw 0;  // 0x60 PUSH1
+        dw 2046;
+        dw 0;  // 0x61 PUSH2
+        dw 2046;
+        dw 0;  // 0x62 PUSH3
+        dw 2046;
+        dw 0;  // 0x63 PUSH4
+        dw 2046;
+        dw 0;  // 0x64 PUSH5
+        dw 2046;
+        dw 0;  // 0x65 PUSH6
+        dw 2046;
+        dw 0;  // 0x66 PUSH7
+        dw 2046;
+        dw 0;  // 0x67 PUSH8
+        dw 2046;
+        dw 0;  // 0x68 PUSH9
+        dw 2046;
+        dw 0;  // 0x69 PUSH10
+        dw 2046;
+        dw 0;  // 0x6a PUSH11
+        dw 2046;
+        dw 0;  // 0x6b PUSH12
+        dw 2046;
+        dw 0;  // 0x6c PUSH13
+        dw 2046;
+        dw 0;  // 0x6d PUSH14
+        dw 2046;
+        dw 0;  // 0x6e PUSH15
+        dw 2046;
+        dw 0;  // 0x6f PUSH16
+        dw 2046;
+        dw 0;  // 0x70 PUSH17
+        dw 2046;
+        dw 0;  // 0x71 PUSH18
+        dw 2046;
+        dw 0;  // 0x72 PUSH19
+        dw 2046;
+        dw 0;  // 0x73 PUSH20
+        dw 2046;
+        dw 0;  // 0x74 PUSH21
+        dw 2046;
+        dw 0;  // 0x75 PUSH22
+        dw 2046;
+        dw 0;  // 0x76 PUSH23
+        dw 2046;
+        dw 0;  // 0x77 PUSH24
+        dw 2046;
+        dw 0;  // 0x78 PUSH25
+        dw 2046;
+        dw 0;  // 0x79 PUSH26
+        dw 2046;
+        dw 0;  // 0x7a PUSH27
+        dw 2046;
+        dw 0;  // 0x7b PUSH28
+        dw 2046;
+        dw 0;  // 0x7c PUSH29
+        dw 2046;
+        dw 0;  // 0x7d PUSH30
+        dw 2046;
+        dw 0;  // 0x7e PUSH31
+        dw 2046;
+        dw 0;  // 0x7f PUSH32
+        dw 2046;
+        dw 2;  // 0x80 DUP1
+        dw 2044;
+        dw 4;  // 0x81 DUP2
+        dw 2042;
+        dw 6;  // 0x82 DUP3
+        dw 2040;
+        dw 8;  // 0x83 DUP4
+        dw 2038;
+        dw 10;  // 0x84 DUP5
+        dw 2036;
+        dw 12;  // 0x85 DUP6
+        dw 2034;
+        dw 14;  // 0x86 DUP7
+        dw 2032;
+        dw 16;  // 0x87 DUP8
+        dw 2030;
+        dw 18;  // 0x88 DUP9
+        dw 2028;
+        dw 20;  // 0x89 DUP10
+        dw 2026;
+        dw 22;  // 0x8a DUP11
+        dw 2024;
+        dw 24;  // 0x8b DUP12
+        dw 2022;
+        dw 26;  // 0x8c DUP13
+        dw 2020;
+        dw 28;  // 0x8d DUP14
+        dw 2018;
+        dw 30;  // 0x8e DUP15
+        dw 2016;
+        dw 32;  // 0x8f DUP16
+        dw 2014;
+        dw 4;  // 0x90 SWAP1
+        dw 2044;
+        dw 6;  // 0x91 SWAP2
+        dw 2042;
+        dw 8;  // 0x92 SWAP3
+        dw 2040;
+        dw 10;  // 0x93 SWAP4
+        dw 2038;
+        dw 12;  // 0x94 SWAP5
+        dw 2036;
+        dw 14;  // 0x95 SWAP6
+        dw 2034;
+        dw 16;  // 0x96 SWAP7
+        dw 2032;
+        dw 18;  // 0x97 SWAP8
+        dw 2030;
+        dw 20;  // 0x98 SWAP9
+        dw 2028;
+        dw 22;  // 0x99 SWAP10
+        dw 2026;
+        dw 24;  // 0x9a SWAP11
+        dw 2024;
+        dw 26;  // 0x9b SWAP12
+        dw 2022;
+        dw 28;  // 0x9c SWAP13
+        dw 2020;
+        dw 30;  // 0x9d SWAP14
+        dw 2018;
+        dw 32;  // 0x9e SWAP15
+        dw 2016;
+        dw 34;  // 0x9f SWAP16
+        dw 2014;
+        dw 4;  // 0xa0 LOG0
+        dw 2044;
+        dw 6;  // 0xa1 LOG1
+        dw 2042;
+        dw 8;  // 0xa2 LOG2
+        dw 2040;
+        dw 10;  // 0xa3 LOG3
+        dw 2038;
+        dw 12;  // 0xa4 LOG4
+        dw 2036;
+        dw 0;  // 0xa5 unknown
+        dw 2048;
+        dw 0;  // 0xa6 unknown
+        dw 2048;
+        dw 0;  // 0xa7 unknown
+        dw 2048;
+        dw 0;  // 0xa8 unknown
+        dw 2048;
+        dw 0;  // 0xa9 unknown
+        dw 2048;
+        dw 0;  // 0xaa unknown
+        dw 2048;
+        dw 0;  // 0xab unknown
+        dw 2048;
+        dw 0;  // 0xac unknown
+        dw 2048;
+        dw 0;  // 0xad unknown
+        dw 2048;
+        dw 0;  // 0xae unknown
+        dw 2048;
+        dw 0;  // 0xaf unknown
+        dw 2048;
+        dw 0;  // 0xb0 unknown
+        dw 2048;
+        dw 0;  // 0xb1 unknown
+        dw 2048;
+        dw 0;  // 0xb2 unknown
+        dw 2048;
+        dw 0;  // 0xb3 unknown
+        dw 2048;
+        dw 0;  // 0xb4 unknown
+        dw 2048;
+        dw 0;  // 0xb5 unknown
+        dw 2048;
+        dw 0;  // 0xb6 unknown
+        dw 2048;
+        dw 0;  // 0xb7 unknown
+        dw 2048;
+        dw 0;  // 0xb8 unknown
+        dw 2048;
+        dw 0;  // 0xb9 unknown
+        dw 2048;
+        dw 0;  // 0xba unknown
+        dw 2048;
+        dw 0;  // 0xbb unknown
+        dw 2048;
+        dw 0;  // 0xbc unknown
+        dw 2048;
+        dw 0;  // 0xbd unknown
+        dw 2048;
+        dw 0;  // 0xbe unknown
+        dw 2048;
+        dw 0;  // 0xbf unknown
+        dw 2048;
+        dw 0;  // 0xc0 unknown
+        dw 2048;
+        dw 0;  // 0xc1 unknown
+        dw 2048;
+        dw 0;  // 0xc2 unknown
+        dw 2048;
+        dw 0;  // 0xc3 unknown
+        dw 2048;
+        dw 0;  // 0xc4 unknown
+        dw 2048;
+        dw 0;  // 0xc5 unknown
+        dw 2048;
+        dw 0;  // 0xc6 unknown
+        dw 2048;
+        dw 0;  // 0xc7 unknown
+        dw 2048;
+        dw 0;  // 0xc8 unknown
+        dw 2048;
+        dw 0;  // 0xc9 unknown
+        dw 2048;
+        dw 0;  // 0xca unknown
+        dw 2048;
+        dw 0;  // 0xcb unknown
+        dw 2048;
+        dw 0;  // 0xcc unknown
+        dw 2048;
+        dw 0;  // 0xcd unknown
+        dw 2048;
+        dw 0;  // 0xce unknown
+        dw 2048;
+        dw 0;  // 0xcf unknown
+        dw 2048;
+        dw 0;  // 0xd0 unknown
+        dw 2048;
+        dw 0;  // 0xd1 unknown
+        dw 2048;
+        dw 0;  // 0xd2 unknown
+        dw 2048;
+        dw 0;  // 0xd3 unknown
+        dw 2048;
+        dw 0;  // 0xd4 unknown
+        dw 2048;
+        dw 0;  // 0xd5 unknown
+        dw 2048;
+        dw 0;  // 0xd6 unknown
+        dw 2048;
+        dw 0;  // 0xd7 unknown
+        dw 2048;
+        dw 0;  // 0xd8 unknown
+        dw 2048;
+        dw 0;  // 0xd9 unknown
+        dw 2048;
+        dw 0;  // 0xda unknown
+        dw 2048;
+        dw 0;  // 0xdb unknown
+        dw 2048;
+        dw 0;  // 0xdc unknown
+        dw 2048;
+        dw 0;  // 0xdd unknown
+        dw 2048;
+        dw 0;  // 0xde unknown
+        dw 2048;
+        dw 0;  // 0xdf unknown
+        dw 2048;
+        dw 0;  // 0xe0 unknown
+        dw 2048;
+        dw 0;  // 0xe1 unknown
+        dw 2048;
+        dw 0;  // 0xe2 unknown
+        dw 2048;
+        dw 0;  // 0xe3 unknown
+        dw 2048;
+        dw 0;  // 0xe4 unknown
+        dw 2048;
+        dw 0;  // 0xe5 unknown
+        dw 2048;
+        dw 0;  // 0xe6 unknown
+        dw 2048;
+        dw 0;  // 0xe7 unknown
+        dw 2048;
+        dw 0;  // 0xe8 unknown
+        dw 2048;
+        dw 0;  // 0xe9 unknown
+        dw 2048;
+        dw 0;  // 0xea unknown
+        dw 2048;
+        dw 0;  // 0xeb unknown
+        dw 2048;
+        dw 0;  // 0xec unknown
+        dw 2048;
+        dw 0;  // 0xed unknown
+        dw 2048;
+        dw 0;  // 0xee unknown
+        dw 2048;
+        dw 0;  // 0xef unknown
+        dw 2048;
+        dw 6;  // 0xf0 CREATE
+        dw 2042;
+        dw 14;  // 0xf1 CALL
+        dw 2034;
+        dw 14;  // 0xf2 CALLCODE
+        dw 2034;
+        dw 4;  // 0xf3 RETURN
+        dw 2044;
+        dw 12;  // 0xf4 DELEGATECALL
+        dw 2036;
+        dw 8;  // 0xf5 CREATE2
+        dw 2040;
+        dw 0;  // 0xf6 unknown
+        dw 2048;
+        dw 0;  // 0xf7 unknown
+        dw 2048;
+        dw 0;  // 0xf8 unknown
+        dw 2048;
+        dw 0;  // 0xf9 unknown
+        dw 2048;
+        dw 12;  // 0xfa STATICCALL
+        dw 2036;
+        dw 0;  // 0xfb unknown
+        dw 2048;
+        dw 0;  // 0xfc unknown
+        dw 2048;
+        dw 4;  // 0xfd REVERT
+        dw 2044;
+        dw 0;  // 0xfe INVALID
+        dw 2048;
+        dw 2;  // 0xff SELFDESTRUCT
+        dw 2046;
     }
 
     // @notice A placeholder for opcodes that don't exist
-    // @dev Halts execution
+    // @dev Halts execution. A sub context reverts, consuming all its gas. An unknown opcode in the
+    // @dev root context fails the whole transaction.
     // @param ctx The pointer to the execution context
     // @return Updated execution context.
     func unknown_opcode{
@@ -654,11 +1286,13 @@ namespace EVMInstructions {
         pedersen_ptr: HashBuiltin*,
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
-    }(ctx_ptr: model.ExecutionContext*) {
+    }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
+        let is_parent_root = ExecutionContext.is_root(ctx.environment.calling_context);
         with_attr error_message("Kakarot: UnknownOpcode") {
-            assert 0 = 1;
+            assert is_parent_root = FALSE;
         }
-        return ();
+        let ctx = ExecutionContext.out_of_gas(ctx);
+        return ctx;
     }
 
     // @notice A placeholder for opcodes that are not implemented yet
@@ -66,10 +66,7 @@ namespace BlockInformation {
             let stack: model.Stack* = Stack.push(self=stack, element=blockhash);
 
             // Update the execution context.
-            // Update context stack.
-            let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-            // Increment gas used.
-            let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_BLOCKHASH);
+            let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_BLOCKHASH);
             return ctx;
         }
 
@@ -83,10 +80,7 @@ namespace BlockInformation {
         let stack: model.Stack* = Stack.push(self=stack, element=blockhash);
 
         // Update the execution context.
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_BLOCKHASH);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_BLOCKHASH);
         return ctx;
     }
 
@@ -111,10 +105,7 @@ namespace BlockInformation {
         let stack: model.Stack* = Stack.push(self=ctx.stack, element=coinbase_address);
 
         // Update the execution context.
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_COINBASE);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_COINBASE);
         return ctx;
     }
 
@@ -142,10 +133,7 @@ namespace BlockInformation {
         let stack: model.Stack* = Stack.push(self=ctx.stack, element=block_timestamp);
 
         // Update the execution context.
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_TIMESTAMP);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_TIMESTAMP);
         return ctx;
     }
 
@@ -173,10 +161,7 @@ namespace BlockInformation {
         let stack: model.Stack* = Stack.push(self=ctx.stack, element=block_number);
 
         // Update the execution context.
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_NUMBER);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_NUMBER);
         return ctx;
     }
 
@@ -201,10 +186,7 @@ namespace BlockInformation {
         let stack: model.Stack* = Stack.push(self=ctx.stack, element=difficulty);
 
         // Update the execution context.
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_DIFFICULTY);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_DIFFICULTY);
         return ctx;
     }
 
@@ -224,14 +206,11 @@ namespace BlockInformation {
         bitwise_ptr: BitwiseBuiltin*,
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
         // Get the Gas Limit
-        let gas_limit = Helpers.to_uint256(val=ctx.gas_limit);
+        let gas_limit = Helpers.to_uint256(val=ctx.environment.gas_limit);
         let stack: model.Stack* = Stack.push(self=ctx.stack, element=gas_limit);
 
         // Update the execution context.
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_GASLIMIT);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_GASLIMIT);
         return ctx;
     }
 
@@ -255,10 +234,7 @@ namespace BlockInformation {
         let stack: model.Stack* = Stack.push(self=ctx.stack, element=chain_id);
 
         // Update the execution context.
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_CHAINID);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_CHAINID);
         return ctx;
     }
 
@@ -281,15 +257,13 @@ namespace BlockInformation {
         // Get balance of current executing contract address balance and push to stack.
         let (native_token_address_) = native_token_address.read();
         let (balance: Uint256) = IEth.balanceOf(
-            contract_address=native_token_address_, account=ctx.starknet_contract_address
+            contract_address=native_token_address_,
+            account=ctx.environment.starknet_contract_address,
         );
         let stack: model.Stack* = Stack.push(self=ctx.stack, element=balance);
 
         // Update the execution context.
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_SELFBALANCE);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_SELFBALANCE);
         return ctx;
     }
 
@@ -314,10 +288,7 @@ namespace BlockInformation {
         let stack: model.Stack* = Stack.push(self=ctx.stack, element=basefee);
 
         // Update the execution context.
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_BASEFEE);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_BASEFEE);
         return ctx;
     }
 }
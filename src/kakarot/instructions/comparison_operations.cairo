@@ -80,10 +80,7 @@ namespace ComparisonOperations {
         // a < b: integer result of comparison a less than b
         let stack: model.Stack* = Stack.push(self=stack, element=Uint256(result, 0));
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_LT);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_LT);
         return ctx;
     }
 
@@ -120,10 +117,7 @@ namespace ComparisonOperations {
         // a < b: integer result of comparison a less than b
         let stack: model.Stack* = Stack.push(stack, Uint256(result, 0));
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_GT);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_GT);
         return ctx;
     }
 
@@ -160,10 +154,7 @@ namespace ComparisonOperations {
         // a < b: integer result of comparison a less than b
         let stack: model.Stack* = Stack.push(self=stack, element=Uint256(result, 0));
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_SLT);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_SLT);
         return ctx;
     }
 
@@ -200,10 +191,7 @@ namespace ComparisonOperations {
         // a < b: integer result of comparison a less than b
         let stack: model.Stack* = Stack.push(self=stack, element=Uint256(result, 0));
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_SGT);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_SGT);
         return ctx;
     }
 
@@ -240,10 +228,7 @@ namespace ComparisonOperations {
         // a == b: 1 if the left side is equal to the right side, 0 otherwise.
         let stack: model.Stack* = Stack.push(self=stack, element=Uint256(result, 0));
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_EQ);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_EQ);
         return ctx;
     }
 
@@ -277,10 +262,7 @@ namespace ComparisonOperations {
         // a == 0: 1 if a is 0, 0 otherwise.
         let stack: model.Stack* = Stack.push(self=stack, element=Uint256(result, 0));
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_ISZERO);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_ISZERO);
         return ctx;
     }
 
@@ -317,10 +299,7 @@ namespace ComparisonOperations {
         // a & b: the bitwise AND result.
         let stack: model.Stack* = Stack.push(self=stack, element=result);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_AND);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_AND);
         return ctx;
     }
 
@@ -357,10 +336,7 @@ namespace ComparisonOperations {
         // a & b: the bitwise AND result.
         let stack: model.Stack* = Stack.push(self=stack, element=result);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_OR);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_OR);
         return ctx;
     }
 
@@ -395,10 +371,7 @@ namespace ComparisonOperations {
         // a & b: the bitwise XOR result.
         let stack: model.Stack* = Stack.push(self=stack, element=result);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_XOR);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_XOR);
         return ctx;
     }
 
@@ -436,10 +409,7 @@ namespace ComparisonOperations {
         // The result of the shift operation.
         let stack: model.Stack* = Stack.push(self=stack, element=result);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_BYTE);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_BYTE);
         return ctx;
     }
 
@@ -476,10 +446,7 @@ namespace ComparisonOperations {
         // The result of the shift operation.
         let stack: model.Stack* = Stack.push(self=stack, element=result);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_SHL);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_SHL);
         return ctx;
     }
 
@@ -516,10 +483,7 @@ namespace ComparisonOperations {
         // The result of the shift operation.
         let stack: model.Stack* = Stack.push(self=stack, element=result);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_SHR);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_SHR);
         return ctx;
     }
 
@@ -585,9 +549,7 @@ namespace ComparisonOperations {
         // The result of the shift operation.
         let stack: model.Stack* = Stack.push(self=stack, element=result);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_SAR);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_SAR);
         return ctx;
     }
 
@@ -621,10 +583,7 @@ namespace ComparisonOperations {
         // The result of the shift operation.
         let stack: model.Stack* = Stack.push(self=stack, element=result);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_NOT);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_NOT);
         return ctx;
     }
 }
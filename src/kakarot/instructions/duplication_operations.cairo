@@ -36,10 +36,7 @@ namespace DuplicationOperations {
         // Duplicate the element to the top of the stack.
         let stack = Stack.push(self=stack, element=element);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_DUP);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_DUP);
         return ctx;
     }
 
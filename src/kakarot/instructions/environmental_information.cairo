@@ -6,7 +6,6 @@
 
 from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
-from starkware.cairo.common.cairo_keccak.keccak import keccak_bigend, finalize_keccak
 from starkware.starknet.common.syscalls import get_caller_address, get_tx_info
 from starkware.cairo.common.uint256 import Uint256
 
@@ -16,8 +15,9 @@ from utils.utils import Helpers
 from kakarot.execution_context import ExecutionContext
 from kakarot.stack import Stack
 from kakarot.memory import Memory
-from kakarot.constants import native_token_address, registry_address
-from kakarot.interfaces.interfaces import IEth, IRegistry, IEvmContract
+from kakarot.constants import native_token_address
+from kakarot.interfaces.interfaces import IEth, IEvmContract
+from kakarot.registry_cache import RegistryCache
 
 // @title Environmental information opcodes.
 // @notice This file contains the functions to execute for environmental information opcodes.
@@ -26,7 +26,6 @@ from kakarot.interfaces.interfaces import IEth, IRegistry, IEvmContract
 namespace EnvironmentalInformation {
     // Define constants.
     const GAS_COST_ADDRESS = 2;
-    const GAS_COST_BALANCE = 100;
     const GAS_COST_ORIGIN = 2;
     const GAS_COST_CALLER = 2;
     const GAS_COST_CALLVALUE = 2;
@@ -36,11 +35,8 @@ namespace EnvironmentalInformation {
     const GAS_COST_CODESIZE = 2;
     const GAS_COST_CODECOPY = 3;
     const GAS_COST_GASPRICE = 2;
-    const GAS_COST_EXTCODESIZE = 2600;
-    const GAS_COST_EXTCODECOPY = 2600;
     const GAS_COST_RETURNDATASIZE = 2;
     const GAS_COST_RETURNDATACOPY = 3;
-    const GAS_COST_EXTCODEHASH = 2600;
 
     // @notice ADDRESS operation.
     // @dev Get address of currently executing account.
@@ -61,12 +57,9 @@ namespace EnvironmentalInformation {
 
         // Get the current execution contract from the context,
         // convert to Uin256, and push to Stack.
-        let address = Helpers.to_uint256(ctx.evm_contract_address);
+        let address = Helpers.to_uint256(ctx.environment.evm_contract_address);
         let stack: model.Stack* = Stack.push(self=ctx.stack, element=address);
-        // Update the execution context.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_ADDRESS);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_ADDRESS);
         return ctx;
     }
 
@@ -89,12 +82,14 @@ namespace EnvironmentalInformation {
 
         // Get the evm address.
         let (stack: model.Stack*, address: Uint256) = Stack.pop(ctx.stack);
+        let address_felt = Helpers.uint256_to_felt(address);
+        let (ctx, local access_gas_cost) = ExecutionContext.access_address(ctx, address_felt);
 
         // Get the starknet account address from the evm account address
-        let (registry_address_) = registry_address.read();
-        let (starknet_contract_address) = IRegistry.get_starknet_contract_address(
-            contract_address=registry_address_, evm_contract_address=address.low
-        );
+        let (
+            registry_cache, starknet_contract_address
+        ) = RegistryCache.get_starknet_contract_address(ctx.cold.registry_cache, address_felt);
+        let ctx = ExecutionContext.update_registry_cache(ctx, registry_cache);
         // Get the number of native tokens owned by the given starknet account
         let (native_token_address_) = native_token_address.read();
         let (balance: Uint256) = IEth.balanceOf(
@@ -104,10 +99,7 @@ namespace EnvironmentalInformation {
         let stack: model.Stack* = Stack.push(stack, balance);
 
         // Update the execution context.
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_BALANCE);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, access_gas_cost);
         return ctx;
     }
 
@@ -131,17 +123,15 @@ namespace EnvironmentalInformation {
         // Get the transaction info which contains the starknet origin address
         let (tx_info) = get_tx_info();
         // Get the EVM address from Starknet address
-        let (registry_address_) = registry_address.read();
-        let (evm_contract_address) = IRegistry.get_evm_contract_address(
-            registry_address_, starknet_contract_address=tx_info.account_contract_address
+        let (registry_cache, evm_contract_address) = RegistryCache.get_evm_contract_address(
+            ctx.cold.registry_cache, tx_info.account_contract_address
         );
+        let ctx = ExecutionContext.update_registry_cache(ctx, registry_cache);
         let origin_address = Helpers.to_uint256(evm_contract_address);
 
         // Update Context stack
         let stack: model.Stack* = Stack.push(self=ctx.stack, element=origin_address);
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_ORIGIN);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_ORIGIN);
         return ctx;
     }
 
@@ -167,10 +157,7 @@ namespace EnvironmentalInformation {
         let stack: model.Stack* = Stack.push(self=ctx.stack, element=caller_address);
 
         // Update the execution context.
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_CALLER);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_CALLER);
         return ctx;
     }
 
@@ -188,14 +175,11 @@ namespace EnvironmentalInformation {
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
-        let uint256_value: Uint256 = Helpers.to_uint256(ctx.call_context.value);
+        let uint256_value: Uint256 = Helpers.to_uint256(ctx.environment.call_context.value);
         let stack: model.Stack* = Stack.push(ctx.stack, uint256_value);
 
         // Update the execution context.
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_CALLVALUE);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_CALLVALUE);
         return ctx;
     }
 
@@ -224,8 +208,8 @@ namespace EnvironmentalInformation {
 
         let (sliced_calldata: felt*) = alloc();
 
-        let calldata: felt* = ctx.call_context.calldata;
-        let calldata_len: felt = ctx.call_context.calldata_len;
+        let calldata: felt* = ctx.environment.call_context.calldata;
+        let calldata_len: felt = ctx.environment.call_context.calldata_len;
 
         // read calldata at offset
         let sliced_calldata: felt* = Helpers.slice_data(
@@ -236,10 +220,7 @@ namespace EnvironmentalInformation {
         // Push CallData word onto stack
         let stack: model.Stack* = Stack.push(self=stack, element=uint256_sliced_calldata);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_CALLDATALOAD);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_CALLDATALOAD);
         return ctx;
     }
 
@@ -258,14 +239,11 @@ namespace EnvironmentalInformation {
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
-        let calldata_size = Helpers.to_uint256(ctx.call_context.calldata_len);
+        let calldata_size = Helpers.to_uint256(ctx.environment.call_context.calldata_len);
         let stack: model.Stack* = Stack.push(ctx.stack, calldata_size);
 
         // Update the execution context.
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_CALLDATASIZE);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_CALLDATASIZE);
         return ctx;
     }
 
@@ -273,7 +251,7 @@ namespace EnvironmentalInformation {
     // @dev Save word to memory.
     // @custom:since Frontier
     // @custom:group Stack Memory Storage and Flow operations.
-    // @custom:gas 3
+    // @custom:gas 3 + dynamic gas
     // @custom:stack_consumed_elements 3
     // @custom:stack_produced_elements 0
     // @param ctx The pointer to the execution context
@@ -297,8 +275,8 @@ namespace EnvironmentalInformation {
         let calldata_offset = popped[1];
         let element_len = popped[2];
 
-        let calldata: felt* = ctx.call_context.calldata;
-        let calldata_len: felt = ctx.call_context.calldata_len;
+        let calldata: felt* = ctx.environment.call_context.calldata;
+        let calldata_len: felt = ctx.environment.call_context.calldata_len;
 
         // Get calldata slice from calldata_offset to element_len
         let sliced_calldata: felt* = Helpers.slice_data(
@@ -313,12 +291,16 @@ namespace EnvironmentalInformation {
             self=ctx.memory, element_len=element_len.low, element=sliced_calldata, offset=offset.low
         );
 
-        // Update context memory.
-        let ctx = ExecutionContext.update_memory(self=ctx, new_memory=memory);
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_CALLDATACOPY);
+        // dynamic_gas := 3 * minimum_word_size + memory_expansion_cost
+        let (minimum_word_size) = Helpers.minimum_word_count(element_len.low);
+        let memory_expansion_cost = memory.cost - ctx.memory.cost;
+        let ctx = ExecutionContext.apply_changes(
+            ctx,
+            stack,
+            memory,
+            0,
+            GAS_COST_CALLDATACOPY + 3 * minimum_word_size + memory_expansion_cost,
+        );
         return ctx;
     }
 
@@ -338,15 +320,12 @@ namespace EnvironmentalInformation {
         bitwise_ptr: BitwiseBuiltin*,
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
         // Get the bytecode size.
-        let code_size = Helpers.to_uint256(ctx.call_context.bytecode_len);
+        let code_size = Helpers.to_uint256(ctx.environment.call_context.bytecode_len);
 
         let stack: model.Stack* = Stack.push(self=ctx.stack, element=code_size);
 
         // Update the execution context.
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_CODESIZE);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_CODESIZE);
         return ctx;
     }
 
@@ -354,7 +333,7 @@ namespace EnvironmentalInformation {
     // @dev Copies slice of bytecode to memory
     // @custom:since Frontier
     // @custom:group Environmental Information
-    // @custom:gas 3
+    // @custom:gas 3 + dynamic gas
     // @custom:stack_consumed_elements 3
     // @custom:stack_produced_elements 0
     // @param ctx The pointer to the execution context
@@ -379,8 +358,8 @@ namespace EnvironmentalInformation {
         let element_len = popped[2];
 
         // Get bytecode slice from code_offset to element_len
-        let bytecode: felt* = ctx.call_context.bytecode;
-        let bytecode_len: felt = ctx.call_context.bytecode_len;
+        let bytecode: felt* = ctx.environment.call_context.bytecode;
+        let bytecode_len: felt = ctx.environment.call_context.bytecode_len;
         let sliced_code: felt* = Helpers.slice_data(
             data_len=bytecode_len,
             data=bytecode,
@@ -393,12 +372,12 @@ namespace EnvironmentalInformation {
             self=ctx.memory, element_len=element_len.low, element=sliced_code, offset=offset.low
         );
 
-        // Update context memory.
-        let ctx = ExecutionContext.update_memory(ctx, memory);
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_CODECOPY);
+        // dynamic_gas := 3 * minimum_word_size + memory_expansion_cost
+        let (minimum_word_size) = Helpers.minimum_word_count(element_len.low);
+        let memory_expansion_cost = memory.cost - ctx.memory.cost;
+        let ctx = ExecutionContext.apply_changes(
+            ctx, stack, memory, 0, GAS_COST_CODECOPY + 3 * minimum_word_size + memory_expansion_cost
+        );
         return ctx;
     }
 
@@ -425,10 +404,7 @@ namespace EnvironmentalInformation {
 
         let stack: model.Stack* = Stack.push(self=ctx.stack, element=cost_uint256);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_GASPRICE);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_GASPRICE);
 
         return ctx;
     }
@@ -456,16 +432,17 @@ namespace EnvironmentalInformation {
         // 0 - address: 20-byte address of the contract to query.
         let (stack, address_uint256) = Stack.pop(self=stack);
         let address_felt = Helpers.uint256_to_felt(address_uint256);
+        let (ctx, local access_gas_cost) = ExecutionContext.access_address(ctx, address_felt);
 
         // Get the starknet address from the given evm address
-        let (registry_address_) = registry_address.read();
-        let (starknet_contract_address) = IRegistry.get_starknet_contract_address(
-            contract_address=registry_address_, evm_contract_address=address_felt
-        );
+        let (
+            registry_cache, starknet_contract_address
+        ) = RegistryCache.get_starknet_contract_address(ctx.cold.registry_cache, address_felt);
+        let ctx = ExecutionContext.update_registry_cache(ctx, registry_cache);
 
         local bytecode_len;
         if (starknet_contract_address != 0) {
-            let (_bytecode_len, _) = IEvmContract.bytecode(
+            let (_bytecode_len) = IEvmContract.bytecode_len(
                 contract_address=starknet_contract_address
             );
 
@@ -485,13 +462,7 @@ namespace EnvironmentalInformation {
         // bytecode_len cannot be greater than 24k in the EVM
         let stack = Stack.push(stack, Uint256(low=bytecode_len, high=0));
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-
-        // TODO:distinction between warm and cold addresses determines dynamic cost
-        //  for now we assume a cold address, which sets dynamic cost to 2600
-        // see: https://www.evm.codes/about#accesssets
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_EXTCODESIZE);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, access_gas_cost);
 
         return ctx;
     }
@@ -527,13 +498,13 @@ namespace EnvironmentalInformation {
         let size = popped[3];
 
         let address_felt = Helpers.uint256_to_felt(address_uint256);
+        let (ctx, local access_gas_cost) = ExecutionContext.access_address(ctx, address_felt);
 
         // Get the starknet address from the given evm address
-        let (registry_address_) = registry_address.read();
-
-        let (starknet_contract_address) = IRegistry.get_starknet_contract_address(
-            contract_address=registry_address_, evm_contract_address=address_felt
-        );
+        let (
+            registry_cache, starknet_contract_address
+        ) = RegistryCache.get_starknet_contract_address(ctx.cold.registry_cache, address_felt);
+        let ctx = ExecutionContext.update_registry_cache(ctx, registry_cache);
 
         if (starknet_contract_address != 0) {
             // we get the bytecode from the Starknet_contract
@@ -571,26 +542,15 @@ namespace EnvironmentalInformation {
         );
 
         // Write bytecode slice to memory at dest_offset
-        let (memory, memory_expansion_cost) = Memory.ensure_length(
-            self=ctx.memory, length=dest_offset.low + size.low
-        );
         let memory: model.Memory* = Memory.store_n(
             self=ctx.memory, element_len=size.low, element=sliced_bytecode, offset=dest_offset.low
         );
 
-        // Update context memory.
-        let ctx = ExecutionContext.update_memory(self=ctx, new_memory=memory);
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
         let (minimum_word_size) = Helpers.minimum_word_count(size.low);
+        let memory_expansion_cost = memory.cost - ctx.memory.cost;
 
-        // TODO:distinction between warm and cold addresses determines `address_access_cost`
-        // for now we assume a cold address, which sets `address_access_cost` to 2600
-        // see: https://www.evm.codes/about#accesssets
-
-        let ctx = ExecutionContext.increment_gas_used(
-            self=ctx, inc_value=3 * minimum_word_size + memory_expansion_cost + GAS_COST_EXTCODECOPY
+        let ctx = ExecutionContext.apply_changes(
+            ctx, stack, memory, 0, 3 * minimum_word_size + memory_expansion_cost + access_gas_cost
         );
 
         return ctx;
@@ -616,10 +576,9 @@ namespace EnvironmentalInformation {
         let stack: model.Stack* = Stack.push(self=ctx.stack, element=return_data_size);
 
         // Update the execution context.
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_RETURNDATASIZE);
+        let ctx = ExecutionContext.apply_changes(
+            ctx, stack, ctx.memory, 0, GAS_COST_RETURNDATASIZE
+        );
         return ctx;
     }
 
@@ -627,7 +586,7 @@ namespace EnvironmentalInformation {
     // @dev Save word to memory.
     // @custom:since Frontier
     // @custom:group Stack Memory Storage and Flow operations.
-    // @custom:gas 3
+    // @custom:gas 3 + dynamic gas
     // @custom:stack_consumed_elements 3
     // @custom:stack_produced_elements 0
     // @param ctx The pointer to the execution context
@@ -651,9 +610,9 @@ namespace EnvironmentalInformation {
         let return_data_offset = popped[1];
         let element_len = popped[2];
 
+        // The return data of the last sub context, see CallHelper.finalize_calling_context
         let return_data_len: felt = ctx.sub_context.return_data_len;
-        // Note: +1 see the CALL opcode: the return_data[0] stores the ret_offset in memory
-        let return_data: felt* = ctx.sub_context.return_data + 1;
+        let return_data: felt* = ctx.sub_context.return_data;
 
         let sliced_return_data: felt* = Helpers.slice_data(
             data_len=return_data_len,
@@ -669,12 +628,16 @@ namespace EnvironmentalInformation {
             offset=offset.low,
         );
 
-        // Update context memory.
-        let ctx = ExecutionContext.update_memory(self=ctx, new_memory=memory);
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_CALLDATACOPY);
+        // dynamic_gas := 3 * minimum_word_size + memory_expansion_cost
+        let (minimum_word_size) = Helpers.minimum_word_count(element_len.low);
+        let memory_expansion_cost = memory.cost - ctx.memory.cost;
+        let ctx = ExecutionContext.apply_changes(
+            ctx,
+            stack,
+            memory,
+            0,
+            GAS_COST_RETURNDATACOPY + 3 * minimum_word_size + memory_expansion_cost,
+        );
         return ctx;
     }
 
@@ -701,52 +664,23 @@ namespace EnvironmentalInformation {
         // 0 - address: 20-byte address of the contract to query.
         let (stack, address_uint256) = Stack.pop(self=stack);
         let address_felt = Helpers.uint256_to_felt(address_uint256);
+        let (ctx, local access_gas_cost) = ExecutionContext.access_address(ctx, address_felt);
 
         // Get the starknet address from the given evm address
-        let (registry_address_) = registry_address.read();
-        let (starknet_contract_address) = IRegistry.get_starknet_contract_address(
-            contract_address=registry_address_, evm_contract_address=address_felt
-        );
+        let (
+            registry_cache, starknet_contract_address
+        ) = RegistryCache.get_starknet_contract_address(ctx.cold.registry_cache, address_felt);
+        let ctx = ExecutionContext.update_registry_cache(ctx, registry_cache);
         if (starknet_contract_address == 0) {
             let stack = Stack.push(stack, Uint256(low=0, high=0));
-            let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-            // Increment gas used (COLD ACCESS)
-            let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_EXTCODEHASH);
+            let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, access_gas_cost);
             return ctx;
         }
 
-        let (bytecode_len, bytecode) = IEvmContract.bytecode(
-            contract_address=starknet_contract_address
-        );
-
-        let (local dest: felt*) = alloc();
-        // convert to little endian
-        Helpers.bytes_to_bytes8_little_endian(
-            bytes_len=bytecode_len,
-            bytes=bytecode,
-            index=0,
-            size=bytecode_len,
-            bytes8=0,
-            bytes8_shift=0,
-            dest=dest,
-            dest_index=0,
-        );
-
-        let (keccak_ptr: felt*) = alloc();
-        local keccak_ptr_start: felt* = keccak_ptr;
-
-        with keccak_ptr {
-            let (result) = keccak_bigend(inputs=dest, n_bytes=bytecode_len);
-
-            finalize_keccak(keccak_ptr_start=keccak_ptr_start, keccak_ptr_end=keccak_ptr);
-        }
+        let (result) = IEvmContract.code_hash(contract_address=starknet_contract_address);
 
         let stack: model.Stack* = Stack.push(self=stack, element=result);
-        // Update context stack
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used (COLD ACCESS)
-        // see: https://www.evm.codes/about#accesssets
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_EXTCODEHASH);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, access_gas_cost);
         return ctx;
     }
 }
@@ -34,10 +34,7 @@ namespace ExchangeOperations {
         // Get the value top i-th stack item.
         let stack = Stack.swap_i(self=stack, i=i + 1);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=GAS_COST_SWAP);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_SWAP);
         return ctx;
     }
 
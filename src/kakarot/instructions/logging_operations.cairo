@@ -5,6 +5,7 @@
 // Starkware dependencies
 from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.math import unsigned_div_rem
 from starkware.starknet.common.syscalls import emit_event
 from starkware.cairo.common.bool import FALSE
 
@@ -21,7 +22,11 @@ from kakarot.memory import Memory
 // @custom:namespace LoggingOperations
 namespace LoggingOperations {
     // Define constants.
-    const GAS_LOG_STATIC = 350;
+    const GAS_COST_LOG = 375;
+    const GAS_COST_LOG_TOPIC = 375;
+    const GAS_COST_LOG_DATA_BYTE = 8;
+    // The event data is the byte size of the log data followed by its bytes packed in big endian felts
+    const EVENT_DATA_BYTES_PER_FELT = 31;
 
     // @notice Generic logging operation
     // @dev Append log record with n topics.
@@ -35,9 +40,11 @@ namespace LoggingOperations {
     ) -> model.ExecutionContext* {
         alloc_locals;
 
-        // This instruction is disallowed when called from a `staticcall` context, which we demark by a read_only attribute
-        with_attr error_message("Kakarot: StateModificationError") {
-            assert ctx.read_only = FALSE;
+        // This instruction is disallowed when called from a `staticcall` context, which we demark by a read_only attribute.
+        // Such a context is always a sub context, which reverts consuming all its gas
+        if (ctx.environment.read_only != FALSE) {
+            let ctx = ExecutionContext.out_of_gas(ctx);
+            return ctx;
         }
 
         // Get stack from context.
@@ -45,7 +52,6 @@ namespace LoggingOperations {
 
         // Pop offset + size.
         let (stack, popped) = Stack.pop_n(stack, topics_len + 2);
-        let ctx = ExecutionContext.update_stack(ctx, stack);
 
         let offset = popped[0];
         let size = popped[1];
@@ -60,13 +66,16 @@ namespace LoggingOperations {
             self=ctx.memory, element_len=actual_size, element=data, offset=actual_offset
         );
 
-        emit_event(keys_len=topics_len * 2, keys=popped + 4, data_len=actual_size, data=data);
-
-        // Update context stack.
-        let ctx = ExecutionContext.update_memory(ctx, memory);
+        let (local packed_data: felt*) = alloc();
+        assert [packed_data] = actual_size;
+        let packed_len = internal.pack_bytes(actual_size, data, packed_data + 1);
+        emit_event(
+            keys_len=topics_len * 2, keys=popped + 4, data_len=1 + packed_len, data=packed_data
+        );
 
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, gas_cost + GAS_LOG_STATIC);
+        // dynamic_gas := 375 * topics_len + 8 * size + memory_expansion_cost
+        let dynamic_gas = GAS_COST_LOG_TOPIC * topics_len + GAS_COST_LOG_DATA_BYTE * actual_size + gas_cost;
+        let ctx = ExecutionContext.apply_changes(ctx, stack, memory, 0, GAS_COST_LOG + dynamic_gas);
         return ctx;
     }
 
@@ -150,3 +159,37 @@ namespace LoggingOperations {
         return ctx;
     }
 }
+
+namespace internal {
+    // @notice Pack bytes in big endian felts of EVENT_DATA_BYTES_PER_FELT bytes, the last one holding the remaining bytes.
+    // @param bytes_len The number of bytes.
+    // @param bytes The bytes.
+    // @param dst The destination of the felts.
+    // @return The number of felts written.
+    func pack_bytes{range_check_ptr}(bytes_len: felt, bytes: felt*, dst: felt*) -> felt {
+        alloc_locals;
+        let (local full_felts_len, local remainder) = unsigned_div_rem(
+            bytes_len, LoggingOperations.EVENT_DATA_BYTES_PER_FELT
+        );
+        pack_full_felts(full_felts_len, bytes, dst);
+        if (remainder == 0) {
+            return full_felts_len;
+        }
+        let last_felt = Helpers.load_word(
+            remainder, bytes + full_felts_len * LoggingOperations.EVENT_DATA_BYTES_PER_FELT
+        );
+        assert dst[full_felts_len] = last_felt;
+        return full_felts_len + 1;
+    }
+
+    func pack_full_felts(felts_len: felt, bytes: felt*, dst: felt*) {
+        if (felts_len == 0) {
+            return ();
+        }
+        let value = Helpers.load_word(LoggingOperations.EVENT_DATA_BYTES_PER_FELT, bytes);
+        assert [dst] = value;
+        return pack_full_felts(
+            felts_len - 1, bytes + LoggingOperations.EVENT_DATA_BYTES_PER_FELT, dst + 1
+        );
+    }
+}
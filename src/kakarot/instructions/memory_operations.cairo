@@ -9,12 +9,14 @@ from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.math_cmp import is_le
 from starkware.cairo.common.bool import FALSE
 
+from kakarot.access_set import AccessSet
 from kakarot.model import model
 from utils.utils import Helpers
 from kakarot.stack import Stack
+from kakarot.storage_cache import StorageCache
 from kakarot.memory import Memory
 from kakarot.execution_context import ExecutionContext
-from kakarot.interfaces.interfaces import IEvmContract
+from kakarot.journal import Journal
 
 // @title Exchange operations opcodes.
 // @notice This file contains the functions to execute for memory operations opcodes.
@@ -31,7 +33,6 @@ namespace MemoryOperations {
     const GAS_COST_POP = 2;
     const GAS_COST_MSTORE8 = 3;
     const GAS_COST_SSTORE = 100;
-    const GAS_COST_SLOAD = 100;
     const GAS_COST_GAS = 2;
 
     // @notice MLOAD operation
@@ -63,12 +64,7 @@ namespace MemoryOperations {
         // Push word to the stack
         let stack: model.Stack* = Stack.push(stack, value);
 
-        // Update context memory.
-        let ctx = ExecutionContext.update_memory(ctx, new_memory);
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_MLOAD + cost);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, new_memory, 0, GAS_COST_MLOAD + cost);
 
         return ctx;
     }
@@ -101,13 +97,11 @@ namespace MemoryOperations {
 
         let memory: model.Memory* = Memory.store(self=ctx.memory, element=value, offset=offset.low);
 
-        // Update context memory.
-        let ctx = ExecutionContext.update_memory(ctx, memory);
-
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_MSTORE);
+        // The memory expansion cost is the increase of the cost of the memory size
+        let memory_expansion_cost = memory.cost - ctx.memory.cost;
+        let ctx = ExecutionContext.apply_changes(
+            ctx, stack, memory, 0, GAS_COST_MSTORE + memory_expansion_cost
+        );
         return ctx;
     }
 
@@ -128,10 +122,7 @@ namespace MemoryOperations {
 
         let stack: model.Stack* = Stack.push(ctx.stack, pc);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_PC);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_PC);
         return ctx;
     }
 
@@ -154,10 +145,7 @@ namespace MemoryOperations {
 
         let stack: model.Stack* = Stack.push(ctx.stack, msize);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_MSIZE);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_MSIZE);
         return ctx;
     }
 
@@ -183,13 +171,10 @@ namespace MemoryOperations {
         // 0 - offset: offset in the deployed code where execution will continue from
         let (stack, offset) = Stack.pop(stack);
 
-        // Update pc counter.
-        let ctx = ExecutionContext.update_program_counter(ctx, offset.low);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_JUMP);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_JUMP);
+        // Update pc counter, last as an invalid destination halts the context.
+        let ctx = ExecutionContext.update_program_counter(ctx, offset.low);
         return ctx;
     }
 
@@ -224,19 +209,13 @@ namespace MemoryOperations {
         let is_condition_valid: felt = is_le(1, skip_condition.low);
 
         if (is_condition_valid != FALSE) {
-            // Update pc counter.
+            let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_JUMPI);
+            // Update pc counter, last as an invalid destination halts the context.
             let ctx = ExecutionContext.update_program_counter(ctx, offset.low);
-            // Update context stack.
-            let ctx = ExecutionContext.update_stack(ctx, stack);
-            // Increment gas used.
-            let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_JUMPI);
             return ctx;
         }
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_JUMPI);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_JUMPI);
         return ctx;
     }
 
@@ -254,8 +233,7 @@ namespace MemoryOperations {
         bitwise_ptr: BitwiseBuiltin*,
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
         alloc_locals;
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_JUMPDEST);
+        let ctx = ExecutionContext.apply_changes(ctx, ctx.stack, ctx.memory, 0, GAS_COST_JUMPDEST);
 
         return ctx;
     }
@@ -281,11 +259,7 @@ namespace MemoryOperations {
 
         let (stack, _) = Stack.pop(stack);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_POP);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_POP);
         return ctx;
     }
 
@@ -293,7 +267,7 @@ namespace MemoryOperations {
     // @dev Save single byte to memory
     // @custom:since Frontier
     // @custom:group Stack Memory Storage and Flow operations.
-    // @custom:gas 3
+    // @custom:gas 3 + dynamic gas
     // @custom:stack_consumed_elements 2
     // @custom:stack_produced_elements 0
     // @param ctx The pointer to the execution context
@@ -325,13 +299,10 @@ namespace MemoryOperations {
             self=ctx.memory, element_len=1, element=value_pointer, offset=offset.low
         );
 
-        // Update context memory.
-        let ctx = ExecutionContext.update_memory(ctx, memory);
-
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_MSTORE8);
+        let memory_expansion_cost = memory.cost - ctx.memory.cost;
+        let ctx = ExecutionContext.apply_changes(
+            ctx, stack, memory, 0, GAS_COST_MSTORE8 + memory_expansion_cost
+        );
         return ctx;
     }
 
@@ -339,7 +310,7 @@ namespace MemoryOperations {
     // @dev Save word to storage.
     // @custom:since Frontier
     // @custom:group Stack Memory Storage and Flow operations.
-    // @custom:gas 3
+    // @custom:gas 100 || 2200
     // @custom:stack_consumed_elements 2
     // @custom:stack_produced_elements 0
     // @param ctx The pointer to the execution context
@@ -352,15 +323,17 @@ namespace MemoryOperations {
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
         alloc_locals;
 
-        // This instruction is disallowed when called from a `staticcall` context, which we demark by a read_only attribute
-        with_attr error_message("Kakarot: StateModificationError") {
-            assert ctx.read_only = FALSE;
+        // This instruction is disallowed when called from a `staticcall` context, which we demark by a read_only attribute.
+        // Such a context is always a sub context, which reverts consuming all its gas
+        if (ctx.environment.read_only != FALSE) {
+            let ctx = ExecutionContext.out_of_gas(ctx);
+            return ctx;
         }
 
         let stack = ctx.stack;
 
         // ------- 1. Get starknet address
-        let starknet_contract_address: felt = ctx.starknet_contract_address;
+        let starknet_contract_address: felt = ctx.environment.starknet_contract_address;
 
         // ----- 2. Pop 2 values: key and value
 
@@ -368,21 +341,30 @@ namespace MemoryOperations {
         // 0 - key: key of memory.
         // 1 - value: value for given key.
         let (stack, popped) = Stack.pop_n(self=stack, n=2);
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-
         let key = popped[0];
         let value = popped[1];
-
-        // 3. Call Write storage on contract with starknet address
-        with_attr error_message("Contract call failed") {
-            IEvmContract.write_storage(
-                contract_address=starknet_contract_address, key=key, value=value
-            );
-        }
-
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_SSTORE);
+        let (ctx, local access_gas_cost) = ExecutionContext.access_storage_key(ctx, key);
+
+        // 3. Write the value in the storage cache, it is committed to the contract when the transaction ends
+        // and journaled so that it is undone if the context reverts
+        let (storage_cache, slot_key, previous_slot) = StorageCache.replace(
+            self=ctx.cold.storage_cache,
+            starknet_contract_address=starknet_contract_address,
+            key=key,
+            value=value,
+        );
+        let ctx = ExecutionContext.update_storage_cache(ctx, storage_cache);
+        let journal = Journal.record_storage(ctx.cold.journal, slot_key, previous_slot);
+        let ctx = ExecutionContext.update_journal(ctx, journal);
+
+        // A cold slot costs the difference between a cold and a warm read on top of the write
+        let ctx = ExecutionContext.apply_changes(
+            ctx,
+            stack,
+            ctx.memory,
+            0,
+            GAS_COST_SSTORE + access_gas_cost - AccessSet.GAS_COST_WARM_ACCESS,
+        );
         return ctx;
     }
 
@@ -390,7 +372,7 @@ namespace MemoryOperations {
     // @dev Load from storage.
     // @custom:since Frontier
     // @custom:group Stack Memory Storage and Flow operations.
-    // @custom:gas 3
+    // @custom:gas 100 || 2100
     // @custom:stack_consumed_elements 1
     // @custom:stack_produced_elements 1
     // @param ctx The pointer to the execution context
@@ -405,26 +387,25 @@ namespace MemoryOperations {
         let stack = ctx.stack;
 
         // ------- 1. Get starknet address
-        let starknet_contract_address: felt = ctx.starknet_contract_address;
+        let starknet_contract_address: felt = ctx.environment.starknet_contract_address;
 
         // ----- 2. Pop 1 value: key
 
         // Stack input:
         // key: key of memory.
         let (stack, local key) = Stack.pop(stack);
-        // local value: Uint256;
-        // 3. Get the data from storage
-
-        let (local value: Uint256) = IEvmContract.storage(
-            contract_address=starknet_contract_address, key=key
+        let (ctx, local access_gas_cost) = ExecutionContext.access_storage_key(ctx, key);
+        // 3. Get the data from the storage cache, reading the contract storage on first access
+        let (storage_cache, local value: Uint256) = StorageCache.read(
+            self=ctx.cold.storage_cache,
+            starknet_contract_address=starknet_contract_address,
+            key=key,
         );
 
         let stack: model.Stack* = Stack.push(stack, value);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_SLOAD);
+        let ctx = ExecutionContext.update_storage_cache(ctx, storage_cache);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, access_gas_cost);
         return ctx;
     }
 
@@ -448,14 +429,10 @@ namespace MemoryOperations {
         let stack: model.Stack* = ctx.stack;
 
         // Compute remaining gas.
-        let remaining_gas = ctx.gas_limit - ctx.gas_used - GAS_COST_GAS;
+        let remaining_gas = ctx.environment.gas_limit - ctx.gas_used - GAS_COST_GAS;
         let stack: model.Stack* = Stack.push(ctx.stack, Uint256(remaining_gas, 0));
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_GAS);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, GAS_COST_GAS);
         return ctx;
     }
 }
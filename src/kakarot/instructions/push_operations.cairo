@@ -35,8 +35,8 @@ namespace PushOperations {
         // Get stack from context.
         let stack: model.Stack* = ctx.stack;
 
-        // Read i bytes.
-        let (ctx, data) = ExecutionContext.read_code(self=ctx, len=i);
+        // Read the i bytes following the opcode, skipped by the program counter below.
+        let data = ctx.environment.call_context.bytecode + ctx.program_counter;
 
         // Convert to Uint256.
         let stack_element: Uint256 = Helpers.bytes_i_to_uint256(val=data, i=i);
@@ -44,10 +44,7 @@ namespace PushOperations {
         // Push to the stack.
         let stack: model.Stack* = Stack.push(stack, stack_element);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, i, GAS_COST);
         return ctx;
     }
 
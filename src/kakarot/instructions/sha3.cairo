@@ -3,13 +3,13 @@
 %lang starknet
 
 // Starkware dependencies
-from starkware.cairo.common.math_cmp import is_le
 from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
-from starkware.cairo.common.cairo_keccak.keccak import keccak_bigend, finalize_keccak
+from starkware.cairo.common.cairo_keccak.keccak import keccak_bigend
+from starkware.cairo.common.dict import dict_read, dict_write
+from starkware.cairo.common.hash import hash2
+from starkware.cairo.common.math import unsigned_div_rem
 from starkware.cairo.common.uint256 import Uint256
-from starkware.cairo.common.pow import pow
-from starkware.cairo.common.bool import FALSE
 
 from kakarot.memory import Memory
 from kakarot.model import model
@@ -50,87 +50,84 @@ namespace Sha3 {
         let offset = popped[0];
         let length = popped[1];
 
-        let (bigendian_data: felt*) = alloc();
-        let (memory, gas_cost) = Memory.load_n(
-            self=ctx.memory, element_len=length.low, element=bigendian_data, offset=offset.low
+        // Read the memory as 16 bytes chunks
+        let (local chunks: felt*) = alloc();
+        let (memory, gas_cost) = Memory.load_chunks(
+            self=ctx.memory, size=length.low, chunks=chunks, offset=offset.low
         );
-
-        let (local dest: felt*) = alloc();
-        bytes_to_byte8_little_endian(
-            bytes_len=length.low,
-            bytes=bigendian_data,
-            index=0,
-            size=length.low,
-            byte8=0,
-            byte8_shift=0,
-            dest=dest,
-            dest_index=0,
+        let (chunks_len, _) = unsigned_div_rem(length.low + 15, 16);
+        let (keccak_segment, result) = internal.keccak(
+            ctx.cold.keccak_segment, length.low, chunks_len, chunks
         );
-
-        let (keccak_ptr: felt*) = alloc();
-        local keccak_ptr_start: felt* = keccak_ptr;
-
-        with keccak_ptr {
-            let (result) = keccak_bigend(inputs=dest, n_bytes=length.low);
-
-            finalize_keccak(keccak_ptr_start=keccak_ptr_start, keccak_ptr_end=keccak_ptr);
-        }
         let stack: model.Stack* = Stack.push(self=stack, element=result);
 
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        let ctx = ExecutionContext.update_memory(ctx, memory);
-
-        // Increment gas used.
         let (minimum_word_size) = Helpers.minimum_word_count(length.low);
         let dynamic_gas = 6 * minimum_word_size + gas_cost;
 
-        let ctx = ExecutionContext.increment_gas_used(
-            self=ctx, inc_value=GAS_COST_SHA3 + dynamic_gas
+        let ctx = ExecutionContext.update_keccak_segment(ctx, keccak_segment);
+        let ctx = ExecutionContext.apply_changes(
+            ctx, stack, memory, 0, GAS_COST_SHA3 + dynamic_gas
         );
 
         return ctx;
     }
+}
 
-    // TODO: natspec
-    func bytes_to_byte8_little_endian{range_check_ptr}(
-        bytes_len: felt,
-        bytes: felt*,
-        index: felt,
-        size: felt,
-        byte8: felt,
-        byte8_shift: felt,
-        dest: felt*,
-        dest_index: felt,
-    ) {
+namespace internal {
+    // @notice Compute the keccak hash of size bytes given as 16 bytes chunks, reusing the hash of a previous
+    //         identical input of the transaction if any.
+    // @dev Inputs are identified in the memo by a pedersen digest of their size and chunks.
+    // @param keccak_segment The keccak segment of the transaction.
+    // @param size The number of bytes to hash.
+    // @param chunks_len The number of chunks.
+    // @param chunks The big endian 16 bytes chunks, the bytes beyond size being 0.
+    // @return The updated keccak segment and the keccak hash.
+    func keccak{pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*}(
+        keccak_segment: model.KeccakSegment*, size: felt, chunks_len: felt, chunks: felt*
+    ) -> (keccak_segment: model.KeccakSegment*, hash: Uint256) {
         alloc_locals;
-        if (index == size) {
-            return ();
+        let key = hash_chunks{hash_ptr=pedersen_ptr}(size, chunks_len, chunks);
+        let memo = keccak_segment.memo;
+        let (cached_hash) = dict_read{dict_ptr=memo}(key);
+        if (cached_hash != 0) {
+            tempvar new_segment = new model.KeccakSegment(
+                keccak_ptr_start=keccak_segment.keccak_ptr_start,
+                keccak_ptr=keccak_segment.keccak_ptr,
+                memo_start=keccak_segment.memo_start,
+                memo=memo,
+                );
+            return (new_segment, [cast(cached_hash, Uint256*)]);
         }
 
-        local current_byte;
-        let out_of_bound = is_le(a=bytes_len, b=index);
-        if (out_of_bound != FALSE) {
-            current_byte = 0;
-        } else {
-            assert current_byte = [bytes + index];
+        // Convert the chunks to the 8 bytes little endian words hashed by keccak
+        let (local words: felt*) = alloc();
+        Helpers.bytes16_to_bytes8_little_endian(chunks_len, chunks, words);
+        let keccak_ptr = keccak_segment.keccak_ptr;
+        with keccak_ptr {
+            let (hash) = keccak_bigend(inputs=words, n_bytes=size);
         }
-
-        let (bit_shift) = pow(256, byte8_shift);
-
-        let _byte8 = byte8 + bit_shift * current_byte;
-
-        let byte8_full = is_le(a=7, b=byte8_shift);
-        let end_of_loop = is_le(size, index + 1);
-        let write_to_dest = is_le(1, byte8_full + end_of_loop);
-        if (write_to_dest != FALSE) {
-            assert dest[dest_index] = _byte8;
-            return bytes_to_byte8_little_endian(
-                bytes_len, bytes, index + 1, size, 0, 0, dest, dest_index + 1
+        tempvar hash_ptr: Uint256* = new Uint256(low=hash.low, high=hash.high);
+        dict_write{dict_ptr=memo}(key, cast(hash_ptr, felt));
+
+        tempvar new_segment = new model.KeccakSegment(
+            keccak_ptr_start=keccak_segment.keccak_ptr_start,
+            keccak_ptr=keccak_ptr,
+            memo_start=keccak_segment.memo_start,
+            memo=memo,
             );
+        return (new_segment, hash);
+    }
+
+    // @notice Chain the pedersen hashes of the chunks, starting from the given hash.
+    // @param hash The current digest.
+    // @param chunks_len The number of remaining chunks.
+    // @param chunks The remaining chunks.
+    // @return The digest of all the chunks.
+    func hash_chunks{hash_ptr: HashBuiltin*}(hash: felt, chunks_len: felt, chunks: felt*) -> felt {
+        if (chunks_len == 0) {
+            return hash;
         }
-        return bytes_to_byte8_little_endian(
-            bytes_len, bytes, index + 1, size, _byte8, byte8_shift + 1, dest, dest_index
-        );
+        let (hash) = hash2(hash, [chunks]);
+        return hash_chunks(hash, chunks_len - 1, chunks + 1);
     }
 }
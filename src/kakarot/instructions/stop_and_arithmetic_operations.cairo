@@ -22,6 +22,7 @@ from openzeppelin.security.safemath.library import SafeUint256
 from kakarot.model import model
 from kakarot.execution_context import ExecutionContext
 from kakarot.stack import Stack
+from utils.utils import Helpers
 
 // @title Arithmetic operations opcodes.
 // @notice This contract contains the functions to execute for arithmetic operations opcodes.
@@ -39,6 +40,7 @@ namespace StopAndArithmeticOperations {
     const GAS_COST_ADDMOD = 8;
     const GAS_COST_MULMOD = 8;
     const GAS_COST_EXP = 10;
+    const GAS_COST_EXP_BYTE = 50;
     const GAS_COST_SIGNEXTEND = 5;
 
     // @notice 0x00 - STOP
@@ -385,7 +387,7 @@ namespace StopAndArithmeticOperations {
     // @dev Exp operation
     // @custom:since Frontier
     // @custom:group Stop and Arithmetic Operations
-    // @custom:gas 10
+    // @custom:gas 10 + dynamic gas
     // @custom:stack_consumed_elements 2
     // @custom:stack_produced_elements 1
     // @param ctx The pointer to the execution context.
@@ -412,7 +414,12 @@ namespace StopAndArithmeticOperations {
         // Stack output:
         // integer result of a ** b
         let stack: model.Stack* = Stack.push(self=stack, element=result);
-        let ctx = apply_context_changes(ctx=ctx, stack=stack, gas_cost=GAS_COST_EXP);
+
+        // dynamic_gas := 50 * exponent_byte_size
+        let exponent_byte_size = Helpers.bytes_used(b);
+        let ctx = apply_context_changes(
+            ctx=ctx, stack=stack, gas_cost=GAS_COST_EXP + GAS_COST_EXP_BYTE * exponent_byte_size
+        );
         return ctx;
     }
 
@@ -478,10 +485,7 @@ namespace StopAndArithmeticOperations {
     func apply_context_changes(
         ctx: model.ExecutionContext*, stack: model.Stack*, gas_cost: felt
     ) -> model.ExecutionContext* {
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(self=ctx, new_stack=stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=gas_cost);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, gas_cost);
         return ctx;
     }
 }
@@ -25,8 +25,11 @@ from kakarot.constants import (
 from kakarot.precompiles.precompiles import Precompiles
 from kakarot.execution_context import ExecutionContext
 from kakarot.interfaces.interfaces import IEvmContract, IRegistry, IEth
+from kakarot.journal import Journal
+from kakarot.jumpdest_bitmap import JumpdestBitmap
 from kakarot.memory import Memory
 from kakarot.model import model
+from kakarot.registry_cache import RegistryCache
 from kakarot.stack import Stack
 from utils.utils import Helpers
 
@@ -37,9 +40,11 @@ from utils.utils import Helpers
 namespace SystemOperations {
     // Gas cost generated from using a CALL opcode (CALL, STATICCALL, etc.) with positive value parameter
     const GAS_COST_POSITIVE_VALUE = 9000;
-    // Gas cost generated from accessing a "cold" address in the network: https://www.evm.codes/about#accesssets
-    const GAS_COST_COLD_ADDRESS_ACCESS = 2600;
+    // Gas cost generated from sending value with CALL to an empty account, see EIP-161
+    const GAS_COST_VALUE_TO_EMPTY_ACCOUNT = 25000;
     const GAS_COST_CREATE = 32000;
+    // Gas cost per byte of the code deployed by CREATE and CREATE2
+    const GAS_COST_CODE_DEPOSIT = 200;
     // @notice CREATE operation.
     // @custom:since Frontier
     // @custom:group System Operations
@@ -55,9 +60,11 @@ namespace SystemOperations {
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
         alloc_locals;
 
-        // This instruction is disallowed when called from a `staticcall` context, which we demark by a read_only attribute
-        with_attr error_message("Kakarot: StateModificationError") {
-            assert ctx.read_only = FALSE;
+        // This instruction is disallowed when called from a `staticcall` context, which we demark by a read_only attribute.
+        // Such a context is always a sub context, which reverts consuming all its gas
+        if (ctx.environment.read_only != FALSE) {
+            let ctx = ExecutionContext.out_of_gas(ctx);
+            return ctx;
         }
 
         // Stack input:
@@ -65,7 +72,6 @@ namespace SystemOperations {
         // 1 - offset: byte offset in the memory in bytes (initialization code)
         // 2 - size: byte size to copy (size of initialization code)
         let (stack, popped) = Stack.pop_n(self=ctx.stack, n=3);
-        let ctx = ExecutionContext.update_stack(ctx, stack);
 
         let value = popped[0];
         let offset = popped[1];
@@ -77,12 +83,22 @@ namespace SystemOperations {
         // -> ``memory_expansion_cost + deployment_code_execution_cost + code_deposit_cost`` is handled inside ``initialize_sub_context``
         let (minimum_word_size) = Helpers.minimum_word_count(size.low);
         let word_size_gas = 6 * minimum_word_size;
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=word_size_gas);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, word_size_gas);
+
+        // Kakarot accounts have no nonce, the global deployment counter is used instead
+        let (ctx, bytecode) = CreateHelper.load_init_code(ctx, offset.low, size.low);
+        let keccak_ptr = ctx.cold.keccak_segment.keccak_ptr;
+        with keccak_ptr {
+            let evm_contract_address = ContractAccount.compute_create_address(
+                ctx.environment.evm_contract_address, _salt
+            );
+        }
+        let ctx = ExecutionContext.update_keccak_ptr(ctx, keccak_ptr);
+        salt.write(_salt + 1);
 
         let sub_ctx = CreateHelper.initialize_sub_context(
-            ctx, value.low, offset.low, size.low, _salt
+            ctx, value.low, size.low, bytecode, evm_contract_address
         );
-        salt.write(_salt + 1);
 
         return sub_ctx;
     }
@@ -102,9 +118,11 @@ namespace SystemOperations {
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
         alloc_locals;
 
-        // This instruction is disallowed when called from a `staticcall` context, which we demark by a read_only attribute
-        with_attr error_message("Kakarot: StateModificationError") {
-            assert ctx.read_only = FALSE;
+        // This instruction is disallowed when called from a `staticcall` context, which we demark by a read_only attribute.
+        // Such a context is always a sub context, which reverts consuming all its gas
+        if (ctx.environment.read_only != FALSE) {
+            let ctx = ExecutionContext.out_of_gas(ctx);
+            return ctx;
         }
 
         // Stack input:
@@ -113,22 +131,32 @@ namespace SystemOperations {
         // 2 - size: byte size to copy (size of initialization code)
         // 3 - salt: salt for address generation
         let (stack, popped) = Stack.pop_n(self=ctx.stack, n=4);
-        let ctx = ExecutionContext.update_stack(ctx, stack);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, 0);
 
         let value = popped[0];
         let offset = popped[1];
         let size = popped[2];
         let salt = popped[3];
 
+        let (ctx, bytecode) = CreateHelper.load_init_code(ctx, offset.low, size.low);
+        let keccak_ptr = ctx.cold.keccak_segment.keccak_ptr;
+        with keccak_ptr {
+            let evm_contract_address = ContractAccount.compute_create2_address(
+                ctx.environment.evm_contract_address, salt, size.low, bytecode
+            );
+        }
+        let ctx = ExecutionContext.update_keccak_ptr(ctx, keccak_ptr);
+
         let sub_ctx = CreateHelper.initialize_sub_context(
-            ctx, value.low, offset.low, size.low, salt.low
+            ctx, value.low, size.low, bytecode, evm_contract_address
         );
 
         return sub_ctx;
     }
 
     // @notice INVALID operation.
-    // @dev Designated invalid instruction.
+    // @dev Designated invalid instruction. A sub context reverts, consuming all its gas. The
+    // @dev instruction in the root context fails the whole transaction.
     // @custom:since Frontier
     // @custom:group System Operations
     // @custom:gas NaN
@@ -142,11 +170,11 @@ namespace SystemOperations {
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
+        let is_parent_root = ExecutionContext.is_root(ctx.environment.calling_context);
         with_attr error_message("Kakarot: 0xFE: Invalid Opcode") {
-            assert TRUE = FALSE;
+            assert is_parent_root = FALSE;
         }
-        // TODO: map the concept of consuming all the gas given to the context
-
+        let ctx = ExecutionContext.out_of_gas(ctx);
         return ctx;
     }
 
@@ -168,15 +196,11 @@ namespace SystemOperations {
         let stack = ctx.stack;
         let (stack, offset) = Stack.pop(stack);
         let (stack, size) = Stack.pop(stack);
-        let ctx = ExecutionContext.update_stack(ctx, stack);
 
         let (memory, gas_cost) = Memory.load_n(
             self=ctx.memory, element_len=size.low, element=ctx.return_data, offset=offset.low
         );
-        let ctx = ExecutionContext.update_memory(self=ctx, new_memory=memory);
-
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, gas_cost);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, memory, 0, gas_cost);
 
         // Note: only new data_len needs to be updated indeed.
         let ctx = ExecutionContext.update_return_data(
@@ -189,7 +213,8 @@ namespace SystemOperations {
     }
 
     // @notice REVERT operation.
-    // @dev
+    // @dev Stop the current context, returning data and undoing its state changes. A reverting
+    // @dev root context fails the whole transaction.
     // @custom:since Byzantium
     // @custom:group System Operations
     // @custom:gas 0 + dynamic gas
@@ -204,31 +229,33 @@ namespace SystemOperations {
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
         alloc_locals;
 
-        // Get stack and memory from context
-        let stack = ctx.stack;
-        let memory = ctx.memory;
-
         // Stack input:
-        // 0 - size: byte size to copy
-        // 1 - offset: byte offset in the memory in bytes
-        let (stack, popped) = Stack.pop_n(self=stack, n=2);
-        // TODO: implement loading of the revert reason based on size value,
-        // currently limited by short string size
-        let size = popped[0];
-        let offset = popped[1];
-
-        // Load revert reason from offset
-        let (memory, revert_reason_uint256, gas_cost) = Memory.load(memory, offset.low);
-        local revert_reason = revert_reason_uint256.low;
-
-        // revert with loaded revert reason short string
-        with_attr error_message("Kakarot: Reverted with reason: {revert_reason}") {
-            assert TRUE = FALSE;
+        // 0 - offset: byte offset in the memory in bytes
+        // 1 - size: byte size to copy
+        let (stack, popped) = Stack.pop_n(self=ctx.stack, n=2);
+        let offset = popped[0];
+        let size = popped[1];
+
+        let is_root = ExecutionContext.is_root(ctx.environment.calling_context);
+        if (is_root != FALSE) {
+            // The reported reason is the low part of the memory word at the second stack input,
+            // as before sub contexts could revert
+            let (memory, revert_reason_uint256, gas_cost) = Memory.load(ctx.memory, size.low);
+            local revert_reason = revert_reason_uint256.low;
+            with_attr error_message("Kakarot: Reverted with reason: {revert_reason}") {
+                assert TRUE = FALSE;
+            }
+            return ctx;
         }
-        // TODO: this is never reached, raising with cairo prevent from implementing a true REVERT
-        // TODO: that still returns some data. This is especially problematic for sub contexts.
-        let ctx = ExecutionContext.update_memory(self=ctx, new_memory=memory);
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=gas_cost);
+
+        let (memory, gas_cost) = Memory.load_n(
+            self=ctx.memory, element_len=size.low, element=ctx.return_data, offset=offset.low
+        );
+        let ctx = ExecutionContext.apply_changes(ctx, stack, memory, 0, gas_cost);
+        let ctx = ExecutionContext.update_return_data(
+            ctx, new_return_data_len=size.low, new_return_data=ctx.return_data
+        );
+        let ctx = ExecutionContext.revert(ctx);
         return ctx;
     }
 
@@ -246,14 +273,25 @@ namespace SystemOperations {
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
-        let sub_ctx = CallHelper.init_sub_context(
-            calling_ctx=ctx, with_value=TRUE, read_only=ctx.read_only
-        );
         // This instruction is disallowed when called from a `staticcall` context when there is an attempt to transfer funds, which occurs when there is a nonzero value argument.
-        with_attr error_message("Kakarot: StateModificationError") {
-            assert ctx.read_only * sub_ctx.call_context.value = FALSE;
+        // Such a context is always a sub context, which reverts consuming all its gas
+        if (ctx.environment.read_only != FALSE) {
+            let (_, value) = Stack.peek(ctx.stack, 2);
+            if (value.low + value.high != 0) {
+                let ctx = ExecutionContext.out_of_gas(ctx);
+                return ctx;
+            }
+            tempvar range_check_ptr = range_check_ptr;
+        } else {
+            tempvar range_check_ptr = range_check_ptr;
         }
 
+        let sub_ctx = CallHelper.init_sub_context(
+            calling_ctx=ctx,
+            with_value=TRUE,
+            transfers_value=TRUE,
+            read_only=ctx.environment.read_only,
+        );
         return sub_ctx;
     }
 
@@ -272,7 +310,7 @@ namespace SystemOperations {
         bitwise_ptr: BitwiseBuiltin*,
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
         let sub_ctx = CallHelper.init_sub_context(
-            calling_ctx=ctx, with_value=FALSE, read_only=TRUE
+            calling_ctx=ctx, with_value=FALSE, transfers_value=FALSE, read_only=TRUE
         );
         return sub_ctx;
     }
@@ -292,10 +330,13 @@ namespace SystemOperations {
         bitwise_ptr: BitwiseBuiltin*,
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
         let sub_ctx = CallHelper.init_sub_context(
-            calling_ctx=ctx, with_value=TRUE, read_only=ctx.read_only
+            calling_ctx=ctx,
+            with_value=TRUE,
+            transfers_value=FALSE,
+            read_only=ctx.environment.read_only,
         );
         let sub_ctx = ExecutionContext.update_addresses(
-            sub_ctx, ctx.starknet_contract_address, ctx.evm_contract_address
+            sub_ctx, ctx.environment.starknet_contract_address, ctx.environment.evm_contract_address
         );
 
         return sub_ctx;
@@ -316,10 +357,13 @@ namespace SystemOperations {
         bitwise_ptr: BitwiseBuiltin*,
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
         let sub_ctx = CallHelper.init_sub_context(
-            calling_ctx=ctx, with_value=FALSE, read_only=ctx.read_only
+            calling_ctx=ctx,
+            with_value=FALSE,
+            transfers_value=FALSE,
+            read_only=ctx.environment.read_only,
         );
         let sub_ctx = ExecutionContext.update_addresses(
-            sub_ctx, ctx.starknet_contract_address, ctx.evm_contract_address
+            sub_ctx, ctx.environment.starknet_contract_address, ctx.environment.evm_contract_address
         );
 
         return sub_ctx;
@@ -340,9 +384,11 @@ namespace SystemOperations {
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
         alloc_locals;
 
-        // This instruction is disallowed when called from a `staticcall` context, which we demark by a read_only attribute
-        with_attr error_message("Kakarot: StateModificationError") {
-            assert ctx.read_only = FALSE;
+        // This instruction is disallowed when called from a `staticcall` context, which we demark by a read_only attribute.
+        // Such a context is always a sub context, which reverts consuming all its gas
+        if (ctx.environment.read_only != FALSE) {
+            let ctx = ExecutionContext.out_of_gas(ctx);
+            return ctx;
         }
 
         // Get stack and memory from context
@@ -351,26 +397,46 @@ namespace SystemOperations {
         // Stack input:
         // 0 - address: account to send the current balance to
         let (stack, address_uint256) = Stack.pop(stack);
-        let ctx = ExecutionContext.update_stack(ctx, stack);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, 0);
 
         let address_felt = Helpers.uint256_to_felt(address_uint256);
 
+        // The native tokens are sent to the starknet account of the recipient, the registered one
+        // or the one at the computed address of a contract account
+        let (registry_cache, registered_recipient) = RegistryCache.get_starknet_contract_address(
+            ctx.cold.registry_cache, address_felt
+        );
+        let ctx = ExecutionContext.update_registry_cache(ctx, registry_cache);
+
+        local recipient;
+        if (registered_recipient != 0) {
+            recipient = registered_recipient;
+
+            tempvar syscall_ptr = syscall_ptr;
+            tempvar pedersen_ptr = pedersen_ptr;
+            tempvar range_check_ptr = range_check_ptr;
+        } else {
+            let computed_recipient = ContractAccount.compute_starknet_address(address_felt);
+            recipient = computed_recipient;
+
+            tempvar syscall_ptr = syscall_ptr;
+            tempvar pedersen_ptr = pedersen_ptr;
+            tempvar range_check_ptr = range_check_ptr;
+        }
+
         // Get the number of native tokens owned by the given starknet
-        // account and transfer them to receiver
+        // account, transferred to receiver when the transaction ends unless the context reverts
         let (native_token_address_) = native_token_address.read();
         let (balance: Uint256) = IEth.balanceOf(
-            contract_address=native_token_address_, account=ctx.starknet_contract_address
-        );
-        let (success) = IEth.transfer(
-            contract_address=native_token_address_, recipient=address_felt, amount=balance
+            contract_address=native_token_address_,
+            account=ctx.environment.starknet_contract_address,
         );
-        with_attr error_message("Kakarot: Transfer failed") {
-            assert success = TRUE;
-        }
+        let journal = Journal.record_transfer(ctx.cold.journal, recipient, balance);
+        let ctx = ExecutionContext.update_journal(ctx, journal);
 
         // Save contract to be destroyed at the end of the transaction
         let ctx = ExecutionContext.push_to_destroy_contract(
-            self=ctx, destroy_contract=ctx.starknet_contract_address
+            self=ctx, destroy_contract=ctx.environment.starknet_contract_address
         );
 
         return ctx;
@@ -386,55 +452,59 @@ namespace CallHelper {
         value: felt,
         args_size: felt,
         calldata: felt*,
+        ret_offset: felt,
         ret_size: felt,
-        return_data: felt*,
     }
 
     // @dev: with_value arg lets specify if the call requires a value (CALL, CALLCODE) or not (STATICCALL, DELEGATECALL).
+    // @dev: transfers_value arg lets specify if the value is sent to the called account (CALL) rather than
+    // @dev: kept by the calling account (CALLCODE).
     // @return The pointer to the context and call args.
     func prepare_args{
         syscall_ptr: felt*,
         pedersen_ptr: HashBuiltin*,
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
-    }(ctx: model.ExecutionContext*, with_value: felt) -> (
+    }(ctx: model.ExecutionContext*, with_value: felt, transfers_value: felt) -> (
         ctx: model.ExecutionContext*, call_args: CallArgs
     ) {
         alloc_locals;
         let (stack, popped) = Stack.pop_n(self=ctx.stack, n=6 + with_value);
-        let ctx = ExecutionContext.update_stack(ctx, stack);
 
         let gas = 2 ** 128 * popped[0].high + popped[0].low;
         let address = 2 ** 128 * popped[1].high + popped[1].low;
         let stack_value = (2 ** 128 * popped[2].high + popped[2].low) * with_value;
         // if the call op expects value to be on the stack, we return it, else the value is the calling call context value
-        let value = with_value * stack_value + (1 - with_value) * ctx.call_context.value;
+        let value = with_value * stack_value + (1 - with_value) * ctx.environment.call_context.value;
         let args_offset = 2 ** 128 * popped[2 + with_value].high + popped[2 + with_value].low;
         let args_size = 2 ** 128 * popped[3 + with_value].high + popped[3 + with_value].low;
         let ret_offset = 2 ** 128 * popped[4 + with_value].high + popped[4 + with_value].low;
         let ret_size = 2 ** 128 * popped[5 + with_value].high + popped[5 + with_value].low;
 
-        // Note: We store the offset here because we can't pre-allocate a memory segment in cairo
-        // During teardown we update the memory using this offset
-        let return_data: felt* = alloc();
-        assert [return_data] = ret_offset;
-
         // Load calldata from Memory
         let (calldata: felt*) = alloc();
         let (memory, gas_cost) = Memory.load_n(
             self=ctx.memory, element_len=args_size, element=calldata, offset=args_offset
         );
+        // The memory where the returned data is written is expanded, and paid for, before the call
+        let (memory, ret_gas_cost) = ensure_ret_length(memory, ret_offset, ret_size);
+
+        let (ctx, local access_gas_cost) = ExecutionContext.access_address(ctx, address);
 
-        // TODO: account for value_to_empty_account_cost in dynamic gas
         let value_nn = is_nn(value);
         let value_not_zero = is_not_zero(value);
         let value_is_positive = value_nn * value_not_zero;
-        let dynamic_gas = gas_cost + SystemOperations.GAS_COST_COLD_ADDRESS_ACCESS + SystemOperations.GAS_COST_POSITIVE_VALUE * value_is_positive;
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=dynamic_gas);
+        let (ctx, local empty_account_gas_cost) = value_to_empty_account_cost(
+            ctx, address, transfers_value * value_is_positive
+        );
+        let dynamic_gas = gas_cost + ret_gas_cost + access_gas_cost + empty_account_gas_cost +
+            SystemOperations.GAS_COST_POSITIVE_VALUE * value_is_positive;
+        let ctx = ExecutionContext.apply_changes(ctx, stack, memory, 0, dynamic_gas);
 
-        let remaining_gas = ctx.gas_limit - ctx.gas_used;
-        let (max_allowed_gas, _) = Helpers.div_rem(remaining_gas, 64);
-        let gas_limit = Helpers.min(gas, max_allowed_gas);
+        // The sub context gets at most all but one 64th of the remaining gas, see EIP-150
+        let remaining_gas = ctx.environment.gas_limit - ctx.gas_used;
+        let (one_64th, _) = Helpers.div_rem(remaining_gas, 64);
+        let gas_limit = Helpers.min(gas, remaining_gas - one_64th);
 
         let call_args = CallArgs(
             gas=gas_limit,
@@ -442,18 +512,73 @@ namespace CallHelper {
             value=value,
             args_size=args_size,
             calldata=calldata,
+            ret_offset=ret_offset,
             ret_size=ret_size,
-            return_data=return_data + 1,
         );
 
-        let ctx = ExecutionContext.update_memory(ctx, memory);
-
         return (ctx, call_args);
     }
 
+    // @notice Compute the gas cost of sending value to an empty account, which creates it, see EIP-161.
+    // @dev An empty account has no code, nonce nor balance. Kakarot accounts have no nonce: the
+    // @dev registered accounts are deployed contract accounts or EOAs, which are never empty, and the
+    // @dev native tokens of an unregistered account are held by its computed starknet address.
+    // @param ctx The pointer to the calling context.
+    // @param address The evm address of the called account.
+    // @param transfers_value Whether a positive value is sent to the called account.
+    // @return The pointer to the updated calling context and the gas cost.
+    func value_to_empty_account_cost{
+        syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr
+    }(ctx: model.ExecutionContext*, address: felt, transfers_value: felt) -> (
+        ctx: model.ExecutionContext*, gas_cost: felt
+    ) {
+        alloc_locals;
+        if (transfers_value == FALSE) {
+            return (ctx, 0);
+        }
+
+        let (registry_cache, registered_account) = RegistryCache.get_starknet_contract_address(
+            ctx.cold.registry_cache, address
+        );
+        let ctx = ExecutionContext.update_registry_cache(ctx, registry_cache);
+        if (registered_account != 0) {
+            return (ctx, 0);
+        }
+        let is_legacy = ContractAccount.is_legacy_address(address);
+        if (is_legacy != FALSE) {
+            return (ctx, SystemOperations.GAS_COST_VALUE_TO_EMPTY_ACCOUNT);
+        }
+
+        let starknet_contract_address = ContractAccount.compute_starknet_address(address);
+        let (native_token_address_) = native_token_address.read();
+        let (balance: Uint256) = IEth.balanceOf(
+            contract_address=native_token_address_, account=starknet_contract_address
+        );
+        if (balance.low + balance.high != 0) {
+            return (ctx, 0);
+        }
+        return (ctx, SystemOperations.GAS_COST_VALUE_TO_EMPTY_ACCOUNT);
+    }
+
+    // @notice Expand the memory to hold the data returned by a call, if any.
+    // @param memory The pointer to the memory of the calling context.
+    // @param ret_offset The offset of the returned data in memory.
+    // @param ret_size The size of the returned data.
+    // @return The pointer to the memory and the gas cost of this expansion.
+    func ensure_ret_length{range_check_ptr}(
+        memory: model.Memory*, ret_offset: felt, ret_size: felt
+    ) -> (memory: model.Memory*, gas_cost: felt) {
+        if (ret_size == 0) {
+            return (memory, 0);
+        }
+        let (memory, gas_cost) = Memory.ensure_length(self=memory, length=ret_offset + ret_size);
+        return (memory, gas_cost);
+    }
+
     // @notice The shared logic of the CALL ops, allowing CALL, CALLCODE, STATICCALL, and DELEGATECALL to share structure and parameterize whether the call requires a value (CALL, CALLCODE) and whether the returned sub context's is read only (STATICCODE)
     // @param calling_ctx The pointer to the calling execution context.
     // @param with_value The boolean that determines whether the sub-context's calling context has a value read from the calling context's stack or the calling context's calling context.
+    // @param transfers_value The boolean that determines whether the value is sent to the called account.
     // @param read_only The boolean that determines whether state modifications can be executed from the sub-execution context.
     // @return The pointer to the sub context.
     func init_sub_context{
@@ -462,10 +587,13 @@ namespace CallHelper {
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
     }(
-        calling_ctx: model.ExecutionContext*, with_value: felt, read_only: felt
+        calling_ctx: model.ExecutionContext*,
+        with_value: felt,
+        transfers_value: felt,
+        read_only: felt,
     ) -> model.ExecutionContext* {
         let (calling_ctx, call_args) = CallHelper.prepare_args(
-            ctx=calling_ctx, with_value=with_value
+            ctx=calling_ctx, with_value=with_value, transfers_value=transfers_value
         );
 
         // Check if the called address is a precompiled contract
@@ -473,12 +601,13 @@ namespace CallHelper {
         if (is_precompile == TRUE) {
             let sub_ctx = Precompiles.run(
                 address=call_args.address,
+                gas_limit=call_args.gas,
                 calldata_len=call_args.args_size,
                 calldata=call_args.calldata,
                 value=call_args.value,
                 calling_context=calling_ctx,
-                return_data_len=call_args.ret_size,
-                return_data=call_args.return_data,
+                ret_offset=call_args.ret_offset,
+                ret_size=call_args.ret_size,
             );
             return sub_ctx;
         }
@@ -490,14 +619,17 @@ namespace CallHelper {
             calldata=call_args.calldata,
             value=call_args.value,
             calling_context=calling_ctx,
-            return_data_len=call_args.ret_size,
-            return_data=call_args.return_data,
+            ret_offset=call_args.ret_offset,
+            ret_size=call_args.ret_size,
             read_only=read_only,
         );
 
         return sub_ctx;
     }
     // @notice At the end of a sub-context call, the calling context's stack and memory are updated.
+    // @dev The state changes of a reverted sub-context are undone and 0 is pushed on the stack.
+    // @dev The return data of the sub-context is written in the calling context memory at ret_offset,
+    // @dev truncated to ret_size, and remains readable with RETURNDATACOPY until the next call.
     // @return The pointer to the updated calling context.
     func finalize_calling_context{
         syscall_ptr: felt*,
@@ -506,66 +638,142 @@ namespace CallHelper {
         bitwise_ptr: BitwiseBuiltin*,
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
         alloc_locals;
-        // TODO: success should be taken from ctx but revert is currently just raising so
-        // TODO: writing here TRUE: with the current implementation, a reverting sub_context
-        // TODO: would break the whole computation, so if it does not, it's TRUE
-        let success = Uint256(low=1, high=0);
-        let ctx = ExecutionContext.update_sub_context(ctx.calling_context, ctx);
-        let ctx = ExecutionContext.increment_gas_used(ctx, ctx.sub_context.gas_used);
-
-        // Append contracts selfdestruct to the calling_context
-        let ctx = ExecutionContext.push_to_destroy_contracts(
-            self=ctx,
-            destroy_contracts_len=ctx.sub_context.destroy_contracts_len,
-            destroy_contracts=ctx.sub_context.destroy_contracts,
-        );
+        let ctx = take_back_state(ctx);
 
+        let success = Uint256(low=1 - ctx.sub_context.reverted, high=0);
         let stack = Stack.push(ctx.stack, success);
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        // ret_offset, see prepare_args
+        let sub_env = ctx.sub_context.environment;
+        let ret_size = Helpers.min(ctx.sub_context.return_data_len, sub_env.ret_size);
         let memory = Memory.store_n(
-            ctx.memory,
-            ctx.sub_context.return_data_len,
-            ctx.sub_context.return_data,
-            [ctx.sub_context.return_data - 1],
+            ctx.memory, ret_size, ctx.sub_context.return_data, sub_env.ret_offset
         );
-        let ctx = ExecutionContext.update_memory(ctx, memory);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, memory, 0, ctx.sub_context.gas_used);
 
         return ctx;
     }
+
+    // @notice Resume the calling context of a stopped sub context, taking back the state they share.
+    // @dev The state changes of a reverted sub context are undone, otherwise its journal and the
+    // @dev contracts it destroyed are appended to the ones of the calling context.
+    // @param sub_ctx The pointer to the stopped sub context.
+    // @return The pointer to the calling context, with sub_ctx as sub context.
+    func take_back_state{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        sub_ctx: model.ExecutionContext*
+    ) -> model.ExecutionContext* {
+        alloc_locals;
+        let ctx = sub_ctx.environment.calling_context;
+        if (sub_ctx.reverted != FALSE) {
+            let (storage_cache, registry_cache, access_set) = Journal.revert(
+                sub_ctx.cold.journal,
+                sub_ctx.cold.storage_cache,
+                sub_ctx.cold.registry_cache,
+                sub_ctx.cold.access_set,
+            );
+            tempvar cold = new model.ColdState(
+                destroy_contracts_len=ctx.cold.destroy_contracts_len,
+                destroy_contracts=ctx.cold.destroy_contracts,
+                storage_cache=storage_cache,
+                registry_cache=registry_cache,
+                access_set=access_set,
+                keccak_segment=sub_ctx.cold.keccak_segment,
+                journal=ctx.cold.journal,
+                );
+            tempvar syscall_ptr = syscall_ptr;
+            tempvar pedersen_ptr = pedersen_ptr;
+            tempvar range_check_ptr = range_check_ptr;
+        } else {
+            // Append contracts selfdestruct to the calling_context
+            Helpers.fill_array(
+                fill_len=sub_ctx.cold.destroy_contracts_len,
+                input_arr=sub_ctx.cold.destroy_contracts,
+                output_arr=ctx.cold.destroy_contracts + ctx.cold.destroy_contracts_len,
+            );
+            let journal = Journal.merge(ctx.cold.journal, sub_ctx.cold.journal);
+            tempvar destroy_contracts_len = ctx.cold.destroy_contracts_len +
+                sub_ctx.cold.destroy_contracts_len;
+            tempvar cold = new model.ColdState(
+                destroy_contracts_len=destroy_contracts_len,
+                destroy_contracts=ctx.cold.destroy_contracts,
+                storage_cache=sub_ctx.cold.storage_cache,
+                registry_cache=sub_ctx.cold.registry_cache,
+                access_set=sub_ctx.cold.access_set,
+                keccak_segment=sub_ctx.cold.keccak_segment,
+                journal=journal,
+                );
+            tempvar syscall_ptr = syscall_ptr;
+            tempvar pedersen_ptr = pedersen_ptr;
+            tempvar range_check_ptr = range_check_ptr;
+        }
+
+        let ctx = sub_ctx.environment.calling_context;
+        return new model.ExecutionContext(
+            environment=ctx.environment,
+            program_counter=ctx.program_counter,
+            stopped=ctx.stopped,
+            return_data=ctx.return_data,
+            return_data_len=ctx.return_data_len,
+            stack=ctx.stack,
+            memory=ctx.memory,
+            gas_used=ctx.gas_used,
+            sub_context=sub_ctx,
+            reverted=ctx.reverted,
+            cold=cold,
+            );
+    }
 }
 
 namespace CreateHelper {
-    // @notice Deploy a new Contract account and initialize a sub context at these addresses
-    //         with bytecode from calling context memory.
-    // @return The pointer to the updated calling context.
-    func initialize_sub_context{
+    // @notice Load the init code of a CREATE or CREATE2 from the calling context memory.
+    // @param offset: The offset of the init code in memory.
+    // @param size: The size of the init code.
+    // @return The pointer to the updated calling context and the init code.
+    func load_init_code{
         syscall_ptr: felt*,
         pedersen_ptr: HashBuiltin*,
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
-    }(
-        ctx: model.ExecutionContext*, value: felt, offset: felt, size: felt, salt: felt
-    ) -> model.ExecutionContext* {
+    }(ctx: model.ExecutionContext*, offset: felt, size: felt) -> (
+        ctx: model.ExecutionContext*, bytecode: felt*
+    ) {
         alloc_locals;
-        let (evm_contract_address, starknet_contract_address) = ContractAccount.deploy(salt);
-
-        // Load bytecode code from memory
-        let (bytecode: felt*) = alloc();
+        let (local bytecode: felt*) = alloc();
         let (memory, gas_cost) = Memory.load_n(
             self=ctx.memory, element_len=size, element=bytecode, offset=offset
         );
-        let ctx = ExecutionContext.update_memory(ctx, memory);
+        let ctx = ExecutionContext.apply_changes(
+            ctx, ctx.stack, memory, 0, gas_cost + SystemOperations.GAS_COST_CREATE
+        );
+
+        return (ctx, bytecode);
+    }
 
-        let ctx = ExecutionContext.increment_gas_used(
-            self=ctx, inc_value=gas_cost + SystemOperations.GAS_COST_CREATE
+    // @notice Deploy a new Contract account at the given evm address and initialize a sub context at these addresses
+    //         with the given init code.
+    // @return The pointer to the sub context.
+    func initialize_sub_context{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(
+        ctx: model.ExecutionContext*,
+        value: felt,
+        size: felt,
+        bytecode: felt*,
+        evm_contract_address: felt,
+    ) -> model.ExecutionContext* {
+        alloc_locals;
+        let (evm_contract_address, starknet_contract_address) = ContractAccount.deploy(
+            evm_contract_address
         );
 
         // Prepare execution context
         let (empty_array: felt*) = alloc();
+        let (_, valid_jumpdests) = JumpdestBitmap.compute(size, bytecode);
         tempvar call_context: model.CallContext* = new model.CallContext(
             bytecode=bytecode,
             bytecode_len=size,
+            valid_jumpdests=valid_jumpdests,
             calldata=empty_array,
             calldata_len=0,
             value=value,
@@ -575,8 +783,39 @@ namespace CreateHelper {
         let stack = Stack.init();
         let memory = Memory.init();
         let empty_context = ExecutionContext.init_empty();
-        tempvar sub_ctx = new model.ExecutionContext(
+        let registry_cache = RegistryCache.set_account_entry(
+            ctx.cold.registry_cache, starknet_contract_address, evm_contract_address
+        );
+        // The deployment is the first change of the sub context, undone if it reverts
+        let journal = Journal.open(ctx.cold.journal);
+        let journal = Journal.record_deployment(
+            journal, starknet_contract_address, evm_contract_address
+        );
+        // The sub context gets all but one 64th of the remaining gas, see EIP-150
+        let remaining_gas = ctx.environment.gas_limit - ctx.gas_used;
+        let (one_64th, _) = Helpers.div_rem(remaining_gas, 64);
+        tempvar environment = new model.Environment(
             call_context=call_context,
+            gas_limit=remaining_gas - one_64th,
+            gas_price=0,
+            starknet_contract_address=starknet_contract_address,
+            evm_contract_address=evm_contract_address,
+            calling_context=ctx,
+            read_only=FALSE,
+            ret_offset=0,
+            ret_size=0,
+            );
+        tempvar cold = new model.ColdState(
+            destroy_contracts_len=0,
+            destroy_contracts=empty_destroy_contracts,
+            storage_cache=ctx.cold.storage_cache,
+            registry_cache=registry_cache,
+            access_set=ctx.cold.access_set,
+            keccak_segment=ctx.cold.keccak_segment,
+            journal=journal,
+            );
+        tempvar sub_ctx = new model.ExecutionContext(
+            environment=environment,
             program_counter=0,
             stopped=FALSE,
             return_data=return_data,
@@ -584,21 +823,18 @@ namespace CreateHelper {
             stack=stack,
             memory=memory,
             gas_used=0,
-            gas_limit=0,
-            gas_price=0,
-            starknet_contract_address=starknet_contract_address,
-            evm_contract_address=evm_contract_address,
-            calling_context=ctx,
             sub_context=empty_context,
-            destroy_contracts_len=0,
-            destroy_contracts=empty_destroy_contracts,
-            read_only=FALSE,
+            reverted=FALSE,
+            cold=cold,
             );
+        // The created address is warm, unless the sub context reverts, see EIP-2929
+        let (sub_ctx, _) = ExecutionContext.access_address(sub_ctx, evm_contract_address);
 
         return sub_ctx;
     }
 
     // @notice At the end of a sub-context initiated with CREATE or CREATE2, the calling context's stack is updated.
+    // @dev The code of a reverted sub-context is not deployed and 0 is pushed on the stack.
     // @return The pointer to the updated calling context.
     func finalize_calling_context{
         syscall_ptr: felt*,
@@ -608,31 +844,52 @@ namespace CreateHelper {
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
         alloc_locals;
 
-        IEvmContract.write_bytecode(
-            contract_address=ctx.starknet_contract_address,
-            bytecode_len=ctx.return_data_len,
-            bytecode=ctx.return_data,
+        let ctx = deposit_code(ctx);
+
+        let ctx = CallHelper.take_back_state(ctx);
+
+        let evm_contract_address = ctx.sub_context.environment.evm_contract_address * (
+            1 - ctx.sub_context.reverted);
+        let (address_high, address_low) = split_felt(evm_contract_address);
+        let stack = Stack.push(ctx.stack, Uint256(low=address_low, high=address_high));
+        let ctx = ExecutionContext.apply_changes(
+            ctx, stack, ctx.memory, 0, ctx.sub_context.gas_used
         );
 
-        // code_deposit_code := 200 * deployed_code_size * BYTES_PER_FELT (as Kakarot packs bytes inside a felt)
-        // dynamic_gas :=  deployment_code_execution_cost + code_deposit_cost
-        let dynamic_gas = ctx.gas_used + 200 * ctx.return_data_len * ContractAccount.BYTES_PER_FELT;
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=dynamic_gas);
+        return ctx;
+    }
 
-        local ctx: model.ExecutionContext* = ExecutionContext.update_sub_context(self=ctx.calling_context, sub_context=ctx);
-        let ctx = ExecutionContext.increment_gas_used(ctx, ctx.sub_context.gas_used);
+    // @notice Write the code returned by a stopped CREATE or CREATE2 sub-context to its account.
+    // @return The pointer to the updated sub-context.
+    func deposit_code{syscall_ptr: felt*, range_check_ptr}(
+        ctx: model.ExecutionContext*
+    ) -> model.ExecutionContext* {
+        alloc_locals;
+        if (ctx.reverted != FALSE) {
+            return ctx;
+        }
 
-        // Append contracts to selfdestruct to the calling_context
-        let ctx = ExecutionContext.push_to_destroy_contracts(
-            self=ctx,
-            destroy_contracts_len=ctx.sub_context.destroy_contracts_len,
-            destroy_contracts=ctx.sub_context.destroy_contracts,
+        // code_deposit_cost := 200 * deployed_code_size
+        local ctx: model.ExecutionContext* = ExecutionContext.apply_changes(
+            ctx,
+            ctx.stack,
+            ctx.memory,
+            0,
+            SystemOperations.GAS_COST_CODE_DEPOSIT * ctx.return_data_len,
         );
 
-        let (address_high, address_low) = split_felt(ctx.sub_context.evm_contract_address);
-        let stack = Stack.push(ctx.stack, Uint256(low=address_low, high=address_high));
-        let ctx = ExecutionContext.update_stack(ctx, stack);
+        // The code is not deployed if the sub-context cannot pay for it
+        let is_out_of_gas = is_le(ctx.environment.gas_limit + 1, ctx.gas_used);
+        if (is_out_of_gas != FALSE) {
+            let ctx = ExecutionContext.out_of_gas(ctx);
+            return ctx;
+        }
 
+        IEvmContract.write_bytecode(
+            contract_address=ctx.environment.starknet_contract_address,
+            bytecode_len=ctx.return_data_len,
+            bytecode=ctx.return_data,
+        );
         return ctx;
     }
 }
@@ -682,27 +939,18 @@ namespace SelfDestructHelper {
         alloc_locals;
 
         let empty_destroy_contracts = _finalize_loop(
-            ctx.destroy_contracts_len, ctx.destroy_contracts
+            ctx.cold.destroy_contracts_len, ctx.cold.destroy_contracts
         );
-
-        return new model.ExecutionContext(
-            call_context=ctx.call_context,
-            program_counter=ctx.program_counter,
-            stopped=ctx.stopped,
-            return_data=ctx.return_data,
-            return_data_len=ctx.return_data_len,
-            stack=ctx.stack,
-            memory=ctx.memory,
-            gas_used=ctx.gas_used,
-            gas_limit=ctx.gas_limit,
-            gas_price=ctx.gas_price,
-            starknet_contract_address=ctx.starknet_contract_address,
-            evm_contract_address=ctx.evm_contract_address,
-            calling_context=ctx.calling_context,
-            sub_context=ctx.sub_context,
+        tempvar cold = new model.ColdState(
             destroy_contracts_len=0,
             destroy_contracts=empty_destroy_contracts,
-            read_only=FALSE,
+            storage_cache=ctx.cold.storage_cache,
+            registry_cache=ctx.cold.registry_cache,
+            access_set=ctx.cold.access_set,
+            keccak_segment=ctx.cold.keccak_segment,
+            journal=ctx.cold.journal,
             );
+        let ctx = ExecutionContext.update_cold(ctx, cold);
+        return ctx;
     }
 }
@@ -42,12 +42,24 @@ namespace IEvmContract {
     }
     func bytecode() -> (bytecode_len: felt, bytecode: felt*) {
     }
+    func code_hash() -> (code_hash: Uint256) {
+    }
+    func valid_jumpdests() -> (valid_jumpdests_len: felt, valid_jumpdests: felt*) {
+    }
+    func bytecode_with_valid_jumpdests() -> (
+        bytecode_len: felt, bytecode: felt*, valid_jumpdests_len: felt, valid_jumpdests: felt*
+    ) {
+    }
     func write_bytecode(bytecode_len: felt, bytecode: felt*) {
     }
     func storage(key: Uint256) -> (value: Uint256) {
     }
     func write_storage(key: Uint256, value: Uint256) {
     }
+    func storage_batch(keys_len: felt, keys: Uint256*) -> (values_len: felt, values: Uint256*) {
+    }
+    func write_storage_batch(keys_len: felt, keys: Uint256*, values_len: felt, values: Uint256*) {
+    }
     func initialize(address: felt) {
     }
     func is_initialized() -> (is_initialized: felt) {
@@ -62,7 +74,13 @@ namespace IKakarot {
     }
 
     func execute_at_address(
-        address: felt, value: felt, gas_limit: felt, calldata_len: felt, calldata: felt*
+        address: felt,
+        value: felt,
+        gas_limit: felt,
+        calldata_len: felt,
+        calldata: felt*,
+        access_list_len: felt,
+        access_list: felt*,
     ) {
     }
 
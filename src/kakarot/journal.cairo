@@ -0,0 +1,215 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bool import TRUE
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.uint256 import Uint256
+
+// Internal dependencies
+from kakarot.access_set import AccessSet
+from kakarot.constants import native_token_address, registry_address
+from kakarot.interfaces.interfaces import IEth, IEvmContract, IRegistry
+from kakarot.model import model
+from kakarot.registry_cache import RegistryCache
+from kakarot.storage_cache import StorageCache
+
+// @title Journal related functions.
+// @notice This file contains functions related to the journal of the state changes of a transaction.
+// @dev The entries of a transaction form a single list. Each execution context starts its journal
+// @dev at the head of the list of its calling context: a reverting context undoes the entries up to
+// @dev this checkpoint, a succeeding one hands its head back to its calling context.
+// @custom:namespace Journal
+// @custom:model model.Journal
+namespace Journal {
+    // Storage slot written in the storage cache, restored to the previous slot.
+    const STORAGE = 0;
+    // Account deployed, removed from the account registry and its code cleared.
+    const DEPLOYMENT = 1;
+    // Native token transfer, only made when the transaction ends.
+    const TRANSFER = 2;
+    // Address or storage slot accessed for the first time, made cold again.
+    const ACCESS = 3;
+
+    // @notice Initialize the journal of a transaction.
+    // @return The pointer to the journal.
+    func init() -> model.Journal* {
+        let first = cast(0, model.JournalEntry*);
+        return new model.Journal(checkpoint=first, head=first);
+    }
+
+    // @notice Start the journal of a sub context at the head of the journal of its calling context.
+    // @param self - The pointer to the journal of the calling context.
+    // @return The pointer to the journal of the sub context.
+    func open(self: model.Journal*) -> model.Journal* {
+        return new model.Journal(checkpoint=self.head, head=self.head);
+    }
+
+    // @notice Take back the entries of a succeeding sub context.
+    // @param self - The pointer to the journal of the calling context.
+    // @param sub_journal - The pointer to the journal of the sub context.
+    // @return The new pointer to the journal of the calling context.
+    func merge(self: model.Journal*, sub_journal: model.Journal*) -> model.Journal* {
+        return new model.Journal(checkpoint=self.checkpoint, head=sub_journal.head);
+    }
+
+    // @notice Record the write of a storage slot.
+    // @param self - The pointer to the journal.
+    // @param slot_key - The storage cache dict key of the slot.
+    // @param previous_slot - The pointer to the replaced StorageSlot, see StorageCache.replace.
+    // @return The new pointer to the journal.
+    func record_storage(
+        self: model.Journal*, slot_key: felt, previous_slot: felt
+    ) -> model.Journal* {
+        tempvar entry = new model.JournalEntry(
+            kind=STORAGE, key=slot_key, value=previous_slot, amount=Uint256(0, 0), previous=self.head
+            );
+        return new model.Journal(checkpoint=self.checkpoint, head=entry);
+    }
+
+    // @notice Record the deployment of an account.
+    // @param self - The pointer to the journal.
+    // @param starknet_contract_address - The starknet address of the account.
+    // @param evm_contract_address - The evm address of the account.
+    // @return The new pointer to the journal.
+    func record_deployment(
+        self: model.Journal*, starknet_contract_address: felt, evm_contract_address: felt
+    ) -> model.Journal* {
+        tempvar entry = new model.JournalEntry(
+            kind=DEPLOYMENT,
+            key=starknet_contract_address,
+            value=evm_contract_address,
+            amount=Uint256(0, 0),
+            previous=self.head,
+            );
+        return new model.Journal(checkpoint=self.checkpoint, head=entry);
+    }
+
+    // @notice Record a native token transfer from Kakarot, made by commit.
+    // @param self - The pointer to the journal.
+    // @param recipient - The starknet address of the recipient.
+    // @param amount - The amount to transfer.
+    // @return The new pointer to the journal.
+    func record_transfer(self: model.Journal*, recipient: felt, amount: Uint256) -> model.Journal* {
+        tempvar entry = new model.JournalEntry(
+            kind=TRANSFER, key=recipient, value=0, amount=amount, previous=self.head
+            );
+        return new model.Journal(checkpoint=self.checkpoint, head=entry);
+    }
+
+    // @notice Record the first access to an address or to a storage slot.
+    // @param self - The pointer to the journal.
+    // @param access_key - The access set dict key of the address or of the slot.
+    // @return The new pointer to the journal.
+    func record_access(self: model.Journal*, access_key: felt) -> model.Journal* {
+        tempvar entry = new model.JournalEntry(
+            kind=ACCESS, key=access_key, value=0, amount=Uint256(0, 0), previous=self.head
+            );
+        return new model.Journal(checkpoint=self.checkpoint, head=entry);
+    }
+
+    // @notice Undo the entries recorded since the checkpoint, most recent first.
+    // @param self - The pointer to the journal of the reverting context.
+    // @param storage_cache - The pointer to the storage cache.
+    // @param registry_cache - The pointer to the registry cache.
+    // @param access_set - The pointer to the access set.
+    // @return The new pointers to the storage cache, to the registry cache and to the access set.
+    func revert{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        self: model.Journal*,
+        storage_cache: model.StorageCache*,
+        registry_cache: model.RegistryCache*,
+        access_set: model.AccessSet*,
+    ) -> (
+        storage_cache: model.StorageCache*,
+        registry_cache: model.RegistryCache*,
+        access_set: model.AccessSet*,
+    ) {
+        return internal.undo(self.head, self.checkpoint, storage_cache, registry_cache, access_set);
+    }
+
+    // @notice Make the transfers of a transaction, in the order in which they were recorded.
+    // @dev Called once, when the root context stops.
+    // @param self - The pointer to the journal of the root context.
+    func commit{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        self: model.Journal*
+    ) {
+        let (native_token_address_) = native_token_address.read();
+        internal.transfer(self.head, native_token_address_);
+        return ();
+    }
+}
+
+namespace internal {
+    // @notice Undo the entries from entry down to checkpoint, excluded.
+    func undo{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        entry: model.JournalEntry*,
+        checkpoint: model.JournalEntry*,
+        storage_cache: model.StorageCache*,
+        registry_cache: model.RegistryCache*,
+        access_set: model.AccessSet*,
+    ) -> (
+        storage_cache: model.StorageCache*,
+        registry_cache: model.RegistryCache*,
+        access_set: model.AccessSet*,
+    ) {
+        alloc_locals;
+        if (cast(entry, felt) == cast(checkpoint, felt)) {
+            return (storage_cache, registry_cache, access_set);
+        }
+
+        if (entry.kind == Journal.STORAGE) {
+            let storage_cache = StorageCache.restore(storage_cache, entry.key, entry.value);
+            return undo(entry.previous, checkpoint, storage_cache, registry_cache, access_set);
+        }
+
+        if (entry.kind == Journal.ACCESS) {
+            let access_set = AccessSet.remove(access_set, entry.key);
+            return undo(entry.previous, checkpoint, storage_cache, registry_cache, access_set);
+        }
+
+        if (entry.kind == Journal.DEPLOYMENT) {
+            let (registry_address_) = registry_address.read();
+            IRegistry.set_account_entry(
+                contract_address=registry_address_,
+                starknet_contract_address=entry.key,
+                evm_contract_address=0,
+            );
+            let registry_cache = RegistryCache.remove_account_entry(
+                registry_cache, entry.key, entry.value
+            );
+            // The starknet account stays deployed, the code written by CreateHelper.deposit_code is cleared
+            let (empty_bytecode: felt*) = alloc();
+            IEvmContract.write_bytecode(
+                contract_address=entry.key, bytecode_len=0, bytecode=empty_bytecode
+            );
+            return undo(entry.previous, checkpoint, storage_cache, registry_cache, access_set);
+        }
+
+        // Transfers are only made by commit, dropping them is enough
+        return undo(entry.previous, checkpoint, storage_cache, registry_cache, access_set);
+    }
+
+    // @notice Make the transfers recorded up to entry, the oldest first.
+    func transfer{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        entry: model.JournalEntry*, native_token_address_: felt
+    ) {
+        alloc_locals;
+        if (cast(entry, felt) == 0) {
+            return ();
+        }
+        transfer(entry.previous, native_token_address_);
+
+        if (entry.kind != Journal.TRANSFER) {
+            return ();
+        }
+        let (success) = IEth.transfer(
+            contract_address=native_token_address_, recipient=entry.key, amount=entry.amount
+        );
+        with_attr error_message("Kakarot: Transfer failed") {
+            assert success = TRUE;
+        }
+        return ();
+    }
+}
@@ -0,0 +1,259 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bitwise import bitwise_and
+from starkware.cairo.common.bool import TRUE, FALSE
+from starkware.cairo.common.cairo_builtins import BitwiseBuiltin
+from starkware.cairo.common.math import unsigned_div_rem
+from starkware.cairo.common.math_cmp import is_le, is_in_range
+from starkware.cairo.common.registers import get_label_location
+
+// @title Valid jump destinations bitmap.
+// @notice This file contains functions related to the bitmap of the valid JUMPDEST of a bytecode.
+// @dev Bit i of felt k is set iff the byte at offset k * BITS_PER_FELT + i is a JUMPDEST opcode,
+// @dev i.e. a 0x5b byte which is not part of the data of a PUSH instruction.
+// @custom:namespace JumpdestBitmap
+namespace JumpdestBitmap {
+    const BITS_PER_FELT = 128;
+
+    // @notice Compute the valid jump destinations bitmap of a bytecode.
+    // @param bytecode_len The length of the bytecode.
+    // @param bytecode The bytecode.
+    // @return bitmap_len The number of felts of the bitmap.
+    // @return bitmap The bitmap.
+    func compute{range_check_ptr}(bytecode_len: felt, bytecode: felt*) -> (
+        bitmap_len: felt, bitmap: felt*
+    ) {
+        alloc_locals;
+        let (local bitmap: felt*) = alloc();
+        if (bytecode_len == 0) {
+            return (0, bitmap);
+        }
+        let bitmap_end = internal.compute_loop(
+            bytecode_len=bytecode_len,
+            bytecode=bytecode,
+            pc=0,
+            chunk_start=0,
+            current=0,
+            output=bitmap,
+        );
+        return (bitmap_end - bitmap, bitmap);
+    }
+
+    // @notice Check whether a pc offset is a valid jump destination.
+    // @dev pc is expected to be lower than the length of the bytecode the bitmap was computed from.
+    // @param bitmap The bitmap.
+    // @param pc The offset to check.
+    // @return TRUE if pc is a valid jump destination, FALSE otherwise.
+    func is_valid{range_check_ptr, bitwise_ptr: BitwiseBuiltin*}(bitmap: felt*, pc: felt) -> felt {
+        alloc_locals;
+        let (local index, offset) = unsigned_div_rem(pc, BITS_PER_FELT);
+        let bit = internal.pow2(offset);
+        let (is_jumpdest) = bitwise_and(bitmap[index], bit);
+        if (is_jumpdest == 0) {
+            return FALSE;
+        }
+        return TRUE;
+    }
+}
+
+namespace internal {
+    // @notice Add the opcode at pc to the current bitmap felt and move to the next opcode.
+    // @param bytecode_len The length of the bytecode.
+    // @param bytecode The bytecode.
+    // @param pc The offset of the current opcode.
+    // @param chunk_start The offset of the first byte covered by the current felt.
+    // @param current The current felt of the bitmap.
+    // @param output The pointer where to write the current felt.
+    // @return The end of the bitmap.
+    func compute_loop{range_check_ptr}(
+        bytecode_len: felt,
+        bytecode: felt*,
+        pc: felt,
+        chunk_start: felt,
+        current: felt,
+        output: felt*,
+    ) -> felt* {
+        alloc_locals;
+        let opcode = [bytecode + pc];
+
+        local new_current;
+        if (opcode == 0x5b) {
+            let bit = pow2(pc - chunk_start);
+            new_current = current + bit;
+        } else {
+            new_current = current;
+        }
+
+        // Skip the data of PUSH1 to PUSH32
+        let is_push = is_in_range(opcode, 0x60, 0x80);
+        local next_pc = pc + 1 + is_push * (opcode - 0x5f);
+
+        let is_end = is_le(bytecode_len, next_pc);
+        if (is_end != FALSE) {
+            assert [output] = new_current;
+            // The data of the last PUSH can overflow in a last chunk with no JUMPDEST
+            let has_next_chunk = is_le(chunk_start + JumpdestBitmap.BITS_PER_FELT + 1, bytecode_len);
+            if (has_next_chunk != FALSE) {
+                assert [output + 1] = 0;
+                return output + 2;
+            }
+            return output + 1;
+        }
+
+        // A PUSH32 is shorter than a chunk, so next_pc is at most in the next chunk
+        let is_new_chunk = is_le(chunk_start + JumpdestBitmap.BITS_PER_FELT, next_pc);
+        if (is_new_chunk != FALSE) {
+            assert [output] = new_current;
+            return compute_loop(
+                bytecode_len,
+                bytecode,
+                next_pc,
+                chunk_start + JumpdestBitmap.BITS_PER_FELT,
+                0,
+                output + 1,
+            );
+        }
+
+        return compute_loop(bytecode_len, bytecode, next_pc, chunk_start, new_current, output);
+    }
+
+    // @notice Return 2 ** i for i in [0, BITS_PER_FELT).
+    func pow2(i: felt) -> felt {
+        let (pow2_address) = get_label_location(pow2_table);
+        return pow2_address[i];
+
+        pow2_table:
+        dw 1;
+        dw 2;
+        dw 4;
+        dw 8;
+        dw 16;
+        dw 32;
+        dw 64;
+        dw 128;
+        dw 256;
+        dw 512;
+        dw 1024;
+        dw 2048;
+        dw 4096;
+        dw 8192;
+        dw 16384;
+        dw 32768;
+        dw 65536;
+        dw 131072;
+        dw 262144;
+        dw 524288;
+        dw 1048576;
+        dw 2097152;
+        dw 4194304;
+        dw 8388608;
+        dw 16777216;
+        dw 33554432;
+        dw 67108864;
+        dw 134217728;
+        dw 268435456;
+        dw 536870912;
+        dw 1073741824;
+        dw 2147483648;
+        dw 4294967296;
+        dw 8589934592;
+        dw 17179869184;
+        dw 34359738368;
+        dw 68719476736;
+        dw 137438953472;
+        dw 274877906944;
+        dw 549755813888;
+        dw 1099511627776;
+        dw 2199023255552;
+        dw 4398046511104;
+        dw 8796093022208;
+        dw 17592186044416;
+        dw 35184372088832;
+        dw 70368744177664;
+        dw 140737488355328;
+        dw 281474976710656;
+        dw 562949953421312;
+        dw 1125899906842624;
+        dw 2251799813685248;
+        dw 4503599627370496;
+        dw 9007199254740992;
+        dw 18014398509481984;
+        dw 36028797018963968;
+        dw 72057594037927936;
+        dw 144115188075855872;
+        dw 288230376151711744;
+        dw 576460752303423488;
+        dw 1152921504606846976;
+        dw 2305843009213693952;
+        dw 4611686018427387904;
+        dw 9223372036854775808;
+        dw 18446744073709551616;
+        dw 36893488147419103232;
+        dw 73786976294838206464;
+        dw 147573952589676412928;
+        dw 295147905179352825856;
+        dw 590295810358705651712;
+        dw 1180591620717411303424;
+        dw 2361183241434822606848;
+        dw 4722366482869645213696;
+        dw 9444732965739290427392;
+        dw 18889465931478580854784;
+        dw 37778931862957161709568;
+        dw 75557863725914323419136;
+        dw 151115727451828646838272;
+        dw 302231454903657293676544;
+        dw 604462909807314587353088;
+        dw 1208925819614629174706176;
+        dw 2417851639229258349412352;
+        dw 4835703278458516698824704;
+        dw 9671406556917033397649408;
+        dw 19342813113834066795298816;
+        dw 38685626227668133590597632;
+        dw 77371252455336267181195264;
+        dw 154742504910672534362390528;
+        dw 309485009821345068724781056;
+        dw 618970019642690137449562112;
+        dw 1237940039285380274899124224;
+        dw 2475880078570760549798248448;
+        dw 4951760157141521099596496896;
+        dw 9903520314283042199192993792;
+        dw 19807040628566084398385987584;
+        dw 39614081257132168796771975168;
+        dw 79228162514264337593543950336;
+        dw 158456325028528675187087900672;
+        dw 316912650057057350374175801344;
+        dw 633825300114114700748351602688;
+        dw 1267650600228229401496703205376;
+        dw 2535301200456458802993406410752;
+        dw 5070602400912917605986812821504;
+        dw 10141204801825835211973625643008;
+        dw 20282409603651670423947251286016;
+        dw 40564819207303340847894502572032;
+        dw 81129638414606681695789005144064;
+        dw 162259276829213363391578010288128;
+        dw 324518553658426726783156020576256;
+        dw 649037107316853453566312041152512;
+        dw 1298074214633706907132624082305024;
+        dw 2596148429267413814265248164610048;
+        dw 5192296858534827628530496329220096;
+        dw 10384593717069655257060992658440192;
+        dw 20769187434139310514121985316880384;
+        dw 41538374868278621028243970633760768;
+        dw 83076749736557242056487941267521536;
+        dw 166153499473114484112975882535043072;
+        dw 332306998946228968225951765070086144;
+        dw 664613997892457936451903530140172288;
+        dw 1329227995784915872903807060280344576;
+        dw 2658455991569831745807614120560689152;
+        dw 5316911983139663491615228241121378304;
+        dw 10633823966279326983230456482242756608;
+        dw 21267647932558653966460912964485513216;
+        dw 42535295865117307932921825928971026432;
+        dw 85070591730234615865843651857942052864;
+        dw 170141183460469231731687303715884105728;
+    }
+}
@@ -14,6 +14,7 @@ from kakarot.stack import Stack
 from kakarot.interfaces.interfaces import IEvmContract
 from kakarot.memory import Memory
 from kakarot.execution_context import ExecutionContext
+from kakarot.jumpdest_bitmap import JumpdestBitmap
 from starkware.cairo.common.dict import DictAccess
 
 // Constructor
@@ -52,8 +53,14 @@ func execute{
     gas_used: felt,
 ) {
     alloc_locals;
+    let (_, valid_jumpdests) = JumpdestBitmap.compute(bytecode_len, bytecode);
     local call_context: model.CallContext* = new model.CallContext(
-        bytecode=bytecode, bytecode_len=bytecode_len, calldata=calldata, calldata_len=calldata_len, value=value
+        bytecode=bytecode,
+        bytecode_len=bytecode_len,
+        valid_jumpdests=valid_jumpdests,
+        calldata=calldata,
+        calldata_len=calldata_len,
+        value=value,
         );
     let summary = Kakarot.execute(call_context);
     let memory_accesses_len = summary.memory.squashed_end - summary.memory.squashed_start;
@@ -77,6 +84,8 @@ func execute{
 // @param gas_limit Max gas the transaction can use
 // @param calldata_len The calldata length
 // @param calldata The calldata which contains the entry point and method parameters
+// @param access_list_len The length of the EIP-2930 access list of the transaction, in felts
+// @param access_list The access list, each address followed by the number of its storage keys and the keys
 // @return stack_accesses_len The size of the accesses array of the stack delta
 // @return stack_accesses The dict accesses in the stack delta
 // @return stack_len The length of the stack
@@ -90,7 +99,15 @@ func execute{
 @external
 func execute_at_address{
     syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
-}(address: felt, value: felt, gas_limit: felt, calldata_len: felt, calldata: felt*) -> (
+}(
+    address: felt,
+    value: felt,
+    gas_limit: felt,
+    calldata_len: felt,
+    calldata: felt*,
+    access_list_len: felt,
+    access_list: felt*,
+) -> (
     stack_accesses_len: felt,
     stack_accesses: felt*,
     stack_len: felt,
@@ -109,6 +126,8 @@ func execute_at_address{
         calldata=calldata,
         value=value,
         gas_limit=gas_limit,
+        access_list_len=access_list_len,
+        access_list=access_list,
     );
     let memory_accesses_len = summary.memory.squashed_end - summary.memory.squashed_start;
     let stack_accesses_len = summary.stack.squashed_end - summary.stack.squashed_start;
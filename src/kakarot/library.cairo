@@ -9,7 +9,7 @@ from starkware.cairo.common.bool import FALSE
 from starkware.cairo.common.math import split_felt
 from starkware.cairo.common.memcpy import memcpy
 from starkware.starknet.common.syscalls import deploy as deploy_syscall
-from starkware.starknet.common.syscalls import get_contract_address
+from starkware.starknet.common.syscalls import get_caller_address, get_contract_address, get_tx_info
 // OpenZeppelin dependencies
 from openzeppelin.access.ownable.library import Ownable
 
@@ -17,10 +17,16 @@ from openzeppelin.access.ownable.library import Ownable
 from kakarot.model import model
 from kakarot.memory import Memory
 from kakarot.stack import Stack
+from kakarot.journal import Journal
+from kakarot.access_set import AccessSet
+from kakarot.registry_cache import RegistryCache
+from kakarot.storage_cache import StorageCache
 from kakarot.instructions import EVMInstructions
 from kakarot.interfaces.interfaces import IRegistry, IEvmContract
 from kakarot.execution_context import ExecutionContext
+from kakarot.jumpdest_bitmap import JumpdestBitmap
 from kakarot.constants import (
+    Constants,
     native_token_address,
     registry_address,
     evm_contract_class_hash,
@@ -67,7 +73,7 @@ namespace Kakarot {
 
         // Compute intrinsic gas cost and update gas used
         let cost = ExecutionContext.compute_intrinsic_gas_cost(self=ctx);
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=cost);
+        let ctx = ExecutionContext.apply_changes(ctx, ctx.stack, ctx.memory, 0, cost);
 
         // Start execution
         let ctx = EVMInstructions.run(ctx=ctx);
@@ -84,6 +90,8 @@ namespace Kakarot {
     // @param address The address of the contract whose bytecode will be executed
     // @param calldata The calldata which contains the entry point and method parameters
     // @param gas_limit Max gas the transaction can use
+    // @param access_list_len The length of the EIP-2930 access list of the transaction, in felts
+    // @param access_list The access list, see AccessSet.add_access_list
     // @return The pointer to the updated execution context.
     func execute_at_address{
         syscall_ptr: felt*,
@@ -91,13 +99,18 @@ namespace Kakarot {
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
     }(
-        address: felt, calldata_len: felt, calldata: felt*, value: felt, gas_limit: felt
+        address: felt,
+        calldata_len: felt,
+        calldata: felt*,
+        value: felt,
+        gas_limit: felt,
+        access_list_len: felt,
+        access_list: felt*,
     ) -> ExecutionContext.Summary* {
         alloc_locals;
 
         // Prepare execution context
         let root_context = ExecutionContext.init_empty();
-        let return_data: felt* = alloc();
         let ctx: model.ExecutionContext* = ExecutionContext.init_at_address(
             address=address,
             gas_limit=gas_limit,
@@ -105,14 +118,28 @@ namespace Kakarot {
             calldata=calldata,
             value=value,
             calling_context=root_context,
-            return_data_len=0,
-            return_data=return_data,
+            ret_offset=0,
+            ret_size=0,
             read_only=FALSE,
         );
 
-        // Compute intrinsic gas cost and update gas used
+        // The sender, the recipient and the access list are warm from the start, see EIP-2929
+        let (tx_info) = get_tx_info();
+        let (registry_cache, sender) = RegistryCache.get_evm_contract_address(
+            ctx.cold.registry_cache, tx_info.account_contract_address
+        );
+        let ctx = ExecutionContext.update_registry_cache(ctx, registry_cache);
+        let (access_set, _) = AccessSet.add_address(ctx.cold.access_set, sender);
+        let (access_set, _) = AccessSet.add_address(access_set, address);
+        let access_set = AccessSet.add_access_list(access_set, access_list_len, access_list);
+        let ctx = ExecutionContext.update_access_set(ctx, access_set);
+
+        // Compute intrinsic gas cost, access list included, and update gas used
         let cost = ExecutionContext.compute_intrinsic_gas_cost(ctx);
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=cost);
+        let access_list_cost = AccessSet.access_list_cost(access_list_len, access_list);
+        let ctx = ExecutionContext.apply_changes(
+            ctx, ctx.stack, ctx.memory, 0, cost + access_list_cost
+        );
 
         // Start execution
         let ctx = EVMInstructions.run(ctx);
@@ -190,17 +217,34 @@ namespace Kakarot {
         evm_contract_address: felt, starknet_contract_address: felt
     ) {
         alloc_locals;
+        // The address is derived as for a CREATE from the caller, with the global deployment counter as nonce
+        let (caller_address) = get_caller_address();
+        let (registry_address_) = registry_address.read();
+        let (sender) = IRegistry.get_evm_contract_address(registry_address_, caller_address);
         let (current_salt) = salt.read();
+        let keccak_segment = ExecutionContext.init_keccak_segment();
+        let keccak_ptr = keccak_segment.keccak_ptr;
+        with keccak_ptr {
+            let evm_contract_address = ContractAccount.compute_create_address(sender, current_salt);
+        }
+        tempvar keccak_segment = new model.KeccakSegment(
+            keccak_ptr_start=keccak_segment.keccak_ptr_start,
+            keccak_ptr=keccak_ptr,
+            memo_start=keccak_segment.memo_start,
+            memo=keccak_segment.memo,
+            );
         let (evm_contract_address, starknet_contract_address) = ContractAccount.deploy(
-            current_salt
+            evm_contract_address
         );
         salt.write(value=current_salt + 1);
 
         // Prepare execution context
         let (empty_array: felt*) = alloc();
+        let (_, valid_jumpdests) = JumpdestBitmap.compute(bytecode_len, bytecode);
         tempvar call_context: model.CallContext* = new model.CallContext(
             bytecode=bytecode,
             bytecode_len=bytecode_len,
+            valid_jumpdests=valid_jumpdests,
             calldata=empty_array,
             calldata_len=0,
             value=0,
@@ -209,10 +253,35 @@ namespace Kakarot {
         let (empty_destroy_contracts: felt*) = alloc();
         let stack: model.Stack* = Stack.init();
         let memory: model.Memory* = Memory.init();
+        let storage_cache: model.StorageCache* = StorageCache.init();
+        let registry_cache: model.RegistryCache* = RegistryCache.init();
+        let access_set: model.AccessSet* = AccessSet.init();
+        let journal: model.Journal* = Journal.init();
         let calling_context = ExecutionContext.init_empty();
         let sub_context = ExecutionContext.init_empty();
-        tempvar ctx: model.ExecutionContext* = new model.ExecutionContext(
+        // TODO: Add support for gas limit
+        tempvar environment = new model.Environment(
             call_context=call_context,
+            gas_limit=Constants.TRANSACTION_GAS_LIMIT,
+            gas_price=0,
+            starknet_contract_address=starknet_contract_address,
+            evm_contract_address=evm_contract_address,
+            calling_context=calling_context,
+            read_only=FALSE,
+            ret_offset=0,
+            ret_size=0,
+            );
+        tempvar cold = new model.ColdState(
+            destroy_contracts_len=0,
+            destroy_contracts=empty_destroy_contracts,
+            storage_cache=storage_cache,
+            registry_cache=registry_cache,
+            access_set=access_set,
+            keccak_segment=keccak_segment,
+            journal=journal,
+            );
+        tempvar ctx: model.ExecutionContext* = new model.ExecutionContext(
+            environment=environment,
             program_counter=0,
             stopped=FALSE,
             return_data=contract_bytecode,
@@ -220,20 +289,14 @@ namespace Kakarot {
             stack=stack,
             memory=memory,
             gas_used=0,
-            gas_limit=0,
-            gas_price=0,
-            starknet_contract_address=starknet_contract_address,
-            evm_contract_address=evm_contract_address,
-            calling_context=calling_context,
             sub_context=sub_context,
-            destroy_contracts_len=0,
-            destroy_contracts=empty_destroy_contracts,
-            read_only=FALSE,
+            reverted=FALSE,
+            cold=cold,
             );
 
         // Compute intrinsic gas cost and update gas used
         let cost = ExecutionContext.compute_intrinsic_gas_cost(ctx);
-        let ctx = ExecutionContext.increment_gas_used(self=ctx, inc_value=cost);
+        let ctx = ExecutionContext.apply_changes(ctx, ctx.stack, ctx.memory, 0, cost);
 
         // Start execution
         let ctx = EVMInstructions.run(ctx);
@@ -8,9 +8,8 @@ from starkware.cairo.common.bool import FALSE
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
 from starkware.cairo.common.dict import DictAccess, dict_read, dict_write
 from starkware.cairo.common.default_dict import default_dict_new, default_dict_finalize
-from starkware.cairo.common.math import split_int, unsigned_div_rem, assert_nn
+from starkware.cairo.common.math import unsigned_div_rem
 from starkware.cairo.common.math_cmp import is_le
-from starkware.cairo.common.memcpy import memcpy
 from starkware.cairo.common.uint256 import Uint256
 
 // Internal dependencies
@@ -47,7 +46,8 @@ namespace Memory {
         return new model.Memory(
             word_dict_start=word_dict_start,
             word_dict=word_dict_start,
-            bytes_len=0);
+            bytes_len=0,
+            cost=0);
     }
 
     // @notice Finalizes the memory.
@@ -71,29 +71,24 @@ namespace Memory {
     ) -> model.Memory* {
         let word_dict = self.word_dict;
 
-        // Compute new bytes_len.
-        let new_min_bytes_len = Helpers.ceil_bytes_len_to_next_32_bytes_word(offset + 32);
+        // Check alignment of offset to 32B words.
+        let (word_index, offset_in_word) = unsigned_div_rem(offset, 32);
 
-        let fits = is_le(new_min_bytes_len, self.bytes_len);
-        if (fits == FALSE) {
-            tempvar new_bytes_len = new_min_bytes_len;
-        } else {
-            tempvar new_bytes_len = self.bytes_len;
+        if (offset_in_word == 0) {
+            // Offset is aligned. This is the simplest and most efficient case,
+            // so we optimize for it. Note that no locals were allocated at all.
+            dict_write{dict_ptr=word_dict}(word_index * 2, element.high);
+            dict_write{dict_ptr=word_dict}(word_index * 2 + 1, element.low);
+            return internal.grow(self, word_dict, word_index + 1);
         }
 
         // Check alignment of offset to 16B chunks.
         let (chunk_index, offset_in_chunk) = unsigned_div_rem(offset, 16);
 
         if (offset_in_chunk == 0) {
-            // Offset is aligned. This is the simplest and most efficient case,
-            // so we optimize for it. Note that no locals were allocated at all.
             dict_write{dict_ptr=word_dict}(chunk_index, element.high);
             dict_write{dict_ptr=word_dict}(chunk_index + 1, element.low);
-            return (new model.Memory(
-                word_dict_start=self.word_dict_start,
-                word_dict=word_dict,
-                bytes_len=new_bytes_len,
-                ));
+            return internal.grow(self, word_dict, word_index + 2);
         }
 
         // Offset is misaligned.
@@ -125,11 +120,7 @@ namespace Memory {
         dict_write{dict_ptr=word_dict}(chunk_index, new_w0);
         dict_write{dict_ptr=word_dict}(chunk_index + 1, new_w1);
         dict_write{dict_ptr=word_dict}(chunk_index + 2, new_w2);
-        return (new model.Memory(
-            word_dict_start=self.word_dict_start,
-            word_dict=word_dict,
-            bytes_len=new_bytes_len,
-            ));
+        return internal.grow(self, word_dict, word_index + 2);
     }
 
     // @notice store_n Store N bytes into the memory.
@@ -148,16 +139,8 @@ namespace Memory {
 
         let word_dict = self.word_dict;
 
-        // Compute new bytes_len.
-        let new_min_bytes_len = Helpers.ceil_bytes_len_to_next_32_bytes_word(offset + element_len);
-
-        let fits = is_le(new_min_bytes_len, self.bytes_len);
-        local new_bytes_len;
-        if (fits == FALSE) {
-            new_bytes_len = new_min_bytes_len;
-        } else {
-            new_bytes_len = self.bytes_len;
-        }
+        // Compute the number of 32B words needed.
+        let (local words_len, _) = unsigned_div_rem(offset + element_len + 31, 32);
 
         // Check alignment of offset to 16B chunks.
         let (chunk_index_i, offset_in_chunk_i) = unsigned_div_rem(offset, 16);
@@ -175,10 +158,7 @@ namespace Memory {
             let x = Helpers.load_word(element_len, element);
             let new_w = w_h * mask_i + x * mask_f + w_ll;
             dict_write{dict_ptr=word_dict}(chunk_index_i, new_w);
-            return (new model.Memory(
-                word_dict_start=self.word_dict_start,
-                word_dict=word_dict,
-                bytes_len=new_bytes_len));
+            return internal.grow(self, word_dict, words_len);
         }
 
         // Otherwise.
@@ -199,10 +179,7 @@ namespace Memory {
             word_dict, chunk_index_i + 1, chunk_index_f, element + 16 - offset_in_chunk_i
         );
 
-        return (new model.Memory(
-            word_dict_start=self.word_dict_start,
-            word_dict=word_dict,
-            bytes_len=new_bytes_len));
+        return internal.grow(self, word_dict, words_len);
     }
 
     func store_aligned_words{range_check_ptr}(
@@ -259,6 +236,7 @@ namespace Memory {
                 word_dict_start=self.word_dict_start,
                 word_dict=word_dict,
                 bytes_len=self.bytes_len,
+                cost=self.cost,
                 ),
                 Uint256(low=el_l, high=el_h),
             );
@@ -290,6 +268,7 @@ namespace Memory {
             word_dict_start=self.word_dict_start,
             word_dict=word_dict,
             bytes_len=self.bytes_len,
+            cost=self.cost,
             ),
             Uint256(low=el_l, high=el_h),
         );
@@ -327,7 +306,8 @@ namespace Memory {
             return (new model.Memory(
                 word_dict_start=self.word_dict_start,
                 word_dict=word_dict,
-                bytes_len=self.bytes_len));
+                bytes_len=self.bytes_len,
+                cost=self.cost));
         }
 
         // Otherwise.
@@ -349,7 +329,8 @@ namespace Memory {
         return (new model.Memory(
             word_dict_start=self.word_dict_start,
             word_dict=word_dict,
-            bytes_len=self.bytes_len));
+            bytes_len=self.bytes_len,
+            cost=self.cost));
     }
 
     func load_aligned_words{range_check_ptr}(
@@ -371,6 +352,7 @@ namespace Memory {
     }
 
     // @notice Expend the memory with length bytes
+    // @dev The cost of the current memory size is cached in the memory, only the new one is computed.
     // @param self - The pointer to the memory.
     // @param length - The number of bytes to add.
     // @return The new pointer to the memory.
@@ -378,28 +360,19 @@ namespace Memory {
     func expand{range_check_ptr}(self: model.Memory*, length: felt) -> (
         new_memory: model.Memory*, cost: felt
     ) {
-        let (last_memory_size_word, _) = unsigned_div_rem(value=self.bytes_len + 31, div=32);
-        let (last_memory_cost, _) = unsigned_div_rem(
-            value=last_memory_size_word * last_memory_size_word, div=512
-        );
-        let last_memory_cost = last_memory_cost + (3 * last_memory_size_word);
-
-        tempvar new_bytes_len = self.bytes_len + length;
+        alloc_locals;
+        local new_bytes_len = self.bytes_len + length;
         let (new_memory_size_word, _) = unsigned_div_rem(value=new_bytes_len + 31, div=32);
-        let (new_memory_cost, _) = unsigned_div_rem(
-            value=new_memory_size_word * new_memory_size_word, div=512
-        );
-        let new_memory_cost = new_memory_cost + (3 * new_memory_size_word);
-
-        let cost = new_memory_cost - last_memory_cost;
+        let new_memory_cost = internal.memory_cost(new_memory_size_word);
 
         return (
             new model.Memory(
             word_dict_start=self.word_dict_start,
             word_dict=self.word_dict,
             bytes_len=new_bytes_len,
+            cost=new_memory_cost,
             ),
-            cost,
+            new_memory_cost - self.cost,
         );
     }
 
@@ -448,4 +421,182 @@ namespace Memory {
         let new_memory = _load_n(new_memory, element_len, element, offset=offset);
         return (new_memory, gas_cost);
     }
+
+    // @notice Expand memory if necessary then load size bytes from it at given offset as 16 bytes chunks.
+    // @dev Chunks are read from the dict and shifted when the offset is misaligned, bytes are never split.
+    // @dev Each chunk is the big endian representation of 16 bytes, the bytes of the last chunk beyond
+    // @dev size are set to 0.
+    // @param self - The pointer to the memory.
+    // @param size - The number of bytes to load.
+    // @param chunks - The output array, of length ceil(size / 16).
+    // @param offset - The memory offset to load from.
+    // @return The new pointer to the memory.
+    // @return The gas cost of this expansion.
+    func load_chunks{range_check_ptr}(
+        self: model.Memory*, size: felt, chunks: felt*, offset: felt
+    ) -> (new_memory: model.Memory*, gas_cost: felt) {
+        alloc_locals;
+        let (local memory: model.Memory*, local gas_cost) = ensure_length(
+            self=self, length=size + offset
+        );
+        if (size == 0) {
+            return (new_memory=memory, gas_cost=gas_cost);
+        }
+
+        let (chunk_index, offset_in_chunk) = unsigned_div_rem(offset, 16);
+        let (local chunks_len, local size_in_chunk) = unsigned_div_rem(size, 16);
+        // An aligned offset gives mask = 2 ** 128, for which div_rem returns the whole chunk as remainder.
+        let mask = Helpers.pow256_rev(offset_in_chunk);
+        let mask_c = 2 ** 128 / mask;
+
+        // Load full chunks.
+        let word_dict = memory.word_dict;
+        let (w) = dict_read{dict_ptr=word_dict}(chunk_index);
+        let (_, w_l) = Helpers.div_rem(w, mask);
+        let (word_dict, last_l) = internal.read_shifted_chunks(
+            word_dict, chunk_index + 1, chunk_index + 1 + chunks_len, w_l, mask, mask_c, chunks
+        );
+        if (size_in_chunk == 0) {
+            let new_memory = internal.grow(memory, word_dict, 0);
+            return (new_memory, gas_cost);
+        }
+
+        // Load the last partial chunk, keeping only its first size_in_chunk bytes.
+        let (w) = dict_read{dict_ptr=word_dict}(chunk_index + 1 + chunks_len);
+        let (w_h, _) = Helpers.div_rem(w, mask);
+        let tail_mask = Helpers.pow256_rev(size_in_chunk);
+        let (tail, _) = Helpers.div_rem(last_l * mask_c + w_h, tail_mask);
+        assert chunks[chunks_len] = tail * tail_mask;
+
+        let new_memory = internal.grow(memory, word_dict, 0);
+        return (new_memory, gas_cost);
+    }
+
+    // @notice Expand memory if necessary then copy size bytes from src_offset to dst_offset.
+    // @dev When both offsets and size are 16 bytes aligned, chunks are copied without being split into bytes.
+    // @param self - The pointer to the memory.
+    // @param dst_offset - The memory offset to copy to.
+    // @param src_offset - The memory offset to copy from.
+    // @param size - The number of bytes to copy.
+    // @return The new pointer to the memory.
+    // @return The gas cost of this expansion.
+    func copy{range_check_ptr}(
+        self: model.Memory*, dst_offset: felt, src_offset: felt, size: felt
+    ) -> (new_memory: model.Memory*, gas_cost: felt) {
+        alloc_locals;
+        if (size == 0) {
+            return (new_memory=self, gas_cost=0);
+        }
+
+        let is_dst_above = is_le(src_offset, dst_offset);
+        local max_offset;
+        if (is_dst_above != FALSE) {
+            max_offset = dst_offset;
+        } else {
+            max_offset = src_offset;
+        }
+        let (local memory: model.Memory*, local gas_cost) = ensure_length(
+            self=self, length=max_offset + size
+        );
+
+        let (local src_chunk_index, src_offset_in_chunk) = unsigned_div_rem(src_offset, 16);
+        let (local dst_chunk_index, dst_offset_in_chunk) = unsigned_div_rem(dst_offset, 16);
+        let (local chunks_len, size_in_chunk) = unsigned_div_rem(size, 16);
+        let (local buffer: felt*) = alloc();
+
+        if (src_offset_in_chunk + dst_offset_in_chunk + size_in_chunk == 0) {
+            // Aligned case: move whole chunks through the buffer.
+            let word_dict = memory.word_dict;
+            let (word_dict) = internal.read_chunks(
+                word_dict, src_chunk_index, src_chunk_index + chunks_len, buffer
+            );
+            let (word_dict) = internal.write_chunks(
+                word_dict, dst_chunk_index, dst_chunk_index + chunks_len, buffer
+            );
+            let new_memory = internal.grow(memory, word_dict, 0);
+            return (new_memory, gas_cost);
+        }
+
+        let new_memory = _load_n(memory, size, buffer, src_offset);
+        let new_memory = store_n(new_memory, size, buffer, dst_offset);
+        return (new_memory, gas_cost);
+    }
+}
+
+namespace internal {
+    // @notice Return the memory expansion cost of a memory of words_len 32B words.
+    func memory_cost{range_check_ptr}(words_len: felt) -> felt {
+        let (quadratic_cost, _) = unsigned_div_rem(value=words_len * words_len, div=512);
+        return quadratic_cost + 3 * words_len;
+    }
+
+    // @notice Return a new memory with the updated dict, expanded to words_len 32B words if needed.
+    func grow{range_check_ptr}(
+        self: model.Memory*, word_dict: DictAccess*, words_len: felt
+    ) -> model.Memory* {
+        alloc_locals;
+        let fits = is_le(words_len * 32, self.bytes_len);
+        if (fits != FALSE) {
+            return (new model.Memory(
+                word_dict_start=self.word_dict_start,
+                word_dict=word_dict,
+                bytes_len=self.bytes_len,
+                cost=self.cost));
+        }
+
+        let cost = memory_cost(words_len);
+        return (new model.Memory(
+            word_dict_start=self.word_dict_start,
+            word_dict=word_dict,
+            bytes_len=words_len * 32,
+            cost=cost));
+    }
+
+    // @notice Read the chunks in [chunk_index, chunk_index_f) to the output array.
+    func read_chunks(
+        word_dict: DictAccess*, chunk_index: felt, chunk_index_f: felt, output: felt*
+    ) -> (word_dict: DictAccess*) {
+        if (chunk_index == chunk_index_f) {
+            return (word_dict=word_dict,);
+        }
+        let (value) = dict_read{dict_ptr=word_dict}(chunk_index);
+        assert [output] = value;
+        return read_chunks(word_dict, chunk_index + 1, chunk_index_f, output + 1);
+    }
+
+    // @notice Read the chunks in [chunk_index, chunk_index_f) shifted by a misaligned offset to the output array.
+    // @dev Each output chunk is the low part of the previous chunk followed by the high part of the current one.
+    // @return The updated dict and the low part of the last chunk read.
+    func read_shifted_chunks{range_check_ptr}(
+        word_dict: DictAccess*,
+        chunk_index: felt,
+        chunk_index_f: felt,
+        previous_l: felt,
+        mask: felt,
+        mask_c: felt,
+        output: felt*,
+    ) -> (word_dict: DictAccess*, last_l: felt) {
+        alloc_locals;
+        if (chunk_index == chunk_index_f) {
+            return (word_dict=word_dict, last_l=previous_l);
+        }
+        let (value) = dict_read{dict_ptr=word_dict}(chunk_index);
+        local word_dict: DictAccess* = word_dict;
+        let (value_h, value_l) = Helpers.div_rem(value, mask);
+        assert [output] = previous_l * mask_c + value_h;
+        return read_shifted_chunks(
+            word_dict, chunk_index + 1, chunk_index_f, value_l, mask, mask_c, output + 1
+        );
+    }
+
+    // @notice Write the input array to the chunks in [chunk_index, chunk_index_f).
+    func write_chunks(
+        word_dict: DictAccess*, chunk_index: felt, chunk_index_f: felt, input: felt*
+    ) -> (word_dict: DictAccess*) {
+        if (chunk_index == chunk_index_f) {
+            return (word_dict=word_dict,);
+        }
+        dict_write{dict_ptr=word_dict}(chunk_index, [input]);
+        return write_chunks(word_dict, chunk_index + 1, chunk_index_f, input + 1);
+    }
 }
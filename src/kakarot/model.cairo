@@ -7,16 +7,23 @@ from starkware.cairo.common.uint256 import Uint256
 from starkware.cairo.common.dict import DictAccess
 
 namespace model {
+    // @notice A single 256 bits word of the stack, linked to the word right below it.
+    // @param value - the 256 bits word
+    // @param next - pointer to the element below, 0 for the bottom of the stack
+    struct StackElement {
+        value: Uint256,
+        next: StackElement*,
+    }
+
     // @notice info: https://www.evm.codes/about#stack
     // @notice Stack with a 1024 items maximum size. Each item is a 256 bits word. The stack is used by most
     // @notice opcodes to consume their parameters from.
-    // @dev Each word is represented by two 128bits (16bytes) chunks.
-    // @param word_dict_start - pointer to a DictAccess array used to store the stack's value at a given index
-    // @param word_dict - pointer to the end of the DictAccess array
-    // @param len_16_bytes - length of the DictAccess array
+    // @dev Elements are stored as a segment of immutable StackElement nodes, so push and pop never
+    // @dev touch a dict and previous stacks remain valid after an update.
+    // @param top - pointer to the top element of the stack, 0 when the stack is empty
+    // @param len_16bytes - number of 128bits (16bytes) chunks in the stack, i.e. twice the number of words
     struct Stack {
-        word_dict_start: DictAccess*,
-        word_dict: DictAccess*,
+        top: StackElement*,
         len_16bytes: felt,
     }
 
@@ -25,49 +32,178 @@ namespace model {
     // @notice between transactions.
     // @param word_dict_start - pointer to a DictAccess used to store the memory's value at a given index
     // @param word_dict - pointer to the end of the DictAccess array
-    // @param len_16_bytes - length of the DictAccess array
+    // @param bytes_len - highest accessed memory byte offset, rounded to the next 32 bytes word when written
+    // @param cost - memory expansion cost already paid for the current memory size
     struct Memory {
         word_dict_start: DictAccess*,
         word_dict: DictAccess*,
         bytes_len: felt,
+        cost: felt,
+    }
+
+    // @notice A storage slot accessed during the transaction.
+    // @param starknet_contract_address - starknet address of the contract account owning the slot
+    // @param key - the storage key of the slot
+    // @param value - the current value of the slot
+    // @param dirty - whether the value has been written and must be committed to the contract account
+    struct StorageSlot {
+        starknet_contract_address: felt,
+        key: Uint256,
+        value: Uint256,
+        dirty: felt,
+    }
+
+    // @notice info: https://www.evm.codes/about#storage
+    // @notice Cache of the storage slots accessed during a transaction, shared by all its execution contexts.
+    // @dev The dict maps the hash of (starknet_contract_address, key) to a pointer to the StorageSlot.
+    // @param dict_start - pointer to a DictAccess used to store the accessed slots
+    // @param dict - pointer to the end of the DictAccess array
+    struct StorageCache {
+        dict_start: DictAccess*,
+        dict: DictAccess*,
+    }
+
+    // @notice Cache of the account registry lookups made during a transaction, shared by all its execution contexts.
+    // @dev Both dicts store the resolved address + 1, so that 0 means that the address has not been resolved yet.
+    // @param evm_to_starknet_start - pointer to a DictAccess mapping evm addresses to starknet addresses
+    // @param evm_to_starknet - pointer to the end of the evm_to_starknet DictAccess array
+    // @param starknet_to_evm_start - pointer to a DictAccess mapping starknet addresses to evm addresses
+    // @param starknet_to_evm - pointer to the end of the starknet_to_evm DictAccess array
+    struct RegistryCache {
+        evm_to_starknet_start: DictAccess*,
+        evm_to_starknet: DictAccess*,
+        starknet_to_evm_start: DictAccess*,
+        starknet_to_evm: DictAccess*,
+    }
+
+    // @notice info: https://www.evm.codes/about#accesssets
+    // @notice Addresses and storage slots accessed during a transaction, shared by all its execution contexts.
+    // @dev The dict maps an evm address, or the hash of (evm_address, key) for a storage slot, to TRUE once
+    // @dev accessed. Accessing a warm address or slot is cheaper than accessing a cold one, see EIP-2929.
+    // @param dict_start - pointer to a DictAccess used to store the warm addresses and slots
+    // @param dict - pointer to the end of the DictAccess array
+    struct AccessSet {
+        dict_start: DictAccess*,
+        dict: DictAccess*,
+    }
+
+    // @notice Keccak builtin segment shared by all the execution contexts of a transaction, finalized once
+    // @notice when the root context stops.
+    // @dev The memo dict maps a pedersen digest of a SHA3 input to a pointer to its Uint256 keccak hash,
+    // @dev and a pedersen digest of an EcRecover input to a pointer to its output.
+    // @param keccak_ptr_start - pointer to the start of the segment
+    // @param keccak_ptr - pointer to the next free cell of the segment
+    // @param memo_start - pointer to a DictAccess used to store the hashes already computed
+    // @param memo - pointer to the end of the memo DictAccess array
+    struct KeccakSegment {
+        keccak_ptr_start: felt*,
+        keccak_ptr: felt*,
+        memo_start: DictAccess*,
+        memo: DictAccess*,
+    }
+
+    // @notice A state change made during a transaction, undone if an execution context that contains
+    // @notice it reverts.
+    // @dev Entries form a single list per transaction, each entry pointing to the one recorded before it.
+    // @param kind - the kind of change, see Journal
+    // @param key - the storage cache dict key of a written slot, the starknet address of a deployed
+    //              account, the starknet address of the recipient of a transfer or the access set
+    //              dict key of an accessed address or slot
+    // @param value - the previous StorageSlot pointer of a written slot or the evm address of a deployed account
+    // @param amount - the amount of a transfer
+    // @param previous - pointer to the entry recorded before, 0 for the first entry of the transaction
+    struct JournalEntry {
+        kind: felt,
+        key: felt,
+        value: felt,
+        amount: Uint256,
+        previous: JournalEntry*,
+    }
+
+    // @notice The state changes recorded by an execution context and the contexts it called.
+    // @param checkpoint - the last entry recorded before the execution context started, 0 if none
+    // @param head - the last entry recorded, equal to checkpoint if the context made no change
+    struct Journal {
+        checkpoint: JournalEntry*,
+        head: JournalEntry*,
     }
 
     // @notice info: https://www.evm.codes/about#calldata
     // @notice Struct storing data related to a call
     // @param bytecode - the executed bytecode
     // @param bytecode_len - length of bytecode
+    // @param valid_jumpdests - bitmap of the valid jump destinations of the bytecode, see JumpdestBitmap
     // @param calldata - byte space where the data parameter of a transaction or call is held
     // @param calldata_len - length of calldata
     // @param value - amount of native token to transfer
     struct CallContext {
         bytecode: felt*,
         bytecode_len: felt,
+        valid_jumpdests: felt*,
         calldata: felt*,
         calldata_len: felt,
         value: felt,
     }
 
-    // @dev Stores all data relevant to the current execution context
+    // @dev Stores the data of an execution context that does not change while it runs
     // @param call_context - call context data
-    // @param program_counter - keep track of the current position in the program as it is being executed
-    // @param stopped - boolean that state if the current execution is halted
-    // @param return_data - region used to return a value after a call
-    // @param return_data_len - return_data length
-    // @param stack - current execution context stack
-    // @param memory - current execution context memory
-    // @param gas_used - gas consumed by the current state of the execution
     // @param gas_limit - maximum amount of gas for the execution
     // @param gas_price - the amount to pay per unit of gas
     // @param starknet_contract_address - starknet address of the contract interacted with
     // @param evm_contract_address - evm address of the contract interacted with
     // @param calling_context - parent context of the current execution context, can be empty when context
     //                          is root context | see ExecutionContext.is_root(ctx)
-    // @param sub_context - child context of the current execution context, can be empty
+    // @param read_only - if set to true, context cannot do any state modifying instructions or send ETH in the sub context.
+    // @param ret_offset - offset in the memory of the calling context where the returned data is written
+    // @param ret_size - maximum size of the returned data written in the memory of the calling context
+    struct Environment {
+        call_context: CallContext*,
+        gas_limit: felt,
+        gas_price: felt,
+        starknet_contract_address: felt,
+        evm_contract_address: felt,
+        calling_context: ExecutionContext*,
+        read_only: felt,
+        ret_offset: felt,
+        ret_size: felt,
+    }
+
+    // @dev Stores the data of an execution context that is not updated by each instruction
+    // @dev They are shared by the copies of an execution context made while it runs, so that
+    // @dev ExecutionContext.apply_changes only copies the fields updated by each instruction.
     // @param destroy_contracts_len - destroy_contract length
     // @param destroy_contracts - array of contracts to destroy at the end of the transaction
-    // @param read_only - if set to true, context cannot do any state modifying instructions or send ETH in the sub context.
+    // @param storage_cache - storage slots accessed during the transaction, committed when the root context stops
+    // @param registry_cache - account registry lookups made during the transaction
+    // @param access_set - addresses and storage slots accessed during the transaction
+    // @param keccak_segment - keccak builtin segment used by the transaction
+    // @param journal - state changes recorded since the execution context started
+    struct ColdState {
+        destroy_contracts_len: felt,
+        destroy_contracts: felt*,
+        storage_cache: StorageCache*,
+        registry_cache: RegistryCache*,
+        access_set: AccessSet*,
+        keccak_segment: KeccakSegment*,
+        journal: Journal*,
+    }
+
+    // @dev Stores all data relevant to the current execution context
+    // @dev Only the fields updated while the context runs are copied by the ExecutionContext
+    // @dev functions, the others are shared through the environment and the cold state.
+    // @param environment - data of the execution context that does not change while it runs
+    // @param program_counter - keep track of the current position in the program as it is being executed
+    // @param stopped - boolean that state if the current execution is halted
+    // @param return_data - region used to return a value after a call
+    // @param return_data_len - return_data length
+    // @param stack - current execution context stack
+    // @param memory - current execution context memory
+    // @param gas_used - gas consumed by the current state of the execution
+    // @param sub_context - child context of the current execution context, can be empty
+    // @param reverted - whether the execution context stopped with a REVERT
+    // @param cold - data of the execution context that is not updated by each instruction
     struct ExecutionContext {
-        call_context: CallContext*,
+        environment: Environment*,
         program_counter: felt,
         stopped: felt,
         return_data: felt*,
@@ -75,14 +211,8 @@ namespace model {
         stack: Stack*,
         memory: Memory*,
         gas_used: felt,
-        gas_limit: felt,
-        gas_price: felt,
-        starknet_contract_address: felt,
-        evm_contract_address: felt,
-        calling_context: ExecutionContext*,
         sub_context: ExecutionContext*,
-        destroy_contracts_len: felt,
-        destroy_contracts: felt*,
-        read_only: felt,
+        reverted: felt,
+        cold: ColdState*,
     }
 }
@@ -0,0 +1,461 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bitwise import bitwise_xor
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.registers import get_label_location
+
+// Internal dependencies
+from utils.utils import Helpers
+
+// @title Blake2f Precompile related functions.
+// @notice This file contains the logic required to run the blake2f precompile, the F
+// @notice compression function of BLAKE2b of EIP-152.
+// @custom:namespace PrecompileBlake2f
+namespace PrecompileBlake2f {
+    const PRECOMPILE_ADDRESS = 0x09;
+    const GAS_COST_PER_ROUND = 1;
+    const INPUT_BYTES_LEN = 213;
+    const WORD_BYTES_LEN = 8;
+    const STATE_WORDS_LEN = 8;
+    const MESSAGE_WORDS_LEN = 16;
+    const ROUNDS_BYTES_LEN = 4;
+    // Offsets of the parameters in the input
+    const H_OFFSET = ROUNDS_BYTES_LEN;
+    const M_OFFSET = H_OFFSET + WORD_BYTES_LEN * STATE_WORDS_LEN;
+    const T_OFFSET = M_OFFSET + WORD_BYTES_LEN * MESSAGE_WORDS_LEN;
+    const F_OFFSET = T_OFFSET + 2 * WORD_BYTES_LEN;
+
+    // @notice Run the precompile.
+    // @dev The input is the number of rounds on 4 big-endian bytes, followed by the state h, the
+    // @dev message block m, the offset counters t and the final block indicator flag f, all the
+    // @dev words being little-endian 64-bit words.
+    // @param input_len The length of input array.
+    // @param input The input array.
+    // @return The output length, output array, and gas usage of precompile.
+    func run{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+        keccak_ptr: felt*,
+    }(_address: felt, input_len: felt, input: felt*) -> (
+        output_len: felt, output: felt*, gas_used: felt
+    ) {
+        alloc_locals;
+        with_attr error_message("Kakarot: blake2f invalid input length") {
+            assert input_len = INPUT_BYTES_LEN;
+        }
+        let f = input[F_OFFSET];
+        with_attr error_message("Kakarot: blake2f invalid final block indicator flag") {
+            assert f * (f - 1) = 0;
+        }
+        let rounds = Helpers.load_word(ROUNDS_BYTES_LEN, input);
+        let (local h: felt*) = alloc();
+        internal.load_words(STATE_WORDS_LEN, input + H_OFFSET, h);
+        let (local m: felt*) = alloc();
+        internal.load_words(MESSAGE_WORDS_LEN, input + M_OFFSET, m);
+        let t0 = internal.load_word(input + T_OFFSET);
+        let t1 = internal.load_word(input + T_OFFSET + WORD_BYTES_LEN);
+
+        let h_new = internal.compress(rounds, h, m, t0, t1, f);
+
+        let (local output: felt*) = alloc();
+        internal.words_to_bytes(STATE_WORDS_LEN, h_new, output);
+        return (WORD_BYTES_LEN * STATE_WORDS_LEN, output, GAS_COST_PER_ROUND * rounds);
+    }
+
+    // @notice Compute the gas cost of the precompile, one gas per round.
+    // @dev Checked against the gas limit before the rounds run, as there can be up to 2**32 - 1 of them.
+    // @param input_len The length of input array.
+    // @param input The input array.
+    // @return The gas cost of the precompile, 0 for an invalid input as run rejects it.
+    func required_gas(input_len: felt, input: felt*) -> felt {
+        if (input_len != INPUT_BYTES_LEN) {
+            return 0;
+        }
+        let rounds = Helpers.load_word(ROUNDS_BYTES_LEN, input);
+        return GAS_COST_PER_ROUND * rounds;
+    }
+}
+
+namespace internal {
+    const MASK64 = 2 ** 64 - 1;
+    // The message permutations repeat every SIGMA_ROWS_LEN rounds.
+    const SIGMA_ROWS_LEN = 10;
+
+    // @notice Compute the F compression function.
+    // @param rounds The number of rounds.
+    // @param h The 8 words of the state.
+    // @param m The 16 words of the message block.
+    // @param t0 The low word of the offset counter.
+    // @param t1 The high word of the offset counter.
+    // @param f The final block indicator flag, 0 or 1.
+    // @return The 8 words of the new state.
+    func compress{bitwise_ptr: BitwiseBuiltin*}(
+        rounds: felt, h: felt*, m: felt*, t0: felt, t1: felt, f: felt
+    ) -> felt* {
+        alloc_locals;
+        let iv = initialization_vector();
+        let (v12) = bitwise_xor(iv[4], t0);
+        let (v13) = bitwise_xor(iv[5], t1);
+        let (v14) = bitwise_xor(iv[6], f * MASK64);
+        let (local v: felt*) = alloc();
+        assert v[0] = h[0];
+        assert v[1] = h[1];
+        assert v[2] = h[2];
+        assert v[3] = h[3];
+        assert v[4] = h[4];
+        assert v[5] = h[5];
+        assert v[6] = h[6];
+        assert v[7] = h[7];
+        assert v[8] = iv[0];
+        assert v[9] = iv[1];
+        assert v[10] = iv[2];
+        assert v[11] = iv[3];
+        assert v[12] = v12;
+        assert v[13] = v13;
+        assert v[14] = v14;
+        assert v[15] = iv[7];
+
+        let sigma = message_permutations();
+        let v_final = run_rounds(rounds, v, m, sigma, 0);
+
+        let (local h_new: felt*) = alloc();
+        finalize(PrecompileBlake2f.STATE_WORDS_LEN, h, v_final, h_new);
+        return h_new;
+    }
+
+    // @notice Run the rounds, each one in a constant number of steps.
+    // @param rounds The number of rounds left.
+    // @param v The 16 words of the working vector.
+    // @param m The 16 words of the message block.
+    // @param sigma The message permutations.
+    // @param sigma_index The index of the permutation of the current round.
+    // @return The working vector after the rounds.
+    func run_rounds{bitwise_ptr: BitwiseBuiltin*}(
+        rounds: felt, v: felt*, m: felt*, sigma: felt*, sigma_index: felt
+    ) -> felt* {
+        if (rounds == 0) {
+            return v;
+        }
+        let w = round(v, m, sigma + PrecompileBlake2f.MESSAGE_WORDS_LEN * sigma_index);
+        if (sigma_index == SIGMA_ROWS_LEN - 1) {
+            return run_rounds(rounds - 1, w, m, sigma, 0);
+        }
+        return run_rounds(rounds - 1, w, m, sigma, sigma_index + 1);
+    }
+
+    // @notice Run one round: mix the columns, then the diagonals of the working vector.
+    // @param v The 16 words of the working vector.
+    // @param m The 16 words of the message block.
+    // @param s The message permutation of the round.
+    // @return The working vector after the round.
+    func round{bitwise_ptr: BitwiseBuiltin*}(v: felt*, m: felt*, s: felt*) -> felt* {
+        alloc_locals;
+        let (a0, b0, c0, d0) = mix(v[0], v[4], v[8], v[12], m[s[0]], m[s[1]]);
+        let (a1, b1, c1, d1) = mix(v[1], v[5], v[9], v[13], m[s[2]], m[s[3]]);
+        let (a2, b2, c2, d2) = mix(v[2], v[6], v[10], v[14], m[s[4]], m[s[5]]);
+        let (a3, b3, c3, d3) = mix(v[3], v[7], v[11], v[15], m[s[6]], m[s[7]]);
+
+        let (local w: felt*) = alloc();
+        let (w0, w5, w10, w15) = mix(a0, b1, c2, d3, m[s[8]], m[s[9]]);
+        let (w1, w6, w11, w12) = mix(a1, b2, c3, d0, m[s[10]], m[s[11]]);
+        let (w2, w7, w8, w13) = mix(a2, b3, c0, d1, m[s[12]], m[s[13]]);
+        let (w3, w4, w9, w14) = mix(a3, b0, c1, d2, m[s[14]], m[s[15]]);
+        assert w[0] = w0;
+        assert w[1] = w1;
+        assert w[2] = w2;
+        assert w[3] = w3;
+        assert w[4] = w4;
+        assert w[5] = w5;
+        assert w[6] = w6;
+        assert w[7] = w7;
+        assert w[8] = w8;
+        assert w[9] = w9;
+        assert w[10] = w10;
+        assert w[11] = w11;
+        assert w[12] = w12;
+        assert w[13] = w13;
+        assert w[14] = w14;
+        assert w[15] = w15;
+        return w;
+    }
+
+    // @notice The G mixing function of BLAKE2b.
+    // @dev Sums are reduced modulo 2 ** 64 with a mask, a right rotation by n splits the word
+    // @dev at bit n with a mask and swaps the two parts.
+    func mix{bitwise_ptr: BitwiseBuiltin*}(
+        a: felt, b: felt, c: felt, d: felt, x: felt, y: felt
+    ) -> (a: felt, b: felt, c: felt, d: felt) {
+        // a1 = a + b + x
+        assert bitwise_ptr[0].x = a + b + x;
+        assert bitwise_ptr[0].y = MASK64;
+        let a1 = bitwise_ptr[0].x_and_y;
+        // d1 = (d ^ a1) >>> 32
+        assert bitwise_ptr[1].x = d;
+        assert bitwise_ptr[1].y = a1;
+        assert bitwise_ptr[2].x = bitwise_ptr[1].x_xor_y;
+        assert bitwise_ptr[2].y = 2 ** 32 - 1;
+        tempvar d1 = (bitwise_ptr[2].x - bitwise_ptr[2].x_and_y) / 2 ** 32 +
+            bitwise_ptr[2].x_and_y * 2 ** 32;
+        // c1 = c + d1
+        assert bitwise_ptr[3].x = c + d1;
+        assert bitwise_ptr[3].y = MASK64;
+        let c1 = bitwise_ptr[3].x_and_y;
+        // b1 = (b ^ c1) >>> 24
+        assert bitwise_ptr[4].x = b;
+        assert bitwise_ptr[4].y = c1;
+        assert bitwise_ptr[5].x = bitwise_ptr[4].x_xor_y;
+        assert bitwise_ptr[5].y = 2 ** 24 - 1;
+        tempvar b1 = (bitwise_ptr[5].x - bitwise_ptr[5].x_and_y) / 2 ** 24 +
+            bitwise_ptr[5].x_and_y * 2 ** 40;
+        // a2 = a1 + b1 + y
+        assert bitwise_ptr[6].x = a1 + b1 + y;
+        assert bitwise_ptr[6].y = MASK64;
+        let a2 = bitwise_ptr[6].x_and_y;
+        // d2 = (d1 ^ a2) >>> 16
+        assert bitwise_ptr[7].x = d1;
+        assert bitwise_ptr[7].y = a2;
+        assert bitwise_ptr[8].x = bitwise_ptr[7].x_xor_y;
+        assert bitwise_ptr[8].y = 2 ** 16 - 1;
+        tempvar d2 = (bitwise_ptr[8].x - bitwise_ptr[8].x_and_y) / 2 ** 16 +
+            bitwise_ptr[8].x_and_y * 2 ** 48;
+        // c2 = c1 + d2
+        assert bitwise_ptr[9].x = c1 + d2;
+        assert bitwise_ptr[9].y = MASK64;
+        let c2 = bitwise_ptr[9].x_and_y;
+        // b2 = (b1 ^ c2) >>> 63
+        assert bitwise_ptr[10].x = b1;
+        assert bitwise_ptr[10].y = c2;
+        assert bitwise_ptr[11].x = bitwise_ptr[10].x_xor_y;
+        assert bitwise_ptr[11].y = 2 ** 63 - 1;
+        tempvar b2 = (bitwise_ptr[11].x - bitwise_ptr[11].x_and_y) / 2 ** 63 +
+            bitwise_ptr[11].x_and_y * 2;
+
+        let bitwise_ptr = bitwise_ptr + 12 * BitwiseBuiltin.SIZE;
+        return (a2, b2, c2, d2);
+    }
+
+    // @notice Write h[i] ^ v[i] ^ v[i + 8] for the len first words of the state at dst.
+    func finalize{bitwise_ptr: BitwiseBuiltin*}(len: felt, h: felt*, v: felt*, dst: felt*) {
+        if (len == 0) {
+            return ();
+        }
+        let (h_v) = bitwise_xor([h], [v]);
+        let (h_new) = bitwise_xor(h_v, v[8]);
+        assert [dst] = h_new;
+        return finalize(len - 1, h + 1, v + 1, dst + 1);
+    }
+
+    // @notice Load a little-endian 64-bit word.
+    func load_word(bytes: felt*) -> felt {
+        return bytes[0] + bytes[1] * 2 ** 8 + bytes[2] * 2 ** 16 + bytes[3] * 2 ** 24 +
+            bytes[4] * 2 ** 32 + bytes[5] * 2 ** 40 + bytes[6] * 2 ** 48 + bytes[7] * 2 ** 56;
+    }
+
+    func load_words(words_len: felt, bytes: felt*, words: felt*) {
+        if (words_len == 0) {
+            return ();
+        }
+        let word = load_word(bytes);
+        assert [words] = word;
+        return load_words(words_len - 1, bytes + PrecompileBlake2f.WORD_BYTES_LEN, words + 1);
+    }
+
+    // @notice Split little-endian 64-bit words into bytes.
+    func words_to_bytes{range_check_ptr}(words_len: felt, words: felt*, bytes: felt*) {
+        if (words_len == 0) {
+            return ();
+        }
+        Helpers.split_word_little([words], PrecompileBlake2f.WORD_BYTES_LEN, bytes);
+        return words_to_bytes(words_len - 1, words + 1, bytes + PrecompileBlake2f.WORD_BYTES_LEN);
+    }
+
+    // @notice Return the initialization vector of BLAKE2b.
+    func initialization_vector() -> felt* {
+        let (initialization_vector_address) = get_label_location(initialization_vector_table);
+        return initialization_vector_address;
+
+        initialization_vector_table:
+        dw 0x6a09e667f3bcc908;
+        dw 0xbb67ae8584caa73b;
+        dw 0x3c6ef372fe94f82b;
+        dw 0xa54ff53a5f1d36f1;
+        dw 0x510e527fade682d1;
+        dw 0x9b05688c2b3e6c1f;
+        dw 0x1f83d9abfb41bd6b;
+        dw 0x5be0cd19137e2179;
+    }
+
+    // @notice Return the SIGMA_ROWS_LEN message permutations, 16 indices each.
+    func message_permutations() -> felt* {
+        let (message_permutations_address) = get_label_location(message_permutations_table);
+        return message_permutations_address;
+
+        message_permutations_table:
+        dw 0;
+        dw 1;
+        dw 2;
+        dw 3;
+        dw 4;
+        dw 5;
+        dw 6;
+        dw 7;
+        dw 8;
+        dw 9;
+        dw 10;
+        dw 11;
+        dw 12;
+        dw 13;
+        dw 14;
+        dw 15;
+        dw 14;
+        dw 10;
+        dw 4;
+        dw 8;
+        dw 9;
+        dw 15;
+        dw 13;
+        dw 6;
+        dw 1;
+        dw 12;
+        dw 0;
+        dw 2;
+        dw 11;
+        dw 7;
+        dw 5;
+        dw 3;
+        dw 11;
+        dw 8;
+        dw 12;
+        dw 0;
+        dw 5;
+        dw 2;
+        dw 15;
+        dw 13;
+        dw 10;
+        dw 14;
+        dw 3;
+        dw 6;
+        dw 7;
+        dw 1;
+        dw 9;
+        dw 4;
+        dw 7;
+        dw 9;
+        dw 3;
+        dw 1;
+        dw 13;
+        dw 12;
+        dw 11;
+        dw 14;
+        dw 2;
+        dw 6;
+        dw 5;
+        dw 10;
+        dw 4;
+        dw 0;
+        dw 15;
+        dw 8;
+        dw 9;
+        dw 0;
+        dw 5;
+        dw 7;
+        dw 2;
+        dw 4;
+        dw 10;
+        dw 15;
+        dw 14;
+        dw 1;
+        dw 11;
+        dw 12;
+        dw 6;
+        dw 8;
+        dw 3;
+        dw 13;
+        dw 2;
+        dw 12;
+        dw 6;
+        dw 10;
+        dw 0;
+        dw 11;
+        dw 8;
+        dw 3;
+        dw 4;
+        dw 13;
+        dw 7;
+        dw 5;
+        dw 15;
+        dw 14;
+        dw 1;
+        dw 9;
+        dw 12;
+        dw 5;
+        dw 1;
+        dw 15;
+        dw 14;
+        dw 13;
+        dw 4;
+        dw 10;
+        dw 0;
+        dw 7;
+        dw 6;
+        dw 3;
+        dw 9;
+        dw 2;
+        dw 8;
+        dw 11;
+        dw 13;
+        dw 11;
+        dw 7;
+        dw 14;
+        dw 12;
+        dw 1;
+        dw 3;
+        dw 9;
+        dw 5;
+        dw 0;
+        dw 15;
+        dw 4;
+        dw 8;
+        dw 6;
+        dw 2;
+        dw 10;
+        dw 6;
+        dw 15;
+        dw 14;
+        dw 9;
+        dw 11;
+        dw 3;
+        dw 0;
+        dw 8;
+        dw 12;
+        dw 2;
+        dw 13;
+        dw 7;
+        dw 1;
+        dw 4;
+        dw 10;
+        dw 5;
+        dw 10;
+        dw 2;
+        dw 8;
+        dw 4;
+        dw 7;
+        dw 6;
+        dw 1;
+        dw 5;
+        dw 15;
+        dw 11;
+        dw 9;
+        dw 14;
+        dw 3;
+        dw 12;
+        dw 13;
+        dw 0;
+    }
+}
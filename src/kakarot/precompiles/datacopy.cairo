@@ -30,6 +30,7 @@ namespace PrecompileDataCopy {
         pedersen_ptr: HashBuiltin*,
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
+        keccak_ptr: felt*,
     }(_address: felt, input_len: felt, input: felt*) -> (
         output_len: felt, output: felt*, gas_used: felt
     ) {
@@ -5,13 +5,20 @@
 // Starkware dependencies
 from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
-from starkware.cairo.common.cairo_keccak.keccak import finalize_keccak
+from starkware.cairo.common.cairo_secp.bigint import BigInt3, bigint_to_uint256
+from starkware.cairo.common.cairo_secp.ec import EcPoint, ec_add, ec_double, fast_ec_add
 from starkware.cairo.common.cairo_secp.signature import (
-    recover_public_key,
+    div_mod_n,
+    get_point_from_x,
     public_key_point_to_eth_address,
 )
+from starkware.cairo.common.dict import DictAccess, dict_read, dict_write
+from starkware.cairo.common.hash_state import hash_felts
+from starkware.cairo.common.math import split_int
+from starkware.cairo.common.registers import get_label_location
 
 // Internal dependencies
+from kakarot.model import model
 from utils.utils import Helpers
 
 // @title EcRecover Precompile related functions.
@@ -22,6 +29,8 @@ from utils.utils import Helpers
 namespace PrecompileEcRecover {
     const PRECOMPILE_ADDRESS = 0x01;
     const GAS_COST_EC_RECOVER = 3000;
+    const INPUT_BYTES_LEN = 4 * 32;
+    const OUTPUT_BYTES_LEN = 32;
 
     // @notice Run the precompile.
     // @param input_len The length of input array.
@@ -32,16 +41,84 @@ namespace PrecompileEcRecover {
         pedersen_ptr: HashBuiltin*,
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
+        keccak_ptr: felt*,
     }(_address: felt, input_len: felt, input: felt*) -> (
         output_len: felt, output: felt*, gas_used: felt
     ) {
         alloc_locals;
+        internal.assert_input_len(input_len);
+        let (local output: felt*) = alloc();
+        internal.recover_address(input, output);
+        return (OUTPUT_BYTES_LEN, output, GAS_COST_EC_RECOVER);
+    }
+
+    // @notice Run the precompile, reusing the output of a previous call of the transaction with the same input.
+    // @dev Inputs are identified in the memo of the keccak segment by a pedersen digest of their words.
+    // @param keccak_segment The keccak segment of the transaction.
+    // @param input_len The length of input array.
+    // @param input The input array.
+    // @return The updated keccak segment, the output length, output array, and gas usage of precompile.
+    func run_memoized{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(keccak_segment: model.KeccakSegment*, input_len: felt, input: felt*) -> (
+        keccak_segment: model.KeccakSegment*, output_len: felt, output: felt*, gas_used: felt
+    ) {
+        alloc_locals;
+        internal.assert_input_len(input_len);
+        let (local output: felt*) = alloc();
+        let key = internal.memo_key{hash_ptr=pedersen_ptr}(input);
+        let memo = keccak_segment.memo;
+        let (cached_output) = dict_read{dict_ptr=memo}(key);
+        if (cached_output != 0) {
+            tempvar new_segment = new model.KeccakSegment(
+                keccak_ptr_start=keccak_segment.keccak_ptr_start,
+                keccak_ptr=keccak_segment.keccak_ptr,
+                memo_start=keccak_segment.memo_start,
+                memo=memo,
+                );
+            return (new_segment, OUTPUT_BYTES_LEN, cast(cached_output, felt*), GAS_COST_EC_RECOVER);
+        }
+        dict_write{dict_ptr=memo}(key, cast(output, felt));
+        local memo: DictAccess* = memo;
+        local pedersen_ptr: HashBuiltin* = pedersen_ptr;
 
+        let keccak_ptr = keccak_segment.keccak_ptr;
+        with keccak_ptr {
+            internal.recover_address(input, output);
+        }
+        tempvar new_segment = new model.KeccakSegment(
+            keccak_ptr_start=keccak_segment.keccak_ptr_start,
+            keccak_ptr=keccak_ptr,
+            memo_start=keccak_segment.memo_start,
+            memo=memo,
+            );
+        return (new_segment, OUTPUT_BYTES_LEN, output, GAS_COST_EC_RECOVER);
+    }
+}
+
+namespace internal {
+    // Scalars are processed in windows of 4 bits, most significant window first.
+    const WINDOW_BASE = 2 ** 4;
+    const WINDOWS_PER_UINT128 = 32;
+
+    func assert_input_len(input_len: felt) {
         with_attr error_message(
                 "EcRecover: received wrong number of bytes in input: {input_len} instead of 4*32") {
-            assert input_len = 4 * 32;
+            assert input_len = PrecompileEcRecover.INPUT_BYTES_LEN;
         }
+        return ();
+    }
 
+    // @notice Recover the address of the signer of an input and write it as 32 bytes.
+    // @param input The 128 bytes of the input: the message hash, v, r and s.
+    // @param output The destination of the address.
+    func recover_address{range_check_ptr, bitwise_ptr: BitwiseBuiltin*, keccak_ptr: felt*}(
+        input: felt*, output: felt*
+    ) {
+        alloc_locals;
         let hash = Helpers.bytes32_to_bigint(input);
         let v_uint256 = Helpers.bytes32_to_uint256(input + 32);
         let v = Helpers.uint256_to_felt(v_uint256);
@@ -54,18 +131,245 @@ namespace PrecompileEcRecover {
         let s = Helpers.bytes32_to_bigint(input + 32 * 3);
 
         // v - 27, see recover_public_key comment
-        let (public_key_point) = recover_public_key(hash, r, s, v - 27);
+        let public_key_point = recover_public_key(hash, r, s, v - 27);
 
-        let (keccak_ptr: felt*) = alloc();
-        local keccak_ptr_start: felt* = keccak_ptr;
-        with keccak_ptr {
-            let (public_address) = public_key_point_to_eth_address(public_key_point);
-            finalize_keccak(keccak_ptr_start=keccak_ptr_start, keccak_ptr_end=keccak_ptr);
+        let (public_address) = public_key_point_to_eth_address(public_key_point);
+        Helpers.split_word(public_address, PrecompileEcRecover.OUTPUT_BYTES_LEN, output);
+        return ();
+    }
+
+    // @notice Return a pedersen digest of the 128 bytes of an input, read as 8 words of 16 bytes.
+    func memo_key{hash_ptr: HashBuiltin*}(input: felt*) -> felt {
+        alloc_locals;
+        let (local words: felt*) = alloc();
+        // The first word tells the inputs of the precompile apart from the SHA3 inputs of the memo
+        assert words[0] = 'ec_recover';
+        let hash = Helpers.bytes32_to_uint256(input);
+        let v = Helpers.bytes32_to_uint256(input + 32);
+        let r = Helpers.bytes32_to_uint256(input + 32 * 2);
+        let s = Helpers.bytes32_to_uint256(input + 32 * 3);
+        assert words[1] = hash.low;
+        assert words[2] = hash.high;
+        assert words[3] = v.low;
+        assert words[4] = v.high;
+        assert words[5] = r.low;
+        assert words[6] = r.high;
+        assert words[7] = s.low;
+        assert words[8] = s.high;
+        let (key) = hash_felts(words, 9);
+        return key;
+    }
+
+    // @notice Recover the public key of a signature, as cairo_secp recover_public_key does.
+    // @dev The result -(msg_hash / r) * G + (s / r) * R is computed with a single chain of doublings,
+    // @dev adding at the end of each window the multiples of -G and R given by the window values.
+    // @dev The multiples of -G are precomputed, the ones of R are computed once per call.
+    // @param msg_hash The signed message hash.
+    // @param r The r value of the signature, the x coordinate of R.
+    // @param s The s value of the signature.
+    // @param v The parity of the y coordinate of R.
+    // @return The public key point.
+    func recover_public_key{range_check_ptr}(
+        msg_hash: BigInt3, r: BigInt3, s: BigInt3, v: felt
+    ) -> EcPoint {
+        alloc_locals;
+        let (local r_point: EcPoint) = get_point_from_x(x=r, v=v);
+        let (u1: BigInt3) = div_mod_n(msg_hash, r);
+        let (u2: BigInt3) = div_mod_n(s, r);
+        let u1_windows = scalar_windows(u1);
+        let u2_windows = scalar_windows(u2);
+
+        let minus_generator_table = minus_generator_multiples();
+        let r_table = point_multiples(r_point);
+        let zero_point = EcPoint(BigInt3(0, 0, 0), BigInt3(0, 0, 0));
+        // The windows are processed from the most significant one
+        let public_key_point = multiply_windows(
+            2 * WINDOWS_PER_UINT128,
+            zero_point,
+            minus_generator_table,
+            u1_windows + 2 * WINDOWS_PER_UINT128 - 1,
+            r_table,
+            u2_windows + 2 * WINDOWS_PER_UINT128 - 1,
+        );
+        return public_key_point;
+    }
+
+    // @notice Split a scalar lower than 2**256 into its 4-bit windows, least significant first.
+    func scalar_windows{range_check_ptr}(scalar: BigInt3) -> felt* {
+        alloc_locals;
+        let (value) = bigint_to_uint256(scalar);
+        let (local windows: felt*) = alloc();
+        split_int(value.low, WINDOWS_PER_UINT128, WINDOW_BASE, WINDOW_BASE, windows);
+        split_int(
+            value.high, WINDOWS_PER_UINT128, WINDOW_BASE, WINDOW_BASE, windows + WINDOWS_PER_UINT128
+        );
+        return windows;
+    }
+
+    // @notice Return the table of the multiples 0, P, 2P, ..., 15P of a nonzero point P.
+    func point_multiples{range_check_ptr}(point: EcPoint) -> EcPoint* {
+        alloc_locals;
+        let (local table: EcPoint*) = alloc();
+        assert table[0] = EcPoint(BigInt3(0, 0, 0), BigInt3(0, 0, 0));
+        assert table[1] = point;
+        let (double_point) = ec_double(point);
+        assert table[2] = double_point;
+        // As the order of the curve is prime, kP and P have distinct x coordinates for 1 < k < 15.
+        fill_multiples(WINDOW_BASE - 3, table + 3 * EcPoint.SIZE, point);
+        return table;
+    }
+
+    func fill_multiples{range_check_ptr}(n: felt, table: EcPoint*, point: EcPoint) {
+        if (n == 0) {
+            return ();
         }
+        let (next) = fast_ec_add([table - EcPoint.SIZE], point);
+        assert table[0] = next;
+        return fill_multiples(n - 1, table + EcPoint.SIZE, point);
+    }
+
+    // @notice Compute 16**n * acc + sum(16**(n-1-i) * (table0[windows0[-i]] + table1[windows1[-i]])).
+    func multiply_windows{range_check_ptr}(
+        n: felt, acc: EcPoint, table0: EcPoint*, windows0: felt*, table1: EcPoint*, windows1: felt*
+    ) -> EcPoint {
+        alloc_locals;
+        let acc = add_multiple(acc, table0, [windows0]);
+        let acc = add_multiple(acc, table1, [windows1]);
+        if (n == 1) {
+            return acc;
+        }
+        let (acc) = ec_double(acc);
+        let (acc) = ec_double(acc);
+        let (acc) = ec_double(acc);
+        let (acc) = ec_double(acc);
+        return multiply_windows(n - 1, acc, table0, windows0 - 1, table1, windows1 - 1);
+    }
+
+    func add_multiple{range_check_ptr}(acc: EcPoint, table: EcPoint*, window: felt) -> EcPoint {
+        if (window == 0) {
+            return acc;
+        }
+        let (res) = ec_add(acc, table[window]);
+        return res;
+    }
 
-        let (output) = alloc();
-        Helpers.split_word(public_address, 32, output);
+    // @notice Return the table of the multiples 0, -G, -2G, ..., -15G of the secp256k1 generator G.
+    func minus_generator_multiples() -> EcPoint* {
+        let (table_address) = get_label_location(minus_generator_multiples_table);
+        return cast(table_address, EcPoint*);
 
-        return (32, output, GAS_COST_EC_RECOVER);
+        minus_generator_multiples_table:
+        // 0
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 1
+        dw 0xe28d959f2815b16f81798;
+        dw 0xa573a1c2c1c0a6ff36cb7;
+        dw 0x79be667ef9dcbbac55a06;
+        dw 0x3aabe663b82f6f04ef2777;
+        dw 0x100fc7bbdd5c0ba12edd65;
+        dw 0xb7c52588d95c3b9aa25b0;
+        // 2
+        dw 0x2f3ca7abac09b95c709ee5;
+        dw 0x1ba5701f36171de392e33;
+        dw 0xc6047f9441ed7d6d30454;
+        dw 0x192f1edc9bce55af301705;
+        dw 0x2f9ae64c54442027366b36;
+        dw 0xe51e970159c23cc65c3a7;
+        // 3
+        dw 0x2f99b08601f113bce036f9;
+        dw 0x3e17e27548a6d4c721160d;
+        dw 0xf9308a019258c31049344;
+        dw 0x3ddce4934602897b4715bd;
+        dw 0x2067572032a66bfd599b2c;
+        dw 0xc77084f09cd217ebf01cc;
+        // 4
+        dw 0x20758474fa94abe8c4cd13;
+        dw 0x24124c2c501331b04e403b;
+        dw 0xe493dbf1c10d80f3581e4;
+        dw 0x201bf30168422b88c630d;
+        dw 0x37d9c56baedc9a61473101;
+        dw 0xae1266c15f2baa48a9bd1;
+        // 5
+        dw 0x219ab7cba8d569b240efe4;
+        dw 0x1c94297144a3a22e12f771;
+        dw 0x2f8bde4d1a07209355b4a;
+        dw 0x3297bf235782c459539959;
+        dw 0x188964d8ef6421df639153;
+        dw 0x2753ddd9c91a1c292b245;
+        // 6
+        dw 0x28a18b2f057a1460297556;
+        dw 0x2850d548d74e0bd91cbe15;
+        dw 0xfff97bd5755eeea420453;
+        dw 0x301b5fc378f3c84f8a0998;
+        dw 0x27fa02e8ea7c85fc3c26b9;
+        dw 0x51ed8885530449df0c416;
+        // 7
+        dw 0x30e39ce92bddedcac4f9bc;
+        dw 0xd97cba9e838f5066df80c;
+        dw 0x5cbdf0646e5db4eaa398f;
+        dw 0x2184a5af7d9d6f78d9755;
+        dw 0xa49e796ac915fb0bd1fb0;
+        dw 0x951435bf45daa69f5ce87;
+        // 8
+        dw 0x2f888a67784ef3e10a2a01;
+        dw 0x10fedc3cf0bc286f741796;
+        dw 0x2f01e5e15cca351daff38;
+        dw 0x2489e84a25d3479342132b;
+        dw 0x1f57b34bb12cf477b0a516;
+        dw 0xa3b25758beac66b6d6c2f;
+        // 9
+        dw 0x17e714c35f110dfc27ccbe;
+        dw 0x1e2a7d566af7825e5a5d31;
+        dw 0xacd484e2f0c7f65309ad1;
+        dw 0x2071f0fa33d9d439b05ff8;
+        dw 0x1a3a27127859489ddd6f22;
+        dw 0x33cc76de4f5826029bc7f;
+        // 10
+        dw 0x3c2b752a68e2a47e247c7;
+        dw 0x31ec6b9ab974d10b526c65;
+        dw 0xa0434d9e47f3c86235477;
+        dw 0x85ea6c3411ac3fc8c9358;
+        dw 0x2065b176ce5a421acf449e;
+        dw 0x76c545bdabe643d85c493;
+        // 11
+        dw 0x17891bbec17895da008cb;
+        dw 0x11adc3196ab15926602f97;
+        dw 0x774ae7f858a9411e5ef42;
+        dw 0x62957cfe28b3536ac3614;
+        dw 0xaa4a121326b2349387480;
+        dw 0x267b5fcd1494a1e6fdbc2;
+        // 12
+        dw 0x20095bc5b0f47070afe85a;
+        dw 0x3c0135cd18cda1f3d10658;
+        dw 0xd01115d548e7561b15c38;
+        dw 0x1792ad94fae4eb0bf9d908;
+        dw 0x2b207a109faa1b71ce8899;
+        dw 0x560cb00237ea1f285749b;
+        // 13
+        dw 0xe58cddeeddf8f19405aa8;
+        dw 0x8170dd21946c1d7ef1984;
+        dw 0xf28773c2d975288bc7d1d;
+        dw 0x2056e0d64a34ac24fc0eae;
+        dw 0x345268c942e31797e496b7;
+        dw 0xf54f6fd17277f5768a7de;
+        // 14
+        dw 0x949e6e49b241a60e823e4;
+        dw 0x19fc1f4e38c89aa9ed8d9e;
+        dw 0x499fdf9e895e719cfd64e;
+        dw 0x6a4339a0bf2afc5ebcd4;
+        dw 0x2c6d6130ae6ee6f618f617;
+        dw 0x353d093b4ab17aae6f0fb;
+        // 15
+        dw 0x5f79e44adbcf8e27e080e;
+        dw 0x2b8c257fd044c79651bcf2;
+        dw 0xd7924d4f7d43ea965a465;
+        dw 0x292c5a3afb235f095d90d7;
+        dw 0x4f75cce484056fd43509d;
+        dw 0xa7e1d78d57938d597c7bd;
     }
 }
@@ -0,0 +1,101 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.math_cmp import is_le
+from starkware.cairo.common.memcpy import memcpy
+from starkware.cairo.common.uint256 import Uint256, uint256_unsigned_div_rem
+
+// Internal dependencies
+from utils.alt_bn128.curve import G1, R_HIGH, R_LOW
+from utils.alt_bn128.field import FQ
+from utils.utils import Helpers
+
+// @title EcMul Precompile related functions.
+// @notice This file contains the logic required to run the ec_mul precompile, the scalar
+// @notice multiplication on the alt_bn128 curve of EIP-196.
+// @custom:namespace PrecompileEcMul
+namespace PrecompileEcMul {
+    const PRECOMPILE_ADDRESS = 0x07;
+    const GAS_COST_EC_MUL = 6000;
+    const WORD_BYTES_LEN = 32;
+    const INPUT_BYTES_LEN = 3 * WORD_BYTES_LEN;
+    const OUTPUT_BYTES_LEN = 2 * WORD_BYTES_LEN;
+
+    // @notice Run the precompile.
+    // @dev The input is the point (x, y) followed by the scalar, padded with zeros to 96 bytes.
+    // @dev (0, 0) encodes the point at infinity.
+    // @param input_len The length of input array.
+    // @param input The input array.
+    // @return The output length, output array, and gas usage of precompile.
+    func run{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+        keccak_ptr: felt*,
+    }(_address: felt, input_len: felt, input: felt*) -> (
+        output_len: felt, output: felt*, gas_used: felt
+    ) {
+        alloc_locals;
+        let input = internal.zero_padded(input_len, input, INPUT_BYTES_LEN);
+        let x = Helpers.bytes32_to_uint256(input);
+        let y = Helpers.bytes32_to_uint256(input + WORD_BYTES_LEN);
+        let k = Helpers.bytes32_to_uint256(input + 2 * WORD_BYTES_LEN);
+        let (local output: felt*) = alloc();
+
+        let is_infinity = internal.are_zero(x, y);
+        if (is_infinity != 0) {
+            Helpers.fill(OUTPUT_BYTES_LEN, output, 0);
+            return (OUTPUT_BYTES_LEN, output, GAS_COST_EC_MUL);
+        }
+        with_attr error_message("Kakarot: ecmul invalid point") {
+            let point = G1.from_uint256(x, y);
+        }
+
+        // k * point only depends on k modulo the order of the group.
+        let (_, k_reduced) = uint256_unsigned_div_rem(k, Uint256(R_LOW, R_HIGH));
+        let is_k_zero = internal.are_zero(k_reduced, Uint256(0, 0));
+        if (is_k_zero != 0) {
+            Helpers.fill(OUTPUT_BYTES_LEN, output, 0);
+            return (OUTPUT_BYTES_LEN, output, GAS_COST_EC_MUL);
+        }
+
+        let result = G1.scalar_mul(point, k_reduced);
+        let result_x = FQ.to_uint256(result.x);
+        let result_y = FQ.to_uint256(result.y);
+        Helpers.split_word(result_x.high, 16, output);
+        Helpers.split_word(result_x.low, 16, output + 16);
+        Helpers.split_word(result_y.high, 16, output + 32);
+        Helpers.split_word(result_y.low, 16, output + 48);
+        return (OUTPUT_BYTES_LEN, output, GAS_COST_EC_MUL);
+    }
+}
+
+namespace internal {
+    // @notice Return the first len bytes of the input, padded with zeros if the input is shorter.
+    func zero_padded{range_check_ptr}(input_len: felt, input: felt*, len: felt) -> felt* {
+        alloc_locals;
+        let is_long_enough = is_le(len, input_len);
+        if (is_long_enough != 0) {
+            return input;
+        }
+        let (local padded: felt*) = alloc();
+        memcpy(padded, input, input_len);
+        Helpers.fill(len - input_len, padded + input_len, 0);
+        return padded;
+    }
+
+    // @notice Return 1 if both words are 0, 0 otherwise.
+    func are_zero(a: Uint256, b: Uint256) -> felt {
+        // All the halves are lower than 2 ** 128, so their sum is 0 only if they all are.
+        tempvar sum = a.low + a.high + b.low + b.high;
+        if (sum == 0) {
+            return 1;
+        }
+        return 0;
+    }
+}
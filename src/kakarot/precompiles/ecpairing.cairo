@@ -0,0 +1,134 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_secp.bigint import BigInt3
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.math import unsigned_div_rem
+from starkware.cairo.common.uint256 import Uint256
+
+// Internal dependencies
+from utils.alt_bn128.curve import G1, G1Point, G2, G2Point
+from utils.alt_bn128.field import Fq2
+from utils.alt_bn128.pairing import Pairing
+from utils.utils import Helpers
+
+// @title EcPairing Precompile related functions.
+// @notice This file contains the logic required to run the ec_pairing precompile, the pairing
+// @notice check on the alt_bn128 curve of EIP-197.
+// @custom:namespace PrecompileEcPairing
+namespace PrecompileEcPairing {
+    const PRECOMPILE_ADDRESS = 0x08;
+    const GAS_COST_BASE = 45000;
+    const GAS_COST_PER_PAIR = 34000;
+    const WORD_BYTES_LEN = 32;
+    const PAIR_BYTES_LEN = 6 * WORD_BYTES_LEN;
+
+    // @notice Run the precompile.
+    // @dev The input is a list of pairs of a G1 point (x, y) and a G2 point
+    // @dev (x_im, x_re, y_im, y_re). All zeros encode the point at infinity.
+    // @param input_len The length of input array.
+    // @param input The input array.
+    // @return The output length, output array, and gas usage of precompile.
+    func run{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+        keccak_ptr: felt*,
+    }(_address: felt, input_len: felt, input: felt*) -> (
+        output_len: felt, output: felt*, gas_used: felt
+    ) {
+        alloc_locals;
+        let (pairs_len, remainder) = unsigned_div_rem(input_len, PAIR_BYTES_LEN);
+        with_attr error_message("Kakarot: ecpairing input length is not a multiple of 192") {
+            assert remainder = 0;
+        }
+
+        // Pairs with a point at infinity are 1 and are dropped before the Miller loop.
+        let (local p: G1Point*) = alloc();
+        let (local q: G2Point*) = alloc();
+        with_attr error_message("Kakarot: ecpairing invalid point") {
+            let n = internal.load_pairs(pairs_len, input, p, q);
+        }
+        let is_one = Pairing.check(n, p, q);
+
+        let (output: felt*) = alloc();
+        Helpers.fill(WORD_BYTES_LEN - 1, output, 0);
+        assert output[WORD_BYTES_LEN - 1] = is_one;
+        return (WORD_BYTES_LEN, output, GAS_COST_BASE + GAS_COST_PER_PAIR * pairs_len);
+    }
+}
+
+namespace internal {
+    // @notice Load the pairs of the input, skipping the ones with a point at infinity.
+    // @param pairs_len The number of pairs of the input.
+    // @param input The input array.
+    // @param p The destination of the G1 points.
+    // @param q The destination of the G2 points.
+    // @return The number of loaded pairs.
+    func load_pairs{range_check_ptr}(
+        pairs_len: felt, input: felt*, p: G1Point*, q: G2Point*
+    ) -> felt {
+        alloc_locals;
+        if (pairs_len == 0) {
+            return 0;
+        }
+        let next_input = input + PrecompileEcPairing.PAIR_BYTES_LEN;
+        let (is_p_infinity, p_point) = load_g1(input);
+        let (is_q_infinity, q_point) = load_g2(input + 2 * PrecompileEcPairing.WORD_BYTES_LEN);
+        tempvar is_skipped = is_p_infinity + is_q_infinity;
+        if (is_skipped != 0) {
+            return load_pairs(pairs_len - 1, next_input, p, q);
+        }
+        assert p[0] = p_point;
+        assert q[0] = q_point;
+        let n = load_pairs(pairs_len - 1, next_input, p + G1Point.SIZE, q + G2Point.SIZE);
+        return n + 1;
+    }
+
+    // @notice Load a G1 point (x, y).
+    // @return 1 and a zero point for the point at infinity, 0 and the point otherwise.
+    func load_g1{range_check_ptr}(input: felt*) -> (is_infinity: felt, point: G1Point) {
+        alloc_locals;
+        let x = Helpers.bytes32_to_uint256(input);
+        let y = Helpers.bytes32_to_uint256(input + 32);
+        let is_infinity = are_zero(x, y);
+        if (is_infinity != 0) {
+            return (1, G1Point(BigInt3(0, 0, 0), BigInt3(0, 0, 0)));
+        }
+        let point = G1.from_uint256(x, y);
+        return (0, point);
+    }
+
+    // @notice Load a G2 point (x_im, x_re, y_im, y_re).
+    // @return 1 and a zero point for the point at infinity, 0 and the point otherwise.
+    func load_g2{range_check_ptr}(input: felt*) -> (is_infinity: felt, point: G2Point) {
+        alloc_locals;
+        let x_im = Helpers.bytes32_to_uint256(input);
+        let x_re = Helpers.bytes32_to_uint256(input + 32);
+        let y_im = Helpers.bytes32_to_uint256(input + 64);
+        let y_re = Helpers.bytes32_to_uint256(input + 96);
+        let is_x_zero = are_zero(x_re, x_im);
+        let is_y_zero = are_zero(y_re, y_im);
+        tempvar is_infinity = is_x_zero * is_y_zero;
+        if (is_infinity != 0) {
+            let zero = Fq2(BigInt3(0, 0, 0), BigInt3(0, 0, 0));
+            return (1, G2Point(zero, zero));
+        }
+        let point = G2.from_uint256(x_re, x_im, y_re, y_im);
+        return (0, point);
+    }
+
+    // @notice Return 1 if both words are 0, 0 otherwise.
+    func are_zero(a: Uint256, b: Uint256) -> felt {
+        // All the halves are lower than 2 ** 128, so their sum is 0 only if they all are.
+        tempvar sum = a.low + a.high + b.low + b.high;
+        if (sum == 0) {
+            return 1;
+        }
+        return 0;
+    }
+}
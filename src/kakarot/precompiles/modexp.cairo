@@ -0,0 +1,335 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.math import assert_le, split_int, unsigned_div_rem
+from starkware.cairo.common.math_cmp import is_le, is_not_zero
+from starkware.cairo.common.memcpy import memcpy
+
+// Internal dependencies
+from utils.bigint import BigInt
+from utils.utils import Helpers
+
+// @title ModExp precompile
+// @custom:precompile
+// @custom:address 0x05
+// @notice This precompile computes base ** exponent mod modulus for arbitrary length integers
+// @dev The exponentiation is a left-to-right sliding window over the exponent bits, using the odd
+// @dev powers of the base up to the window size.
+// @custom:namespace PrecompileModExp
+namespace PrecompileModExp {
+    const PRECOMPILE_ADDRESS = 0x05;
+    const MIN_GAS = 200;
+    const LENGTH_BYTES = 32;
+    const HEADER_BYTES = 3 * LENGTH_BYTES;
+    const MAX_LENGTH = 2 ** 32;
+
+    // @notice Run the precompile.
+    // @param input_len The length of input array.
+    // @param input The input array.
+    // @return The output length, output array, and gas usage of precompile.
+    func run{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+        keccak_ptr: felt*,
+    }(_address: felt, input_len: felt, input: felt*) -> (
+        output_len: felt, output: felt*, gas_used: felt
+    ) {
+        alloc_locals;
+        let header = internal.zero_padded(input_len, input, HEADER_BYTES);
+        let base_len = internal.load_length(header);
+        let exp_len = internal.load_length(header + LENGTH_BYTES);
+        let mod_len = internal.load_length(header + 2 * LENGTH_BYTES);
+        let data = internal.zero_padded(
+            input_len, input, HEADER_BYTES + base_len + exp_len + mod_len
+        );
+        let base = data + HEADER_BYTES;
+        let exponent = base + base_len;
+        let modulus = exponent + exp_len;
+
+        let (local exponent_bits: felt*) = alloc();
+        internal.bytes_to_bits(exp_len, exponent, exponent_bits);
+        let leading_zeros = internal.count_leading_zeros(8 * exp_len, exponent_bits);
+        let gas_used = required_gas(input_len, input);
+
+        let (local output: felt*) = alloc();
+        if (mod_len == 0) {
+            return (0, output, gas_used);
+        }
+
+        let (modulus_limbs_len, modulus_limbs) = BigInt.from_bytes(mod_len, modulus);
+        let m_len = BigInt.significant_len(modulus_limbs_len, modulus_limbs);
+        if (m_len == 0) {
+            Helpers.fill(mod_len, output, 0);
+            return (mod_len, output, gas_used);
+        }
+
+        let (base_limbs_len, base_limbs) = BigInt.from_bytes(base_len, base);
+        let result = internal.exponentiate(
+            base_limbs_len,
+            base_limbs,
+            8 * exp_len - leading_zeros,
+            exponent_bits + leading_zeros,
+            m_len,
+            modulus_limbs,
+        );
+        BigInt.to_bytes(m_len, result, mod_len, output);
+        return (mod_len, output, gas_used);
+    }
+
+    // @notice Compute the gas cost of the precompile, see EIP-2565.
+    // @dev Only the header and the first 32 bytes of the exponent are read, so that the cost can be
+    // @dev checked against the gas limit before the operands are loaded.
+    // @param input_len The length of input array.
+    // @param input The input array.
+    // @return The gas cost of the precompile.
+    func required_gas{range_check_ptr}(input_len: felt, input: felt*) -> felt {
+        alloc_locals;
+        let header = internal.zero_padded(input_len, input, HEADER_BYTES);
+        let base_len = internal.load_length(header);
+        let exp_len = internal.load_length(header + LENGTH_BYTES);
+        let mod_len = internal.load_length(header + 2 * LENGTH_BYTES);
+
+        let is_exp_long = is_le(LENGTH_BYTES + 1, exp_len);
+        local head_len = exp_len + is_exp_long * (LENGTH_BYTES - exp_len);
+        let head = Helpers.slice_data(input_len, input, HEADER_BYTES + base_len, head_len);
+        let (local head_bits: felt*) = alloc();
+        internal.bytes_to_bits(head_len, head, head_bits);
+        let leading_zeros = internal.count_leading_zeros(8 * head_len, head_bits);
+        return internal.gas_cost(base_len, exp_len, mod_len, leading_zeros);
+    }
+}
+
+namespace internal {
+    // @notice Return the first len bytes of the input, padded with zeros if the input is shorter.
+    func zero_padded{range_check_ptr}(input_len: felt, input: felt*, len: felt) -> felt* {
+        alloc_locals;
+        let is_long_enough = is_le(len, input_len);
+        if (is_long_enough != 0) {
+            return input;
+        }
+        let (local padded: felt*) = alloc();
+        memcpy(padded, input, input_len);
+        Helpers.fill(len - input_len, padded + input_len, 0);
+        return padded;
+    }
+
+    // @notice Load a 32 bytes length of the header.
+    func load_length{range_check_ptr}(ptr: felt*) -> felt {
+        alloc_locals;
+        let high = Helpers.load_word(16, ptr);
+        let low = Helpers.load_word(16, ptr + 16);
+        with_attr error_message("Kakarot: modexp length is too large") {
+            assert high = 0;
+            assert_le(low, PrecompileModExp.MAX_LENGTH);
+        }
+        return low;
+    }
+
+    // @notice Decompose bytes into bits, most significant bit first.
+    func bytes_to_bits{range_check_ptr}(bytes_len: felt, bytes: felt*, bits: felt*) {
+        alloc_locals;
+        if (bytes_len == 0) {
+            return ();
+        }
+        // split_int outputs the bits least significant first.
+        let (local byte_bits: felt*) = alloc();
+        split_int([bytes], 8, 2, 2, byte_bits);
+        assert bits[0] = byte_bits[7];
+        assert bits[1] = byte_bits[6];
+        assert bits[2] = byte_bits[5];
+        assert bits[3] = byte_bits[4];
+        assert bits[4] = byte_bits[3];
+        assert bits[5] = byte_bits[2];
+        assert bits[6] = byte_bits[1];
+        assert bits[7] = byte_bits[0];
+        return bytes_to_bits(bytes_len - 1, bytes + 1, bits + 8);
+    }
+
+    // @notice Return the number of zeros before the first set bit.
+    func count_leading_zeros(bits_len: felt, bits: felt*) -> felt {
+        if (bits_len == 0) {
+            return 0;
+        }
+        tempvar bit = [bits];
+        if (bit != 0) {
+            return 0;
+        }
+        let count = count_leading_zeros(bits_len - 1, bits + 1);
+        return count + 1;
+    }
+
+    // @notice Compute the EIP-2565 gas cost.
+    // @param base_len The length of the base in bytes.
+    // @param exp_len The length of the exponent in bytes.
+    // @param mod_len The length of the modulus in bytes.
+    // @param leading_zeros The number of leading zero bits of the exponent.
+    // @return The gas cost.
+    func gas_cost{range_check_ptr}(
+        base_len: felt, exp_len: felt, mod_len: felt, leading_zeros: felt
+    ) -> felt {
+        alloc_locals;
+        let is_mod_longer = is_le(base_len, mod_len);
+        local max_len = base_len + is_mod_longer * (mod_len - base_len);
+        let (words, _) = unsigned_div_rem(max_len + 7, 8);
+        local multiplication_complexity = words * words;
+
+        // Only the bit length of the first 32 bytes of the exponent is accounted for, the tail
+        // costs 8 iterations per byte.
+        let is_exp_long = is_le(PrecompileModExp.LENGTH_BYTES + 1, exp_len);
+        local head_len = exp_len + is_exp_long * (PrecompileModExp.LENGTH_BYTES - exp_len);
+        let is_head_zero = is_le(8 * head_len, leading_zeros);
+        local head_bit_len = (1 - is_head_zero) * (8 * head_len - leading_zeros);
+        let is_head_set = is_not_zero(head_bit_len);
+        local adjusted_exp_len = 8 * (exp_len - head_len) + is_head_set * (head_bit_len - 1);
+        let is_adjusted_exp_len_set = is_not_zero(adjusted_exp_len);
+        local iteration_count = adjusted_exp_len + 1 - is_adjusted_exp_len_set;
+
+        let (gas, _) = unsigned_div_rem(multiplication_complexity * iteration_count, 3);
+        let is_min_gas = is_le(gas, PrecompileModExp.MIN_GAS);
+        return gas + is_min_gas * (PrecompileModExp.MIN_GAS - gas);
+    }
+
+    // @notice Compute base ** exponent mod m.
+    // @param base_len The number of limbs of the base.
+    // @param base The limbs of the base.
+    // @param bits_len The number of bits of the exponent, starting from its first set bit.
+    // @param bits The bits of the exponent, most significant first.
+    // @param m_len The number of limbs of m, the most significant one not being 0.
+    // @param m The limbs of m.
+    // @return The m_len limbs of the result.
+    func exponentiate{range_check_ptr}(
+        base_len: felt, base: felt*, bits_len: felt, bits: felt*, m_len: felt, m: felt*
+    ) -> felt* {
+        alloc_locals;
+        let (local one: felt*) = alloc();
+        assert one[0] = 1;
+        if (bits_len == 0) {
+            return BigInt.mulmod(1, one, 1, one, m_len, m);
+        }
+
+        let reduced_base = BigInt.mulmod(base_len, base, 1, one, m_len, m);
+        let (window_size, table_len) = get_window_size(bits_len);
+        let table = odd_powers(table_len, reduced_base, m_len, m);
+
+        // The first window starts the accumulator without squaring 1.
+        let (len, value) = next_window(bits_len, bits, window_size);
+        let acc = table[(value - 1) / 2];
+        return sliding_window(bits_len - len, bits + len, window_size, table, m_len, m, acc);
+    }
+
+    // @notice Return the window size for an exponent of bits_len bits and the matching
+    // @notice number of precomputed odd powers.
+    func get_window_size{range_check_ptr}(bits_len: felt) -> (window_size: felt, table_len: felt) {
+        let is_above_671 = is_le(672, bits_len);
+        if (is_above_671 != 0) {
+            return (6, 32);
+        }
+        let is_above_239 = is_le(240, bits_len);
+        if (is_above_239 != 0) {
+            return (5, 16);
+        }
+        let is_above_79 = is_le(80, bits_len);
+        if (is_above_79 != 0) {
+            return (4, 8);
+        }
+        let is_above_23 = is_le(24, bits_len);
+        if (is_above_23 != 0) {
+            return (3, 4);
+        }
+        return (1, 1);
+    }
+
+    // @notice Return the table of base ** (2 * i + 1) mod m for i in [0, table_len).
+    func odd_powers{range_check_ptr}(
+        table_len: felt, base: felt*, m_len: felt, m: felt*
+    ) -> felt** {
+        alloc_locals;
+        let (local table: felt**) = alloc();
+        assert table[0] = base;
+        if (table_len == 1) {
+            return table;
+        }
+        let square = BigInt.mulmod(m_len, base, m_len, base, m_len, m);
+        fill_odd_powers(table_len - 1, table, square, m_len, m);
+        return table;
+    }
+
+    // @notice Fill table[1], ..., table[n] with table[i] = table[i - 1] * square mod m.
+    func fill_odd_powers{range_check_ptr}(
+        n: felt, table: felt**, square: felt*, m_len: felt, m: felt*
+    ) {
+        if (n == 0) {
+            return ();
+        }
+        let next = BigInt.mulmod(m_len, table[0], m_len, square, m_len, m);
+        assert table[1] = next;
+        return fill_odd_powers(n - 1, table + 1, square, m_len, m);
+    }
+
+    // @notice Return the longest window of at most window_size bits starting and ending with
+    // @notice a set bit, given that bits[0] is set.
+    // @return The length of the window and its value.
+    func next_window{range_check_ptr}(bits_len: felt, bits: felt*, window_size: felt) -> (
+        len: felt, value: felt
+    ) {
+        let is_short = is_le(bits_len, window_size);
+        tempvar max_len = window_size + is_short * (bits_len - window_size);
+        return scan_window(max_len, bits, 0, 0, 0, 0);
+    }
+
+    // @notice Scan the bits of a window, keeping track of the last set bit.
+    func scan_window{range_check_ptr}(
+        max_len: felt, bits: felt*, i: felt, value: felt, window_len: felt, window_value: felt
+    ) -> (len: felt, value: felt) {
+        if (i == max_len) {
+            return (window_len, window_value);
+        }
+        tempvar bit = bits[i];
+        tempvar value = value * 2 + bit;
+        if (bit == 0) {
+            return scan_window(max_len, bits, i + 1, value, window_len, window_value);
+        }
+        return scan_window(max_len, bits, i + 1, value, i + 1, value);
+    }
+
+    // @notice Process the remaining exponent bits, squaring the accumulator once per bit and
+    // @notice multiplying it by an odd power of the base at the end of each window.
+    func sliding_window{range_check_ptr}(
+        bits_len: felt,
+        bits: felt*,
+        window_size: felt,
+        table: felt**,
+        m_len: felt,
+        m: felt*,
+        acc: felt*,
+    ) -> felt* {
+        alloc_locals;
+        if (bits_len == 0) {
+            return acc;
+        }
+        tempvar bit = [bits];
+        if (bit == 0) {
+            let acc = BigInt.mulmod(m_len, acc, m_len, acc, m_len, m);
+            return sliding_window(bits_len - 1, bits + 1, window_size, table, m_len, m, acc);
+        }
+        let (len, value) = next_window(bits_len, bits, window_size);
+        let acc = square(len, acc, m_len, m);
+        let acc = BigInt.mulmod(m_len, acc, m_len, table[(value - 1) / 2], m_len, m);
+        return sliding_window(bits_len - len, bits + len, window_size, table, m_len, m, acc);
+    }
+
+    // @notice Square the accumulator n times.
+    func square{range_check_ptr}(n: felt, acc: felt*, m_len: felt, m: felt*) -> felt* {
+        if (n == 0) {
+            return acc;
+        }
+        let acc = BigInt.mulmod(m_len, acc, m_len, acc, m_len, m);
+        return square(n - 1, acc, m_len, m);
+    }
+}
@@ -4,19 +4,24 @@
 // Starkware dependencies
 from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.bool import TRUE, FALSE
-from starkware.cairo.common.memcpy import memcpy
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
 from starkware.cairo.common.math_cmp import is_le, is_not_zero
 
 // Internal dependencies
 from kakarot.constants import Constants
 from kakarot.execution_context import ExecutionContext
+from kakarot.journal import Journal
 from kakarot.memory import Memory
 from kakarot.model import model
+from kakarot.precompiles.blake2f import PrecompileBlake2f
 from kakarot.precompiles.datacopy import PrecompileDataCopy
 from kakarot.precompiles.ecadd import PrecompileEcAdd
+from kakarot.precompiles.ecmul import PrecompileEcMul
+from kakarot.precompiles.ecpairing import PrecompileEcPairing
 from kakarot.precompiles.ec_recover import PrecompileEcRecover
+from kakarot.precompiles.modexp import PrecompileModExp
 from kakarot.precompiles.ripemd160 import PrecompileRIPEMD160
+from kakarot.precompiles.sha256 import PrecompileSHA256
 from kakarot.stack import Stack
 
 // @title Precompile related functions.
@@ -26,9 +31,16 @@ from kakarot.stack import Stack
 namespace Precompiles {
     // @notice Executes a precompile at a given precompile address
     // @dev Associates gas used and precompile return values to a execution subcontext
+    // @dev A precompile that needs more gas than its gas limit returns no data, and its sub context
+    // @dev consumes all its gas as any out of gas context.
     // @param address The precompile address to be executed
+    // @param gas_limit The gas limit of the execution subcontext
     // @param calldata_len The calldata length
     // @param calldata The calldata.
+    // @param value The value in wei sent to the precompile.
+    // @param calling_context The pointer to the calling execution context.
+    // @param ret_offset The offset in the memory of the calling context where the output is written.
+    // @param ret_size The maximum size of the output written in the memory of the calling context.
     // @return The initialized execution context.
     func run{
         syscall_ptr: felt*,
@@ -37,46 +49,170 @@ namespace Precompiles {
         bitwise_ptr: BitwiseBuiltin*,
     }(
         address: felt,
+        gas_limit: felt,
         calldata_len: felt,
         calldata: felt*,
         value: felt,
         calling_context: model.ExecutionContext*,
-        return_data_len: felt,
-        return_data: felt*,
+        ret_offset: felt,
+        ret_size: felt,
     ) -> model.ExecutionContext* {
         alloc_locals;
 
-        // Execute the precompile at a given address
-        let (output_len, output, gas_used) = _exec_precompile(address, calldata_len, calldata);
+        // Some precompiles can exhaust the Starknet steps before their gas is compared with the
+        // gas limit, their cost is checked before they run
+        let required_gas = _required_gas(address, calldata_len, calldata);
+        let is_out_of_gas = is_le(gas_limit + 1, required_gas);
+        if (is_out_of_gas != FALSE) {
+            let (empty_output: felt*) = alloc();
+            let sub_ctx = _init_sub_context(
+                address,
+                gas_limit,
+                calling_context,
+                ret_offset,
+                ret_size,
+                calling_context.cold.keccak_segment,
+                0,
+                empty_output,
+                0,
+            );
+            return ExecutionContext.out_of_gas(sub_ctx);
+        }
+
+        // Execute the precompile at a given address, within the keccak segment of the transaction
+        let (keccak_segment, output_len, output, gas_used) = _exec_precompile_in_segment(
+            calling_context.cold.keccak_segment, address, calldata_len, calldata
+        );
+
+        // The output is the return data of the sub context, written in the calling context memory
+        // by CallHelper.finalize_calling_context
+        let sub_ctx = _init_sub_context(
+            address,
+            gas_limit,
+            calling_context,
+            ret_offset,
+            ret_size,
+            keccak_segment,
+            output_len,
+            output,
+            gas_used,
+        );
+        let is_out_of_gas = is_le(gas_limit + 1, gas_used);
+        if (is_out_of_gas != FALSE) {
+            return ExecutionContext.out_of_gas(sub_ctx);
+        }
+        return sub_ctx;
+    }
 
-        // Copy results of precompile to return data
-        memcpy(return_data, output, output_len);
-        // Build returned execution context
-        local sub_ctx: model.ExecutionContext* = new model.ExecutionContext(
+    func is_precompile{range_check_ptr}(address: felt) -> felt {
+        return is_not_zero(address) * is_le(address, Constants.LAST_PRECOMPILE_ADDRESS);
+    }
+
+    // @notice Build the stopped execution context of a precompile.
+    // @param address The precompile address.
+    // @param gas_limit The gas limit of the execution subcontext.
+    // @param calling_context The pointer to the calling execution context.
+    // @param ret_offset The offset in the memory of the calling context where the output is written.
+    // @param ret_size The maximum size of the output written in the memory of the calling context.
+    // @param keccak_segment The keccak segment of the transaction.
+    // @param output_len The output length.
+    // @param output The output array.
+    // @param gas_used The gas used by the precompile.
+    // @return The execution context of the precompile.
+    func _init_sub_context(
+        address: felt,
+        gas_limit: felt,
+        calling_context: model.ExecutionContext*,
+        ret_offset: felt,
+        ret_size: felt,
+        keccak_segment: model.KeccakSegment*,
+        output_len: felt,
+        output: felt*,
+        gas_used: felt,
+    ) -> model.ExecutionContext* {
+        let journal = Journal.open(calling_context.cold.journal);
+        tempvar environment = new model.Environment(
             call_context=cast(0, model.CallContext*),
-            program_counter=0,
-            stopped=TRUE,
-            return_data=return_data,
-            return_data_len=return_data_len,
-            stack=cast(0, model.Stack*),
-            memory=cast(0, model.Memory*),
-            gas_used=gas_used,
-            gas_limit=0,
+            gas_limit=gas_limit,
             gas_price=0,
             starknet_contract_address=0,
             evm_contract_address=address,
             calling_context=calling_context,
-            sub_context=cast(0, model.ExecutionContext*),
+            read_only=FALSE,
+            ret_offset=ret_offset,
+            ret_size=ret_size,
+            );
+        tempvar cold = new model.ColdState(
             destroy_contracts_len=0,
             destroy_contracts=cast(0, felt*),
-            read_only=FALSE,
+            storage_cache=calling_context.cold.storage_cache,
+            registry_cache=calling_context.cold.registry_cache,
+            access_set=calling_context.cold.access_set,
+            keccak_segment=keccak_segment,
+            journal=journal,
+            );
+        return new model.ExecutionContext(
+            environment=environment,
+            program_counter=0,
+            stopped=TRUE,
+            return_data=output,
+            return_data_len=output_len,
+            stack=cast(0, model.Stack*),
+            memory=cast(0, model.Memory*),
+            gas_used=gas_used,
+            sub_context=cast(0, model.ExecutionContext*),
+            reverted=FALSE,
+            cold=cold,
             );
+    }
 
-        return sub_ctx;
+    // @notice Compute the gas cost of the precompiles that is known before running them.
+    // @dev BLAKE2F runs up to 2**32 - 1 rounds and MODEXP takes operands of up to 2**32 bytes.
+    // @param address The precompile address.
+    // @param input_len The length of the input array.
+    // @param input The input array.
+    // @return The gas cost of the precompile, 0 for the precompiles that are not checked beforehand.
+    func _required_gas{range_check_ptr}(address: felt, input_len: felt, input: felt*) -> felt {
+        if (address == PrecompileBlake2f.PRECOMPILE_ADDRESS) {
+            let gas = PrecompileBlake2f.required_gas(input_len, input);
+            return gas;
+        }
+        if (address == PrecompileModExp.PRECOMPILE_ADDRESS) {
+            return PrecompileModExp.required_gas(input_len, input);
+        }
+        return 0;
     }
 
-    func is_precompile{range_check_ptr}(address: felt) -> felt {
-        return is_not_zero(address) * is_le(address, Constants.LAST_PRECOMPILE_ADDRESS);
+    // @notice Executes associated function of precompiled address within a keccak segment
+    // @dev The outputs of EcRecover are memoized in the segment, as the same signatures are often checked again.
+    // @param keccak_segment The keccak segment of the transaction.
+    // @param address The precompile address.
+    // @param input_len The length of the input array.
+    // @param input The input array.
+    // @return The updated keccak segment, the output length, output array, and gas used of the application of the precompile.
+    func _exec_precompile_in_segment{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(keccak_segment: model.KeccakSegment*, address: felt, input_len: felt, input: felt*) -> (
+        keccak_segment: model.KeccakSegment*, output_len: felt, output: felt*, gas_used: felt
+    ) {
+        if (address == PrecompileEcRecover.PRECOMPILE_ADDRESS) {
+            return PrecompileEcRecover.run_memoized(keccak_segment, input_len, input);
+        }
+
+        let keccak_ptr = keccak_segment.keccak_ptr;
+        with keccak_ptr {
+            let (output_len, output, gas_used) = _exec_precompile(address, input_len, input);
+        }
+        tempvar new_segment = new model.KeccakSegment(
+            keccak_ptr_start=keccak_segment.keccak_ptr_start,
+            keccak_ptr=keccak_ptr,
+            memo_start=keccak_segment.memo_start,
+            memo=keccak_segment.memo,
+            );
+        return (new_segment, output_len, output, gas_used);
     }
 
     // @notice Executes associated function of precompiled address
@@ -90,6 +226,7 @@ namespace Precompiles {
         pedersen_ptr: HashBuiltin*,
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
+        keccak_ptr: felt*,
     }(address: felt, input_len: felt, input: felt*) -> (
         output_len: felt, output: felt*, gas_used: felt
     ) {
@@ -102,6 +239,7 @@ namespace Precompiles {
         [ap] = pedersen_ptr, ap++;
         [ap] = range_check_ptr, ap++;
         [ap] = bitwise_ptr, ap++;
+        [ap] = keccak_ptr, ap++;
         [ap] = address, ap++;
         [ap] = input_len, ap++;
         [ap] = input, ap++;
@@ -112,21 +250,21 @@ namespace Precompiles {
         ret;
         call PrecompileEcRecover.run;  // 0x1
         ret;
-        call not_implemented_precompile;  // 0x2
+        call PrecompileSHA256.run;  // 0x2
         ret;
         call PrecompileRIPEMD160.run;  // 0x3
         ret;
         call PrecompileDataCopy.run;  // 0x4
         ret;
-        call not_implemented_precompile;  // 0x5
+        call PrecompileModExp.run;  // 0x5
         ret;
         call PrecompileEcAdd.run;  // 0x6
         ret;
-        call not_implemented_precompile;  // 0x7
+        call PrecompileEcMul.run;  // 0x7
         ret;
-        call not_implemented_precompile;  // 0x8
+        call PrecompileEcPairing.run;  // 0x8
         ret;
-        call not_implemented_precompile;  // 0x9
+        call PrecompileBlake2f.run;  // 0x9
         ret;
     }
 
@@ -139,6 +277,7 @@ namespace Precompiles {
         pedersen_ptr: HashBuiltin*,
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
+        keccak_ptr: felt*,
     }(address: felt, _input_len: felt, _input: felt*) {
         with_attr error_message("Kakarot: NotImplementedPrecompile {address}") {
             assert 0 = 1;
@@ -0,0 +1,93 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.math import unsigned_div_rem
+
+// Internal dependencies
+from utils.sha256 import SHA256
+from utils.utils import Helpers
+
+// @title SHA256 Precompile related functions.
+// @notice This file contains the logic required to run the SHA256 precompile.
+// @custom:namespace PrecompileSHA256
+namespace PrecompileSHA256 {
+    const PRECOMPILE_ADDRESS = 0x02;
+    const GAS_COST_SHA256 = 60;
+    const GAS_COST_SHA256_WORD = 12;
+    const OUTPUT_BYTES_LEN = 32;
+
+    // @notice Run the precompile.
+    // @param input_len The length of input array.
+    // @param input The input array.
+    // @return The output length, output array, and gas usage of precompile.
+    func run{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+        keccak_ptr: felt*,
+    }(_address: felt, input_len: felt, input: felt*) -> (
+        output_len: felt, output: felt*, gas_used: felt
+    ) {
+        alloc_locals;
+        let (local words: felt*) = alloc();
+        internal.bytes_to_words(input_len, input, words);
+
+        let (local sha256_ptr_start: felt*) = alloc();
+        let sha256_ptr = sha256_ptr_start;
+        with sha256_ptr {
+            let digest = SHA256.hash(words, input_len);
+        }
+        SHA256.finalize(sha256_ptr_start, sha256_ptr);
+
+        let (local output: felt*) = alloc();
+        internal.words_to_bytes(SHA256.STATE_WORDS_LEN, digest, output);
+        let (minimum_word_size) = Helpers.minimum_word_count(input_len);
+        return (
+            OUTPUT_BYTES_LEN, output, GAS_COST_SHA256_WORD * minimum_word_size + GAS_COST_SHA256
+        );
+    }
+}
+
+namespace internal {
+    // @notice Pack bytes into big-endian 32-bit words, the last one being padded with zeros.
+    // @param bytes_len The number of bytes.
+    // @param bytes The bytes.
+    // @param words The destination of the words.
+    func bytes_to_words{range_check_ptr}(bytes_len: felt, bytes: felt*, words: felt*) {
+        alloc_locals;
+        let (full_words_len, remainder) = unsigned_div_rem(bytes_len, SHA256.WORD_BYTES_LEN);
+        load_words(full_words_len, bytes, words);
+        if (remainder == 0) {
+            return ();
+        }
+        let last_word = Helpers.load_word(
+            remainder, bytes + SHA256.WORD_BYTES_LEN * full_words_len
+        );
+        let shift = Helpers.pow256_rev(12 + remainder);
+        assert words[full_words_len] = last_word * shift;
+        return ();
+    }
+
+    func load_words(words_len: felt, bytes: felt*, words: felt*) {
+        if (words_len == 0) {
+            return ();
+        }
+        let word = Helpers.load_word(SHA256.WORD_BYTES_LEN, bytes);
+        assert [words] = word;
+        return load_words(words_len - 1, bytes + SHA256.WORD_BYTES_LEN, words + 1);
+    }
+
+    // @notice Split big-endian 32-bit words into bytes.
+    func words_to_bytes{range_check_ptr}(words_len: felt, words: felt*, bytes: felt*) {
+        if (words_len == 0) {
+            return ();
+        }
+        Helpers.split_word([words], SHA256.WORD_BYTES_LEN, bytes);
+        return words_to_bytes(words_len - 1, words + 1, bytes + SHA256.WORD_BYTES_LEN);
+    }
+}
@@ -0,0 +1,161 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.default_dict import default_dict_new, default_dict_finalize
+from starkware.cairo.common.dict import DictAccess, dict_read, dict_write
+
+// Internal dependencies
+from kakarot.constants import registry_address
+from kakarot.interfaces.interfaces import IRegistry
+from kakarot.model import model
+
+// @title Registry cache related functions.
+// @notice This file contains functions related to the transaction account registry cache.
+// @dev Addresses are resolved through the account registry at most once per transaction, the
+// @dev following lookups of the same address being served by the cache.
+// @custom:namespace RegistryCache
+// @custom:model model.RegistryCache
+namespace RegistryCache {
+    // @notice Initialize the registry cache.
+    // @return The pointer to the registry cache.
+    func init() -> model.RegistryCache* {
+        alloc_locals;
+        let (evm_to_starknet_start: DictAccess*) = default_dict_new(0);
+        let (starknet_to_evm_start: DictAccess*) = default_dict_new(0);
+        return new model.RegistryCache(
+            evm_to_starknet_start=evm_to_starknet_start,
+            evm_to_starknet=evm_to_starknet_start,
+            starknet_to_evm_start=starknet_to_evm_start,
+            starknet_to_evm=starknet_to_evm_start,
+            );
+    }
+
+    // @notice Finalizes the registry cache.
+    // @dev The cache cannot be used anymore after being finalized.
+    // @param self - The pointer to the registry cache.
+    func finalize{range_check_ptr}(self: model.RegistryCache*) {
+        default_dict_finalize(self.evm_to_starknet_start, self.evm_to_starknet, 0);
+        default_dict_finalize(self.starknet_to_evm_start, self.starknet_to_evm, 0);
+        return ();
+    }
+
+    // @notice Get the starknet address of an evm address.
+    // @param self - The pointer to the registry cache.
+    // @param evm_contract_address - The evm address to resolve.
+    // @return The new pointer to the registry cache.
+    // @return The starknet address, 0 if the evm address is not registered.
+    func get_starknet_contract_address{
+        syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr
+    }(self: model.RegistryCache*, evm_contract_address: felt) -> (
+        self: model.RegistryCache*, starknet_contract_address: felt
+    ) {
+        alloc_locals;
+        let evm_to_starknet = self.evm_to_starknet;
+        let (cached_address) = dict_read{dict_ptr=evm_to_starknet}(evm_contract_address);
+
+        if (cached_address != 0) {
+            tempvar new_self = new model.RegistryCache(
+                evm_to_starknet_start=self.evm_to_starknet_start,
+                evm_to_starknet=evm_to_starknet,
+                starknet_to_evm_start=self.starknet_to_evm_start,
+                starknet_to_evm=self.starknet_to_evm,
+                );
+            return (new_self, cached_address - 1);
+        }
+
+        let (registry_address_) = registry_address.read();
+        let (local starknet_contract_address) = IRegistry.get_starknet_contract_address(
+            contract_address=registry_address_, evm_contract_address=evm_contract_address
+        );
+        dict_write{dict_ptr=evm_to_starknet}(evm_contract_address, starknet_contract_address + 1);
+        tempvar new_self = new model.RegistryCache(
+            evm_to_starknet_start=self.evm_to_starknet_start,
+            evm_to_starknet=evm_to_starknet,
+            starknet_to_evm_start=self.starknet_to_evm_start,
+            starknet_to_evm=self.starknet_to_evm,
+            );
+        return (new_self, starknet_contract_address);
+    }
+
+    // @notice Get the evm address of a starknet address.
+    // @param self - The pointer to the registry cache.
+    // @param starknet_contract_address - The starknet address to resolve.
+    // @return The new pointer to the registry cache.
+    // @return The evm address, 0 if the starknet address is not registered.
+    func get_evm_contract_address{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        self: model.RegistryCache*, starknet_contract_address: felt
+    ) -> (self: model.RegistryCache*, evm_contract_address: felt) {
+        alloc_locals;
+        let starknet_to_evm = self.starknet_to_evm;
+        let (cached_address) = dict_read{dict_ptr=starknet_to_evm}(starknet_contract_address);
+
+        if (cached_address != 0) {
+            tempvar new_self = new model.RegistryCache(
+                evm_to_starknet_start=self.evm_to_starknet_start,
+                evm_to_starknet=self.evm_to_starknet,
+                starknet_to_evm_start=self.starknet_to_evm_start,
+                starknet_to_evm=starknet_to_evm,
+                );
+            return (new_self, cached_address - 1);
+        }
+
+        let (registry_address_) = registry_address.read();
+        let (local evm_contract_address) = IRegistry.get_evm_contract_address(
+            contract_address=registry_address_, starknet_contract_address=starknet_contract_address
+        );
+        dict_write{dict_ptr=starknet_to_evm}(starknet_contract_address, evm_contract_address + 1);
+        tempvar new_self = new model.RegistryCache(
+            evm_to_starknet_start=self.evm_to_starknet_start,
+            evm_to_starknet=self.evm_to_starknet,
+            starknet_to_evm_start=self.starknet_to_evm_start,
+            starknet_to_evm=starknet_to_evm,
+            );
+        return (new_self, evm_contract_address);
+    }
+
+    // @notice Record a new entry of the account registry.
+    // @dev Used when an account is deployed during the transaction, the registry itself being updated by the caller.
+    // @param self - The pointer to the registry cache.
+    // @param starknet_contract_address - The starknet address of the account.
+    // @param evm_contract_address - The evm address of the account.
+    // @return The new pointer to the registry cache.
+    func set_account_entry(
+        self: model.RegistryCache*, starknet_contract_address: felt, evm_contract_address: felt
+    ) -> model.RegistryCache* {
+        let evm_to_starknet = self.evm_to_starknet;
+        let starknet_to_evm = self.starknet_to_evm;
+        dict_write{dict_ptr=evm_to_starknet}(evm_contract_address, starknet_contract_address + 1);
+        dict_write{dict_ptr=starknet_to_evm}(starknet_contract_address, evm_contract_address + 1);
+        return new model.RegistryCache(
+            evm_to_starknet_start=self.evm_to_starknet_start,
+            evm_to_starknet=evm_to_starknet,
+            starknet_to_evm_start=self.starknet_to_evm_start,
+            starknet_to_evm=starknet_to_evm,
+            );
+    }
+
+    // @notice Record that an account is not registered anymore.
+    // @dev Used when the deployment of an account is reverted, the registry itself being updated by the caller.
+    // @param self - The pointer to the registry cache.
+    // @param starknet_contract_address - The starknet address of the account.
+    // @param evm_contract_address - The evm address of the account.
+    // @return The new pointer to the registry cache.
+    func remove_account_entry(
+        self: model.RegistryCache*, starknet_contract_address: felt, evm_contract_address: felt
+    ) -> model.RegistryCache* {
+        let evm_to_starknet = self.evm_to_starknet;
+        let starknet_to_evm = self.starknet_to_evm;
+        // Both addresses resolve to 0, stored as 0 + 1
+        dict_write{dict_ptr=evm_to_starknet}(evm_contract_address, 1);
+        dict_write{dict_ptr=starknet_to_evm}(starknet_contract_address, 1);
+        return new model.RegistryCache(
+            evm_to_starknet_start=self.evm_to_starknet_start,
+            evm_to_starknet=evm_to_starknet,
+            starknet_to_evm_start=self.starknet_to_evm_start,
+            starknet_to_evm=starknet_to_evm,
+            );
+    }
+}
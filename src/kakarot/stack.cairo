@@ -4,24 +4,25 @@
 
 // Starkware dependencies
 from starkware.cairo.common.alloc import alloc
-from starkware.cairo.common.math import assert_le, unsigned_div_rem
+from starkware.cairo.common.math import assert_le
 from starkware.cairo.common.uint256 import Uint256
-from starkware.cairo.common.memcpy import memcpy
-from starkware.cairo.common.dict import DictAccess, dict_read, dict_write
-from starkware.cairo.common.default_dict import default_dict_new, default_dict_finalize
+from starkware.cairo.common.dict import DictAccess
 
 // Internal dependencies
 from kakarot.constants import Constants
 from kakarot.model import model
-from utils.utils import Helpers
 
 // @title Stack related functions.
 // @notice This file contains functions related to the stack.
+// @dev The stack is a segment of immutable model.StackElement, each one pointing to the element below it.
+// @dev Pushing or popping is O(1) and doesn't require any dict access nor squashing at finalization.
 // @author @abdelhamidbakhta
 // @custom:namespace Stack
 // @custom:model model.Stack
 namespace Stack {
     // Summary of stack. Created upon finalization of the stack.
+    // @dev squashed_start and squashed_end keep the layout of a squashed dict, ie. for each word
+    //      (2 * index, 0, high) and (2 * index + 1, 0, low), ordered from the bottom of the stack.
     struct Summary {
         len_16bytes: felt,
         squashed_start: DictAccess*,
@@ -30,52 +31,36 @@ namespace Stack {
 
     // @notice Initialize the stack.
     // @return The pointer to the stack.
-    // TODO: Maybe use Stack elements directly instead of bytes
     func init() -> model.Stack* {
-        alloc_locals;
-        let (word_dict_start: DictAccess*) = default_dict_new(0);
-        return new model.Stack(
-            word_dict_start=word_dict_start,
-            word_dict=word_dict_start,
-            len_16bytes=0);
+        return new model.Stack(top=cast(0, model.StackElement*), len_16bytes=0);
     }
 
     // @notice Finalizes the stack.
     // @return The pointer to the stack Summary.
     func finalize{range_check_ptr}(self: model.Stack*) -> Summary* {
-        let (squashed_start, squashed_end) = default_dict_finalize(
-            self.word_dict_start, self.word_dict, 0
-        );
+        alloc_locals;
+        let (squashed_start: DictAccess*) = alloc();
+        internal._dump(element=self.top, n=self.len_16bytes / 2, output=squashed_start);
         return new Summary(
-            len_16bytes=self.len_16bytes, squashed_start=squashed_start, squashed_end=squashed_end
+            len_16bytes=self.len_16bytes,
+            squashed_start=squashed_start,
+            squashed_end=squashed_start + self.len_16bytes * DictAccess.SIZE,
             );
     }
 
     // @notice Store an element into the stack.
     // @param self - The pointer to the stack.
     // @param element - The element to push.
-    // @param offset - The offset to store the element at.
     // @return The new pointer to the stack.
     func push{range_check_ptr}(self: model.Stack*, element: Uint256) -> model.Stack* {
-        let word_dict = self.word_dict;
-        let position_zero = self.len_16bytes;
-
-        if (position_zero == Constants.STACK_MAX_DEPTH * 2 + 2) {
+        if (self.len_16bytes == Constants.STACK_MAX_DEPTH * 2 + 2) {
             with_attr error_message("Kakarot: StackOverflow") {
                 assert 1 = 0;
             }
         }
 
-        // Add Uint256 low and high to Dict
-        dict_write{dict_ptr=word_dict}(position_zero, element.high);
-        dict_write{dict_ptr=word_dict}(position_zero + 1, element.low);
-
-        // Return new Stack
-        return (new model.Stack(
-            word_dict_start=self.word_dict_start,
-            word_dict=word_dict,
-            len_16bytes=self.len_16bytes + 2,
-            ));
+        tempvar top = new model.StackElement(value=element, next=self.top);
+        return new model.Stack(top=top, len_16bytes=self.len_16bytes + 2);
     }
 
     // @notice Pop N elements from the stack.
@@ -87,49 +72,18 @@ namespace Stack {
         new_stack: model.Stack*, elements: Uint256*
     ) {
         alloc_locals;
-        let word_dict = self.word_dict;
-        let position_zero = self.len_16bytes;
-
         // Check if there is underflow
         with_attr error_message("Kakarot: StackUnderflow") {
-            assert_le(n * 2, position_zero);
+            assert_le(n * 2, self.len_16bytes);
         }
 
-        let (new_elements: Uint256*) = alloc();
+        let (local new_elements: Uint256*) = alloc();
 
-        // Generate an array of Uint256* to return
-        let (word_dict) = stack_to_uint256(
-            word_dict=word_dict, stack_len=position_zero, n=n * 2, output=new_elements
-        );
+        // Copy the n top elements to an array of Uint256
+        let top = internal._copy_to_array(element=self.top, n=n, output=new_elements);
 
         // Return Stack with updated Len
-        let popped_len = 2 * n;
-        return (
-            new model.Stack(
-            word_dict_start=self.word_dict_start,
-            word_dict=word_dict,
-            len_16bytes=self.len_16bytes - popped_len,
-            ),
-            new_elements,
-        );
-    }
-
-    func stack_to_uint256{range_check_ptr}(
-        word_dict: DictAccess*, stack_len: felt, n: felt, output: Uint256*
-    ) -> (word_dict: DictAccess*) {
-        if (n == 0) {
-            return (word_dict=word_dict);
-        }
-
-        // Get Low and High of element at position N
-        let (el_high) = dict_read{dict_ptr=word_dict}(stack_len - n);
-        let (el_low) = dict_read{dict_ptr=word_dict}(stack_len - n + 1);
-
-        // Save Uint256 value in array
-        let n_index = n / 2 - 1;
-        assert output[n_index] = Uint256(low=el_low, high=el_high);
-
-        return stack_to_uint256(word_dict=word_dict, stack_len=stack_len, n=n - 2, output=output);
+        return (new model.Stack(top=top, len_16bytes=self.len_16bytes - 2 * n), new_elements);
     }
 
     // @notice Pop an element from the stack.
@@ -137,29 +91,15 @@ namespace Stack {
     // @return The new pointer to the stack.
     // @return The popped element.
     func pop{range_check_ptr}(self: model.Stack*) -> (new_stack: model.Stack*, element: Uint256) {
-        let word_dict = self.word_dict;
-        let position_zero = self.len_16bytes;
         // Check if stack will underflow
-
-        if (position_zero == 0) {
+        if (self.len_16bytes == 0) {
             with_attr error_message("Kakarot: StackUnderflow") {
                 assert 1 = 0;
             }
         }
 
-        // Read and Copy element at position 1(first on stack)
-        let (el_high) = dict_read{dict_ptr=word_dict}(position_zero - 2);
-        let (el_low) = dict_read{dict_ptr=word_dict}(position_zero - 1);
-
-        // Update and return Stack
-        return (
-            new model.Stack(
-            word_dict_start=self.word_dict_start,
-            word_dict=word_dict,
-            len_16bytes=self.len_16bytes - 2,
-            ),
-            Uint256(low=el_low, high=el_high),
-        );
+        let top = self.top;
+        return (new model.Stack(top=top.next, len_16bytes=self.len_16bytes - 2), top.value);
     }
 
     // @notice Return a value from the stack at a given stack index.
@@ -170,59 +110,79 @@ namespace Stack {
     func peek{range_check_ptr}(self: model.Stack*, stack_index: felt) -> (
         self: model.Stack*, value: Uint256
     ) {
-        let word_dict = self.word_dict;
-        let position_zero = self.len_16bytes;
+        alloc_locals;
         // Check if there is underflow
         with_attr error_message("Kakarot: StackUnderflow") {
-            assert_le(stack_index * 2, position_zero);
+            assert_le(stack_index * 2 + 2, self.len_16bytes);
         }
-        // Read element at position "stack_index"
-        let (el_high) = dict_read{dict_ptr=word_dict}(position_zero - stack_index * 2 - 2);
-        let (el_low) = dict_read{dict_ptr=word_dict}(position_zero - stack_index * 2 - 1);
-        // Return element
-        return (
-            new model.Stack(
-            word_dict_start=self.word_dict_start,
-            word_dict=word_dict,
-            len_16bytes=self.len_16bytes,
-            ),
-            Uint256(low=el_low, high=el_high),
-        );
+
+        let element = internal._walk(element=self.top, n=stack_index);
+        return (self, element.value);
     }
 
     // @notice Swap two elements in the stack.
-    // @dev i is 0-based, 0 is the top of the stack.
+    // @dev i is 1-based, the top of the stack is swapped with the i-th element.
     // @param self - The pointer to the stack.
     // @param i - The index of the second element to swap.
     // @return The new pointer to the stack.
     func swap_i{range_check_ptr}(self: model.Stack*, i: felt) -> model.Stack* {
-        let word_dict = self.word_dict;
-        let position_zero = self.len_16bytes;
-
+        alloc_locals;
         // Check if there is underflow
         with_attr error_message("Kakarot: StackUnderflow") {
-            assert_le(i * 2, position_zero);
+            assert_le(i * 2, self.len_16bytes);
         }
 
-        // Read elements at stack postition 1
-        let (el1_high) = dict_read{dict_ptr=word_dict}(position_zero - 2);
-        let (el1_low) = dict_read{dict_ptr=word_dict}(position_zero - 1);
-        // Read elements at stack postition N
-        let (el2_high) = dict_read{dict_ptr=word_dict}(position_zero - i * 2);
-        let (el2_low) = dict_read{dict_ptr=word_dict}(position_zero - i * 2 + 1);
-
-        // Swap elements
-        dict_write{dict_ptr=word_dict}(position_zero - 2, el2_high);
-        dict_write{dict_ptr=word_dict}(position_zero - 1, el2_low);
-        dict_write{dict_ptr=word_dict}((position_zero - i * 2), el1_high);
-        dict_write{dict_ptr=word_dict}((position_zero - i * 2 + 1), el1_low);
+        // Replace the i-th element with the top one, keeping the elements below untouched
+        let top = self.top;
+        let (next, value) = internal._replace(element=top.next, n=i - 2, value=top.value);
+        tempvar new_top = new model.StackElement(value=value, next=next);
 
         // Return Stack
-        return (
-            new model.Stack(
-            word_dict_start=self.word_dict_start,
-            word_dict=word_dict,
-            len_16bytes=self.len_16bytes,
-            ));
+        return new model.Stack(top=new_top, len_16bytes=self.len_16bytes);
+    }
+}
+
+namespace internal {
+    // @notice Return the element n positions below the given one.
+    func _walk(element: model.StackElement*, n: felt) -> model.StackElement* {
+        if (n == 0) {
+            return element;
+        }
+        return _walk(element.next, n - 1);
+    }
+
+    // @notice Copy n elements starting from the given one into output.
+    // @return The element right below the last copied one.
+    func _copy_to_array(element: model.StackElement*, n: felt, output: Uint256*) -> model.StackElement* {
+        if (n == 0) {
+            return element;
+        }
+        assert [output] = element.value;
+        return _copy_to_array(element.next, n - 1, output + Uint256.SIZE);
+    }
+
+    // @notice Rebuild the chain down to the element n positions below the given one, replacing its value.
+    // @dev Elements below the replaced one are shared with the previous chain.
+    // @return The new chain and the value that has been replaced.
+    func _replace(element: model.StackElement*, n: felt, value: Uint256) -> (
+        new_element: model.StackElement*, old_value: Uint256
+    ) {
+        if (n == 0) {
+            tempvar new_element = new model.StackElement(value=value, next=element.next);
+            return (new_element, element.value);
+        }
+        let (next, old_value) = _replace(element.next, n - 1, value);
+        tempvar new_element = new model.StackElement(value=element.value, next=next);
+        return (new_element, old_value);
+    }
+
+    // @notice Write the n words of the chain in a squashed dict layout, bottom of the stack first.
+    func _dump(element: model.StackElement*, n: felt, output: DictAccess*) {
+        if (n == 0) {
+            return ();
+        }
+        assert output[2 * n - 2] = DictAccess(key=2 * n - 2, prev_value=0, new_value=element.value.high);
+        assert output[2 * n - 1] = DictAccess(key=2 * n - 1, prev_value=0, new_value=element.value.low);
+        return _dump(element.next, n - 1, output);
     }
 }
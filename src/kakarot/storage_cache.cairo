@@ -0,0 +1,216 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bool import FALSE, TRUE
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.default_dict import default_dict_new, default_dict_finalize
+from starkware.cairo.common.dict import DictAccess, dict_read, dict_write
+from starkware.cairo.common.hash import hash2
+from starkware.cairo.common.uint256 import Uint256
+
+// Internal dependencies
+from kakarot.interfaces.interfaces import IEvmContract
+from kakarot.model import model
+
+// @title Storage cache related functions.
+// @notice This file contains functions related to the transaction storage cache.
+// @dev SLOAD and SSTORE go through the cache so that a slot is read at most once from its contract
+// @dev account, and only its final value is written back when the transaction ends.
+// @custom:namespace StorageCache
+// @custom:model model.StorageCache
+namespace StorageCache {
+    // @notice Initialize the storage cache.
+    // @return The pointer to the storage cache.
+    func init() -> model.StorageCache* {
+        alloc_locals;
+        let (dict_start: DictAccess*) = default_dict_new(0);
+        return new model.StorageCache(dict_start=dict_start, dict=dict_start);
+    }
+
+    // @notice Read a storage slot, from the cache if it has already been accessed.
+    // @param self - The pointer to the storage cache.
+    // @param starknet_contract_address - The starknet address of the contract account.
+    // @param key - The storage key.
+    // @return The new pointer to the storage cache.
+    // @return The value of the slot.
+    func read{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        self: model.StorageCache*, starknet_contract_address: felt, key: Uint256
+    ) -> (self: model.StorageCache*, value: Uint256) {
+        alloc_locals;
+        let dict = self.dict;
+        let slot_key = internal.hash_key(starknet_contract_address, key);
+        let (slot_ptr) = dict_read{dict_ptr=dict}(slot_key);
+
+        if (slot_ptr != 0) {
+            let slot = cast(slot_ptr, model.StorageSlot*);
+            tempvar new_self = new model.StorageCache(dict_start=self.dict_start, dict=dict);
+            return (new_self, slot.value);
+        }
+
+        let (local value: Uint256) = IEvmContract.storage(
+            contract_address=starknet_contract_address, key=key
+        );
+        tempvar slot = new model.StorageSlot(
+            starknet_contract_address=starknet_contract_address, key=key, value=value, dirty=FALSE
+            );
+        dict_write{dict_ptr=dict}(slot_key, cast(slot, felt));
+        tempvar new_self = new model.StorageCache(dict_start=self.dict_start, dict=dict);
+        return (new_self, value);
+    }
+
+    // @notice Write a storage slot in the cache.
+    // @dev The value is only written to the contract account when the cache is committed.
+    // @param self - The pointer to the storage cache.
+    // @param starknet_contract_address - The starknet address of the contract account.
+    // @param key - The storage key.
+    // @param value - The value to store.
+    // @return The new pointer to the storage cache.
+    func write{pedersen_ptr: HashBuiltin*}(
+        self: model.StorageCache*, starknet_contract_address: felt, key: Uint256, value: Uint256
+    ) -> model.StorageCache* {
+        alloc_locals;
+        let dict = self.dict;
+        let slot_key = internal.hash_key(starknet_contract_address, key);
+        tempvar slot = new model.StorageSlot(
+            starknet_contract_address=starknet_contract_address, key=key, value=value, dirty=TRUE
+            );
+        dict_write{dict_ptr=dict}(slot_key, cast(slot, felt));
+        return new model.StorageCache(dict_start=self.dict_start, dict=dict);
+    }
+
+    // @notice Write a storage slot in the cache and return the slot it replaces.
+    // @dev Used by SSTORE so that the write can be undone with restore if its execution context reverts.
+    // @param self - The pointer to the storage cache.
+    // @param starknet_contract_address - The starknet address of the contract account.
+    // @param key - The storage key.
+    // @param value - The value to store.
+    // @return The new pointer to the storage cache.
+    // @return The dict key of the slot.
+    // @return The pointer to the replaced StorageSlot, 0 if the slot was not accessed before.
+    func replace{pedersen_ptr: HashBuiltin*}(
+        self: model.StorageCache*, starknet_contract_address: felt, key: Uint256, value: Uint256
+    ) -> (self: model.StorageCache*, slot_key: felt, previous_slot: felt) {
+        alloc_locals;
+        let dict = self.dict;
+        let slot_key = internal.hash_key(starknet_contract_address, key);
+        let (previous_slot) = dict_read{dict_ptr=dict}(slot_key);
+        tempvar slot = new model.StorageSlot(
+            starknet_contract_address=starknet_contract_address, key=key, value=value, dirty=TRUE
+            );
+        dict_write{dict_ptr=dict}(slot_key, cast(slot, felt));
+        tempvar new_self = new model.StorageCache(dict_start=self.dict_start, dict=dict);
+        return (new_self, slot_key, previous_slot);
+    }
+
+    // @notice Put back a slot replaced by replace.
+    // @param self - The pointer to the storage cache.
+    // @param slot_key - The dict key of the slot.
+    // @param previous_slot - The pointer to the replaced StorageSlot, 0 if the slot was not accessed before.
+    // @return The new pointer to the storage cache.
+    func restore(
+        self: model.StorageCache*, slot_key: felt, previous_slot: felt
+    ) -> model.StorageCache* {
+        let dict = self.dict;
+        dict_write{dict_ptr=dict}(slot_key, previous_slot);
+        return new model.StorageCache(dict_start=self.dict_start, dict=dict);
+    }
+
+    // @notice Write the final value of the written slots to their contract account.
+    // @dev Dirty slots are grouped by contract account so that each account is written with a
+    // @dev single write_storage_batch call. The cache cannot be used anymore after being committed.
+    // @param self - The pointer to the storage cache.
+    func commit{syscall_ptr: felt*, range_check_ptr}(self: model.StorageCache*) {
+        alloc_locals;
+        let (squashed_start, squashed_end) = default_dict_finalize(self.dict_start, self.dict, 0);
+
+        // Group the dirty slots in a linked list per contract account
+        let (accounts_start: DictAccess*) = default_dict_new(0);
+        let accounts = accounts_start;
+        internal.group_dirty_slots{accounts=accounts}(squashed_start, squashed_end);
+        let (accounts_squashed_start, accounts_squashed_end) = default_dict_finalize(
+            accounts_start, accounts, 0
+        );
+
+        internal.commit_accounts(accounts_squashed_start, accounts_squashed_end);
+        return ();
+    }
+}
+
+namespace internal {
+    // @notice Compute the dict key of a storage slot.
+    func hash_key{pedersen_ptr: HashBuiltin*}(
+        starknet_contract_address: felt, key: Uint256
+    ) -> felt {
+        let (hash_low) = hash2{hash_ptr=pedersen_ptr}(starknet_contract_address, key.low);
+        let (slot_key) = hash2{hash_ptr=pedersen_ptr}(hash_low, key.high);
+        return slot_key;
+    }
+
+    // Node of the linked list of the dirty slots of a contract account.
+    struct SlotNode {
+        slot: model.StorageSlot*,
+        next: SlotNode*,
+    }
+
+    // @notice Prepend the dirty slots of a squashed storage cache to the list of their contract account.
+    // @dev accounts maps a starknet contract address to the head of its list.
+    func group_dirty_slots{accounts: DictAccess*}(
+        squashed_start: DictAccess*, squashed_end: DictAccess*
+    ) {
+        if (squashed_start == squashed_end) {
+            return ();
+        }
+
+        // Slots whose first access has been reverted are back to 0
+        if (squashed_start.new_value == 0) {
+            return group_dirty_slots(squashed_start + DictAccess.SIZE, squashed_end);
+        }
+        let slot = cast(squashed_start.new_value, model.StorageSlot*);
+        if (slot.dirty == FALSE) {
+            return group_dirty_slots(squashed_start + DictAccess.SIZE, squashed_end);
+        }
+
+        let (head) = dict_read{dict_ptr=accounts}(slot.starknet_contract_address);
+        tempvar node = new SlotNode(slot=slot, next=cast(head, SlotNode*));
+        dict_write{dict_ptr=accounts}(slot.starknet_contract_address, cast(node, felt));
+        return group_dirty_slots(squashed_start + DictAccess.SIZE, squashed_end);
+    }
+
+    // @notice Write the dirty slots of each contract account of a squashed accounts dict.
+    func commit_accounts{syscall_ptr: felt*, range_check_ptr}(
+        squashed_start: DictAccess*, squashed_end: DictAccess*
+    ) {
+        alloc_locals;
+        if (squashed_start == squashed_end) {
+            return ();
+        }
+
+        let (local keys: Uint256*) = alloc();
+        let (local values: Uint256*) = alloc();
+        let slots_len = copy_slots(
+            node=cast(squashed_start.new_value, SlotNode*), keys=keys, values=values, len=0
+        );
+        IEvmContract.write_storage_batch(
+            contract_address=squashed_start.key,
+            keys_len=slots_len,
+            keys=keys,
+            values_len=slots_len,
+            values=values,
+        );
+        return commit_accounts(squashed_start + DictAccess.SIZE, squashed_end);
+    }
+
+    // @notice Copy the keys and values of a list of slots.
+    // @return The number of copied slots.
+    func copy_slots(node: SlotNode*, keys: Uint256*, values: Uint256*, len: felt) -> felt {
+        if (cast(node, felt) == 0) {
+            return len;
+        }
+        assert [keys] = node.slot.key;
+        assert [values] = node.slot.value;
+        return copy_slots(node.next, keys + Uint256.SIZE, values + Uint256.SIZE, len + 1);
+    }
+}
@@ -0,0 +1,362 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// StarkWare dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_secp.bigint import BigInt3, UnreducedBigInt5, bigint_mul
+from starkware.cairo.common.math import unsigned_div_rem
+from starkware.cairo.common.uint256 import Uint256
+
+// Internal dependencies
+from utils.alt_bn128.field import FQ, FQ2, FQ12, Fq2, UnreducedFq2
+from utils.utils import Helpers
+
+// B2 = 3 / (9 + u), the constant of the twist y ** 2 = x ** 3 + B2, as 86 bits limbs.
+const B2_A0_D0 = 0x1befa33267e6dc24a138e5;
+const B2_A0_D1 = 0x22646f81ab0ed6d3179567;
+const B2_A0_D2 = 0x2b149d40ceb8aaae81be1;
+const B2_A1_D0 = 0x2d1852e4a2bd0685c315d2;
+const B2_A1_D1 = 0x3eb7bb63f7d29d3e821394;
+const B2_A1_D2 = 0x9713b03af0fed4cd2ca;
+
+// The order r of G1 and G2, as 128 bits halves.
+const R_LOW = 0x2833e84879b9709143e1f593f0000001;
+const R_HIGH = 0x30644e72e131a029b85045b68181585d;
+
+// 6 * x ** 2, x being the BN254 curve parameter, and its number of bits.
+const SIX_X_SQUARED = 147946756881789318990833708069417712966;
+const SIX_X_SQUARED_BITS = 127;
+
+// @notice An affine point of G1, the curve y ** 2 = x ** 3 + 3 over Fq.
+struct G1Point {
+    x: BigInt3,
+    y: BigInt3,
+}
+
+// @notice An affine point of G2, the twist y ** 2 = x ** 3 + B2 over Fq2.
+struct G2Point {
+    x: Fq2,
+    y: Fq2,
+}
+
+// @title Arithmetic of the BN254 G1 group
+// @notice Points are affine and never the point at infinity, which callers handle.
+// @custom:namespace G1
+namespace G1 {
+    const WINDOW_BITS = 4;
+    const WINDOW_SIZE = 16;
+
+    // @notice Load a point from its coordinates.
+    // @dev Fails if a coordinate is not lower than p or if the point is not on the curve.
+    func from_uint256{range_check_ptr}(x: Uint256, y: Uint256) -> G1Point {
+        alloc_locals;
+        let point_x = FQ.from_uint256(x);
+        let point_y = FQ.from_uint256(y);
+        let point = G1Point(point_x, point_y);
+        assert_on_curve(point);
+        return point;
+    }
+
+    // @notice Assert that p is on the curve.
+    func assert_on_curve{range_check_ptr}(p: G1Point) {
+        alloc_locals;
+        let x_squared = FQ.mul(p.x, p.x);
+        let (x_cubed) = bigint_mul(x_squared, p.x);
+        let (y_squared) = bigint_mul(p.y, p.y);
+        FQ.verify_zero(
+            UnreducedBigInt5(
+                y_squared.d0 - x_cubed.d0 - 3,
+                y_squared.d1 - x_cubed.d1,
+                y_squared.d2 - x_cubed.d2,
+                y_squared.d3 - x_cubed.d3,
+                y_squared.d4 - x_cubed.d4,
+            ),
+        );
+        return ();
+    }
+
+    // @notice Compute 2 * p.
+    // @dev p.y must not be 0, which holds on BN254 as G1 has no point of order 2.
+    func double{range_check_ptr}(p: G1Point) -> G1Point {
+        alloc_locals;
+        let x_squared = FQ.mul(p.x, p.x);
+        let slope = FQ.div(
+            BigInt3(3 * x_squared.d0, 3 * x_squared.d1, 3 * x_squared.d2),
+            BigInt3(2 * p.y.d0, 2 * p.y.d1, 2 * p.y.d2),
+        );
+        return internal.g1_from_slope(p, slope, p.x);
+    }
+
+    // @notice Compute p + q.
+    // @dev p and q must have different x coordinates.
+    func add{range_check_ptr}(p: G1Point, q: G1Point) -> G1Point {
+        alloc_locals;
+        let slope = FQ.div(
+            BigInt3(q.y.d0 - p.y.d0, q.y.d1 - p.y.d1, q.y.d2 - p.y.d2),
+            BigInt3(q.x.d0 - p.x.d0, q.x.d1 - p.x.d1, q.x.d2 - p.x.d2),
+        );
+        return internal.g1_from_slope(p, slope, q.x);
+    }
+
+    // @notice Compute k * p with a fixed window of WINDOW_BITS bits.
+    // @dev The multiples 1 * p, ..., 15 * p are precomputed, then each window costs
+    // @dev WINDOW_BITS doublings and at most one addition.
+    // @param p The point, on the curve.
+    // @param k The scalar, in (0, r), r being the order of G1.
+    // @return The point k * p.
+    func scalar_mul{range_check_ptr}(p: G1Point, k: Uint256) -> G1Point {
+        alloc_locals;
+        let (local bytes: felt*) = alloc();
+        Helpers.split_word(k.high, 16, bytes);
+        Helpers.split_word(k.low, 16, bytes + 16);
+        let (local digits: felt*) = alloc();
+        internal.bytes_to_nibbles(32, bytes, digits);
+
+        let (local table: G1Point*) = alloc();
+        assert table[0] = p;
+        let p2 = double(p);
+        assert table[1] = p2;
+        internal.fill_multiples(p, table, 2);
+
+        let leading_zeros = internal.count_leading_zeros(digits);
+        let first_digit = digits[leading_zeros];
+        let acc = table[first_digit - 1];
+        return internal.g1_windows(
+            table, 2 * 32 - leading_zeros - 1, digits + leading_zeros + 1, acc
+        );
+    }
+}
+
+// @title Arithmetic of the BN254 G2 group, on the sextic twist
+// @notice Points are affine and never the point at infinity, which callers handle.
+// @custom:namespace G2
+namespace G2 {
+    // @notice Load a point from its coordinates x_re + x_im * u and y_re + y_im * u.
+    // @dev Fails if a coordinate is not lower than p, if the point is not on the twist or if it
+    // @dev is not in G2.
+    func from_uint256{range_check_ptr}(
+        x_re: Uint256, x_im: Uint256, y_re: Uint256, y_im: Uint256
+    ) -> G2Point {
+        alloc_locals;
+        let x_a0 = FQ.from_uint256(x_re);
+        let x_a1 = FQ.from_uint256(x_im);
+        let y_a0 = FQ.from_uint256(y_re);
+        let y_a1 = FQ.from_uint256(y_im);
+        let point = G2Point(Fq2(x_a0, x_a1), Fq2(y_a0, y_a1));
+        assert_on_curve(point);
+        assert_in_subgroup(point);
+        return point;
+    }
+
+    // @notice Assert that q is on the twist.
+    func assert_on_curve{range_check_ptr}(q: G2Point) {
+        alloc_locals;
+        let x_squared = FQ2.mul(q.x, q.x);
+        let x_cubed = FQ2.mul_unreduced(x_squared, q.x);
+        let y_squared = FQ2.mul_unreduced(q.y, q.y);
+        FQ2.verify_zero(
+            UnreducedFq2(
+                UnreducedBigInt5(
+                    y_squared.a0.d0 - x_cubed.a0.d0 - B2_A0_D0,
+                    y_squared.a0.d1 - x_cubed.a0.d1 - B2_A0_D1,
+                    y_squared.a0.d2 - x_cubed.a0.d2 - B2_A0_D2,
+                    y_squared.a0.d3 - x_cubed.a0.d3,
+                    y_squared.a0.d4 - x_cubed.a0.d4,
+                ),
+                UnreducedBigInt5(
+                    y_squared.a1.d0 - x_cubed.a1.d0 - B2_A1_D0,
+                    y_squared.a1.d1 - x_cubed.a1.d1 - B2_A1_D1,
+                    y_squared.a1.d2 - x_cubed.a1.d2 - B2_A1_D2,
+                    y_squared.a1.d3 - x_cubed.a1.d3,
+                    y_squared.a1.d4 - x_cubed.a1.d4,
+                ),
+            ),
+        );
+        return ();
+    }
+
+    // @notice Compute 2 * t.
+    // @dev t.y must not be 0.
+    // @return The slope of the tangent at t, and 2 * t.
+    func double{range_check_ptr}(t: G2Point) -> (slope: Fq2, point: G2Point) {
+        alloc_locals;
+        let x_squared = FQ2.mul(t.x, t.x);
+        let numerator = FQ2.scale(x_squared, 3);
+        let denominator = FQ2.scale(t.y, 2);
+        let slope = FQ2.div(numerator, denominator);
+        let point = internal.g2_from_slope(t, slope, t.x);
+        return (slope, point);
+    }
+
+    // @notice Compute t + q.
+    // @dev t and q must have different x coordinates.
+    // @return The slope of the line through t and q, and t + q.
+    func add{range_check_ptr}(t: G2Point, q: G2Point) -> (slope: Fq2, point: G2Point) {
+        alloc_locals;
+        let numerator = FQ2.sub(q.y, t.y);
+        let denominator = FQ2.sub(q.x, t.x);
+        let slope = FQ2.div(numerator, denominator);
+        let point = internal.g2_from_slope(t, slope, q.x);
+        return (slope, point);
+    }
+
+    // @notice Compute the image of q by the endomorphism induced by the p-power Frobenius.
+    func frobenius{range_check_ptr}(q: G2Point) -> G2Point {
+        alloc_locals;
+        let coefficients = FQ12.frobenius_coefficients(1);
+        let x_conjugate = FQ2.conjugate(q.x);
+        let y_conjugate = FQ2.conjugate(q.y);
+        let x = FQ2.mul(x_conjugate, coefficients[2]);
+        let y = FQ2.mul(y_conjugate, coefficients[3]);
+        let res = G2Point(x, y);
+        return res;
+    }
+
+    // @notice Compute the image of q by the endomorphism induced by the p ** 2-power Frobenius,
+    // @notice negated.
+    func neg_frobenius_square{range_check_ptr}(q: G2Point) -> G2Point {
+        alloc_locals;
+        // The coefficient applied to y is -1, which the negation cancels out.
+        let coefficients = FQ12.frobenius_coefficients(2);
+        let x = FQ2.mul(q.x, coefficients[2]);
+        let res = G2Point(x, q.y);
+        return res;
+    }
+
+    // @notice Assert that q belongs to the subgroup of order r of the twist.
+    // @dev Uses the criterion frobenius(q) = 6 * x ** 2 * q, x being the BN254 curve parameter.
+    func assert_in_subgroup{range_check_ptr}(q: G2Point) {
+        alloc_locals;
+        let (local bits: felt*) = alloc();
+        Helpers.split_bits(SIX_X_SQUARED, SIX_X_SQUARED_BITS, bits);
+        let multiple = internal.g2_mul_loop(q, SIX_X_SQUARED_BITS - 1, bits + 1, q);
+        let image = frobenius(q);
+        let diff_x = FQ2.sub(multiple.x, image.x);
+        let diff_y = FQ2.sub(multiple.y, image.y);
+        FQ.verify_zero(UnreducedBigInt5(diff_x.a0.d0, diff_x.a0.d1, diff_x.a0.d2, 0, 0));
+        FQ.verify_zero(UnreducedBigInt5(diff_x.a1.d0, diff_x.a1.d1, diff_x.a1.d2, 0, 0));
+        FQ.verify_zero(UnreducedBigInt5(diff_y.a0.d0, diff_y.a0.d1, diff_y.a0.d2, 0, 0));
+        FQ.verify_zero(UnreducedBigInt5(diff_y.a1.d0, diff_y.a1.d1, diff_y.a1.d2, 0, 0));
+        return ();
+    }
+}
+
+namespace internal {
+    // @notice Return the third intersection of the line of a given slope through p and a point
+    // @notice of abscissa q_x with the curve, negated.
+    func g1_from_slope{range_check_ptr}(p: G1Point, slope: BigInt3, q_x: BigInt3) -> G1Point {
+        alloc_locals;
+        let (slope_squared) = bigint_mul(slope, slope);
+        let x = FQ.reduce(
+            UnreducedBigInt5(
+                slope_squared.d0 - p.x.d0 - q_x.d0,
+                slope_squared.d1 - p.x.d1 - q_x.d1,
+                slope_squared.d2 - p.x.d2 - q_x.d2,
+                slope_squared.d3,
+                slope_squared.d4,
+            ),
+        );
+        let (y_plus_p_y) = bigint_mul(
+            slope, BigInt3(p.x.d0 - x.d0, p.x.d1 - x.d1, p.x.d2 - x.d2)
+        );
+        let y = FQ.reduce(
+            UnreducedBigInt5(
+                y_plus_p_y.d0 - p.y.d0,
+                y_plus_p_y.d1 - p.y.d1,
+                y_plus_p_y.d2 - p.y.d2,
+                y_plus_p_y.d3,
+                y_plus_p_y.d4,
+            ),
+        );
+        let res = G1Point(x, y);
+        return res;
+    }
+
+    // @notice Return the third intersection of the line of a given slope through t and a point
+    // @notice of abscissa q_x with the twist, negated.
+    func g2_from_slope{range_check_ptr}(t: G2Point, slope: Fq2, q_x: Fq2) -> G2Point {
+        alloc_locals;
+        let slope_squared = FQ2.mul_unreduced(slope, slope);
+        let x_sum = Fq2(
+            BigInt3(t.x.a0.d0 + q_x.a0.d0, t.x.a0.d1 + q_x.a0.d1, t.x.a0.d2 + q_x.a0.d2),
+            BigInt3(t.x.a1.d0 + q_x.a1.d0, t.x.a1.d1 + q_x.a1.d1, t.x.a1.d2 + q_x.a1.d2),
+        );
+        let x_unreduced = FQ2.sub_unreduced(slope_squared, x_sum);
+        let x = FQ2.reduce(x_unreduced);
+        let x_diff = FQ2.sub(t.x, x);
+        let y_plus_t_y = FQ2.mul_unreduced(slope, x_diff);
+        let y_unreduced = FQ2.sub_unreduced(y_plus_t_y, t.y);
+        let y = FQ2.reduce(y_unreduced);
+        let res = G2Point(x, y);
+        return res;
+    }
+
+    // @notice Split 4 bits digits out of bytes, most significant first.
+    func bytes_to_nibbles{range_check_ptr}(bytes_len: felt, bytes: felt*, nibbles: felt*) {
+        if (bytes_len == 0) {
+            return ();
+        }
+        let (high, low) = unsigned_div_rem([bytes], G1.WINDOW_SIZE);
+        assert nibbles[0] = high;
+        assert nibbles[1] = low;
+        return bytes_to_nibbles(bytes_len - 1, bytes + 1, nibbles + 2);
+    }
+
+    // @notice Return the number of zero digits before the first non zero one.
+    func count_leading_zeros(digits: felt*) -> felt {
+        tempvar digit = [digits];
+        if (digit != 0) {
+            return 0;
+        }
+        let count = count_leading_zeros(digits + 1);
+        return count + 1;
+    }
+
+    // @notice Fill table[i - 1] with i * p for i in (n, WINDOW_SIZE), table[n - 1] being n * p.
+    func fill_multiples{range_check_ptr}(p: G1Point, table: G1Point*, n: felt) {
+        if (n == G1.WINDOW_SIZE - 1) {
+            return ();
+        }
+        let next = G1.add(table[n - 1], p);
+        assert table[n] = next;
+        return fill_multiples(p, table, n + 1);
+    }
+
+    // @notice Process the remaining digits of a fixed window multiplication.
+    func g1_windows{range_check_ptr}(
+        table: G1Point*, digits_len: felt, digits: felt*, acc: G1Point
+    ) -> G1Point {
+        alloc_locals;
+        if (digits_len == 0) {
+            return acc;
+        }
+        let acc = G1.double(acc);
+        let acc = G1.double(acc);
+        let acc = G1.double(acc);
+        let acc = G1.double(acc);
+        tempvar digit = [digits];
+        if (digit == 0) {
+            return g1_windows(table, digits_len - 1, digits + 1, acc);
+        }
+        let acc = G1.add(acc, table[digit - 1]);
+        return g1_windows(table, digits_len - 1, digits + 1, acc);
+    }
+
+    // @notice Double acc and add q for each remaining bit, most significant first.
+    func g2_mul_loop{range_check_ptr}(
+        q: G2Point, bits_len: felt, bits: felt*, acc: G2Point
+    ) -> G2Point {
+        alloc_locals;
+        if (bits_len == 0) {
+            return acc;
+        }
+        let (_, acc) = G2.double(acc);
+        tempvar bit = [bits];
+        if (bit == 0) {
+            return g2_mul_loop(q, bits_len - 1, bits + 1, acc);
+        }
+        let (_, acc) = G2.add(acc, q);
+        return g2_mul_loop(q, bits_len - 1, bits + 1, acc);
+    }
+}
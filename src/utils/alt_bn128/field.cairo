@@ -0,0 +1,776 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// StarkWare dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_secp.bigint import (
+    BigInt3,
+    UnreducedBigInt5,
+    bigint_mul,
+    bigint_to_uint256,
+    nondet_bigint3,
+    uint256_to_bigint,
+)
+from starkware.cairo.common.cairo_secp.constants import BASE
+from starkware.cairo.common.math_cmp import is_le
+from starkware.cairo.common.registers import get_label_location
+from starkware.cairo.common.uint256 import Uint256, uint256_lt
+
+// The BN254 base field modulus p, as 86 bits limbs.
+const P0 = 0x31ca8d3c208c16d87cfd47;
+const P1 = 0x16da060561765e05aa45a1;
+const P2 = 0x30644e72e131a029b8504;
+// The BN254 base field modulus p, as 128 bits halves.
+const P_LOW = 0x97816a916871ca8d3c208c16d87cfd47;
+const P_HIGH = 0x30644e72e131a029b85045b68181585d;
+
+// @notice An element a0 + a1 * u of Fq2 = Fq[u] / (u ** 2 + 1).
+struct Fq2 {
+    a0: BigInt3,
+    a1: BigInt3,
+}
+
+// @notice An element of Fq2 whose components are unreduced products.
+struct UnreducedFq2 {
+    a0: UnreducedBigInt5,
+    a1: UnreducedBigInt5,
+}
+
+// @notice An element c0 + c1 * w + ... + c5 * w ** 5 of Fq12 = Fq2[w] / (w ** 6 - (9 + u)).
+struct Fq12 {
+    c0: Fq2,
+    c1: Fq2,
+    c2: Fq2,
+    c3: Fq2,
+    c4: Fq2,
+    c5: Fq2,
+}
+
+// @title Arithmetic of the BN254 base field
+// @notice Elements are BigInt3 whose limbs may be negative or slightly above the base, products
+// @notice are kept unreduced and reduced once with div_mod.
+// @custom:namespace FQ
+namespace FQ {
+    // @notice Compute x / y modulo p.
+    // @dev The hints are the ones of the bigint_div_mod function of cairo-lang: they provide res
+    // @dev and k such that res * y - x = k * p, which is checked with a carry chain.
+    // @dev y must not be 0 modulo p and |res * y - x| must be lower than 2 ** 258 * p, which
+    // @dev holds for x lower than 21 * p ** 2 and y lower than 2 * p.
+    // @param x The unreduced dividend.
+    // @param y The divisor.
+    // @return A BigInt3 equal to x / y modulo p.
+    func div_mod{range_check_ptr}(x: UnreducedBigInt5, y: BigInt3) -> BigInt3 {
+        alloc_locals;
+        local P: BigInt3 = BigInt3(P0, P1, P2);
+        local flag;
+        %{
+            from starkware.cairo.common.cairo_secp.secp_utils import pack
+            from starkware.cairo.common.math_utils import as_int
+            from starkware.python.math_utils import div_mod, safe_div
+
+            p = pack(ids.P, PRIME)
+            x = pack(ids.x, PRIME) + as_int(ids.x.d3, PRIME) * ids.BASE ** 3 + as_int(ids.x.d4, PRIME) * ids.BASE ** 4
+            y = pack(ids.y, PRIME)
+
+            value = res = div_mod(x, y, p)
+        %}
+        let (local res: BigInt3) = nondet_bigint3();
+        %{
+            k = safe_div(res * y - x, p)
+            value = k if k > 0 else 0 - k
+            ids.flag = 1 if k > 0 else 0
+        %}
+        let (k) = nondet_bigint3();
+        assert flag * flag = flag;
+        tempvar sign = 2 * flag - 1;
+
+        let (res_y) = bigint_mul(res, y);
+        let (kp) = bigint_mul(k, P);
+        tempvar carry0 = (res_y.d0 - x.d0 - sign * kp.d0) / BASE;
+        assert [range_check_ptr] = carry0 + 2 ** 127;
+        tempvar carry1 = (res_y.d1 - x.d1 - sign * kp.d1 + carry0) / BASE;
+        assert [range_check_ptr + 1] = carry1 + 2 ** 127;
+        tempvar carry2 = (res_y.d2 - x.d2 - sign * kp.d2 + carry1) / BASE;
+        assert [range_check_ptr + 2] = carry2 + 2 ** 127;
+        tempvar carry3 = (res_y.d3 - x.d3 - sign * kp.d3 + carry2) / BASE;
+        assert [range_check_ptr + 3] = carry3 + 2 ** 127;
+        assert res_y.d4 - x.d4 - sign * kp.d4 + carry3 = 0;
+
+        let range_check_ptr = range_check_ptr + 4;
+        return res;
+    }
+
+    // @notice Reduce an unreduced value modulo p.
+    // @param x The value to reduce, lower than 21 * p ** 2.
+    // @return A BigInt3 equal to x modulo p.
+    func reduce{range_check_ptr}(x: UnreducedBigInt5) -> BigInt3 {
+        let res = div_mod(x, BigInt3(1, 0, 0));
+        return res;
+    }
+
+    // @notice Assert that val is 0 modulo p.
+    // @param val The value to check.
+    func verify_zero{range_check_ptr}(val: UnreducedBigInt5) {
+        let res = reduce(val);
+        assert res = BigInt3(0, 0, 0);
+        return ();
+    }
+
+    // @notice Compute x * y modulo p.
+    func mul{range_check_ptr}(x: BigInt3, y: BigInt3) -> BigInt3 {
+        let (product) = bigint_mul(x, y);
+        return reduce(product);
+    }
+
+    // @notice Compute x / y modulo p.
+    // @dev y must not be 0 modulo p.
+    func div{range_check_ptr}(x: BigInt3, y: BigInt3) -> BigInt3 {
+        let res = div_mod(UnreducedBigInt5(x.d0, x.d1, x.d2, 0, 0), y);
+        return res;
+    }
+
+    // @notice Return whether x is 0 modulo p.
+    // @dev A non zero x is proven so by exhibiting its inverse.
+    // @return 1 if x is 0 modulo p, 0 otherwise.
+    func is_zero{range_check_ptr}(x: BigInt3) -> felt {
+        alloc_locals;
+        let res = reduce(UnreducedBigInt5(x.d0, x.d1, x.d2, 0, 0));
+        local res: BigInt3 = res;
+        // The limbs of res are non negative.
+        if (res.d0 + res.d1 + res.d2 == 0) {
+            return 1;
+        }
+        div_mod(UnreducedBigInt5(1, 0, 0, 0, 0), res);
+        return 0;
+    }
+
+    // @notice Return whether a Uint256 is a canonical field element, i.e. lower than p.
+    func is_canonical{range_check_ptr}(x: Uint256) -> felt {
+        let (res) = uint256_lt(x, Uint256(P_LOW, P_HIGH));
+        return res;
+    }
+
+    // @notice Convert a canonical field element to a BigInt3.
+    // @dev Fails if x is not lower than p.
+    func from_uint256{range_check_ptr}(x: Uint256) -> BigInt3 {
+        let is_reduced = is_canonical(x);
+        assert is_reduced = 1;
+        let (res) = uint256_to_bigint(x);
+        return res;
+    }
+
+    // @notice Convert x to its canonical representative in [0, p) as a Uint256.
+    func to_uint256{range_check_ptr}(x: BigInt3) -> Uint256 {
+        alloc_locals;
+        let res = reduce(UnreducedBigInt5(x.d0, x.d1, x.d2, 0, 0));
+        let (local res_uint256: Uint256) = bigint_to_uint256(res);
+        let is_reduced = is_canonical(res_uint256);
+        assert is_reduced = 1;
+        return res_uint256;
+    }
+}
+
+// @title Arithmetic of the quadratic extension Fq2
+// @custom:namespace FQ2
+namespace FQ2 {
+    // @notice Return the unit of Fq2.
+    func one() -> Fq2 {
+        let res = Fq2(BigInt3(1, 0, 0), BigInt3(0, 0, 0));
+        return res;
+    }
+
+    // @notice Compute x * y without reducing the result.
+    func mul_unreduced(x: Fq2, y: Fq2) -> UnreducedFq2 {
+        alloc_locals;
+        // (x0 + x1 * u) * (y0 + y1 * u) = x0 * y0 - x1 * y1 + (x0 * y1 + x1 * y0) * u.
+        let (x0y0) = bigint_mul(x.a0, y.a0);
+        let (x1y1) = bigint_mul(x.a1, y.a1);
+        let (x0y1) = bigint_mul(x.a0, y.a1);
+        let (x1y0) = bigint_mul(x.a1, y.a0);
+        let res = UnreducedFq2(
+            UnreducedBigInt5(
+            x0y0.d0 - x1y1.d0,
+            x0y0.d1 - x1y1.d1,
+            x0y0.d2 - x1y1.d2,
+            x0y0.d3 - x1y1.d3,
+            x0y0.d4 - x1y1.d4,
+            ),
+            UnreducedBigInt5(
+            x0y1.d0 + x1y0.d0,
+            x0y1.d1 + x1y0.d1,
+            x0y1.d2 + x1y0.d2,
+            x0y1.d3 + x1y0.d3,
+            x0y1.d4 + x1y0.d4,
+            ),
+        );
+        return res;
+    }
+
+    // @notice Compute x * y, y being in Fq, without reducing the result.
+    func mul_by_fq_unreduced(x: Fq2, y: BigInt3) -> UnreducedFq2 {
+        alloc_locals;
+        let (x0y) = bigint_mul(x.a0, y);
+        let (x1y) = bigint_mul(x.a1, y);
+        let res = UnreducedFq2(x0y, x1y);
+        return res;
+    }
+
+    // @notice Compute x * (9 + u), the non residue of the sextic twist.
+    func mul_by_xi_unreduced(x: UnreducedFq2) -> UnreducedFq2 {
+        let res = UnreducedFq2(
+            UnreducedBigInt5(
+            9 * x.a0.d0 - x.a1.d0,
+            9 * x.a0.d1 - x.a1.d1,
+            9 * x.a0.d2 - x.a1.d2,
+            9 * x.a0.d3 - x.a1.d3,
+            9 * x.a0.d4 - x.a1.d4,
+            ),
+            UnreducedBigInt5(
+            x.a0.d0 + 9 * x.a1.d0,
+            x.a0.d1 + 9 * x.a1.d1,
+            x.a0.d2 + 9 * x.a1.d2,
+            x.a0.d3 + 9 * x.a1.d3,
+            x.a0.d4 + 9 * x.a1.d4,
+            ),
+        );
+        return res;
+    }
+
+    // @notice Compute x + y on unreduced values.
+    func add_unreduced(x: UnreducedFq2, y: UnreducedFq2) -> UnreducedFq2 {
+        let res = UnreducedFq2(
+            UnreducedBigInt5(
+            x.a0.d0 + y.a0.d0,
+            x.a0.d1 + y.a0.d1,
+            x.a0.d2 + y.a0.d2,
+            x.a0.d3 + y.a0.d3,
+            x.a0.d4 + y.a0.d4,
+            ),
+            UnreducedBigInt5(
+            x.a1.d0 + y.a1.d0,
+            x.a1.d1 + y.a1.d1,
+            x.a1.d2 + y.a1.d2,
+            x.a1.d3 + y.a1.d3,
+            x.a1.d4 + y.a1.d4,
+            ),
+        );
+        return res;
+    }
+
+    // @notice Compute x - y, x being unreduced.
+    func sub_unreduced(x: UnreducedFq2, y: Fq2) -> UnreducedFq2 {
+        let res = UnreducedFq2(
+            UnreducedBigInt5(
+            x.a0.d0 - y.a0.d0, x.a0.d1 - y.a0.d1, x.a0.d2 - y.a0.d2, x.a0.d3, x.a0.d4
+            ),
+            UnreducedBigInt5(
+            x.a1.d0 - y.a1.d0, x.a1.d1 - y.a1.d1, x.a1.d2 - y.a1.d2, x.a1.d3, x.a1.d4
+            ),
+        );
+        return res;
+    }
+
+    // @notice Compute x - y, limb by limb.
+    func sub(x: Fq2, y: Fq2) -> Fq2 {
+        let res = Fq2(
+            BigInt3(x.a0.d0 - y.a0.d0, x.a0.d1 - y.a0.d1, x.a0.d2 - y.a0.d2),
+            BigInt3(x.a1.d0 - y.a1.d0, x.a1.d1 - y.a1.d1, x.a1.d2 - y.a1.d2),
+        );
+        return res;
+    }
+
+    // @notice Compute k * x for a small constant k, limb by limb.
+    func scale(x: Fq2, k: felt) -> Fq2 {
+        let res = Fq2(
+            BigInt3(k * x.a0.d0, k * x.a0.d1, k * x.a0.d2),
+            BigInt3(k * x.a1.d0, k * x.a1.d1, k * x.a1.d2),
+        );
+        return res;
+    }
+
+    // @notice Compute the conjugate x0 - x1 * u of x.
+    func conjugate(x: Fq2) -> Fq2 {
+        let res = Fq2(x.a0, BigInt3(-x.a1.d0, -x.a1.d1, -x.a1.d2));
+        return res;
+    }
+
+    // @notice Compute -x.
+    func neg(x: Fq2) -> Fq2 {
+        let res = Fq2(BigInt3(-x.a0.d0, -x.a0.d1, -x.a0.d2), BigInt3(-x.a1.d0, -x.a1.d1, -x.a1.d2));
+        return res;
+    }
+
+    // @notice Assert that x is 0 modulo p.
+    func verify_zero{range_check_ptr}(x: UnreducedFq2) {
+        FQ.verify_zero(x.a0);
+        FQ.verify_zero(x.a1);
+        return ();
+    }
+
+    // @notice Reduce an unreduced value modulo p.
+    func reduce{range_check_ptr}(x: UnreducedFq2) -> Fq2 {
+        alloc_locals;
+        let a0 = FQ.reduce(x.a0);
+        let a1 = FQ.reduce(x.a1);
+        let res = Fq2(a0, a1);
+        return res;
+    }
+
+    // @notice Compute x * y.
+    func mul{range_check_ptr}(x: Fq2, y: Fq2) -> Fq2 {
+        let product = mul_unreduced(x, y);
+        return reduce(product);
+    }
+
+    // @notice Compute x / y.
+    // @dev x / y = x * conj(y) / (y0 ** 2 + y1 ** 2), y must not be 0.
+    func div{range_check_ptr}(x: Fq2, y: Fq2) -> Fq2 {
+        alloc_locals;
+        let (y0_squared) = bigint_mul(y.a0, y.a0);
+        let (y1_squared) = bigint_mul(y.a1, y.a1);
+        let norm = FQ.reduce(
+            UnreducedBigInt5(
+            y0_squared.d0 + y1_squared.d0,
+            y0_squared.d1 + y1_squared.d1,
+            y0_squared.d2 + y1_squared.d2,
+            y0_squared.d3 + y1_squared.d3,
+            y0_squared.d4 + y1_squared.d4,
+            ),
+        );
+        local norm: BigInt3 = norm;
+        let y_conjugate = conjugate(y);
+        let numerator = mul_unreduced(x, y_conjugate);
+        local numerator: UnreducedFq2 = numerator;
+        let a0 = FQ.div_mod(numerator.a0, norm);
+        local a0: BigInt3 = a0;
+        let a1 = FQ.div_mod(numerator.a1, norm);
+        let res = Fq2(a0, a1);
+        return res;
+    }
+}
+
+// @title Arithmetic of the degree 12 extension Fq12
+// @notice Elements are passed by pointer, and each coefficient of a product is reduced once.
+// @custom:namespace FQ12
+namespace FQ12 {
+    // @notice Return the unit of Fq12.
+    func one() -> Fq12* {
+        let (one_address) = get_label_location(one_value);
+        return cast(one_address, Fq12*);
+
+        one_value:
+        dw 1;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+    }
+
+    // @notice Compute a * b.
+    func mul{range_check_ptr}(a: Fq12*, b: Fq12*) -> Fq12* {
+        alloc_locals;
+        let (local res: Fq2*) = alloc();
+        internal.mul_coefficients(cast(a, Fq2*), cast(b, Fq2*), 0, res);
+        return cast(res, Fq12*);
+    }
+
+    // @notice Compute a ** 2, sharing the symmetric products of mul.
+    func square{range_check_ptr}(a: Fq12*) -> Fq12* {
+        alloc_locals;
+        let (local res: Fq2*) = alloc();
+        internal.square_coefficients(cast(a, Fq2*), 0, res);
+        return cast(res, Fq12*);
+    }
+
+    // @notice Compute f * (l0 + l1 * w + l3 * w ** 3), the sparse value of a Miller loop line.
+    // @param f The value to multiply.
+    // @param l0 The coefficient of 1, in Fq.
+    // @param l1 The coefficient of w.
+    // @param l3 The coefficient of w ** 3.
+    func mul_by_line{range_check_ptr}(f: Fq12*, l0: BigInt3, l1: Fq2, l3: Fq2) -> Fq12* {
+        alloc_locals;
+        let (local res: Fq2*) = alloc();
+        internal.mul_by_line_coefficients(cast(f, Fq2*), l0, l1, l3, 0, res);
+        return cast(res, Fq12*);
+    }
+
+    // @notice Compute a ** (p ** 6), which negates the odd coefficients.
+    func conjugate(a: Fq12*) -> Fq12* {
+        alloc_locals;
+        let c1 = FQ2.neg(a.c1);
+        let c3 = FQ2.neg(a.c3);
+        let c5 = FQ2.neg(a.c5);
+        tempvar res = new Fq12(a.c0, c1, a.c2, c3, a.c4, c5);
+        return res;
+    }
+
+    // @notice Return the coefficients (9 + u) ** (i * (p ** power - 1) / 6), for i in [0, 6).
+    // @param power 1, 2 or 3.
+    func frobenius_coefficients(power: felt) -> Fq2* {
+        let (coefficients_address) = get_label_location(coefficients);
+        return cast(coefficients_address, Fq2*) + (power - 1) * 6 * Fq2.SIZE;
+
+        coefficients:
+        // (9 + u) ** (i * (p ** 1 - 1) / 6)
+        dw 0x1;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x2f2176d60b35dadcc9e470;
+        dw 0x3f75db9a2d8171487820a4;
+        dw 0x1284b71c2865a7dfe8b99;
+        dw 0x2ec7e5ca5cf05f80f362ac;
+        dw 0x33f848542e39d1e649de3b;
+        dw 0x246996f3b4fae7e6a6327;
+        dw 0x3330c99e39557176f553d;
+        dw 0x30f3d566c50ede330c430b;
+        dw 0x2fb347984f7911f74c0be;
+        dw 0x3c9dce1665d51c640fcba2;
+        dw 0x322f5d681e50cab8a8742d;
+        dw 0x16c9e55061ebae204ba4c;
+        dw 0x95998dc54014671a0135a;
+        dw 0x1a62db8be6e76eab83b6a7;
+        dw 0x63cf305489af5dcdc5ec;
+        dw 0x225bd282d37f632623b0e3;
+        dw 0x169fb1e5bcac8601f7263e;
+        dw 0x7c03cbcac41049a0704b;
+        dw 0x14ec72848a1f55921ea762;
+        dw 0x2dd68607a134ccd97defa;
+        dw 0x5b54f5e64eea80180f3c;
+        dw 0x1ec763c13b4711cd2b8126;
+        dw 0x2c0ec2c7248da174ba86f;
+        dw 0x2c145edbe7fd8aee9f3a8;
+        dw 0x2a1bd32ea2c810eab7692f;
+        dw 0x198690d4ffd10971166d56;
+        dw 0x183c1e74f798649e93a3;
+        dw 0xe2ac024c6b8ee6e0c2c4b;
+        dw 0x91b1dca7df6c2032e659e;
+        dw 0x12acf2ca76fd0675a27fb;
+        // (9 + u) ** (i * (p ** 2 - 1) / 6)
+        dw 0x1;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x166e3de4bd44e5607cfd49;
+        dw 0x279f82b332c30a3c1a7eee;
+        dw 0x30644e72e131a0295e6dd;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x166e3de4bd44e5607cfd48;
+        dw 0x279f82b332c30a3c1a7eee;
+        dw 0x30644e72e131a0295e6dd;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x31ca8d3c208c16d87cfd46;
+        dw 0x16da060561765e05aa45a1;
+        dw 0x30644e72e131a029b8504;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x1b5c4f5763473177fffffe;
+        dw 0x2f3a83522eb353c98fc6b3;
+        dw 0x59e26;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x1b5c4f5763473177ffffff;
+        dw 0x2f3a83522eb353c98fc6b3;
+        dw 0x59e26;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        // (9 + u) ** (i * (p ** 3 - 1) / 6)
+        dw 0x1;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x15d24ae86f7d391ed4a67f;
+        dw 0x23342b2aa422532ce36f9;
+        dw 0x19dc81cfcc82e4bbefe96;
+        dw 0x1439ec7694aa2bf4c0c101;
+        dw 0x3b8cd5d84e75fc0e978e5f;
+        dw 0xabf8b60be77d7306cbe;
+        dw 0x2942d37b746ee87bdcfb6d;
+        dw 0x31de567c96b2017ff4f575;
+        dw 0x856e078b755ef0abaff1;
+        dw 0x3f2631380cab2baaa586de;
+        dw 0x39b7b098253c3f7cc6fe63;
+        dw 0x4f1de41b3d1766fa9f30;
+        dw 0x2870f45fcc8ad066dce9ed;
+        dw 0x3c772a797a8eef5a268efa;
+        dw 0x2a275b6d9896aa4cdbf17;
+        dw 0xf6ebab94d0cb3b2594c64;
+        dw 0x3a541fa4c9d803b31f63;
+        dw 0x28a411b634f09b8fb14b9;
+        dw 0x306bcb0e1a92bc3ccbf066;
+        dw 0x3ded6c9113b98cc2515d6;
+        dw 0xbc58c6611c08dab19bee;
+        dw 0x3f96e55fe3ed9d730c239f;
+        dw 0x1bbc33487412912a7821cd;
+        dw 0x23d5e999e1910a12feb0f;
+        dw 0x3c84a5ebde847076261b43;
+        dw 0x27e8ed34fda4bb5a026259;
+        dw 0x13c49044952c090571169;
+        dw 0x280211f25041384282499;
+        dw 0x8a0a9218cf4f8b76ba880;
+        dw 0x16db366a59b1dd0b9fb1b;
+    }
+
+    // @notice Compute a ** (p ** power).
+    // @dev Coefficients are conjugated for odd powers, then multiplied by frobenius_coefficients.
+    // @param power 1, 2 or 3.
+    func frobenius{range_check_ptr}(a: Fq12*, power: felt) -> Fq12* {
+        alloc_locals;
+        let coefficients = frobenius_coefficients(power);
+        // The sign of the imaginary parts, -1 for odd powers.
+        tempvar sign = 1 - 2 * (power - 2) * (power - 2);
+        let (local res: Fq2*) = alloc();
+        internal.frobenius_coefficients(cast(a, Fq2*), coefficients, sign, 6, res);
+        return cast(res, Fq12*);
+    }
+
+    // @notice Compute 1 / a.
+    // @dev a must not be 0. With b = a * a ** (p ** 6) in Fq6 and t = b ** (p ** 2) * b ** (p ** 4),
+    // @dev b * t is the norm of a in Fq2 and 1 / a = a ** (p ** 6) * t / (b * t).
+    func inv{range_check_ptr}(a: Fq12*) -> Fq12* {
+        alloc_locals;
+        let a_conjugate = conjugate(a);
+        let b = mul(a, a_conjugate);
+        let b_p2 = frobenius(b, 2);
+        let b_p4 = frobenius(b_p2, 2);
+        let t = mul(b_p2, b_p4);
+        let norm = mul(b, t);
+        let numerator = mul(a_conjugate, t);
+        let one = FQ2.one();
+        let norm_inv = FQ2.div(one, norm.c0);
+        let (local res: Fq2*) = alloc();
+        internal.scale_coefficients(cast(numerator, Fq2*), norm_inv, 6, res);
+        return cast(res, Fq12*);
+    }
+
+    // @notice Compute a ** e, e being given as bits, most significant first.
+    // @param a The base.
+    // @param bits_len The number of bits of e.
+    // @param bits The bits of e, the first one being 1.
+    func pow{range_check_ptr}(a: Fq12*, bits_len: felt, bits: felt*) -> Fq12* {
+        return internal.pow_loop(a, bits_len - 1, bits + 1, a);
+    }
+
+    // @notice Return whether a is 1.
+    // @return 1 if a is 1, 0 otherwise.
+    func is_one{range_check_ptr}(a: Fq12*) -> felt {
+        alloc_locals;
+        let components = cast(a, BigInt3*);
+        let is_first_one = FQ.is_zero(
+            BigInt3(components[0].d0 - 1, components[0].d1, components[0].d2)
+        );
+        if (is_first_one == 0) {
+            return 0;
+        }
+        return internal.are_zero(11, components + BigInt3.SIZE);
+    }
+}
+
+namespace internal {
+    // @notice Write the coefficients k, ..., 5 of a * b to res.
+    // @dev The coefficient of w ** k sums a[i] * b[k - i], plus (9 + u) times a[i] * b[k + 6 - i].
+    func mul_coefficients{range_check_ptr}(a: Fq2*, b: Fq2*, k: felt, res: Fq2*) {
+        alloc_locals;
+        if (k == 6) {
+            return ();
+        }
+        let zero = UnreducedFq2(UnreducedBigInt5(0, 0, 0, 0, 0), UnreducedBigInt5(0, 0, 0, 0, 0));
+        let low = sum_of_products(k + 1, a, b + k * Fq2.SIZE, zero);
+        let high = sum_of_products(5 - k, a + (k + 1) * Fq2.SIZE, b + 5 * Fq2.SIZE, zero);
+        let coefficient = reduce_with_xi(low, high);
+        assert res[k] = coefficient;
+        return mul_coefficients(a, b, k + 1, res);
+    }
+
+    // @notice Reduce low + (9 + u) * high.
+    // @dev high is reduced first, so that each reduction stays within the bound of FQ.div_mod.
+    func reduce_with_xi{range_check_ptr}(low: UnreducedFq2, high: UnreducedFq2) -> Fq2 {
+        alloc_locals;
+        let h = FQ2.reduce(high);
+        let h_unreduced = UnreducedFq2(
+            UnreducedBigInt5(h.a0.d0, h.a0.d1, h.a0.d2, 0, 0),
+            UnreducedBigInt5(h.a1.d0, h.a1.d1, h.a1.d2, 0, 0),
+        );
+        let h_xi = FQ2.mul_by_xi_unreduced(h_unreduced);
+        let sum = FQ2.add_unreduced(low, h_xi);
+        return FQ2.reduce(sum);
+    }
+
+    // @notice Write the coefficients k, ..., 5 of a ** 2 to res.
+    func square_coefficients{range_check_ptr}(a: Fq2*, k: felt, res: Fq2*) {
+        alloc_locals;
+        if (k == 6) {
+            return ();
+        }
+        let low = symmetric_sum(k + 1, a, a + k * Fq2.SIZE);
+        let high = symmetric_sum(5 - k, a + (k + 1) * Fq2.SIZE, a + 5 * Fq2.SIZE);
+        let coefficient = reduce_with_xi(low, high);
+        assert res[k] = coefficient;
+        return square_coefficients(a, k + 1, res);
+    }
+
+    // @notice Return the sum of x[i] * y[-i] for i in [0, n), y being x + n - 1.
+    // @dev Each pair of distinct terms is computed once and doubled.
+    func symmetric_sum(n: felt, x: Fq2*, y: Fq2*) -> UnreducedFq2 {
+        alloc_locals;
+        if (n == 0) {
+            let res = UnreducedFq2(
+                UnreducedBigInt5(0, 0, 0, 0, 0), UnreducedBigInt5(0, 0, 0, 0, 0)
+            );
+            return res;
+        }
+        if (n == 1) {
+            return FQ2.mul_unreduced([x], [x]);
+        }
+        let product = FQ2.mul_unreduced([x], [y]);
+        let rest = symmetric_sum(n - 2, x + Fq2.SIZE, y - Fq2.SIZE);
+        let doubled = FQ2.add_unreduced(product, product);
+        return FQ2.add_unreduced(doubled, rest);
+    }
+
+    // @notice Return acc plus the sum of x[i] * y[-i] for i in [0, n).
+    func sum_of_products(n: felt, x: Fq2*, y: Fq2*, acc: UnreducedFq2) -> UnreducedFq2 {
+        if (n == 0) {
+            return acc;
+        }
+        let product = FQ2.mul_unreduced([x], [y]);
+        let acc = FQ2.add_unreduced(acc, product);
+        // Stop before y moves below the start of its segment.
+        if (n == 1) {
+            return acc;
+        }
+        return sum_of_products(n - 1, x + Fq2.SIZE, y - Fq2.SIZE, acc);
+    }
+
+    // @notice Write the coefficients k, ..., 5 of f * (l0 + l1 * w + l3 * w ** 3) to res.
+    func mul_by_line_coefficients{range_check_ptr}(
+        f: Fq2*, l0: BigInt3, l1: Fq2, l3: Fq2, k: felt, res: Fq2*
+    ) {
+        alloc_locals;
+        if (k == 6) {
+            return ();
+        }
+        let zero = UnreducedFq2(UnreducedBigInt5(0, 0, 0, 0, 0), UnreducedBigInt5(0, 0, 0, 0, 0));
+        let term0 = FQ2.mul_by_fq_unreduced(f[k], l0);
+        let (low, high) = add_shifted_product(f, l1, k, 1, term0, zero);
+        let (low, high) = add_shifted_product(f, l3, k, 3, low, high);
+        let coefficient = reduce_with_xi(low, high);
+        assert res[k] = coefficient;
+        return mul_by_line_coefficients(f, l0, l1, l3, k + 1, res);
+    }
+
+    // @notice Add the contribution of f[k - shift] * l to the coefficient of w ** k, to low, or
+    // @notice to high when it wraps around with w ** 6 = 9 + u.
+    func add_shifted_product{range_check_ptr}(
+        f: Fq2*, l: Fq2, k: felt, shift: felt, low: UnreducedFq2, high: UnreducedFq2
+    ) -> (low: UnreducedFq2, high: UnreducedFq2) {
+        alloc_locals;
+        let is_wrapped = is_le(k + 1, shift);
+        if (is_wrapped != 0) {
+            let product = FQ2.mul_unreduced(f[k + 6 - shift], l);
+            let high = FQ2.add_unreduced(high, product);
+            return (low, high);
+        }
+        let product = FQ2.mul_unreduced(f[k - shift], l);
+        let low = FQ2.add_unreduced(low, product);
+        return (low, high);
+    }
+
+    // @notice Write conj(a[i]) * coefficients[i] to res, for the last n coefficients.
+    func frobenius_coefficients{range_check_ptr}(
+        a: Fq2*, coefficients: Fq2*, sign: felt, n: felt, res: Fq2*
+    ) {
+        alloc_locals;
+        if (n == 0) {
+            return ();
+        }
+        let x = Fq2(a[0].a0, BigInt3(sign * a[0].a1.d0, sign * a[0].a1.d1, sign * a[0].a1.d2));
+        let coefficient = FQ2.mul(x, coefficients[0]);
+        assert res[0] = coefficient;
+        return frobenius_coefficients(
+            a + Fq2.SIZE, coefficients + Fq2.SIZE, sign, n - 1, res + Fq2.SIZE
+        );
+    }
+
+    // @notice Write a[i] * c to res, for the last n coefficients.
+    func scale_coefficients{range_check_ptr}(a: Fq2*, c: Fq2, n: felt, res: Fq2*) {
+        if (n == 0) {
+            return ();
+        }
+        let coefficient = FQ2.mul(a[0], c);
+        assert res[0] = coefficient;
+        return scale_coefficients(a + Fq2.SIZE, c, n - 1, res + Fq2.SIZE);
+    }
+
+    // @notice Return whether the n components are 0 modulo p.
+    func are_zero{range_check_ptr}(n: felt, components: BigInt3*) -> felt {
+        if (n == 0) {
+            return 1;
+        }
+        let is_zero = FQ.is_zero(components[0]);
+        if (is_zero == 0) {
+            return 0;
+        }
+        return are_zero(n - 1, components + BigInt3.SIZE);
+    }
+
+    // @notice Square and multiply acc by a for each remaining bit.
+    func pow_loop{range_check_ptr}(a: Fq12*, bits_len: felt, bits: felt*, acc: Fq12*) -> Fq12* {
+        alloc_locals;
+        if (bits_len == 0) {
+            return acc;
+        }
+        let acc = FQ12.square(acc);
+        tempvar bit = [bits];
+        if (bit == 0) {
+            return pow_loop(a, bits_len - 1, bits + 1, acc);
+        }
+        let acc = FQ12.mul(acc, a);
+        return pow_loop(a, bits_len - 1, bits + 1, acc);
+    }
+}
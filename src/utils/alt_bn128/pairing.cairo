@@ -0,0 +1,198 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// StarkWare dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_secp.bigint import BigInt3
+
+// Internal dependencies
+from utils.alt_bn128.curve import G1Point, G2, G2Point
+from utils.alt_bn128.field import FQ2, FQ12, Fq2, Fq12
+from utils.utils import Helpers
+
+// x, the BN254 curve parameter, and its number of bits.
+const X = 4965661367192848881;
+const X_BITS = 63;
+// 6 * x + 2, the loop count of the optimal ate pairing, and its number of bits.
+const ATE_LOOP_COUNT = 29793968203157093288;
+const ATE_LOOP_COUNT_BITS = 65;
+
+// @title Optimal ate pairing on BN254
+// @notice The Miller loops of all the pairs run together and share the squarings of their
+// @notice accumulator, then a single final exponentiation is applied to the product.
+// @custom:namespace Pairing
+namespace Pairing {
+    // @notice Return whether the product of the pairings e(p[i], q[i]) is 1.
+    // @dev Points must be on their curve, q[i] in G2, and none of them at infinity.
+    // @param n The number of pairs.
+    // @param p The G1 points.
+    // @param q The G2 points.
+    // @return 1 if the product is 1, 0 otherwise.
+    func check{range_check_ptr}(n: felt, p: G1Point*, q: G2Point*) -> felt {
+        alloc_locals;
+        if (n == 0) {
+            return 1;
+        }
+        let f = miller_loop(n, p, q);
+        let f = final_exponentiation(f);
+        return FQ12.is_one(f);
+    }
+
+    // @notice Compute the product of the Miller loops of the pairs.
+    func miller_loop{range_check_ptr}(n: felt, p: G1Point*, q: G2Point*) -> Fq12* {
+        alloc_locals;
+        let (local bits: felt*) = alloc();
+        Helpers.split_bits(ATE_LOOP_COUNT, ATE_LOOP_COUNT_BITS, bits);
+        let one = FQ12.one();
+        let (f, t) = internal.iterations(n, p, q, ATE_LOOP_COUNT_BITS - 1, bits + 1, one, q);
+
+        // Two more additions with the images of q by the Frobenius endomorphisms.
+        let f = internal.add_frobenius_images(n, p, q, t, f);
+        return f;
+    }
+
+    // @notice Raise f to the power (p ** 12 - 1) / r.
+    // @dev The hard part follows the addition chain of Scott et al., "On the final
+    // @dev exponentiation for calculating pairings on ordinary elliptic curves".
+    func final_exponentiation{range_check_ptr}(f: Fq12*) -> Fq12* {
+        alloc_locals;
+        // Easy part, f ** ((p ** 6 - 1) * (p ** 2 + 1)).
+        let f_inv = FQ12.inv(f);
+        let f_conjugate = FQ12.conjugate(f);
+        let f = FQ12.mul(f_conjugate, f_inv);
+        let f_frobenius = FQ12.frobenius(f, 2);
+        let f = FQ12.mul(f_frobenius, f);
+
+        // Hard part, f ** ((p ** 4 - p ** 2 + 1) / r).
+        let (local x_bits: felt*) = alloc();
+        Helpers.split_bits(X, X_BITS, x_bits);
+        let fx = FQ12.pow(f, X_BITS, x_bits);
+        let fx2 = FQ12.pow(fx, X_BITS, x_bits);
+        let fx3 = FQ12.pow(fx2, X_BITS, x_bits);
+
+        let f_p = FQ12.frobenius(f, 1);
+        let f_p2 = FQ12.frobenius(f, 2);
+        let f_p3 = FQ12.frobenius(f, 3);
+        let y0 = FQ12.mul(f_p, f_p2);
+        let y0 = FQ12.mul(y0, f_p3);
+        let y1 = FQ12.conjugate(f);
+        let y2 = FQ12.frobenius(fx2, 2);
+        let fx_p = FQ12.frobenius(fx, 1);
+        let y3 = FQ12.conjugate(fx_p);
+        let fx2_p = FQ12.frobenius(fx2, 1);
+        let y4 = FQ12.mul(fx, fx2_p);
+        let y4 = FQ12.conjugate(y4);
+        let y5 = FQ12.conjugate(fx2);
+        let fx3_p = FQ12.frobenius(fx3, 1);
+        let y6 = FQ12.mul(fx3, fx3_p);
+        let y6 = FQ12.conjugate(y6);
+
+        let t0 = FQ12.square(y6);
+        let t0 = FQ12.mul(t0, y4);
+        let t0 = FQ12.mul(t0, y5);
+        let t1 = FQ12.mul(y3, y5);
+        let t1 = FQ12.mul(t1, t0);
+        let t0 = FQ12.mul(t0, y2);
+        let t1 = FQ12.square(t1);
+        let t1 = FQ12.mul(t1, t0);
+        let t1 = FQ12.square(t1);
+        let t0 = FQ12.mul(t1, y1);
+        let t1 = FQ12.mul(t1, y0);
+        let t0 = FQ12.square(t0);
+        let t0 = FQ12.mul(t0, t1);
+        return t0;
+    }
+}
+
+namespace internal {
+    // @notice Run the remaining iterations of the Miller loop on all the pairs.
+    // @param n The number of pairs.
+    // @param p The G1 points.
+    // @param q The G2 points.
+    // @param bits_len The number of remaining bits of the loop count.
+    // @param bits The remaining bits of the loop count.
+    // @param f The accumulator shared by all the pairs.
+    // @param t The current multiples of the G2 points.
+    // @return The accumulator and the final multiples of the G2 points.
+    func iterations{range_check_ptr}(
+        n: felt, p: G1Point*, q: G2Point*, bits_len: felt, bits: felt*, f: Fq12*, t: G2Point*
+    ) -> (f: Fq12*, t: G2Point*) {
+        alloc_locals;
+        if (bits_len == 0) {
+            return (f, t);
+        }
+        let f = FQ12.square(f);
+        let (local t_doubled: G2Point*) = alloc();
+        let f = double_steps(n, p, t, f, t_doubled);
+        tempvar bit = [bits];
+        if (bit == 0) {
+            return iterations(n, p, q, bits_len - 1, bits + 1, f, t_doubled);
+        }
+        let (local t_added: G2Point*) = alloc();
+        let f = add_steps(n, p, q, t_doubled, f, t_added);
+        return iterations(n, p, q, bits_len - 1, bits + 1, f, t_added);
+    }
+
+    // @notice Double each t[i] and multiply f by the tangent lines evaluated at p[i].
+    func double_steps{range_check_ptr}(
+        n: felt, p: G1Point*, t: G2Point*, f: Fq12*, t_next: G2Point*
+    ) -> Fq12* {
+        alloc_locals;
+        if (n == 0) {
+            return f;
+        }
+        let (slope, doubled) = G2.double(t[0]);
+        assert t_next[0] = doubled;
+        let f = line(f, p[0], slope, t[0]);
+        return double_steps(n - 1, p + G1Point.SIZE, t + G2Point.SIZE, f, t_next + G2Point.SIZE);
+    }
+
+    // @notice Add q[i] to each t[i] and multiply f by the lines evaluated at p[i].
+    func add_steps{range_check_ptr}(
+        n: felt, p: G1Point*, q: G2Point*, t: G2Point*, f: Fq12*, t_next: G2Point*
+    ) -> Fq12* {
+        alloc_locals;
+        if (n == 0) {
+            return f;
+        }
+        let (slope, sum) = G2.add(t[0], q[0]);
+        assert t_next[0] = sum;
+        let f = line(f, p[0], slope, t[0]);
+        return add_steps(
+            n - 1, p + G1Point.SIZE, q + G2Point.SIZE, t + G2Point.SIZE, f, t_next + G2Point.SIZE
+        );
+    }
+
+    // @notice Add the Frobenius images of q[i] to each t[i], multiplying f by the lines.
+    // @dev The second sum is never used, only its line is.
+    func add_frobenius_images{range_check_ptr}(
+        n: felt, p: G1Point*, q: G2Point*, t: G2Point*, f: Fq12*
+    ) -> Fq12* {
+        alloc_locals;
+        if (n == 0) {
+            return f;
+        }
+        let q1 = G2.frobenius(q[0]);
+        let (slope, sum) = G2.add(t[0], q1);
+        let f = line(f, p[0], slope, t[0]);
+        let q2 = G2.neg_frobenius_square(q[0]);
+        let (slope, _) = G2.add(sum, q2);
+        let f = line(f, p[0], slope, sum);
+        return add_frobenius_images(
+            n - 1, p + G1Point.SIZE, q + G2Point.SIZE, t + G2Point.SIZE, f
+        );
+    }
+
+    // @notice Multiply f by the line of a given slope through t, evaluated at p.
+    // @dev The line is y_p - slope * x_p * w + (slope * x_t - y_t) * w ** 3 once untwisted.
+    func line{range_check_ptr}(f: Fq12*, p: G1Point, slope: Fq2, t: G2Point) -> Fq12* {
+        alloc_locals;
+        let l1_unreduced = FQ2.mul_by_fq_unreduced(slope, BigInt3(-p.x.d0, -p.x.d1, -p.x.d2));
+        let l1 = FQ2.reduce(l1_unreduced);
+        let slope_x = FQ2.mul_unreduced(slope, t.x);
+        let l3_unreduced = FQ2.sub_unreduced(slope_x, t.y);
+        let l3 = FQ2.reduce(l3_unreduced);
+        return FQ12.mul_by_line(f, p.y, l1, l3);
+    }
+}
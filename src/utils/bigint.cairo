@@ -0,0 +1,357 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// StarkWare dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.math import unsigned_div_rem
+from starkware.cairo.common.math_cmp import is_le
+
+// Internal dependencies
+from utils.utils import Helpers
+
+// @title Arbitrary length unsigned integers
+// @notice Big integers are stored as arrays of 112 bits limbs, least significant limb first,
+// @notice so that the schoolbook product of two limbs and its sums always fit in a felt.
+// @dev Modular products are reduced by schoolbook long division. Both operands are first scaled
+// @dev so that the most significant limb of the modulus has its top bit set, which bounds the
+// @dev error of each quotient limb estimated from the leading limbs to 2.
+// @custom:namespace BigInt
+namespace BigInt {
+    const LIMB_BYTES = 14;
+    const BASE = 2 ** 112;
+
+    // @notice Load a big-endian byte array into limbs.
+    // @param bytes_len The number of bytes.
+    // @param bytes The bytes array.
+    // @return The number of limbs and the limbs array.
+    func from_bytes{range_check_ptr}(bytes_len: felt, bytes: felt*) -> (
+        limbs_len: felt, limbs: felt*
+    ) {
+        alloc_locals;
+        let (local limbs: felt*) = alloc();
+        let (full_limbs_len, top_len) = unsigned_div_rem(bytes_len, LIMB_BYTES);
+        if (top_len == 0) {
+            internal.load_limbs(full_limbs_len, bytes, limbs);
+            return (full_limbs_len, limbs);
+        }
+        let top = Helpers.load_word(top_len, bytes);
+        assert limbs[full_limbs_len] = top;
+        internal.load_limbs(full_limbs_len, bytes + top_len, limbs);
+        return (full_limbs_len + 1, limbs);
+    }
+
+    // @notice Write limbs to a big-endian byte array of a given length.
+    // @dev The value must fit in bytes_len bytes.
+    // @param limbs_len The number of limbs.
+    // @param limbs The limbs array.
+    // @param bytes_len The number of bytes to write.
+    // @param dst The destination array.
+    func to_bytes{range_check_ptr}(limbs_len: felt, limbs: felt*, bytes_len: felt, dst: felt*) {
+        alloc_locals;
+        if (limbs_len == 0) {
+            Helpers.fill(bytes_len, dst, 0);
+            return ();
+        }
+        let is_last = is_le(bytes_len, LIMB_BYTES);
+        if (is_last != 0) {
+            Helpers.split_word(limbs[0], bytes_len, dst);
+            internal.assert_zero(limbs_len - 1, limbs + 1);
+            return ();
+        }
+        Helpers.split_word(limbs[0], LIMB_BYTES, dst + bytes_len - LIMB_BYTES);
+        return to_bytes(limbs_len - 1, limbs + 1, bytes_len - LIMB_BYTES, dst);
+    }
+
+    // @notice Return the number of limbs left once the most significant zero limbs are dropped.
+    // @param limbs_len The number of limbs.
+    // @param limbs The limbs array.
+    // @return The number of significant limbs, 0 if the value is 0.
+    func significant_len(limbs_len: felt, limbs: felt*) -> felt {
+        if (limbs_len == 0) {
+            return 0;
+        }
+        tempvar top = limbs[limbs_len - 1];
+        if (top != 0) {
+            return limbs_len;
+        }
+        return significant_len(limbs_len - 1, limbs);
+    }
+
+    // @notice Compute a * b mod m.
+    // @dev The most significant limb of m must not be 0, see significant_len.
+    // @param a_len The number of limbs of a.
+    // @param a The limbs of a.
+    // @param b_len The number of limbs of b.
+    // @param b The limbs of b.
+    // @param m_len The number of limbs of m.
+    // @param m The limbs of m.
+    // @return The m_len limbs of the result.
+    func mulmod{range_check_ptr}(
+        a_len: felt, a: felt*, b_len: felt, b: felt*, m_len: felt, m: felt*
+    ) -> felt* {
+        alloc_locals;
+        let shift = internal.normalization_shift(m[m_len - 1]);
+        local shift = shift;
+        let (local normalized_m: felt*) = alloc();
+        internal.shift_limbs(m_len, m, shift, 0, normalized_m);
+        let (local normalized_a: felt*) = alloc();
+        internal.shift_limbs(a_len, a, shift, 0, normalized_a);
+        let x_len = significant_len(a_len + 1, normalized_a);
+        local x_len = x_len;
+        let y_len = significant_len(b_len, b);
+        local y_len = y_len;
+        if (x_len * y_len == 0) {
+            let (local zero: felt*) = alloc();
+            Helpers.fill(m_len, zero, 0);
+            return zero;
+        }
+
+        // The product is padded with zeros to at least m_len + 1 limbs, the m_len - 1 leading
+        // ones and a zero limb being the initial remainder. It is preceded by a zero limb read
+        // by the last division step.
+        local product_len = x_len + y_len;
+        let (local product: felt*) = alloc();
+        assert product[0] = 0;
+        internal.product_limbs(
+            product_len, x_len - 1, y_len - 1, 1, normalized_a, b + 1, 0, product + 1
+        );
+        let is_short = is_le(product_len, m_len - 1);
+        local padded_len = product_len + is_short * (m_len - product_len);
+        Helpers.fill(padded_len + 1 - product_len, product + 1 + product_len, 0);
+
+        let (local r: felt*) = alloc();
+        let remainder = internal.divide(
+            padded_len - m_len, product + 1, m_len, product + 1 + padded_len - m_len, normalized_m
+        );
+        internal.unshift_limbs(m_len, remainder, shift, BASE / shift, 0, r);
+        return r;
+    }
+}
+
+namespace internal {
+    // Offset making the signed limbs of sub_mul non negative, a multiple of BigInt.BASE.
+    const SUB_OFFSET = 2 ** 230;
+    const SUB_CARRY_OFFSET = 2 ** 118;
+
+    // @notice Fill limbs[n - 1], ..., limbs[0] with consecutive LIMB_BYTES big-endian words.
+    func load_limbs(n: felt, bytes: felt*, limbs: felt*) {
+        if (n == 0) {
+            return ();
+        }
+        let limb = Helpers.load_word(BigInt.LIMB_BYTES, bytes);
+        assert limbs[n - 1] = limb;
+        return load_limbs(n - 1, bytes + BigInt.LIMB_BYTES, limbs);
+    }
+
+    // @notice Assert that all the limbs are 0.
+    func assert_zero(limbs_len: felt, limbs: felt*) {
+        if (limbs_len == 0) {
+            return ();
+        }
+        assert [limbs] = 0;
+        return assert_zero(limbs_len - 1, limbs + 1);
+    }
+
+    // @notice Return the largest power of two shift such that top * shift < BigInt.BASE.
+    // @param top The most significant limb of a value, not 0.
+    func normalization_shift{range_check_ptr}(top: felt) -> felt {
+        let shift = shift_step(top, 1, 2 ** 64);
+        let shift = shift_step(top, shift, 2 ** 32);
+        let shift = shift_step(top, shift, 2 ** 16);
+        let shift = shift_step(top, shift, 2 ** 8);
+        let shift = shift_step(top, shift, 2 ** 4);
+        let shift = shift_step(top, shift, 2 ** 2);
+        let shift = shift_step(top, shift, 2);
+        return shift;
+    }
+
+    // @notice Return shift * factor if top * shift * factor < BigInt.BASE, shift otherwise.
+    func shift_step{range_check_ptr}(top: felt, shift: felt, factor: felt) -> felt {
+        let is_small = is_le(top * shift, BigInt.BASE / factor - 1);
+        return shift + is_small * (shift * factor - shift);
+    }
+
+    // @notice Return the quotient and remainder of value by BigInt.BASE.
+    // @dev value must be lower than 2 ** 240, the quotient is range checked to 128 bits.
+    func split_limb{range_check_ptr}(value: felt) -> (high: felt, low: felt) {
+        let div = BigInt.BASE;
+        let q = [range_check_ptr];
+        let r = [range_check_ptr + 1];
+        %{
+            from starkware.cairo.common.math_utils import assert_integer
+            assert_integer(ids.div)
+            assert 0 < ids.div <= PRIME // range_check_builtin.bound, \
+                f'div={hex(ids.div)} is out of the valid range.'
+            ids.q, ids.r = divmod(ids.value, ids.div)
+        %}
+        assert [range_check_ptr + 2] = BigInt.BASE - 1 - r;
+        let range_check_ptr = range_check_ptr + 3;
+        assert value = q * BigInt.BASE + r;
+        return (q, r);
+    }
+
+    // @notice Write the len + 1 limbs of x * shift + carry to dst.
+    // @dev shift must be at most BigInt.BASE.
+    func shift_limbs{range_check_ptr}(len: felt, x: felt*, shift: felt, carry: felt, dst: felt*) {
+        if (len == 0) {
+            assert [dst] = carry;
+            return ();
+        }
+        let (next_carry, limb) = split_limb([x] * shift + carry);
+        assert [dst] = limb;
+        return shift_limbs(len - 1, x + 1, shift, next_carry, dst + 1);
+    }
+
+    // @notice Write the len limbs of x / shift to dst, shift dividing x.
+    // @dev The limbs are processed from the most significant one, high being the remainder of
+    // @dev the division of the limb above by shift.
+    func unshift_limbs{range_check_ptr}(
+        len: felt, x: felt*, shift: felt, scale: felt, high: felt, dst: felt*
+    ) {
+        if (len == 0) {
+            assert high = 0;
+            return ();
+        }
+        let (limb, low) = unsigned_div_rem(x[len - 1], shift);
+        assert dst[len - 1] = limb + high * scale;
+        return unshift_limbs(len - 1, x, shift, scale, low, dst);
+    }
+
+    // @notice Write the next len limbs of the product of x and y to dst, given the carry of the
+    // @notice previous limb.
+    // @dev The limb k is the sum of x[i] * y[k - i] for the count values of i starting at lo,
+    // @dev with x_lo = x + lo and y_top = y + k - lo + 1. The window grows on the side of x
+    // @dev while x_left limbs of x are left, and slides on the side of y once y_left is 0.
+    func product_limbs{range_check_ptr}(
+        len: felt,
+        x_left: felt,
+        y_left: felt,
+        count: felt,
+        x_lo: felt*,
+        y_top: felt*,
+        carry: felt,
+        dst: felt*,
+    ) {
+        if (len == 0) {
+            assert carry = 0;
+            return ();
+        }
+        let value = dot(count, x_lo, y_top);
+        let (next_carry, limb) = split_limb(value + carry);
+        assert [dst] = limb;
+        if (x_left != 0) {
+            if (y_left != 0) {
+                return product_limbs(
+                    len - 1, x_left - 1, y_left - 1, count + 1, x_lo, y_top + 1, next_carry, dst + 1
+                );
+            }
+            return product_limbs(
+                len - 1, x_left - 1, 0, count, x_lo + 1, y_top, next_carry, dst + 1
+            );
+        }
+        if (y_left != 0) {
+            return product_limbs(
+                len - 1, 0, y_left - 1, count, x_lo, y_top + 1, next_carry, dst + 1
+            );
+        }
+        return product_limbs(len - 1, 0, 0, count - 1, x_lo + 1, y_top, next_carry, dst + 1);
+    }
+
+    // @notice Reduce the limbs j to 0 of x, the limb x[-1] being readable.
+    // @param j The index of the next limb of x.
+    // @param x The limbs of the dividend.
+    // @param n The number of limbs of m.
+    // @param window The n + 1 limbs made of x[j] followed by the remainder of the limbs above,
+    // lower than m.
+    // @param m The n + 1 limbs of the divisor, the limb n being 0 and the limb n - 1 being at
+    // least BigInt.BASE / 2.
+    // @return The n limbs of the remainder of x.
+    func divide{range_check_ptr}(j: felt, x: felt*, n: felt, window: felt*, m: felt*) -> felt* {
+        alloc_locals;
+        let (local estimate, _) = unsigned_div_rem(
+            window[n] * BigInt.BASE + window[n - 1], m[n - 1]
+        );
+        let is_large = is_le(BigInt.BASE, estimate);
+        local q = estimate + is_large * (BigInt.BASE - 1 - estimate);
+        // The remainder is written right after the next limb of x, forming the next window.
+        let (local next: felt*) = alloc();
+        assert next[0] = x[j - 1];
+        let borrow = sub_mul(n + 1, window, q, m, 0, next + 1);
+        let next = add_back(n, next, m, borrow);
+        if (j == 0) {
+            return next + 1;
+        }
+        return divide(j - 1, x, n, next, m);
+    }
+
+    // @notice Write the len limbs of x - q * y + carry to dst and return the final carry.
+    func sub_mul{range_check_ptr}(
+        len: felt, x: felt*, q: felt, y: felt*, carry: felt, dst: felt*
+    ) -> felt {
+        if (len == 0) {
+            return carry;
+        }
+        let (next_carry, limb) = split_limb([x] - q * [y] + carry + SUB_OFFSET);
+        assert [dst] = limb;
+        return sub_mul(len - 1, x + 1, q, y + 1, next_carry - SUB_CARRY_OFFSET, dst + 1);
+    }
+
+    // @notice Add m to the n + 1 limbs following window[0] until the borrow is cleared.
+    // @dev The quotient estimate exceeds the actual quotient by at most 2.
+    func add_back{range_check_ptr}(n: felt, window: felt*, m: felt*, borrow: felt) -> felt* {
+        alloc_locals;
+        if (borrow == 0) {
+            assert window[n + 1] = 0;
+            return window;
+        }
+        let (local sum: felt*) = alloc();
+        assert sum[0] = window[0];
+        let carry = add(n + 1, window + 1, m, 0, sum + 1);
+        return add_back(n, sum, m, borrow + carry);
+    }
+
+    // @notice Write the len limbs of x + y + carry to dst and return the final carry.
+    func add{range_check_ptr}(len: felt, x: felt*, y: felt*, carry: felt, dst: felt*) -> felt {
+        if (len == 0) {
+            return carry;
+        }
+        let (next_carry, limb) = split_limb([x] + [y] + carry);
+        assert [dst] = limb;
+        return add(len - 1, x + 1, y + 1, next_carry, dst + 1);
+    }
+
+    // @notice Return the sum of x[i] * y[-1 - i] for i in [0, n).
+    // @dev y points past the first limb read so that no pointer below its segment is written.
+    func dot(n: felt, x: felt*, y: felt*) -> felt {
+        if (n == 0) {
+            return 0;
+        }
+        // Line the arguments up with the loop variables.
+        ap += 1;
+        tempvar acc = 0;
+
+        // n, x, y, ?, ?, ?, acc
+        loop:
+        let n = [ap - 7];
+        let x = cast([ap - 6], felt*);
+        let y = cast([ap - 5], felt*);
+        let acc = [ap - 1];
+
+        tempvar n = n - 1;
+        tempvar x = x + 1;
+        tempvar y = y - 1;
+        tempvar x_i = [x - 1];
+        tempvar y_i = [y];
+        tempvar product = x_i * y_i;
+        tempvar acc = acc + product;
+
+        static_assert n == [ap - 7];
+        static_assert x == [ap - 6];
+        static_assert y == [ap - 5];
+        static_assert acc == [ap - 1];
+        jmp loop if n != 0;
+
+        return acc;
+    }
+}
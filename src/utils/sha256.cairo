@@ -0,0 +1,487 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_builtins import BitwiseBuiltin
+from starkware.cairo.common.math import unsigned_div_rem
+from starkware.cairo.common.memcpy import memcpy
+from starkware.cairo.common.registers import get_label_location
+
+// Internal dependencies
+from utils.utils import Helpers
+
+// @title SHA-256 related functions.
+// @notice This file contains a SHA-256 implementation working on big-endian 32-bit words.
+// @notice Each compression is computed by a hint and recorded as an instance in a sha256 segment.
+// @notice SHA256.finalize then verifies the instances BATCH_SIZE at a time: the same word of
+// @notice every instance of a batch is packed in one felt, so that one bitwise operation serves
+// @notice all the instances at once.
+// @custom:namespace SHA256
+namespace SHA256 {
+    const WORD_BYTES_LEN = 4;
+    const BLOCK_WORDS_LEN = 16;
+    const STATE_WORDS_LEN = 8;
+    // An instance is a message block, the state before its compression and the state after.
+    const INSTANCE_SIZE = BLOCK_WORDS_LEN + 2 * STATE_WORDS_LEN;
+    const BATCH_SIZE = 7;
+
+    // @notice Hash a message given as big-endian 32-bit words.
+    // @dev The bytes of a partial last word are its most significant ones, the others being 0.
+    // @dev The digest is only sound once the sha256 segment has been given to finalize.
+    // @param words The message words.
+    // @param n_bytes The length of the message in bytes.
+    // @return The digest as 8 big-endian 32-bit words.
+    func hash{range_check_ptr, sha256_ptr: felt*}(words: felt*, n_bytes: felt) -> felt* {
+        alloc_locals;
+        let (local full_words_len, local remainder) = unsigned_div_rem(n_bytes, WORD_BYTES_LEN);
+        // The message is followed by the 0x80 byte and its length in bits on 8 bytes.
+        let (blocks_len, _) = unsigned_div_rem(n_bytes + 8, WORD_BYTES_LEN * BLOCK_WORDS_LEN);
+        local padded_len = BLOCK_WORDS_LEN * (blocks_len + 1);
+        let (local padded: felt*) = alloc();
+        memcpy(padded, words, full_words_len);
+
+        local last_word;
+        if (remainder == 0) {
+            assert last_word = 0;
+        } else {
+            assert last_word = words[full_words_len];
+        }
+        let shift = Helpers.pow256_rev(13 + remainder);
+        assert padded[full_words_len] = last_word + 0x80 * shift;
+        Helpers.fill(padded_len - full_words_len - 3, padded + full_words_len + 1, 0);
+        let (length_high, length_low) = unsigned_div_rem(8 * n_bytes, 2 ** 32);
+        assert padded[padded_len - 2] = length_high;
+        assert padded[padded_len - 1] = length_low;
+
+        let padding_instance = internal.padding_instance();
+        let iv = padding_instance + BLOCK_WORDS_LEN;
+        let digest = internal.compress_blocks(blocks_len + 1, padded, iv);
+        return digest;
+    }
+
+    // @notice Verify the compressions recorded in a sha256 segment.
+    // @dev The segment is completed up to a multiple of BATCH_SIZE instances with compressions
+    // @dev of the zero block, so nothing may be written after sha256_ptr_end.
+    // @param sha256_ptr_start The start of the sha256 segment.
+    // @param sha256_ptr_end The end of the sha256 segment.
+    func finalize{range_check_ptr, bitwise_ptr: BitwiseBuiltin*}(
+        sha256_ptr_start: felt*, sha256_ptr_end: felt*
+    ) {
+        alloc_locals;
+        let (instances_len, _) = unsigned_div_rem(sha256_ptr_end - sha256_ptr_start, INSTANCE_SIZE);
+        let (local batches_len, remainder) = unsigned_div_rem(
+            instances_len + BATCH_SIZE - 1, BATCH_SIZE
+        );
+        let padding_instance = internal.padding_instance();
+        internal.append_instances(BATCH_SIZE - 1 - remainder, sha256_ptr_end, padding_instance);
+
+        let round_constants = internal.round_constants();
+        internal.verify_batches(batches_len, sha256_ptr_start, round_constants);
+        return ();
+    }
+}
+
+namespace internal {
+    // The 32-bit words of a batch are packed every 35 bits, the 3 spare bits of a lane absorbing
+    // the carries of up to 7 additions before the lanes are reduced with MASK32.
+    const SHIFTS = 1 + 2 ** 35 + 2 ** 70 + 2 ** 105 + 2 ** 140 + 2 ** 175 + 2 ** 210;
+    const MASK32 = (2 ** 32 - 1) * SHIFTS;
+    // Names expected by the compression hint of cairo_sha256.
+    const SHA256_INPUT_CHUNK_SIZE_FELTS = SHA256.BLOCK_WORDS_LEN;
+    const SHA256_STATE_SIZE_FELTS = SHA256.STATE_WORDS_LEN;
+
+    // @notice Record the compressions of the blocks in the sha256 segment.
+    // @param blocks_len The number of blocks.
+    // @param blocks The message blocks.
+    // @param state The state before the first compression.
+    // @return The state after the last compression.
+    func compress_blocks{sha256_ptr: felt*}(
+        blocks_len: felt, blocks: felt*, state: felt*
+    ) -> felt* {
+        if (blocks_len == 0) {
+            return state;
+        }
+        memcpy(sha256_ptr, blocks, SHA256.BLOCK_WORDS_LEN);
+        memcpy(sha256_ptr + SHA256.BLOCK_WORDS_LEN, state, SHA256.STATE_WORDS_LEN);
+        let sha256_start = sha256_ptr;
+        let output = sha256_ptr + SHA256.BLOCK_WORDS_LEN + SHA256.STATE_WORDS_LEN;
+        %{
+            from starkware.cairo.common.cairo_sha256.sha256_utils import (
+                compute_message_schedule, sha2_compress_function)
+
+            _sha256_input_chunk_size_felts = int(ids.SHA256_INPUT_CHUNK_SIZE_FELTS)
+            assert 0 <= _sha256_input_chunk_size_felts < 100
+            _sha256_state_size_felts = int(ids.SHA256_STATE_SIZE_FELTS)
+            assert 0 <= _sha256_state_size_felts < 100
+            w = compute_message_schedule(memory.get_range(
+                ids.sha256_start, _sha256_input_chunk_size_felts))
+            new_state = sha2_compress_function(memory.get_range(ids.state, _sha256_state_size_felts), w)
+            segments.write_arg(ids.output, new_state)
+        %}
+        let sha256_ptr = sha256_ptr + SHA256.INSTANCE_SIZE;
+        return compress_blocks(blocks_len - 1, blocks + SHA256.BLOCK_WORDS_LEN, output);
+    }
+
+    // @notice Write n copies of an instance at dst.
+    func append_instances(n: felt, dst: felt*, instance: felt*) {
+        if (n == 0) {
+            return ();
+        }
+        memcpy(dst, instance, SHA256.INSTANCE_SIZE);
+        return append_instances(n - 1, dst + SHA256.INSTANCE_SIZE, instance);
+    }
+
+    // @notice Verify batches_len batches of BATCH_SIZE consecutive instances.
+    func verify_batches{range_check_ptr, bitwise_ptr: BitwiseBuiltin*}(
+        batches_len: felt, instances: felt*, round_constants: felt*
+    ) {
+        alloc_locals;
+        if (batches_len == 0) {
+            return ();
+        }
+        let (local w: felt*) = alloc();
+        pack(SHA256.BLOCK_WORDS_LEN, instances, w);
+        message_schedule(64 - SHA256.BLOCK_WORDS_LEN, w);
+        let (local state: felt*) = alloc();
+        pack(SHA256.STATE_WORDS_LEN, instances + SHA256.BLOCK_WORDS_LEN, state);
+
+        let (a, b, c, d, e, f, g, h) = rounds(
+            state[0],
+            state[1],
+            state[2],
+            state[3],
+            state[4],
+            state[5],
+            state[6],
+            state[7],
+            w,
+            round_constants,
+            64,
+        );
+        let (local new_state: felt*) = alloc();
+        add_words(state[0], a, new_state);
+        add_words(state[1], b, new_state + 1);
+        add_words(state[2], c, new_state + 2);
+        add_words(state[3], d, new_state + 3);
+        add_words(state[4], e, new_state + 4);
+        add_words(state[5], f, new_state + 5);
+        add_words(state[6], g, new_state + 6);
+        add_words(state[7], h, new_state + 7);
+        assert_unpacked(
+            SHA256.STATE_WORDS_LEN,
+            instances + SHA256.BLOCK_WORDS_LEN + SHA256.STATE_WORDS_LEN,
+            new_state,
+        );
+
+        return verify_batches(
+            batches_len - 1, instances + SHA256.BATCH_SIZE * SHA256.INSTANCE_SIZE, round_constants
+        );
+    }
+
+    // @notice Pack the same len consecutive words of BATCH_SIZE instances.
+    func pack(len: felt, words: felt*, dst: felt*) {
+        if (len == 0) {
+            return ();
+        }
+        let packed = pack_lanes(words);
+        assert [dst] = packed;
+        return pack(len - 1, words + 1, dst + 1);
+    }
+
+    // @notice Pack the word at ptr of BATCH_SIZE consecutive instances.
+    func pack_lanes(ptr: felt*) -> felt {
+        return ptr[0] + ptr[SHA256.INSTANCE_SIZE] * 2 ** 35 +
+            ptr[2 * SHA256.INSTANCE_SIZE] * 2 ** 70 +
+            ptr[3 * SHA256.INSTANCE_SIZE] * 2 ** 105 +
+            ptr[4 * SHA256.INSTANCE_SIZE] * 2 ** 140 +
+            ptr[5 * SHA256.INSTANCE_SIZE] * 2 ** 175 +
+            ptr[6 * SHA256.INSTANCE_SIZE] * 2 ** 210;
+    }
+
+    // @notice Assert that the len consecutive words of BATCH_SIZE instances are the 32-bit lanes
+    // @notice of the packed words.
+    func assert_unpacked{range_check_ptr}(len: felt, words: felt*, packed: felt*) {
+        if (len == 0) {
+            return ();
+        }
+        // The lanes are lower than 2 ** 32, so the packing is one to one.
+        assert_word(words[0]);
+        assert_word(words[SHA256.INSTANCE_SIZE]);
+        assert_word(words[2 * SHA256.INSTANCE_SIZE]);
+        assert_word(words[3 * SHA256.INSTANCE_SIZE]);
+        assert_word(words[4 * SHA256.INSTANCE_SIZE]);
+        assert_word(words[5 * SHA256.INSTANCE_SIZE]);
+        assert_word(words[6 * SHA256.INSTANCE_SIZE]);
+        let lanes = pack_lanes(words);
+        assert [packed] = lanes;
+        return assert_unpacked(len - 1, words + 1, packed + 1);
+    }
+
+    // @notice Assert that 0 <= value < 2 ** 32.
+    func assert_word{range_check_ptr}(value: felt) {
+        assert [range_check_ptr] = value;
+        assert [range_check_ptr + 1] = value * 2 ** 96;
+        let range_check_ptr = range_check_ptr + 2;
+        return ();
+    }
+
+    // @notice Write the lane-wise sum of x and y modulo 2 ** 32 at dst.
+    func add_words{bitwise_ptr: BitwiseBuiltin*}(x: felt, y: felt, dst: felt*) {
+        assert bitwise_ptr[0].x = x + y;
+        assert bitwise_ptr[0].y = MASK32;
+        assert [dst] = bitwise_ptr[0].x_and_y;
+        let bitwise_ptr = bitwise_ptr + BitwiseBuiltin.SIZE;
+        return ();
+    }
+
+    // @notice Extend the 16 packed words of a block to the n following words of its schedule.
+    func message_schedule{bitwise_ptr: BitwiseBuiltin*}(n: felt, w: felt*) {
+        alloc_locals;
+        if (n == 0) {
+            return ();
+        }
+        let s0 = small_sigma0(w[1]);
+        let s1 = small_sigma1(w[14]);
+        add_words(w[0] + s0 + w[9], s1, w + 16);
+        return message_schedule(n - 1, w + 1);
+    }
+
+    // @notice Run n rounds of the compression on packed words.
+    func rounds{bitwise_ptr: BitwiseBuiltin*}(
+        a: felt,
+        b: felt,
+        c: felt,
+        d: felt,
+        e: felt,
+        f: felt,
+        g: felt,
+        h: felt,
+        w: felt*,
+        k: felt*,
+        n: felt,
+    ) -> (a: felt, b: felt, c: felt, d: felt, e: felt, f: felt, g: felt, h: felt) {
+        alloc_locals;
+        if (n == 0) {
+            return (a, b, c, d, e, f, g, h);
+        }
+        let sigma1 = big_sigma1(e);
+        let sigma0 = big_sigma0(a);
+
+        // ch(e, f, g) = g ^ (e & (f ^ g)) and maj(a, b, c) = (a & b) + (c & (a ^ b)), the two
+        // terms of the latter having no bit in common.
+        assert bitwise_ptr[0].x = f;
+        assert bitwise_ptr[0].y = g;
+        assert bitwise_ptr[1].x = e;
+        assert bitwise_ptr[1].y = bitwise_ptr[0].x_xor_y;
+        assert bitwise_ptr[2].x = g;
+        assert bitwise_ptr[2].y = bitwise_ptr[1].x_and_y;
+        assert bitwise_ptr[3].x = a;
+        assert bitwise_ptr[3].y = b;
+        assert bitwise_ptr[4].x = c;
+        assert bitwise_ptr[4].y = bitwise_ptr[3].x_xor_y;
+        tempvar temp1 = h + sigma1 + bitwise_ptr[2].x_xor_y + [k] * SHIFTS + [w];
+        tempvar temp2 = sigma0 + bitwise_ptr[3].x_and_y + bitwise_ptr[4].x_and_y;
+        assert bitwise_ptr[5].x = d + temp1;
+        assert bitwise_ptr[5].y = MASK32;
+        assert bitwise_ptr[6].x = temp1 + temp2;
+        assert bitwise_ptr[6].y = MASK32;
+        let new_e = bitwise_ptr[5].x_and_y;
+        let new_a = bitwise_ptr[6].x_and_y;
+        let bitwise_ptr = bitwise_ptr + 7 * BitwiseBuiltin.SIZE;
+
+        return rounds(new_a, a, b, c, new_e, e, f, g, w + 1, k + 1, n - 1);
+    }
+
+    // @notice Compute rotr(x, 2) ^ rotr(x, 13) ^ rotr(x, 22) on packed words.
+    func big_sigma0{bitwise_ptr: BitwiseBuiltin*}(x: felt) -> felt {
+        assert bitwise_ptr[0].x = x;
+        assert bitwise_ptr[0].y = (2 ** 2 - 1) * SHIFTS;
+        assert bitwise_ptr[1].x = x;
+        assert bitwise_ptr[1].y = (2 ** 13 - 1) * SHIFTS;
+        assert bitwise_ptr[2].x = x;
+        assert bitwise_ptr[2].y = (2 ** 22 - 1) * SHIFTS;
+        assert bitwise_ptr[3].x = (x - bitwise_ptr[0].x_and_y) / 2 ** 2 + bitwise_ptr[0].x_and_y *
+            2 ** 30;
+        assert bitwise_ptr[3].y = (x - bitwise_ptr[1].x_and_y) / 2 ** 13 + bitwise_ptr[1].x_and_y *
+            2 ** 19;
+        assert bitwise_ptr[4].x = bitwise_ptr[3].x_xor_y;
+        assert bitwise_ptr[4].y = (x - bitwise_ptr[2].x_and_y) / 2 ** 22 + bitwise_ptr[2].x_and_y *
+            2 ** 10;
+        let res = bitwise_ptr[4].x_xor_y;
+        let bitwise_ptr = bitwise_ptr + 5 * BitwiseBuiltin.SIZE;
+        return res;
+    }
+
+    // @notice Compute rotr(x, 6) ^ rotr(x, 11) ^ rotr(x, 25) on packed words.
+    func big_sigma1{bitwise_ptr: BitwiseBuiltin*}(x: felt) -> felt {
+        assert bitwise_ptr[0].x = x;
+        assert bitwise_ptr[0].y = (2 ** 6 - 1) * SHIFTS;
+        assert bitwise_ptr[1].x = x;
+        assert bitwise_ptr[1].y = (2 ** 11 - 1) * SHIFTS;
+        assert bitwise_ptr[2].x = x;
+        assert bitwise_ptr[2].y = (2 ** 25 - 1) * SHIFTS;
+        assert bitwise_ptr[3].x = (x - bitwise_ptr[0].x_and_y) / 2 ** 6 + bitwise_ptr[0].x_and_y *
+            2 ** 26;
+        assert bitwise_ptr[3].y = (x - bitwise_ptr[1].x_and_y) / 2 ** 11 + bitwise_ptr[1].x_and_y *
+            2 ** 21;
+        assert bitwise_ptr[4].x = bitwise_ptr[3].x_xor_y;
+        assert bitwise_ptr[4].y = (x - bitwise_ptr[2].x_and_y) / 2 ** 25 + bitwise_ptr[2].x_and_y *
+            2 ** 7;
+        let res = bitwise_ptr[4].x_xor_y;
+        let bitwise_ptr = bitwise_ptr + 5 * BitwiseBuiltin.SIZE;
+        return res;
+    }
+
+    // @notice Compute rotr(x, 7) ^ rotr(x, 18) ^ (x >> 3) on packed words.
+    func small_sigma0{bitwise_ptr: BitwiseBuiltin*}(x: felt) -> felt {
+        assert bitwise_ptr[0].x = x;
+        assert bitwise_ptr[0].y = (2 ** 7 - 1) * SHIFTS;
+        assert bitwise_ptr[1].x = x;
+        assert bitwise_ptr[1].y = (2 ** 18 - 1) * SHIFTS;
+        assert bitwise_ptr[2].x = x;
+        assert bitwise_ptr[2].y = (2 ** 3 - 1) * SHIFTS;
+        assert bitwise_ptr[3].x = (x - bitwise_ptr[0].x_and_y) / 2 ** 7 + bitwise_ptr[0].x_and_y *
+            2 ** 25;
+        assert bitwise_ptr[3].y = (x - bitwise_ptr[1].x_and_y) / 2 ** 18 + bitwise_ptr[1].x_and_y *
+            2 ** 14;
+        assert bitwise_ptr[4].x = bitwise_ptr[3].x_xor_y;
+        assert bitwise_ptr[4].y = (x - bitwise_ptr[2].x_and_y) / 2 ** 3;
+        let res = bitwise_ptr[4].x_xor_y;
+        let bitwise_ptr = bitwise_ptr + 5 * BitwiseBuiltin.SIZE;
+        return res;
+    }
+
+    // @notice Compute rotr(x, 17) ^ rotr(x, 19) ^ (x >> 10) on packed words.
+    func small_sigma1{bitwise_ptr: BitwiseBuiltin*}(x: felt) -> felt {
+        assert bitwise_ptr[0].x = x;
+        assert bitwise_ptr[0].y = (2 ** 17 - 1) * SHIFTS;
+        assert bitwise_ptr[1].x = x;
+        assert bitwise_ptr[1].y = (2 ** 19 - 1) * SHIFTS;
+        assert bitwise_ptr[2].x = x;
+        assert bitwise_ptr[2].y = (2 ** 10 - 1) * SHIFTS;
+        assert bitwise_ptr[3].x = (x - bitwise_ptr[0].x_and_y) / 2 ** 17 + bitwise_ptr[0].x_and_y *
+            2 ** 15;
+        assert bitwise_ptr[3].y = (x - bitwise_ptr[1].x_and_y) / 2 ** 19 + bitwise_ptr[1].x_and_y *
+            2 ** 13;
+        assert bitwise_ptr[4].x = bitwise_ptr[3].x_xor_y;
+        assert bitwise_ptr[4].y = (x - bitwise_ptr[2].x_and_y) / 2 ** 10;
+        let res = bitwise_ptr[4].x_xor_y;
+        let bitwise_ptr = bitwise_ptr + 5 * BitwiseBuiltin.SIZE;
+        return res;
+    }
+
+    // @notice Return the 64 round constants.
+    func round_constants() -> felt* {
+        let (round_constants_address) = get_label_location(round_constants_table);
+        return round_constants_address;
+
+        round_constants_table:
+        dw 0x428a2f98;
+        dw 0x71374491;
+        dw 0xb5c0fbcf;
+        dw 0xe9b5dba5;
+        dw 0x3956c25b;
+        dw 0x59f111f1;
+        dw 0x923f82a4;
+        dw 0xab1c5ed5;
+        dw 0xd807aa98;
+        dw 0x12835b01;
+        dw 0x243185be;
+        dw 0x550c7dc3;
+        dw 0x72be5d74;
+        dw 0x80deb1fe;
+        dw 0x9bdc06a7;
+        dw 0xc19bf174;
+        dw 0xe49b69c1;
+        dw 0xefbe4786;
+        dw 0xfc19dc6;
+        dw 0x240ca1cc;
+        dw 0x2de92c6f;
+        dw 0x4a7484aa;
+        dw 0x5cb0a9dc;
+        dw 0x76f988da;
+        dw 0x983e5152;
+        dw 0xa831c66d;
+        dw 0xb00327c8;
+        dw 0xbf597fc7;
+        dw 0xc6e00bf3;
+        dw 0xd5a79147;
+        dw 0x6ca6351;
+        dw 0x14292967;
+        dw 0x27b70a85;
+        dw 0x2e1b2138;
+        dw 0x4d2c6dfc;
+        dw 0x53380d13;
+        dw 0x650a7354;
+        dw 0x766a0abb;
+        dw 0x81c2c92e;
+        dw 0x92722c85;
+        dw 0xa2bfe8a1;
+        dw 0xa81a664b;
+        dw 0xc24b8b70;
+        dw 0xc76c51a3;
+        dw 0xd192e819;
+        dw 0xd6990624;
+        dw 0xf40e3585;
+        dw 0x106aa070;
+        dw 0x19a4c116;
+        dw 0x1e376c08;
+        dw 0x2748774c;
+        dw 0x34b0bcb5;
+        dw 0x391c0cb3;
+        dw 0x4ed8aa4a;
+        dw 0x5b9cca4f;
+        dw 0x682e6ff3;
+        dw 0x748f82ee;
+        dw 0x78a5636f;
+        dw 0x84c87814;
+        dw 0x8cc70208;
+        dw 0x90befffa;
+        dw 0xa4506ceb;
+        dw 0xbef9a3f7;
+        dw 0xc67178f2;
+    }
+
+    // @notice Return the compression of the zero block from the initial state, which completes
+    // @notice the last batch. Its state before compression is the initial state of SHA-256.
+    func padding_instance() -> felt* {
+        let (padding_instance_address) = get_label_location(padding_instance_table);
+        return padding_instance_address;
+
+        padding_instance_table:
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x0;
+        dw 0x6a09e667;
+        dw 0xbb67ae85;
+        dw 0x3c6ef372;
+        dw 0xa54ff53a;
+        dw 0x510e527f;
+        dw 0x9b05688c;
+        dw 0x1f83d9ab;
+        dw 0x5be0cd19;
+        dw 0xda5698be;
+        dw 0x17b9b469;
+        dw 0x62335799;
+        dw 0x779fbeca;
+        dw 0x8ce5d491;
+        dw 0xc0d26243;
+        dw 0xbafef9ea;
+        dw 0x1837a9d8;
+    }
+}
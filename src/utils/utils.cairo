@@ -4,6 +4,7 @@
 
 // StarkWare dependencies
 from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_builtins import BitwiseBuiltin
 from starkware.cairo.common.math import (
     assert_le,
     split_felt,
@@ -333,6 +334,35 @@ namespace Helpers {
         return split_word((value - low_part) / 256, len, dst);
     }
 
+    // @notice Splits a felt into `len` bytes, little-endian, and outputs to `dst`.
+    func split_word_little{range_check_ptr}(value: felt, len: felt, dst: felt*) {
+        if (len == 0) {
+            assert value = 0;
+            return ();
+        }
+        let output = &dst[0];
+        let base = 256;
+        let bound = 256;
+        %{
+            memory[ids.output] = res = (int(ids.value) % PRIME) % ids.base
+            assert res < ids.bound, f'split_int(): Limb {res} is out of range.'
+        %}
+        tempvar low_part = [output];
+        assert_nn_le(low_part, 255);
+        return split_word_little((value - low_part) / 256, len - 1, dst + 1);
+    }
+
+    // @notice Splits a felt into `len` bits, big-endian, and outputs to `dst`.
+    func split_bits{range_check_ptr}(value: felt, len: felt, dst: felt*) {
+        if (len == 0) {
+            assert value = 0;
+            return ();
+        }
+        let (q, bit) = unsigned_div_rem(value, 2);
+        assert dst[len - 1] = bit;
+        return split_bits(q, len - 1, dst);
+    }
+
     // @notice Splits a felt into 16 bytes, big-endien, and outputs to `dst`.
     func split_word_128{range_check_ptr}(start_value: felt, dst: felt*) {
         // Fill dst using only hints with no opcodes.
@@ -547,6 +577,28 @@ namespace Helpers {
         return q * 32;
     }
 
+    // @notice Returns the number of bytes used by the big endian representation of a uint256
+    // ex: bytes_used(Uint256(0, 0)) = 0
+    // ex: bytes_used(Uint256(256, 0)) = 2
+    func bytes_used{range_check_ptr}(value: Uint256) -> felt {
+        if (value.high != 0) {
+            let high_bytes = bytes_used_128(value.high);
+            return 16 + high_bytes;
+        }
+        let low_bytes = bytes_used_128(value.low);
+        return low_bytes;
+    }
+
+    // @notice Returns the number of bytes used by the big endian representation of a 128 bits felt
+    func bytes_used_128{range_check_ptr}(value: felt) -> felt {
+        if (value == 0) {
+            return 0;
+        }
+        let (quotient, _) = unsigned_div_rem(value, 256);
+        let quotient_bytes = bytes_used_128(quotient);
+        return 1 + quotient_bytes;
+    }
+
     // @notice Returns the min value between a and b
     func min{range_check_ptr}(a: felt, b: felt) -> felt {
         if (is_le(a, b) == 0) {
@@ -556,6 +608,40 @@ namespace Helpers {
         }
     }
 
+    // @notice Convert 16 bytes big endian chunks to 8 bytes little endian words, as expected by keccak.
+    // @dev The bytes of both halves of a chunk are swapped at once with the bitwise builtin.
+    // @param chunks_len: The number of chunks.
+    // @param chunks: The chunks, big endian representations of 16 bytes.
+    // @param dest: The output array, of length 2 * chunks_len.
+    func bytes16_to_bytes8_little_endian{bitwise_ptr: BitwiseBuiltin*}(
+        chunks_len: felt, chunks: felt*, dest: felt*
+    ) {
+        if (chunks_len == 0) {
+            return ();
+        }
+
+        // Swap bytes, then 16 bits and 32 bits groups within each 64 bits half.
+        let chunk = [chunks];
+        assert bitwise_ptr[0].x = chunk;
+        assert bitwise_ptr[0].y = 0x00ff00ff00ff00ff00ff00ff00ff00ff;
+        tempvar chunk = bitwise_ptr[0].x_and_y * 2 ** 8 + (chunk - bitwise_ptr[0].x_and_y) / 2 ** 8;
+        assert bitwise_ptr[1].x = chunk;
+        assert bitwise_ptr[1].y = 0x0000ffff0000ffff0000ffff0000ffff;
+        tempvar chunk = bitwise_ptr[1].x_and_y * 2 ** 16 + (chunk - bitwise_ptr[1].x_and_y) / 2 ** 16;
+        assert bitwise_ptr[2].x = chunk;
+        assert bitwise_ptr[2].y = 0x00000000ffffffff00000000ffffffff;
+        tempvar chunk = bitwise_ptr[2].x_and_y * 2 ** 32 + (chunk - bitwise_ptr[2].x_and_y) / 2 ** 32;
+
+        // The high half holds the first 8 bytes.
+        assert bitwise_ptr[3].x = chunk;
+        assert bitwise_ptr[3].y = 0xffffffffffffffff;
+        assert dest[0] = (chunk - bitwise_ptr[3].x_and_y) / 2 ** 64;
+        assert dest[1] = bitwise_ptr[3].x_and_y;
+
+        let bitwise_ptr = bitwise_ptr + 4 * BitwiseBuiltin.SIZE;
+        return bytes16_to_bytes8_little_endian(chunks_len - 1, chunks + 1, dest + 2);
+    }
+
     // @notice convert bytes to little endian
     func bytes_to_bytes8_little_endian{range_check_ptr}(
         bytes_len: felt,
@@ -18,6 +18,7 @@ test_cases = [
             "stack": "",
             "memory": "0000000000000000000000000000000000000000000000000000000000000042",
             "return_value": "0000000000000000000000000000000000000000000000000000000000000042",
+            "gas_used": 21018,
         },
         "id": "return",
         "marks": [pytest.mark.RETURN, pytest.mark.SystemOperations],
@@ -30,6 +31,7 @@ test_cases = [
             "stack": "",
             "memory": "0000",
             "return_value": "00",
+            "gas_used": 21009,
         },
         "id": "return2",
         "marks": [pytest.mark.RETURN, pytest.mark.SystemOperations],
@@ -42,6 +44,7 @@ test_cases = [
             "stack": "",
             "memory": "0360003900000000000000000000000000000000000000000000000000000000",
             "return_value": "",
+            "gas_used": 21018,
         },
         "id": "codecopy",
         "marks": [pytest.mark.CODECOPY, pytest.mark.EnvironmentalInformation],
@@ -54,6 +57,7 @@ test_cases = [
             "stack": "1766847064778384329583297500742918515827483896875618958121606201292619775",
             "memory": "6008601f60003900000000000000000000000000000000000000000000000000",
             "return_value": "",
+            "gas_used": 21021,
         },
         "id": "codecopy2",
         "marks": [pytest.mark.CODECOPY, pytest.mark.EnvironmentalInformation],
@@ -66,6 +70,7 @@ test_cases = [
             "stack": "16",
             "memory": "",
             "return_value": "",
+            "gas_used": 21154,
         },
         "id": "Arithmetic operations",
         "marks": [
@@ -91,6 +96,7 @@ test_cases = [
             "stack": "1,1,3,4,2,5,3",
             "memory": "",
             "return_value": "",
+            "gas_used": 21021,
         },
         "id": "Duplication operations",
         "marks": [pytest.mark.DUP, pytest.mark.DuplicationOperations],
@@ -103,6 +109,7 @@ test_cases = [
             "stack": "1",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SAR",
         "marks": [pytest.mark.SAR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -115,6 +122,7 @@ test_cases = [
             "stack": "115792089237316195423570985008687907853269984665640564039457584007913129639935",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SAR",
         "marks": [pytest.mark.SAR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -127,6 +135,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SAR",
         "marks": [pytest.mark.SAR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -139,6 +148,7 @@ test_cases = [
             "stack": "1",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SAR",
         "marks": [pytest.mark.SAR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -151,6 +161,7 @@ test_cases = [
             "stack": "127",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SAR",
         "marks": [pytest.mark.SAR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -163,6 +174,7 @@ test_cases = [
             "stack": "1",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SAR",
         "marks": [pytest.mark.SAR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -175,6 +187,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SAR",
         "marks": [pytest.mark.SAR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -187,6 +200,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SAR",
         "marks": [pytest.mark.SAR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -199,6 +213,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SAR",
         "marks": [pytest.mark.SAR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -211,6 +226,7 @@ test_cases = [
             "stack": "86844066927987146567678238756515930889952488499230423029593188005934847229952",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHR",
         "marks": [pytest.mark.SAR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -223,6 +239,7 @@ test_cases = [
             "stack": "115792089237316195423570985008687907853269984665640564039457584007913129639935",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SAR",
         "marks": [pytest.mark.SAR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -235,6 +252,7 @@ test_cases = [
             "stack": "115792089237316195423570985008687907853269984665640564039457584007913129639935",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SAR",
         "marks": [pytest.mark.SAR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -247,6 +265,7 @@ test_cases = [
             "stack": "115792089237316195423570985008687907853269984665640564039457584007913129639935",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SAR",
         "marks": [pytest.mark.SAR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -259,6 +278,7 @@ test_cases = [
             "stack": "115792089237316195423570985008687907853269984665640564039457584007913129639935",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SAR",
         "marks": [pytest.mark.SAR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -271,6 +291,7 @@ test_cases = [
             "stack": "115792089237316195423570985008687907853269984665640564039457584007913129639935",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SAR",
         "marks": [pytest.mark.SAR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -283,6 +304,7 @@ test_cases = [
             "stack": "115792089237316195423570985008687907853269984665640564039457584007913129639935",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SAR",
         "marks": [pytest.mark.SAR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -295,6 +317,7 @@ test_cases = [
             "stack": "1",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHL",
         "marks": [pytest.mark.SHL, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -307,6 +330,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHL",
         "marks": [pytest.mark.SHL, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -319,6 +343,7 @@ test_cases = [
             "stack": "115792089237316195423570985008687907853269984665640564039457584007913129639934",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHL",
         "marks": [pytest.mark.SHL, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -331,6 +356,7 @@ test_cases = [
             "stack": "2",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHL",
         "marks": [pytest.mark.SHL, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -343,6 +369,7 @@ test_cases = [
             "stack": "57896044618658097711785492504343953926634992332820282019728792003956564819968",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHL",
         "marks": [pytest.mark.SHL, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -355,6 +382,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHL",
         "marks": [pytest.mark.SHL, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -367,6 +395,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHL",
         "marks": [pytest.mark.SHL, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -379,6 +408,7 @@ test_cases = [
             "stack": "115792089237316195423570985008687907853269984665640564039457584007913129639935",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHL",
         "marks": [pytest.mark.SHL, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -391,6 +421,7 @@ test_cases = [
             "stack": "115792089237316195423570985008687907853269984665640564039457584007913129639934",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHL",
         "marks": [pytest.mark.SHL, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -403,6 +434,7 @@ test_cases = [
             "stack": "57896044618658097711785492504343953926634992332820282019728792003956564819968",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHL",
         "marks": [pytest.mark.SHL, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -415,6 +447,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHL",
         "marks": [pytest.mark.SHL, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -427,6 +460,7 @@ test_cases = [
             "stack": "1",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHR",
         "marks": [pytest.mark.SHR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -439,6 +473,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHR",
         "marks": [pytest.mark.SHR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -451,6 +486,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHR",
         "marks": [pytest.mark.SHR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -463,6 +499,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHR",
         "marks": [pytest.mark.SHR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -475,6 +512,7 @@ test_cases = [
             "stack": "28948022309329048855892746252171976963317496166410141009864396001978282409984",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHR",
         "marks": [pytest.mark.SHR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -487,6 +525,7 @@ test_cases = [
             "stack": "1",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHR",
         "marks": [pytest.mark.SHR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -499,6 +538,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHR",
         "marks": [pytest.mark.SHR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -511,6 +551,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHR",
         "marks": [pytest.mark.SHR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -523,6 +564,7 @@ test_cases = [
             "stack": "115792089237316195423570985008687907853269984665640564039457584007913129639935",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHR",
         "marks": [pytest.mark.SHR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -535,6 +577,7 @@ test_cases = [
             "stack": "57896044618658097711785492504343953926634992332820282019728792003956564819967",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHR",
         "marks": [pytest.mark.SHR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -547,6 +590,7 @@ test_cases = [
             "stack": "1",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SHR",
         "marks": [pytest.mark.SHR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -559,6 +603,7 @@ test_cases = [
             "stack": "5",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - AND",
         "marks": [pytest.mark.AND, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -571,6 +616,7 @@ test_cases = [
             "stack": "1,0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21018,
         },
         "id": "Comparison & bitwise logic operations - EQ",
         "marks": [pytest.mark.EQ, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -583,6 +629,7 @@ test_cases = [
             "stack": "0,1",
             "memory": "",
             "return_value": "",
+            "gas_used": 21018,
         },
         "id": "Comparison & bitwise logic operations - GT",
         "marks": [pytest.mark.GT, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -595,6 +642,7 @@ test_cases = [
             "stack": "1",
             "memory": "",
             "return_value": "",
+            "gas_used": 21006,
         },
         "id": "Comparison & bitwise logic operations - ISZERO",
         "marks": [pytest.mark.ISZERO, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -607,6 +655,7 @@ test_cases = [
             "stack": "1,0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21018,
         },
         "id": "Comparison & bitwise logic operations - LT",
         "marks": [pytest.mark.LT, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -619,6 +668,7 @@ test_cases = [
             "stack": "115792089237316195423570985008687907853269984665640564039457584007913129639935",
             "memory": "",
             "return_value": "",
+            "gas_used": 21006,
         },
         "id": "Comparison & bitwise logic operations - NOT",
         "marks": [pytest.mark.NOT, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -631,6 +681,7 @@ test_cases = [
             "stack": "7",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - OR",
         "marks": [pytest.mark.OR, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -643,6 +694,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SGT",
         "marks": [pytest.mark.SGT, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -655,6 +707,7 @@ test_cases = [
             "stack": "1",
             "memory": "",
             "return_value": "",
+            "gas_used": 21009,
         },
         "id": "Comparison & bitwise logic operations - SLT",
         "marks": [pytest.mark.SLT, pytest.mark.ComparisonBitwiseLogicOperations],
@@ -667,6 +720,7 @@ test_cases = [
             "stack": "1,2,3,4",
             "memory": "",
             "return_value": "",
+            "gas_used": 21021,
         },
         "id": "Exchange operations",
         "marks": [pytest.mark.SWAP, pytest.mark.ExchangeOperations],
@@ -679,6 +733,7 @@ test_cases = [
             "stack": "1,258,7",
             "memory": "",
             "return_value": "",
+            "gas_used": 21008,
         },
         "id": "Environmental information",
         "marks": [pytest.mark.CODESIZE, pytest.mark.EnvironmentalInformation],
@@ -691,6 +746,7 @@ test_cases = [
             "stack": "1,2,1263227476",
             "memory": "",
             "return_value": "",
+            "gas_used": 21008,
         },
         "id": "Block information CHAINID",
         "marks": [pytest.mark.CHAINID, pytest.mark.BlockInformation],
@@ -703,6 +759,7 @@ test_cases = [
             "stack": "1598625851760128517552627854997699631064626954749952456622017584404508471300",
             "memory": "",
             "return_value": "",
+            "gas_used": 21002,
         },
         "id": "Block information COINBASE",
         "marks": [pytest.mark.COINBASE, pytest.mark.BlockInformation],
@@ -727,6 +784,7 @@ test_cases = [
             "stack": str(blockhashes["current_block"]["block_number"]),
             "memory": "",
             "return_value": "",
+            "gas_used": 21002,
         },
         "id": "Block information NUMBER",
         "marks": [pytest.mark.NUMBER, pytest.mark.BlockInformation],
@@ -739,6 +797,7 @@ test_cases = [
             "stack": str(blockhashes["current_block"]["timestamp"]),
             "memory": "",
             "return_value": "",
+            "gas_used": 21002,
         },
         "id": "Block information TIMESTAMP",
         "marks": [pytest.mark.TIMESTAMP, pytest.mark.BlockInformation],
@@ -751,6 +810,7 @@ test_cases = [
             "stack": "0000000000000000000000000000000000000000000000000000000000000000",
             "memory": "",
             "return_value": "",
+            "gas_used": 21005,
         },
         "id": "Get balance of currently executing contract - 0x47 SELFBALANCE",
         "marks": [pytest.mark.SELFBALANCE, pytest.mark.BlockInformation],
@@ -763,6 +823,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21002,
         },
         "id": "Origin Address",
         "marks": [pytest.mark.ORIGIN, pytest.mark.EnvironmentalInformation],
@@ -775,6 +836,7 @@ test_cases = [
             "stack": "1",
             "memory": "",
             "return_value": "",
+            "gas_used": 21002,
         },
         "id": "Caller Address",
         "marks": [pytest.mark.CALLER, pytest.mark.EnvironmentalInformation],
@@ -787,6 +849,7 @@ test_cases = [
             "stack": "31605475728638136284098257830937953109142906242585568807375082376557418698875",
             "memory": "0000000000000000000000000000000000000000000000000000000000000100",
             "return_value": "",
+            "gas_used": 21054,
         },
         "id": "Hash 32 bytes",
         "marks": [pytest.mark.SHA3],
@@ -799,6 +862,7 @@ test_cases = [
             "stack": "68071607937700842810429351077030899797510977729217708600998965445571406158526",
             "memory": "0000000000000000000000000000000000000000000000000000000000000010",
             "return_value": "",
+            "gas_used": 21054,
         },
         "id": "Hash 1 byte with offset 1f",
         "marks": [pytest.mark.SHA3],
@@ -811,6 +875,7 @@ test_cases = [
             "stack": "85131057757245807317576516368191972321038229705283732634690444270750521936266",
             "memory": "0000000000000000000000000000000000000000000000000000000000000010",
             "return_value": "",
+            "gas_used": 21054,
         },
         "id": "Hash 1 byte no offset",
         "marks": [pytest.mark.SHA3],
@@ -823,6 +888,7 @@ test_cases = [
             "stack": "101225983456080153511598605893998939348063346639131267901574990367534118792751",
             "memory": "0000000000000000000000000000000000000000000000000000000000000010",
             "return_value": "",
+            "gas_used": 21054,
         },
         "id": "Hash 7 bytes",
         "marks": [pytest.mark.SHA3],
@@ -835,6 +901,7 @@ test_cases = [
             "stack": "500549258012437878224561338362079327067368301550791134293299473726337612750",
             "memory": "0000000000000000000000000000000000000000000000000000000000000010",
             "return_value": "",
+            "gas_used": 21054,
         },
         "id": "Hash 8 bytes",
         "marks": [pytest.mark.SHA3],
@@ -847,6 +914,7 @@ test_cases = [
             "stack": "78337347954576241567341556127836028920764967266964912349540464394612926403441",
             "memory": "0000000000000000000000000000000000000000000000000000000000000010",
             "return_value": "",
+            "gas_used": 21054,
         },
         "id": "Hash 9 bytes",
         "marks": [pytest.mark.SHA3],
@@ -859,6 +927,7 @@ test_cases = [
             "stack": "41382199742381387985558122494590197322490258008471162768551975289239028668781",
             "memory": "0000000000000000000000000000000000000000000000000000000000000010",
             "return_value": "",
+            "gas_used": 21054,
         },
         "id": "Hash 17 bytes",
         "marks": [pytest.mark.SHA3],
@@ -871,6 +940,7 @@ test_cases = [
             "stack": "1000000",
             "memory": "",
             "return_value": "",
+            "gas_used": 21002,
         },
         "id": "Gas Limit",
         "marks": [pytest.mark.GASLIMIT, pytest.mark.BlockInformation],
@@ -883,6 +953,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21002,
         },
         "id": "Get the size of return data - 0x3d RETURNDATASIZE",
         "marks": [pytest.mark.RETURNDATASIZE, pytest.mark.EnvironmentalInformation],
@@ -895,6 +966,7 @@ test_cases = [
             "stack": "10,0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21005,
         },
         "id": "Load Word from Memory",
         "marks": [pytest.mark.DIFFICULTY, pytest.mark.BlockInformation],
@@ -907,6 +979,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21002,
         },
         "id": "Get baseFee",
         "marks": [
@@ -922,6 +995,7 @@ test_cases = [
             "stack": "9000000000",
             "memory": "",
             "return_value": "",
+            "gas_used": 21002,
         },
         "id": "Get deposited value by the instruction/transaction responsible for this execution - 0x34 CALLVALUE",
         "marks": [pytest.mark.CALLVALUE, pytest.mark.EnvironmentalInformation],
@@ -934,6 +1008,7 @@ test_cases = [
             "stack": "10",
             "memory": "",
             "return_value": "",
+            "gas_used": 21146,
         },
         "id": "Load CallData onto the Stack - 0x35 CALLDATALOAD",
         "marks": [pytest.mark.CALLDATALOAD, pytest.mark.EnvironmentalInformation],
@@ -946,6 +1021,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21002,
         },
         "id": "Get the size of calldata when empty calldata - 0x36 CALLDATASIZE",
         "marks": [pytest.mark.CALLDATASIZE, pytest.mark.EnvironmentalInformation],
@@ -958,6 +1034,7 @@ test_cases = [
             "stack": "1",
             "memory": "",
             "return_value": "",
+            "gas_used": 21018,
         },
         "id": "Get the size of calldata when non empty calldata - 0x36 CALLDATASIZE",
         "marks": [pytest.mark.CALLDATASIZE, pytest.mark.EnvironmentalInformation],
@@ -970,6 +1047,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21103,
         },
         "id": "Balance",
         "marks": [pytest.mark.BALANCE, pytest.mark.EnvironmentalInformation],
@@ -982,6 +1060,7 @@ test_cases = [
             "stack": "",
             "memory": "000000000000000000000000000000000000000000000000000000000000000a",
             "return_value": "",
+            "gas_used": 21012,
         },
         "id": "Memory operations",
         "marks": [pytest.mark.MSTORE, pytest.mark.StackMemoryStorageFlowOperations],
@@ -994,6 +1073,7 @@ test_cases = [
             "stack": "",
             "memory": "00000000000000000000000000000000000000000000000000000000000000000a00000000000000000000000000000000000000000000000000000000000000",
             "return_value": "",
+            "gas_used": 21015,
         },
         "id": "Memory operations",
         "marks": [pytest.mark.MSTORE, pytest.mark.StackMemoryStorageFlowOperations],
@@ -1006,6 +1086,7 @@ test_cases = [
             "stack": "",
             "memory": "000000000000000000000000000000000000000000000000000000000000000a0000000000000000000000000000000000000000000000000000000000000000000000fa00000000000000000000000000000000000000000000000000000000",
             "return_value": "",
+            "gas_used": 21027,
         },
         "id": "Memory operations",
         "marks": [
@@ -1021,6 +1102,7 @@ test_cases = [
             "stack": "0,1,3",
             "memory": "",
             "return_value": "",
+            "gas_used": 21007,
         },
         "id": "Memory operation - PC",
         "marks": [pytest.mark.PC, pytest.mark.StackMemoryStorageFlowOperations],
@@ -1033,6 +1115,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21002,
         },
         "id": "Get Memory Size",
         "marks": [pytest.mark.MSIZE, pytest.mark.StackMemoryStorageFlowOperations],
@@ -1045,6 +1128,7 @@ test_cases = [
             "stack": "10",
             "memory": "000000000000000000000000000000000000000000000000000000000000000a",
             "return_value": "",
+            "gas_used": 21018,
         },
         "id": "Load Word from Memory",
         "marks": [
@@ -1061,6 +1145,7 @@ test_cases = [
             "stack": "0,1,1,1,8",
             "memory": "",
             "return_value": "",
+            "gas_used": 21014,
         },
         "id": "Jumpdest opcode",
         "marks": [
@@ -1076,6 +1161,7 @@ test_cases = [
             "stack": "11",
             "memory": "",
             "return_value": "",
+            "gas_used": 21015,
         },
         "id": "JUMP opcode",
         "marks": [
@@ -1091,6 +1177,7 @@ test_cases = [
             "stack": "20",
             "memory": "",
             "return_value": "",
+            "gas_used": 21042,
         },
         "id": "JUMP if condition is met",
         "marks": [
@@ -1106,6 +1193,7 @@ test_cases = [
             "stack": "",
             "memory": "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000011",
             "return_value": "",
+            "gas_used": 21018,
         },
         "id": "Memory operations - Check very large offsets",
         "marks": [
@@ -1121,6 +1209,7 @@ test_cases = [
             "stack": "",
             "memory": "000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000022",
             "return_value": "",
+            "gas_used": 21027,
         },
         "id": "Memory operations - Check Colliding offsets",
         "marks": [
@@ -1136,6 +1225,7 @@ test_cases = [
             "stack": "",
             "memory": "0000111111111111111111111111111111111111111111111111111111111111",
             "return_value": "",
+            "gas_used": 21012,
         },
         "id": "Memory operations - Check saving memory with 30 bytes",
         "marks": [
@@ -1151,6 +1241,7 @@ test_cases = [
             "stack": "",
             "memory": "00000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000011ffffffffffffffffffffff",
             "return_value": "",
+            "gas_used": 21027,
         },
         "id": "Memory operations - Check saving memory in between an already saved memory location",
         "marks": [
@@ -1166,6 +1257,7 @@ test_cases = [
             "stack": "",
             "memory": "0000002200000000000000000000000000000000000000000000000000000000",
             "return_value": "",
+            "gas_used": 21012,
         },
         "id": "Memory operations - Check saving memory in between an already saved memory location",
         "marks": [
@@ -1181,6 +1273,7 @@ test_cases = [
             "stack": "",
             "memory": "1111111111221111111111111111111111111111111111111111111111111111",
             "return_value": "",
+            "gas_used": 21021,
         },
         "id": "Memory operations - Check saving memory in between an already saved memory location",
         "marks": [
@@ -1196,6 +1289,7 @@ test_cases = [
             "stack": "",
             "memory": "0000000000005566778899aabbcceeddff0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000",
             "return_value": "",
+            "gas_used": 21265,
         },
         "id": "calldatacopy",
         "marks": [
@@ -1211,6 +1305,7 @@ test_cases = [
             "stack": "",
             "memory": "0011221111111111111111111111111111111133445566778899aabbccddeeff",
             "return_value": "",
+            "gas_used": 21571,
         },
         "id": "calldatacopy1",
         "marks": [
@@ -1226,6 +1321,7 @@ test_cases = [
             "stack": "",
             "memory": "5566778899aabbcceeddff00112233445566778899aabbccddeeff00000000000000000000000000000000000000000000000000000000000000000000000000",
             "return_value": "",
+            "gas_used": 21512,
         },
         "id": "calldatacopy2",
         "marks": [
@@ -1241,6 +1337,7 @@ test_cases = [
             "stack": "",
             "memory": "5566778899aabbcceeddff00112233445566778899aabbccddeeff0011223344",
             "return_value": "",
+            "gas_used": 21750,
         },
         "id": "calldatacopy3",
         "marks": [
@@ -1256,6 +1353,7 @@ test_cases = [
             "stack": "",
             "memory": "33445566778899aabbcceeddff00112233445566778899aabbccddeeff00112233445566778899aabbccddeeff00000000000000000000000000000000000000",
             "return_value": "",
+            "gas_used": 21756,
         },
         "id": "calldatacopy4",
         "marks": [
@@ -1271,6 +1369,7 @@ test_cases = [
             "stack": "",
             "memory": "5566778899aabbcceeddff001122334400000000000000000000000000000000",
             "return_value": "",
+            "gas_used": 21506,
         },
         "id": "calldatacopy5",
         "marks": [
@@ -1287,6 +1386,7 @@ test_cases = [
             "memory": "0000000000000000000000000000000000000000000000000000000000000010",
             "return_value": "",
             "events": [[[], [0x10]]],
+            "gas_used": 21401,
         },
         "id": "PRElog0",
         "marks": [
@@ -1303,6 +1403,7 @@ test_cases = [
             "memory": "0000000000000000000000000000000000000000000000000000000000000010000000",
             "return_value": "",
             "events": [[[], [0x00]]],
+            "gas_used": 21404,
         },
         "id": "PRElog0-1",
         "marks": [
@@ -1310,6 +1411,24 @@ test_cases = [
             pytest.mark.LoggingOperations,
         ],
     },
+    {
+        "params": {
+            "value": 0,
+            "code": "601060005260406000A000",
+            "calldata": "",
+            "stack": "",
+            "memory": "0000000000000000000000000000000000000000000000000000000000000010"
+            + "00" * 32,
+            "return_value": "",
+            "events": [[[], [0x00] * 31 + [0x10] + [0x00] * 32]],
+            "gas_used": 21908,
+        },
+        "id": "log0-two-words",
+        "marks": [
+            pytest.mark.LOG,
+            pytest.mark.LoggingOperations,
+        ],
+    },
     {
         "params": {
             "value": 0,
@@ -1327,6 +1446,7 @@ test_cases = [
                     [0x10],
                 ]
             ],
+            "gas_used": 21779,
         },
         "id": "PRElog1",
         "marks": [
@@ -1343,6 +1463,7 @@ test_cases = [
             "memory": "0000000000000000000000000000000000000000000000000000000000000010000000",
             "return_value": "",
             "events": [[[0xFF, 0x00], [0x00]]],
+            "gas_used": 21782,
         },
         "id": "PRElog1-1",
         "marks": [
@@ -1369,6 +1490,7 @@ test_cases = [
                     [0x10],
                 ]
             ],
+            "gas_used": 22157,
         },
         "id": "PRElog2",
         "marks": [
@@ -1385,6 +1507,7 @@ test_cases = [
             "memory": "0000000000000000000000000000000000000000000000000000000000000010000000",
             "return_value": "",
             "events": [[[0xFF, 0x00, 0x00, 0x00], [0x00]]],
+            "gas_used": 22160,
         },
         "id": "PRElog2-1",
         "marks": [
@@ -1413,6 +1536,7 @@ test_cases = [
                     [0x10],
                 ]
             ],
+            "gas_used": 22535,
         },
         "id": "PRElog3",
         "marks": [
@@ -1429,6 +1553,7 @@ test_cases = [
             "memory": "0000000000000000000000000000000000000000000000000000000000000010000000",
             "return_value": "",
             "events": [[[0xFF, 0x00, 0x00, 0x00, 0xAB, 0x00], [0x00]]],
+            "gas_used": 22538,
         },
         "id": "PRElog3-1",
         "marks": [
@@ -1459,6 +1584,7 @@ test_cases = [
                     [0x10],
                 ]
             ],
+            "gas_used": 22913,
         },
         "id": "PRElog4",
         "marks": [
@@ -1475,6 +1601,7 @@ test_cases = [
             "memory": "0000000000000000000000000000000000000000000000000000000000000010000000",
             "return_value": "",
             "events": [[[0xFF, 0x00, 0x00, 0x00, 0xAB, 0x00, 0x08, 0x00], [0x00]]],
+            "gas_used": 22916,
         },
         "id": "PRElog4-1",
     },
@@ -1486,6 +1613,7 @@ test_cases = [
             "stack": "",
             "memory": "6002000000000000000000000000000000000000000000000000000000000000",
             "return_value": "",
+            "gas_used": 21018,
         },
         "id": "Environment Information - CODECOPY (0x39) - code slice within bounds, memory offset > len with tail padding",
         "marks": [
@@ -1501,6 +1629,7 @@ test_cases = [
             "stack": "",
             "memory": "002233445566778899778899aabbccddeeff00112233445566778899aabbccdd",
             "return_value": "",
+            "gas_used": 21027,
         },
         "id": "Environmental Information - CODECOPY (0x39) - code slice within bounds, memory copy within bounds",
         "marks": [
@@ -1516,6 +1645,7 @@ test_cases = [
             "stack": "",
             "memory": "002233445566778899aabbccddeeff00112233445566778899aabbccdd6000526000000000000000000000000000000000000000000000000000000000000000",
             "return_value": "",
+            "gas_used": 21030,
         },
         "id": "Environmental Information - CODECOPY (0x39) - code slice within bounds, memory offset < len < offset + size",
         "marks": [
@@ -1531,6 +1661,7 @@ test_cases = [
             "stack": "",
             "memory": "00000060026003390000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000",
             "return_value": "",
+            "gas_used": 21024,
         },
         "id": "Environmental Information - CODECOPY (0x39) - code with padding + memory offset > len ",
         "marks": [
@@ -1546,6 +1677,7 @@ test_cases = [
             "stack": "",
             "memory": "000000110000000000778899aabbccddeeff00112233445566778899aabbccdd",
             "return_value": "",
+            "gas_used": 21027,
         },
         "id": "Environmental Information - CODECOPY (0x39) - code offset > len, memory offset + size < len",
         "marks": [
@@ -1561,6 +1693,7 @@ test_cases = [
             "stack": "",
             "memory": "7dffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff7f0000000000000000000000000000000000000000000000000000000000000000",
             "return_value": "",
+            "gas_used": 21034,
         },
         "id": "Environment Information - CODECOPY (0x39) - evmcode example 1",
         "marks": [
@@ -1576,6 +1709,7 @@ test_cases = [
             "stack": "",
             "memory": "7f00000000000000ffffffffffffffffffffffffffffffffffffffffffffff7f0000000000000000000000000000000000000000000000000000000000000000",
             "return_value": "",
+            "gas_used": 21049,
         },
         "id": "Environment Information - CODECOPY (0x39) - evmcode example 1+2",
         "marks": [
@@ -1591,6 +1725,7 @@ test_cases = [
             "stack": "0",
             "memory": "",
             "return_value": "",
+            "gas_used": 21002,
         },
         "id": "Get address of currently executing account - 0x30 ADDRESS",
         "marks": [pytest.mark.ADDRESS, pytest.mark.EnvironmentalInformation],
@@ -1609,6 +1744,7 @@ test_cases = [
                 "0000000000000000000000007156526fbd7a3c72969b54f64e42c10fbb768c8a"
             ),
             "return_value": "",
+            "gas_used": 24177,
         },
         "id": "Precompiles - EC_RECOVER - playground test case",
         "marks": [pytest.mark.EC_RECOVER, pytest.mark.Precompiles],
@@ -1624,6 +1760,7 @@ test_cases = [
                 "0000000000000000000000002c0c45d3ecab80fe060e5f1d7057cd2f8de5e557"
             ),
             "return_value": "",
+            "gas_used": 21861,
         },
         "id": "Precompiles - RIPEMD160 - playground test case",
         "marks": [pytest.mark.RIPEMD160, pytest.mark.Precompiles],
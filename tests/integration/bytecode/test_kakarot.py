@@ -7,6 +7,7 @@ from tests.integration.helpers.helpers import (
     extract_stack_from_execute,
     hex_string_to_bytes_array,
 )
+from tests.integration.helpers.wrap_kakarot import decode_event_data
 from tests.utils.reporting import traceit
 
 params_execute = [pytest.param(case.pop("params"), **case) for case in test_cases]
@@ -34,12 +35,16 @@ class TestKakarot:
         )
         assert memory_result == hex_string_to_bytes_array(params["memory"])
 
+        gas_used = params.get("gas_used")
+        if gas_used:
+            assert res.result.gas_used == gas_used
+
         events = params.get("events")
         if events:
             assert [
                 [
                     event.keys,
-                    event.data,
+                    list(decode_event_data(event.data)),
                 ]
                 for event in sorted(res.call_info.events, key=lambda x: x.order)
             ] == events
@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from typing import cast
+from typing import List, cast
 
 from starkware.starknet.testing.starknet import StarknetContract
 from web3 import Web3
@@ -14,6 +14,22 @@ from tests.integration.helpers.helpers import hex_string_to_bytes_array
 from tests.utils.reporting import traceit
 
 
+# Kakarot events carry the byte size of the log data followed by its bytes packed in big endian felts
+EVENT_DATA_BYTES_PER_FELT = 31
+
+
+def decode_event_data(data: List[int]) -> bytes:
+    """
+    Recover the log data bytes from the data of a Kakarot event.
+    """
+    size, *felts = data
+    full_felts_len, remainder = divmod(size, EVENT_DATA_BYTES_PER_FELT)
+    return b"".join(
+        felt.to_bytes(EVENT_DATA_BYTES_PER_FELT, "big")
+        for felt in felts[:full_felts_len]
+    ) + (felts[full_felts_len].to_bytes(remainder, "big") if remainder else b"")
+
+
 def wrap_for_kakarot(
     contract: Contract, kakarot: StarknetContract, evm_contract_address: int
 ):
@@ -42,6 +58,7 @@ def wrap_for_kakarot(
                     calldata=hex_string_to_bytes_array(
                         contract.encodeABI(fun, args, kwargs)
                     ),
+                    access_list=[],
                 )
                 res = await call.call()
             else:
@@ -59,6 +76,7 @@ def wrap_for_kakarot(
                     calldata=hex_string_to_bytes_array(
                         contract.encodeABI(fun, args, kwargs)
                     ),
+                    access_list=[],
                 )
                 res = await call.execute(caller_address=caller_address)
             if call._traced:
@@ -82,7 +100,7 @@ def wrap_for_kakarot(
                     address=Web3.toChecksumAddress(f"{evm_contract_address:040x}"),
                     blockHash=bytes(),
                     blockNumber=bytes(),
-                    data=bytes(event.data),
+                    data=decode_event_data(event.data),
                     logIndex=log_index,
                     topic=bytes(),
                     topics=[
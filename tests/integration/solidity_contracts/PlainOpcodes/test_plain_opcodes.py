@@ -1,5 +1,3 @@
-import re
-
 import pytest
 from web3 import Web3
 
@@ -21,10 +19,8 @@ class TestPlainOpcodes:
             self,
             plain_opcodes,
         ):
-            with pytest.raises(Exception) as e:
-                await plain_opcodes.opcodeStaticCall2()
-            message = re.search(r"Error message: (.*)", e.value.message)[1]  # type: ignore
-            assert message == "Kakarot: StateModificationError"
+            success, _ = await plain_opcodes.opcodeStaticCall2()
+            assert not success
 
     class TestCall:
         async def test_should_increase_counter(
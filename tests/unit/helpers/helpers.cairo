@@ -17,9 +17,11 @@ from starkware.cairo.common.math import split_felt
 
 // Internal dependencies
 from kakarot.execution_context import ExecutionContext
+from kakarot.journal import Journal
 from kakarot.stack import Stack
 from kakarot.memory import Memory
 from kakarot.model import model
+from kakarot.jumpdest_bitmap import JumpdestBitmap
 from utils.utils import Helpers
 
 namespace TestHelpers {
@@ -33,8 +35,14 @@ namespace TestHelpers {
 
         let (calldata) = alloc();
         assert [calldata] = '';
+        let (_, valid_jumpdests) = JumpdestBitmap.compute(bytecode_len, bytecode);
         local call_context: model.CallContext* = new model.CallContext(
-            bytecode=bytecode, bytecode_len=bytecode_len, calldata=calldata, calldata_len=1, value=0
+            bytecode=bytecode,
+            bytecode_len=bytecode_len,
+            valid_jumpdests=valid_jumpdests,
+            calldata=calldata,
+            calldata_len=1,
+            value=0,
             );
         let ctx: model.ExecutionContext* = ExecutionContext.init(call_context);
         return ctx;
@@ -47,7 +55,7 @@ namespace TestHelpers {
         bitwise_ptr: BitwiseBuiltin*,
     }(bytecode_len: felt, bytecode: felt*, stack: model.Stack*) -> model.ExecutionContext* {
         let ctx: model.ExecutionContext* = init_context(bytecode_len, bytecode);
-        let ctx = ExecutionContext.update_stack(ctx, stack);
+        let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, 0);
         return ctx;
     }
 
@@ -75,8 +83,68 @@ namespace TestHelpers {
         bytecode_len: felt, bytecode: felt*, stack: model.Stack*, sub_ctx: model.ExecutionContext*
     ) -> model.ExecutionContext* {
         let ctx: model.ExecutionContext* = init_context_with_stack(bytecode_len, bytecode, stack);
-        let ctx = ExecutionContext.update_sub_context(ctx, sub_ctx);
-        return ctx;
+        return new model.ExecutionContext(
+            environment=ctx.environment,
+            program_counter=ctx.program_counter,
+            stopped=ctx.stopped,
+            return_data=ctx.return_data,
+            return_data_len=ctx.return_data_len,
+            stack=ctx.stack,
+            memory=ctx.memory,
+            gas_used=ctx.gas_used,
+            sub_context=sub_ctx,
+            reverted=ctx.reverted,
+            cold=ctx.cold,
+            );
+    }
+
+    // @notice Init an execution context called by a root context, see ExecutionContext.is_root.
+    func init_sub_context{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(
+        bytecode_len: felt, bytecode: felt*, stack: model.Stack*, read_only: felt
+    ) -> model.ExecutionContext* {
+        alloc_locals;
+        let (empty_bytecode) = alloc();
+        let calling_context = init_context(0, empty_bytecode);
+        let ctx = init_context_with_stack(bytecode_len, bytecode, stack);
+        tempvar environment = new model.Environment(
+            call_context=ctx.environment.call_context,
+            gas_limit=ctx.environment.gas_limit,
+            gas_price=0,
+            starknet_contract_address=0,
+            evm_contract_address=0,
+            calling_context=calling_context,
+            read_only=read_only,
+            ret_offset=0,
+            ret_size=0,
+            );
+        let journal = Journal.open(calling_context.cold.journal);
+        tempvar cold = new model.ColdState(
+            destroy_contracts_len=ctx.cold.destroy_contracts_len,
+            destroy_contracts=ctx.cold.destroy_contracts,
+            storage_cache=calling_context.cold.storage_cache,
+            registry_cache=calling_context.cold.registry_cache,
+            access_set=calling_context.cold.access_set,
+            keccak_segment=calling_context.cold.keccak_segment,
+            journal=journal,
+            );
+        return new model.ExecutionContext(
+            environment=environment,
+            program_counter=ctx.program_counter,
+            stopped=ctx.stopped,
+            return_data=ctx.return_data,
+            return_data_len=ctx.return_data_len,
+            stack=ctx.stack,
+            memory=ctx.memory,
+            gas_used=ctx.gas_used,
+            sub_context=ctx.sub_context,
+            reverted=ctx.reverted,
+            cold=cold,
+            );
     }
 
     func init_context_with_return_data{
@@ -129,6 +197,24 @@ namespace TestHelpers {
         return push_elements_in_range_to_stack(element, n - 1, updated_stack);
     }
 
+    // @notice Init a stack with the given values, from the bottom to the top of the stack.
+    func init_stack_with_values{range_check_ptr}(
+        values_len: felt, values: felt*
+    ) -> model.Stack* {
+        let stack = Stack.init();
+        return push_values(stack, values_len, values);
+    }
+
+    func push_values{range_check_ptr}(
+        stack: model.Stack*, values_len: felt, values: felt*
+    ) -> model.Stack* {
+        if (values_len == 0) {
+            return stack;
+        }
+        let stack = Stack.push(stack, Uint256([values], 0));
+        return push_values(stack, values_len - 1, values + 1);
+    }
+
     func assert_stack_last_element_contains_uint256{range_check_ptr}(
         stack: model.Stack*, value: Uint256
     ) {
@@ -183,7 +269,8 @@ namespace TestHelpers {
         }
 
         assert_call_context_equal(
-            execution_context_0.call_context, execution_context_1.call_context
+            execution_context_0.environment.call_context,
+            execution_context_1.environment.call_context,
         );
         assert execution_context_0.program_counter = execution_context_1.program_counter;
         assert execution_context_0.stopped = execution_context_1.stopped;
@@ -199,12 +286,13 @@ namespace TestHelpers {
         // assert execution_context_0.stack = execution_context_1.stack;
         // assert execution_context_0.memory = execution_context_1.memory;
 
-        assert execution_context_0.gas_limit = execution_context_1.gas_limit;
-        assert execution_context_0.gas_price = execution_context_1.gas_price;
-        assert execution_context_0.starknet_contract_address = execution_context_1.starknet_contract_address;
-        assert execution_context_0.evm_contract_address = execution_context_1.evm_contract_address;
+        assert execution_context_0.environment.gas_limit = execution_context_1.environment.gas_limit;
+        assert execution_context_0.environment.gas_price = execution_context_1.environment.gas_price;
+        assert execution_context_0.environment.starknet_contract_address = execution_context_1.environment.starknet_contract_address;
+        assert execution_context_0.environment.evm_contract_address = execution_context_1.environment.evm_contract_address;
         return assert_execution_context_equal(
-            execution_context_0.calling_context, execution_context_1.calling_context
+            execution_context_0.environment.calling_context,
+            execution_context_1.environment.calling_context,
         );
     }
 
@@ -229,7 +317,7 @@ namespace TestHelpers {
 
     func print_execution_context(execution_context: model.ExecutionContext*) {
         %{ print("print_execution_context") %}
-        print_call_context(execution_context.call_context);
+        print_call_context(execution_context.environment.call_context);
         %{
             print(f"{ids.execution_context.program_counter=}")
             print(f"{ids.execution_context.stopped=}")
@@ -241,10 +329,10 @@ namespace TestHelpers {
         // memory
         %{
             print(f"{ids.execution_context.gas_used=}")
-            print(f"{ids.execution_context.gas_limit=}")
-            print(f"{ids.execution_context.gas_price}")
-            print(f"{ids.execution_context.starknet_contract_address=}")
-            print(f"{ids.execution_context.evm_contract_address=}")
+            print(f"{ids.execution_context.environment.gas_limit=}")
+            print(f"{ids.execution_context.environment.gas_price}")
+            print(f"{ids.execution_context.environment.starknet_contract_address=}")
+            print(f"{ids.execution_context.environment.evm_contract_address=}")
         %}
         return ();
     }
@@ -1,6 +1,8 @@
 import random
+import re
 
 import pytest
+from Crypto.Hash import keccak
 from starkware.starknet.testing.contract import StarknetContract
 
 from tests.utils.reporting import traceit
@@ -10,7 +12,7 @@ random.seed(0)
 
 @pytest.mark.asyncio
 class TestContractAccount:
-    @pytest.mark.parametrize("bytecode_len", [0, 15, 16, 17, 30, 31, 32, 33])
+    @pytest.mark.parametrize("bytecode_len", [0, 15, 16, 17, 30, 31, 32, 33, 47, 48, 62, 63])
     async def test_should_store_code(
         self, contract_account: StarknetContract, bytecode_len
     ):
@@ -20,3 +22,53 @@ class TestContractAccount:
             await contract_account.write_bytecode(bytecode).execute(caller_address=1)
         stored_bytecode = (await contract_account.bytecode().call()).result.bytecode
         assert stored_bytecode == bytecode
+
+    @pytest.mark.parametrize("bytecode_len", [0, 31, 32])
+    async def test_should_store_code_len_and_hash(
+        self, contract_account: StarknetContract, bytecode_len
+    ):
+        bytecode = [random.randint(0, 255) for _ in range(bytecode_len)]
+        keccak_hash = keccak.new(digest_bits=256)
+        keccak_hash.update(bytearray(bytecode))
+        expected_hash = int.from_bytes(keccak_hash.digest(), byteorder="big")
+
+        await contract_account.write_bytecode(bytecode).execute(caller_address=1)
+        stored_len = (await contract_account.bytecode_len().call()).result.len
+        assert stored_len == bytecode_len
+        code_hash = (await contract_account.code_hash().call()).result.code_hash
+        assert code_hash.low + (code_hash.high << 128) == expected_hash
+
+    async def test_should_store_valid_jumpdests(
+        self, contract_account: StarknetContract
+    ):
+        # PUSH1 0x5b JUMPDEST, the first 0x5b is push data
+        bytecode = [0x60, 0x5B, 0x5B]
+
+        await contract_account.write_bytecode(bytecode).execute(caller_address=1)
+        result = (await contract_account.bytecode_with_valid_jumpdests().call()).result
+        assert result.bytecode == bytecode
+        assert result.valid_jumpdests == [0b100]
+        valid_jumpdests = (await contract_account.valid_jumpdests().call()).result
+        assert valid_jumpdests.valid_jumpdests == [0b100]
+
+    async def test_should_write_and_read_storage_batch(
+        self, contract_account: StarknetContract
+    ):
+        keys = [(1, 0), (2, 0), (0, 1)]
+        values = [(10, 0), (0, 20), (30, 40)]
+
+        await contract_account.write_storage_batch(keys, values).execute(
+            caller_address=1
+        )
+        stored_values = (await contract_account.storage_batch(keys).call()).result.values
+        assert [(value.low, value.high) for value in stored_values] == values
+
+    async def test_should_fail_write_storage_batch_with_different_lengths(
+        self, contract_account: StarknetContract
+    ):
+        with pytest.raises(Exception) as e:
+            await contract_account.write_storage_batch([(1, 0)], []).execute(
+                caller_address=1
+            )
+        message = re.search(r"Error message: (.*)", e.value.message)[1]  # type: ignore
+        assert message == "Kakarot: keys and values must have the same length"
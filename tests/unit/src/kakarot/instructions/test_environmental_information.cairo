@@ -12,8 +12,13 @@ from starkware.cairo.common.math import split_felt
 // Local dependencies
 from utils.utils import Helpers
 from kakarot.model import model
+from kakarot.jumpdest_bitmap import JumpdestBitmap
 from kakarot.interfaces.interfaces import IKakarot
 from kakarot.stack import Stack
+from kakarot.journal import Journal
+from kakarot.access_set import AccessSet
+from kakarot.registry_cache import RegistryCache
+from kakarot.storage_cache import StorageCache
 from kakarot.memory import Memory
 from kakarot.constants import Constants, registry_address, evm_contract_class_hash
 from kakarot.execution_context import ExecutionContext
@@ -32,8 +37,14 @@ func init_context{
     tempvar bytecode_len = 1;
     let (calldata) = alloc();
     assert [calldata] = '';
+    let (_, valid_jumpdests) = JumpdestBitmap.compute(bytecode_len, bytecode);
     local call_context: model.CallContext* = new model.CallContext(
-        bytecode=bytecode, bytecode_len=bytecode_len, calldata=calldata, calldata_len=1, value=0
+        bytecode=bytecode,
+        bytecode_len=bytecode_len,
+        valid_jumpdests=valid_jumpdests,
+        calldata=calldata,
+        calldata_len=1,
+        value=0,
         );
 
     // Initialize ExecutionContext
@@ -41,12 +52,37 @@ func init_context{
     let (empty_destroy_contracts: felt*) = alloc();
     let stack: model.Stack* = Stack.init();
     let memory: model.Memory* = Memory.init();
+    let storage_cache: model.StorageCache* = StorageCache.init();
+    let registry_cache: model.RegistryCache* = RegistryCache.init();
+    let access_set: model.AccessSet* = AccessSet.init();
+    let keccak_segment: model.KeccakSegment* = ExecutionContext.init_keccak_segment();
+    let journal: model.Journal* = Journal.init();
     let gas_limit = Constants.TRANSACTION_GAS_LIMIT;
     let calling_context = ExecutionContext.init_empty();
     let sub_context = ExecutionContext.init_empty();
 
-    local ctx: model.ExecutionContext* = new model.ExecutionContext(
+    tempvar environment = new model.Environment(
         call_context=call_context,
+        gas_limit=gas_limit,
+        gas_price=0,
+        starknet_contract_address=0,
+        evm_contract_address=420,
+        calling_context=calling_context,
+        read_only=FALSE,
+        ret_offset=0,
+        ret_size=0,
+        );
+    tempvar cold = new model.ColdState(
+        destroy_contracts_len=0,
+        destroy_contracts=empty_destroy_contracts,
+        storage_cache=storage_cache,
+        registry_cache=registry_cache,
+        access_set=access_set,
+        keccak_segment=keccak_segment,
+        journal=journal,
+        );
+    local ctx: model.ExecutionContext* = new model.ExecutionContext(
+        environment=environment,
         program_counter=0,
         stopped=FALSE,
         return_data=empty_return_data,
@@ -54,15 +90,9 @@ func init_context{
         stack=stack,
         memory=memory,
         gas_used=0,
-        gas_limit=gas_limit,
-        gas_price=0,
-        starknet_contract_address=0,
-        evm_contract_address=420,
-        calling_context=calling_context,
         sub_context=sub_context,
-        destroy_contracts_len=0,
-        destroy_contracts=empty_destroy_contracts,
-        read_only=FALSE,
+        reverted=FALSE,
+        cold=cold,
         );
     return ctx;
 }
@@ -106,7 +136,7 @@ func test__exec_extcodesize__should_handle_address_with_no_code{
         bytecode_len, bytecode, stack
     );
 
-    // we are hardcoding an assumption of 'cold' address access, for now.
+    // The address has not been accessed yet, hence is cold
     let expected_gas = 2600;
 
     // When
@@ -122,6 +152,40 @@ func test__exec_extcodesize__should_handle_address_with_no_code{
     return ();
 }
 
+@external
+func test__exec_extcodesize__should_charge_warm_access_once_the_address_is_accessed{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(account_registry_address: felt) {
+    // Given
+    alloc_locals;
+
+    registry_address.write(account_registry_address);
+
+    let bytecode_len = 0;
+    let (bytecode) = alloc();
+    let address = Uint256(0xDEAD, 0);
+    let stack = Stack.init();
+    let stack = Stack.push(stack, address);
+    let stack = Stack.push(stack, address);
+
+    let ctx: model.ExecutionContext* = TestHelpers.init_context_with_stack(
+        bytecode_len, bytecode, stack
+    );
+    let ctx = EnvironmentalInformation.exec_extcodesize(ctx);
+    let (stack, _) = Stack.pop(ctx.stack);
+    let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, 0);
+    local gas_used_before = ctx.gas_used;
+
+    // When
+    let ctx = EnvironmentalInformation.exec_extcodesize(ctx);
+
+    // Then
+    assert gas_used_before = AccessSet.GAS_COST_COLD_ADDRESS_ACCESS;
+    assert ctx.gas_used - gas_used_before = AccessSet.GAS_COST_WARM_ACCESS;
+
+    return ();
+}
+
 @external
 func test__exec_extcodecopy__should_handle_address_with_code{
     syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
@@ -147,7 +211,7 @@ func test__exec_extcodecopy__should_handle_address_with_code{
 
     let ctx: model.ExecutionContext* = TestHelpers.init_context_with_stack(0, bytecode, stack);
 
-    // we are hardcoding an assumption of 'cold' address access, for now.
+    // The address has not been accessed yet, hence is cold
     let address_access_cost = 2600;
     let (minimum_word_size) = Helpers.minimum_word_count(size);
     let (_, memory_expansion_cost) = Memory.ensure_length(
@@ -186,7 +250,7 @@ func test__exec_extcodecopy__should_handle_address_with_no_code{
 
     let ctx: model.ExecutionContext* = TestHelpers.init_context_with_stack(0, bytecode, stack);
 
-    // we are hardcoding an assumption of 'cold' address access, for now.
+    // The address has not been accessed yet, hence is cold
     // but the dynamic gas values of  `minimum_word_size` and `memory_expansion_cost`
     // are being tested
     let expected_gas = 2609;
@@ -224,8 +288,14 @@ func test__exec_gasprice{
     let expected_gas_price_uint256 = Helpers.to_uint256(expected_gas_price_felt);
 
     // When
+    let (_, valid_jumpdests) = JumpdestBitmap.compute(bytecode_len, bytecode);
     local call_context: model.CallContext* = new model.CallContext(
-        bytecode=bytecode, bytecode_len=bytecode_len, calldata=calldata, calldata_len=calldata_len, value=0
+        bytecode=bytecode,
+        bytecode_len=bytecode_len,
+        valid_jumpdests=valid_jumpdests,
+        calldata=calldata,
+        calldata_len=calldata_len,
+        value=0,
         );
     let ctx: model.ExecutionContext* = ExecutionContext.init(call_context);
     let result = EnvironmentalInformation.exec_gasprice(ctx);
@@ -248,8 +318,7 @@ func test__returndatacopy{
     let (bytecode) = alloc();
     let (return_data) = alloc();
     let return_data_len: felt = 32;
-    // filling at return_data + 1 because first first felt is return_data offset
-    TestHelpers.array_fill(return_data + 1, return_data_len, 0xFF);
+    TestHelpers.array_fill(return_data, return_data_len, 0xFF);
     let child_ctx: model.ExecutionContext* = TestHelpers.init_context_with_return_data(
         0, bytecode, return_data_len, return_data
     );
@@ -274,15 +343,17 @@ func test__returndatacopy{
     assert_uint256_eq(
         data, Uint256(0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF, 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF)
     );
-    assert result.gas_used = 3;
+    assert result.gas_used = 9;
 
     // Pushing parameters for another RETURNDATACOPY
     let stack: model.Stack* = Stack.init();
     let stack: model.Stack* = Stack.push(stack, Uint256(1, 0));
     let stack: model.Stack* = Stack.push(stack, Uint256(31, 0));
     let stack: model.Stack* = Stack.push(stack, Uint256(32, 0));
-    let ctx: model.ExecutionContext* = ExecutionContext.update_stack(result, stack);
-    let ctx: model.ExecutionContext* = ExecutionContext.update_memory(ctx, memory);
+    let ctx: model.ExecutionContext* = ExecutionContext.apply_changes(
+        result, stack, result.memory, 0, 0
+    );
+    let ctx: model.ExecutionContext* = ExecutionContext.apply_changes(ctx, ctx.stack, memory, 0, 0);
 
     // When
     let result: model.ExecutionContext* = EnvironmentalInformation.exec_returndatacopy(ctx);
@@ -32,6 +32,15 @@ class TestEnvironmentalInformation:
             account_registry_address=account_registry.contract_address
         ).call()
 
+    async def test_extcodesize_should_charge_warm_access_once_the_address_is_accessed(
+        self,
+        environmental_information,
+        account_registry,
+    ):
+        await environmental_information.test__exec_extcodesize__should_charge_warm_access_once_the_address_is_accessed(
+            account_registry_address=account_registry.contract_address
+        ).call()
+
     async def test_extcodecopy_should_handle_address_with_no_code(
         self,
         environmental_information,
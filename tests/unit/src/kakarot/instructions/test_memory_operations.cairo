@@ -25,7 +25,7 @@ func test__exec_pc__should_update_after_incrementing{
 
     let (bytecode) = alloc();
     let ctx: model.ExecutionContext* = TestHelpers.init_context(0, bytecode);
-    let ctx = ExecutionContext.increment_program_counter(ctx, increment);
+    let ctx = ExecutionContext.apply_changes(ctx, ctx.stack, ctx.memory, increment, 0);
 
     // When
     let result = MemoryOperations.exec_pc(ctx);
@@ -52,7 +52,7 @@ func test__exec_pop_should_pop_an_item_from_execution_context{
 
     let stack: model.Stack* = Stack.push(stack, Uint256(1, 0));
     let stack: model.Stack* = Stack.push(stack, Uint256(2, 0));
-    let ctx = ExecutionContext.update_stack(ctx, stack);
+    let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, 0);
 
     // When
     let result = MemoryOperations.exec_pop(ctx);
@@ -79,10 +79,10 @@ func test__exec_mload_should_load_a_value_from_memory{
 
     let stack: model.Stack* = Stack.push(stack, Uint256(1, 0));
     let stack: model.Stack* = Stack.push(stack, Uint256(0, 0));
-    let ctx = ExecutionContext.update_stack(ctx, stack);
+    let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, 0);
     let ctx = MemoryOperations.exec_mstore(ctx);
     let stack: model.Stack* = Stack.push(ctx.stack, Uint256(0, 0));
-    let ctx = ExecutionContext.update_stack(ctx, stack);
+    let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, 0);
 
     // When
     local gas_used_before = ctx.gas_used;
@@ -112,10 +112,10 @@ func test__exec_mload_should_load_a_value_from_memory_with_memory_expansion{
 
     let stack: model.Stack* = Stack.push(stack, Uint256(1, 0));
     let stack: model.Stack* = Stack.push(stack, Uint256(0, 0));
-    let ctx = ExecutionContext.update_stack(ctx, stack);
+    let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, 0);
     let ctx = MemoryOperations.exec_mstore(ctx);
     let stack: model.Stack* = Stack.push(ctx.stack, Uint256(test_offset, 0));
-    let ctx = ExecutionContext.update_stack(ctx, stack);
+    let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, 0);
 
     // When
     local gas_used_before = ctx.gas_used;
@@ -146,16 +146,16 @@ func test__exec_mload_should_load_a_value_from_memory_with_offset_larger_than_ms
 
     let stack: model.Stack* = Stack.push(stack, Uint256(1, 0));
     let stack: model.Stack* = Stack.push(stack, Uint256(0, 0));
-    let ctx = ExecutionContext.update_stack(ctx, stack);
+    let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, 0);
     let ctx = MemoryOperations.exec_mstore(ctx);
     let stack: model.Stack* = Stack.push(ctx.stack, Uint256(test_offset, 0));
-    let ctx = ExecutionContext.update_stack(ctx, stack);
+    let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, 0);
 
     // When
     let result = MemoryOperations.exec_mload(ctx);
 
     // Then
-    assert result.gas_used = 73;
+    assert result.gas_used = 76;
     let len: felt = result.stack.len_16bytes / 2;
     assert len = 1;
     let (stack, index0) = Stack.peek(result.stack, 0);
@@ -175,7 +175,7 @@ func test__exec_gas_should_return_remaining_gas{
     // Given
     let stack: model.Stack* = Stack.init();
 
-    let ctx = ExecutionContext.update_stack(ctx, stack);
+    let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, 0);
 
     // When
     local gas_used_before = ctx.gas_used;
@@ -0,0 +1,53 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.uint256 import Uint256, assert_uint256_eq
+
+// Local dependencies
+from kakarot.model import model
+from kakarot.stack import Stack
+from kakarot.execution_context import ExecutionContext
+from kakarot.instructions.memory_operations import MemoryOperations
+from kakarot.instructions.sha3 import Sha3
+from tests.unit.helpers.helpers import TestHelpers
+
+@external
+func test__exec_sha3__should_reuse_the_hash_of_a_repeated_input{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(offset: felt, size: felt, expected_low: felt, expected_high: felt) {
+    // Given
+    alloc_locals;
+    let stack: model.Stack* = Stack.init();
+    let stack = Stack.push(
+        stack, Uint256(0x2122232425262728292a2b2c2d2e2f30, 0x1112131415161718191a1b1c1d1e1f20)
+    );
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let (bytecode) = alloc();
+    let ctx = TestHelpers.init_context_with_stack(0, bytecode, stack);
+    let ctx = MemoryOperations.exec_mstore(ctx);
+
+    // When
+    let stack = Stack.push(ctx.stack, Uint256(size, 0));
+    let stack = Stack.push(stack, Uint256(offset, 0));
+    let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, 0);
+    let ctx = Sha3.exec_sha3(ctx);
+    let (stack, first_hash) = Stack.peek(ctx.stack, 0);
+    local keccak_ptr: felt* = ctx.cold.keccak_segment.keccak_ptr;
+
+    let stack = Stack.push(ctx.stack, Uint256(size, 0));
+    let stack = Stack.push(stack, Uint256(offset, 0));
+    let ctx = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, 0);
+    let ctx = Sha3.exec_sha3(ctx);
+    let (stack, second_hash) = Stack.peek(ctx.stack, 0);
+
+    // Then
+    assert_uint256_eq(first_hash, Uint256(expected_low, expected_high));
+    assert_uint256_eq(second_hash, first_hash);
+    assert ctx.cold.keccak_segment.keccak_ptr = keccak_ptr;
+    ExecutionContext.finalize_keccak_segment(ctx);
+    return ();
+}
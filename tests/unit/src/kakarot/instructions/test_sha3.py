@@ -0,0 +1,32 @@
+import pytest
+import pytest_asyncio
+from Crypto.Hash import keccak
+from starkware.starknet.testing.starknet import Starknet
+
+MEMORY = bytes.fromhex(
+    "1112131415161718191a1b1c1d1e1f202122232425262728292a2b2c2d2e2f30"
+)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def sha3(starknet: Starknet):
+    return await starknet.deploy(
+        source="./tests/unit/src/kakarot/instructions/test_sha3.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+    )
+
+
+@pytest.mark.asyncio
+class TestSha3:
+    @pytest.mark.parametrize("offset, size", [(0, 0), (0, 32), (3, 7), (5, 20), (16, 30)])
+    async def test_should_reuse_the_hash_of_a_repeated_input(
+        self, sha3, offset, size
+    ):
+        data = (MEMORY + bytes(64))[offset : offset + size]
+        expected = int.from_bytes(
+            keccak.new(data=data, digest_bits=256).digest(), "big"
+        )
+        await sha3.test__exec_sha3__should_reuse_the_hash_of_a_repeated_input(
+            offset, size, expected % 2**128, expected >> 128
+        ).call()
@@ -282,7 +282,7 @@ func test__exec_exp__should_exp_0_and_1{
     let result = StopAndArithmeticOperations.exec_exp(ctx);
 
     // Then
-    assert result.gas_used = 10;
+    assert result.gas_used = 60;
     let len: felt = result.stack.len_16bytes / 2;
     assert len = 2;
     let (stack, index0) = Stack.peek(result.stack, 0);
@@ -4,7 +4,9 @@
 
 // Starkware dependencies
 from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bool import FALSE, TRUE
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.cairo_keccak.keccak import finalize_keccak
 from starkware.cairo.common.uint256 import Uint256
 from starkware.starknet.common.syscalls import deploy
 from starkware.cairo.common.math import split_felt, assert_not_zero, assert_le
@@ -22,10 +24,13 @@ from kakarot.instructions.system_operations import (
     SelfDestructHelper,
 )
 from kakarot.interfaces.interfaces import IEvmContract, IKakarot, IRegistry
+from kakarot.journal import Journal
 from kakarot.library import Kakarot
 from kakarot.model import model
+from kakarot.jumpdest_bitmap import JumpdestBitmap
 from kakarot.stack import Stack
 from kakarot.memory import Memory
+from kakarot.storage_cache import StorageCache
 from tests.unit.helpers.helpers import TestHelpers
 from utils.utils import Helpers
 
@@ -47,7 +52,7 @@ func test__exec_return_should_return_context_with_updated_return_data{
     // Then
     let stack: model.Stack* = Stack.push(ctx.stack, Uint256(32, 0));
     let stack: model.Stack* = Stack.push(stack, Uint256(0, 0));
-    let ctx: model.ExecutionContext* = ExecutionContext.update_stack(ctx, stack);
+    let ctx: model.ExecutionContext* = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, 0);
     let ctx: model.ExecutionContext* = SystemOperations.exec_return(ctx);
 
     // Then
@@ -76,7 +81,7 @@ func test__exec_revert{
     // Then
     let stack: model.Stack* = Stack.push(ctx.stack, Uint256(32, 0));
     let stack: model.Stack* = Stack.push(stack, Uint256(0, 0));
-    let ctx: model.ExecutionContext* = ExecutionContext.update_stack(ctx, stack);
+    let ctx: model.ExecutionContext* = ExecutionContext.apply_changes(ctx, stack, ctx.memory, 0, 0);
     SystemOperations.exec_revert(ctx);
     return ();
 }
@@ -124,24 +129,25 @@ func test__exec_call__should_return_a_new_context_based_on_calling_ctx_stack{
     let sub_ctx = SystemOperations.exec_call(ctx);
 
     // Then
-    assert sub_ctx.call_context.bytecode_len = bytecode_len;
-    assert sub_ctx.call_context.calldata_len = 4;
-    assert [sub_ctx.call_context.calldata] = 0x44;
-    assert [sub_ctx.call_context.calldata + 1] = 0x55;
-    assert [sub_ctx.call_context.calldata + 2] = 0x66;
-    assert [sub_ctx.call_context.calldata + 3] = 0x77;
-    assert sub_ctx.call_context.value = value.low;
+    assert sub_ctx.environment.call_context.bytecode_len = bytecode_len;
+    assert sub_ctx.environment.call_context.calldata_len = 4;
+    assert [sub_ctx.environment.call_context.calldata] = 0x44;
+    assert [sub_ctx.environment.call_context.calldata + 1] = 0x55;
+    assert [sub_ctx.environment.call_context.calldata + 2] = 0x66;
+    assert [sub_ctx.environment.call_context.calldata + 3] = 0x77;
+    assert sub_ctx.environment.call_context.value = value.low;
     assert sub_ctx.program_counter = 0;
     assert sub_ctx.stopped = 0;
-    assert sub_ctx.return_data_len = ret_size.low;
-    assert [sub_ctx.return_data] = ret_offset.low;
+    assert sub_ctx.return_data_len = 0;
+    assert sub_ctx.environment.ret_offset = ret_offset.low;
+    assert sub_ctx.environment.ret_size = ret_size.low;
     assert sub_ctx.gas_used = 0;
     let (gas_felt, _) = Helpers.div_rem(Constants.TRANSACTION_GAS_LIMIT, 64);
-    assert_le(sub_ctx.gas_limit, gas_felt);
-    assert sub_ctx.gas_price = 0;
-    assert sub_ctx.starknet_contract_address = starknet_contract_address;
-    assert sub_ctx.evm_contract_address = evm_contract_address;
-    TestHelpers.assert_execution_context_equal(sub_ctx.calling_context, ctx);
+    assert_le(sub_ctx.environment.gas_limit, gas_felt);
+    assert sub_ctx.environment.gas_price = 0;
+    assert sub_ctx.environment.starknet_contract_address = starknet_contract_address;
+    assert sub_ctx.environment.evm_contract_address = evm_contract_address;
+    TestHelpers.assert_execution_context_equal(sub_ctx.environment.calling_context, ctx);
 
     // Fake a RETURN in sub_ctx then teardow, see note in evm.codes:
     // If the size of the return data is not known, it can also be retrieved after the call with
@@ -158,6 +164,162 @@ func test__exec_call__should_return_a_new_context_based_on_calling_ctx_stack{
     return ();
 }
 
+@external
+func test__exec_call__should_undo_the_storage_changes_of_a_reverted_sub_context{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(evm_contract_class_hash_: felt, registry_address_: felt) {
+    // Deploy an empty contract
+    alloc_locals;
+    let (bytecode) = alloc();
+    evm_contract_class_hash.write(evm_contract_class_hash_);
+    registry_address.write(registry_address_);
+    let (local evm_contract_address, local starknet_contract_address) = ContractAccount.deploy(0);
+
+    // Call it with ret_offset 5 and ret_size 32
+    let stack: model.Stack* = Stack.init();
+    let gas = Helpers.to_uint256(Constants.TRANSACTION_GAS_LIMIT);
+    let (address_high, address_low) = split_felt(evm_contract_address);
+    let stack = Stack.push(stack, Uint256(32, 0));
+    let stack = Stack.push(stack, Uint256(5, 0));
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let stack = Stack.push(stack, Uint256(address_low, address_high));
+    let stack = Stack.push(stack, gas);
+    let ctx = TestHelpers.init_context_with_stack(0, bytecode, stack);
+    let sub_ctx = SystemOperations.exec_call(ctx);
+
+    // Store 2 at key 1, then revert with the word 3
+    let key = Uint256(1, 0);
+    let stack = Stack.push(sub_ctx.stack, Uint256(2, 0));
+    let stack = Stack.push(stack, key);
+    let sub_ctx = ExecutionContext.apply_changes(sub_ctx, stack, sub_ctx.memory, 0, 0);
+    let sub_ctx = MemoryOperations.exec_sstore(sub_ctx);
+    let stack = Stack.push(sub_ctx.stack, Uint256(3, 0));
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let sub_ctx = ExecutionContext.apply_changes(sub_ctx, stack, sub_ctx.memory, 0, 0);
+    let sub_ctx = MemoryOperations.exec_mstore(sub_ctx);
+    let stack = Stack.push(sub_ctx.stack, Uint256(32, 0));
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let sub_ctx = ExecutionContext.apply_changes(sub_ctx, stack, sub_ctx.memory, 0, 0);
+
+    // When
+    let sub_ctx = SystemOperations.exec_revert(sub_ctx);
+    let ctx = CallHelper.finalize_calling_context(sub_ctx);
+
+    // Then
+    assert sub_ctx.reverted = 1;
+    let (stack, success) = Stack.peek(ctx.stack, 0);
+    assert success = Uint256(0, 0);
+    let (memory, returned_data, _) = Memory.load(ctx.memory, 5);
+    assert returned_data = Uint256(3, 0);
+    let (storage_cache, value) = StorageCache.read(
+        ctx.cold.storage_cache, starknet_contract_address, key
+    );
+    assert value = Uint256(0, 0);
+    assert ctx.cold.journal.head = ctx.cold.journal.checkpoint;
+
+    return ();
+}
+
+@external
+func test__exec_call__should_write_the_returned_data_truncated_to_ret_size{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(evm_contract_class_hash_: felt, registry_address_: felt) {
+    // Deploy an empty contract
+    alloc_locals;
+    let (bytecode) = alloc();
+    evm_contract_class_hash.write(evm_contract_class_hash_);
+    registry_address.write(registry_address_);
+    let (local evm_contract_address, _) = ContractAccount.deploy(0);
+
+    // Call it with ret_offset 5 and ret_size 1
+    let stack: model.Stack* = Stack.init();
+    let gas = Helpers.to_uint256(Constants.TRANSACTION_GAS_LIMIT);
+    let (address_high, address_low) = split_felt(evm_contract_address);
+    let stack = Stack.push(stack, Uint256(1, 0));
+    let stack = Stack.push(stack, Uint256(5, 0));
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let stack = Stack.push(stack, Uint256(address_low, address_high));
+    let stack = Stack.push(stack, gas);
+    let ctx = TestHelpers.init_context_with_stack(0, bytecode, stack);
+    let sub_ctx = SystemOperations.exec_call(ctx);
+
+    // Return the word 0x11 00 ... 00
+    let stack = Stack.push(sub_ctx.stack, Uint256(0, 0x11000000000000000000000000000000));
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let sub_ctx = ExecutionContext.apply_changes(sub_ctx, stack, sub_ctx.memory, 0, 0);
+    let sub_ctx = MemoryOperations.exec_mstore(sub_ctx);
+    let stack = Stack.push(sub_ctx.stack, Uint256(32, 0));
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let sub_ctx = ExecutionContext.apply_changes(sub_ctx, stack, sub_ctx.memory, 0, 0);
+
+    // When
+    let sub_ctx = SystemOperations.exec_return(sub_ctx);
+    let ctx = CallHelper.finalize_calling_context(sub_ctx);
+
+    // Then
+    let (stack, success) = Stack.peek(ctx.stack, 0);
+    assert success = Uint256(1, 0);
+    let (memory, returned_data, _) = Memory.load(ctx.memory, 5);
+    assert returned_data = Uint256(0, 0x11000000000000000000000000000000);
+    assert ctx.sub_context.return_data_len = 32;
+
+    return ();
+}
+
+@view
+func test__prepare_args__should_charge_the_value_sent_to_an_empty_account{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(
+    eth_address: felt,
+    evm_contract_class_hash_: felt,
+    registry_address_: felt,
+    address: felt,
+    value: felt,
+    transfers_value: felt,
+    deploy: felt,
+) -> (gas_used: felt) {
+    alloc_locals;
+    native_token_address.write(eth_address);
+    evm_contract_class_hash.write(evm_contract_class_hash_);
+    registry_address.write(registry_address_);
+    if (deploy != FALSE) {
+        ContractAccount.deploy(address);
+        tempvar syscall_ptr = syscall_ptr;
+        tempvar pedersen_ptr = pedersen_ptr;
+        tempvar range_check_ptr = range_check_ptr;
+        tempvar bitwise_ptr = bitwise_ptr;
+    } else {
+        tempvar syscall_ptr = syscall_ptr;
+        tempvar pedersen_ptr = pedersen_ptr;
+        tempvar range_check_ptr = range_check_ptr;
+        tempvar bitwise_ptr = bitwise_ptr;
+    }
+
+    // Call the address with no calldata nor returned data
+    let stack: model.Stack* = Stack.init();
+    let gas = Helpers.to_uint256(Constants.TRANSACTION_GAS_LIMIT);
+    let (address_high, address_low) = split_felt(address);
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let stack = Stack.push(stack, Uint256(value, 0));
+    let stack = Stack.push(stack, Uint256(address_low, address_high));
+    let stack = Stack.push(stack, gas);
+    let (bytecode) = alloc();
+    let ctx = TestHelpers.init_context_with_stack(0, bytecode, stack);
+
+    // When
+    let (ctx, _) = CallHelper.prepare_args(ctx, with_value=TRUE, transfers_value=transfers_value);
+
+    // Then
+    return (gas_used=ctx.gas_used);
+}
+
 @external
 func test__exec_callcode__should_return_a_new_context_based_on_calling_ctx_stack{
     syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
@@ -201,24 +363,25 @@ func test__exec_callcode__should_return_a_new_context_based_on_calling_ctx_stack
     let sub_ctx = SystemOperations.exec_callcode(ctx);
 
     // Then
-    assert sub_ctx.call_context.bytecode_len = 0;
-    assert sub_ctx.call_context.calldata_len = 4;
-    assert [sub_ctx.call_context.calldata] = 0x44;
-    assert [sub_ctx.call_context.calldata + 1] = 0x55;
-    assert [sub_ctx.call_context.calldata + 2] = 0x66;
-    assert [sub_ctx.call_context.calldata + 3] = 0x77;
-    assert sub_ctx.call_context.value = value.low;
+    assert sub_ctx.environment.call_context.bytecode_len = 0;
+    assert sub_ctx.environment.call_context.calldata_len = 4;
+    assert [sub_ctx.environment.call_context.calldata] = 0x44;
+    assert [sub_ctx.environment.call_context.calldata + 1] = 0x55;
+    assert [sub_ctx.environment.call_context.calldata + 2] = 0x66;
+    assert [sub_ctx.environment.call_context.calldata + 3] = 0x77;
+    assert sub_ctx.environment.call_context.value = value.low;
     assert sub_ctx.program_counter = 0;
     assert sub_ctx.stopped = 0;
-    assert sub_ctx.return_data_len = ret_size.low;
-    assert [sub_ctx.return_data] = ret_offset.low;
+    assert sub_ctx.return_data_len = 0;
+    assert sub_ctx.environment.ret_offset = ret_offset.low;
+    assert sub_ctx.environment.ret_size = ret_size.low;
     assert sub_ctx.gas_used = 0;
     let (gas_felt, _) = Helpers.div_rem(Constants.TRANSACTION_GAS_LIMIT, 64);
-    assert_le(sub_ctx.gas_limit, gas_felt);
-    assert sub_ctx.gas_price = 0;
-    assert sub_ctx.starknet_contract_address = ctx.starknet_contract_address;
-    assert sub_ctx.evm_contract_address = ctx.evm_contract_address;
-    TestHelpers.assert_execution_context_equal(sub_ctx.calling_context, ctx);
+    assert_le(sub_ctx.environment.gas_limit, gas_felt);
+    assert sub_ctx.environment.gas_price = 0;
+    assert sub_ctx.environment.starknet_contract_address = ctx.environment.starknet_contract_address;
+    assert sub_ctx.environment.evm_contract_address = ctx.environment.evm_contract_address;
+    TestHelpers.assert_execution_context_equal(sub_ctx.environment.calling_context, ctx);
 
     // Fake a RETURN in sub_ctx then teardow, see note in evm.codes:
     // If the size of the return data is not known, it can also be retrieved after the call with
@@ -276,24 +439,25 @@ func test__exec_staticcall__should_return_a_new_context_based_on_calling_ctx_sta
     let sub_ctx = SystemOperations.exec_staticcall(ctx);
 
     // Then
-    assert sub_ctx.call_context.bytecode_len = 0;
-    assert sub_ctx.call_context.calldata_len = 4;
-    assert [sub_ctx.call_context.calldata] = 0x44;
-    assert [sub_ctx.call_context.calldata + 1] = 0x55;
-    assert [sub_ctx.call_context.calldata + 2] = 0x66;
-    assert [sub_ctx.call_context.calldata + 3] = 0x77;
-    assert sub_ctx.call_context.value = 0;
+    assert sub_ctx.environment.call_context.bytecode_len = 0;
+    assert sub_ctx.environment.call_context.calldata_len = 4;
+    assert [sub_ctx.environment.call_context.calldata] = 0x44;
+    assert [sub_ctx.environment.call_context.calldata + 1] = 0x55;
+    assert [sub_ctx.environment.call_context.calldata + 2] = 0x66;
+    assert [sub_ctx.environment.call_context.calldata + 3] = 0x77;
+    assert sub_ctx.environment.call_context.value = 0;
     assert sub_ctx.program_counter = 0;
     assert sub_ctx.stopped = 0;
-    assert sub_ctx.return_data_len = ret_size.low;
-    assert [sub_ctx.return_data] = ret_offset.low;
+    assert sub_ctx.return_data_len = 0;
+    assert sub_ctx.environment.ret_offset = ret_offset.low;
+    assert sub_ctx.environment.ret_size = ret_size.low;
     assert sub_ctx.gas_used = 0;
     let (gas_felt, _) = Helpers.div_rem(Constants.TRANSACTION_GAS_LIMIT, 64);
-    assert_le(sub_ctx.gas_limit, gas_felt);
-    assert sub_ctx.gas_price = 0;
-    assert sub_ctx.starknet_contract_address = starknet_contract_address;
-    assert sub_ctx.evm_contract_address = evm_contract_address;
-    TestHelpers.assert_execution_context_equal(sub_ctx.calling_context, ctx);
+    assert_le(sub_ctx.environment.gas_limit, gas_felt);
+    assert sub_ctx.environment.gas_price = 0;
+    assert sub_ctx.environment.starknet_contract_address = starknet_contract_address;
+    assert sub_ctx.environment.evm_contract_address = evm_contract_address;
+    TestHelpers.assert_execution_context_equal(sub_ctx.environment.calling_context, ctx);
 
     // Fake a RETURN in sub_ctx then teardow, see note in evm.codes:
     // If the size of the return data is not known, it can also be retrieved after the call with
@@ -351,24 +515,25 @@ func test__exec_delegatecall__should_return_a_new_context_based_on_calling_ctx_s
     let sub_ctx = SystemOperations.exec_delegatecall(ctx);
 
     // Then
-    assert sub_ctx.call_context.bytecode_len = 0;
-    assert sub_ctx.call_context.calldata_len = 4;
-    assert [sub_ctx.call_context.calldata] = 0x44;
-    assert [sub_ctx.call_context.calldata + 1] = 0x55;
-    assert [sub_ctx.call_context.calldata + 2] = 0x66;
-    assert [sub_ctx.call_context.calldata + 3] = 0x77;
-    assert sub_ctx.call_context.value = 0;
+    assert sub_ctx.environment.call_context.bytecode_len = 0;
+    assert sub_ctx.environment.call_context.calldata_len = 4;
+    assert [sub_ctx.environment.call_context.calldata] = 0x44;
+    assert [sub_ctx.environment.call_context.calldata + 1] = 0x55;
+    assert [sub_ctx.environment.call_context.calldata + 2] = 0x66;
+    assert [sub_ctx.environment.call_context.calldata + 3] = 0x77;
+    assert sub_ctx.environment.call_context.value = 0;
     assert sub_ctx.program_counter = 0;
     assert sub_ctx.stopped = 0;
-    assert sub_ctx.return_data_len = ret_size.low;
-    assert [sub_ctx.return_data] = ret_offset.low;
+    assert sub_ctx.return_data_len = 0;
+    assert sub_ctx.environment.ret_offset = ret_offset.low;
+    assert sub_ctx.environment.ret_size = ret_size.low;
     assert sub_ctx.gas_used = 0;
     let (gas_felt, _) = Helpers.div_rem(Constants.TRANSACTION_GAS_LIMIT, 64);
-    assert_le(sub_ctx.gas_limit, gas_felt);
-    assert sub_ctx.gas_price = 0;
-    assert sub_ctx.starknet_contract_address = ctx.starknet_contract_address;
-    assert sub_ctx.evm_contract_address = ctx.evm_contract_address;
-    TestHelpers.assert_execution_context_equal(sub_ctx.calling_context, ctx);
+    assert_le(sub_ctx.environment.gas_limit, gas_felt);
+    assert sub_ctx.environment.gas_price = 0;
+    assert sub_ctx.environment.starknet_contract_address = ctx.environment.starknet_contract_address;
+    assert sub_ctx.environment.evm_contract_address = ctx.environment.evm_contract_address;
+    TestHelpers.assert_execution_context_equal(sub_ctx.environment.calling_context, ctx);
 
     // Fake a RETURN in sub_ctx then teardow, see note in evm.codes:
     // If the size of the return data is not known, it can also be retrieved after the call with
@@ -388,7 +553,7 @@ func test__exec_delegatecall__should_return_a_new_context_based_on_calling_ctx_s
 @external
 func test__exec_create__should_return_a_new_context_with_bytecode_from_memory_at_empty_address{
     syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
-}(evm_contract_class_hash_: felt, registry_address_: felt) {
+}(evm_contract_class_hash_: felt, registry_address_: felt, expected_evm_contract_address: felt) {
     alloc_locals;
     evm_contract_class_hash.write(evm_contract_class_hash_);
     registry_address.write(registry_address_);
@@ -418,26 +583,29 @@ func test__exec_create__should_return_a_new_context_with_bytecode_from_memory_at
     let sub_ctx = SystemOperations.exec_create(ctx);
 
     // Then
-    assert sub_ctx.call_context.bytecode_len = 4;
-    assert sub_ctx.call_context.calldata_len = 0;
-    assert [sub_ctx.call_context.bytecode] = 0x44;
-    assert [sub_ctx.call_context.bytecode + 1] = 0x55;
-    assert [sub_ctx.call_context.bytecode + 2] = 0x66;
-    assert [sub_ctx.call_context.bytecode + 3] = 0x77;
-    assert sub_ctx.call_context.value = value.low;
+    assert sub_ctx.environment.call_context.bytecode_len = 4;
+    assert sub_ctx.environment.call_context.calldata_len = 0;
+    assert [sub_ctx.environment.call_context.bytecode] = 0x44;
+    assert [sub_ctx.environment.call_context.bytecode + 1] = 0x55;
+    assert [sub_ctx.environment.call_context.bytecode + 2] = 0x66;
+    assert [sub_ctx.environment.call_context.bytecode + 3] = 0x77;
+    assert sub_ctx.environment.call_context.value = value.low;
     assert sub_ctx.program_counter = 0;
     assert sub_ctx.stopped = 0;
     assert sub_ctx.return_data_len = 0;
     assert sub_ctx.gas_used = 0;
-    assert sub_ctx.gas_limit = 0;
-    assert sub_ctx.gas_price = 0;
-    assert_not_zero(sub_ctx.starknet_contract_address);
-    assert_not_zero(sub_ctx.evm_contract_address);
+    let calling_ctx = sub_ctx.environment.calling_context;
+    assert_le(
+        sub_ctx.environment.gas_limit, calling_ctx.environment.gas_limit - calling_ctx.gas_used
+    );
+    assert sub_ctx.environment.gas_price = 0;
+    assert_not_zero(sub_ctx.environment.starknet_contract_address);
+    assert sub_ctx.environment.evm_contract_address = expected_evm_contract_address;
     let (sub_ctx_contract_stored_bytecode) = IEvmContract.bytecode_len(
-        sub_ctx.starknet_contract_address
+        sub_ctx.environment.starknet_contract_address
     );
     assert sub_ctx_contract_stored_bytecode = 0;
-    TestHelpers.assert_execution_context_equal(ctx, sub_ctx.calling_context);
+    TestHelpers.assert_execution_context_equal(ctx, sub_ctx.environment.calling_context);
 
     // Fake a RETURN in sub_ctx then finalize
     let return_data_len = 65;
@@ -450,10 +618,10 @@ func test__exec_create__should_return_a_new_context_with_bytecode_from_memory_at
     // Then
     let (stack, address) = Stack.peek(ctx.stack, 0);
     let evm_contract_address = Helpers.uint256_to_felt(address);
-    assert evm_contract_address = sub_ctx.evm_contract_address;
+    assert evm_contract_address = sub_ctx.environment.evm_contract_address;
     TestHelpers.assert_execution_context_equal(ctx.sub_context, sub_ctx);
     let (created_contract_bytecode_len, created_contract_bytecode) = IEvmContract.bytecode(
-        sub_ctx.starknet_contract_address
+        sub_ctx.environment.starknet_contract_address
     );
     TestHelpers.assert_array_equal(
         created_contract_bytecode_len,
@@ -468,7 +636,7 @@ func test__exec_create__should_return_a_new_context_with_bytecode_from_memory_at
 @external
 func test__exec_create2__should_return_a_new_context_with_bytecode_from_memory_at_empty_address{
     syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
-}(evm_contract_class_hash_: felt, registry_address_: felt) {
+}(evm_contract_class_hash_: felt, registry_address_: felt, expected_evm_contract_address: felt) {
     alloc_locals;
     evm_contract_class_hash.write(evm_contract_class_hash_);
     registry_address.write(registry_address_);
@@ -500,26 +668,29 @@ func test__exec_create2__should_return_a_new_context_with_bytecode_from_memory_a
     let sub_ctx = SystemOperations.exec_create2(ctx);
 
     // Then
-    assert sub_ctx.call_context.bytecode_len = 4;
-    assert sub_ctx.call_context.calldata_len = 0;
-    assert [sub_ctx.call_context.bytecode] = 0x44;
-    assert [sub_ctx.call_context.bytecode + 1] = 0x55;
-    assert [sub_ctx.call_context.bytecode + 2] = 0x66;
-    assert [sub_ctx.call_context.bytecode + 3] = 0x77;
-    assert sub_ctx.call_context.value = value.low;
+    assert sub_ctx.environment.call_context.bytecode_len = 4;
+    assert sub_ctx.environment.call_context.calldata_len = 0;
+    assert [sub_ctx.environment.call_context.bytecode] = 0x44;
+    assert [sub_ctx.environment.call_context.bytecode + 1] = 0x55;
+    assert [sub_ctx.environment.call_context.bytecode + 2] = 0x66;
+    assert [sub_ctx.environment.call_context.bytecode + 3] = 0x77;
+    assert sub_ctx.environment.call_context.value = value.low;
     assert sub_ctx.program_counter = 0;
     assert sub_ctx.stopped = 0;
     assert sub_ctx.return_data_len = 0;
     assert sub_ctx.gas_used = 0;
-    assert sub_ctx.gas_limit = 0;
-    assert sub_ctx.gas_price = 0;
-    assert_not_zero(sub_ctx.starknet_contract_address);
-    assert_not_zero(sub_ctx.evm_contract_address);
+    let calling_ctx = sub_ctx.environment.calling_context;
+    assert_le(
+        sub_ctx.environment.gas_limit, calling_ctx.environment.gas_limit - calling_ctx.gas_used
+    );
+    assert sub_ctx.environment.gas_price = 0;
+    assert_not_zero(sub_ctx.environment.starknet_contract_address);
+    assert sub_ctx.environment.evm_contract_address = expected_evm_contract_address;
     let (sub_ctx_contract_stored_bytecode) = IEvmContract.bytecode_len(
-        sub_ctx.starknet_contract_address
+        sub_ctx.environment.starknet_contract_address
     );
     assert sub_ctx_contract_stored_bytecode = 0;
-    TestHelpers.assert_execution_context_equal(ctx, sub_ctx.calling_context);
+    TestHelpers.assert_execution_context_equal(ctx, sub_ctx.environment.calling_context);
 
     // Fake a RETURN in sub_ctx then finalize
     let return_data_len = 65;
@@ -532,11 +703,10 @@ func test__exec_create2__should_return_a_new_context_with_bytecode_from_memory_a
     // Then
     let (stack, address) = Stack.peek(ctx.stack, 0);
     let evm_contract_address = Helpers.uint256_to_felt(address);
-    assert evm_contract_address = sub_ctx.evm_contract_address;
-    // TODO: add test for salt usage when EVM address is properly computed
+    assert evm_contract_address = sub_ctx.environment.evm_contract_address;
     TestHelpers.assert_execution_context_equal(ctx.sub_context, sub_ctx);
     let (created_contract_bytecode_len, created_contract_bytecode) = IEvmContract.bytecode(
-        sub_ctx.starknet_contract_address
+        sub_ctx.environment.starknet_contract_address
     );
     TestHelpers.assert_array_equal(
         created_contract_bytecode_len,
@@ -548,6 +718,66 @@ func test__exec_create2__should_return_a_new_context_with_bytecode_from_memory_a
     return ();
 }
 
+@external
+func test__exec_create2__should_undo_the_creation_when_the_calling_context_reverts{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(evm_contract_class_hash_: felt, registry_address_: felt) {
+    alloc_locals;
+    evm_contract_class_hash.write(evm_contract_class_hash_);
+    registry_address.write(registry_address_);
+
+    // Given a sub context creating a contract with CREATE2, see the test above
+    let stack: model.Stack* = Stack.init();
+    let stack = Stack.push(stack, Uint256(5, 0));
+    let stack = Stack.push(stack, Uint256(4, 0));
+    let stack = Stack.push(stack, Uint256(3, 0));
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let stack = Stack.push(stack, Uint256(low=0, high=22774453838368691922685013100469420032));
+    let stack = Stack.push(stack, Uint256(0, 0));
+    let (bytecode: felt*) = alloc();
+    let ctx = TestHelpers.init_sub_context(0, bytecode, stack, FALSE);
+    let ctx = MemoryOperations.exec_mstore(ctx);
+    let sub_ctx = SystemOperations.exec_create2(ctx);
+    local evm_contract_address = sub_ctx.environment.evm_contract_address;
+    local starknet_contract_address = sub_ctx.environment.starknet_contract_address;
+
+    // And a successful creation
+    let return_data_len = 65;
+    TestHelpers.array_fill(sub_ctx.return_data, return_data_len, 0xff);
+    let sub_ctx = ExecutionContext.update_return_data(
+        sub_ctx, return_data_len, sub_ctx.return_data
+    );
+    let ctx = CreateHelper.finalize_calling_context(sub_ctx);
+    let (bytecode_len) = IEvmContract.bytecode_len(starknet_contract_address);
+    assert bytecode_len = return_data_len;
+
+    // When the calling context reverts
+    let (storage_cache, registry_cache, access_set) = Journal.revert(
+        ctx.cold.journal, ctx.cold.storage_cache, ctx.cold.registry_cache, ctx.cold.access_set
+    );
+
+    // Then the account is unregistered and has no code
+    let (registered_address) = IRegistry.get_evm_contract_address(
+        contract_address=registry_address_, starknet_contract_address=starknet_contract_address
+    );
+    assert registered_address = 0;
+    let (bytecode_len) = IEvmContract.bytecode_len(starknet_contract_address);
+    assert bytecode_len = 0;
+
+    // And the same address can be created again
+    let (redeployed_evm_address, redeployed_starknet_address) = ContractAccount.deploy(
+        evm_contract_address
+    );
+    assert redeployed_evm_address = evm_contract_address;
+    assert redeployed_starknet_address = starknet_contract_address;
+    let (registered_address) = IRegistry.get_evm_contract_address(
+        contract_address=registry_address_, starknet_contract_address=starknet_contract_address
+    );
+    assert registered_address = evm_contract_address;
+
+    return ();
+}
+
 @external
 func test__exec_selfdestruct__should_delete_account_bytecode{
     syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
@@ -563,30 +793,38 @@ func test__exec_selfdestruct__should_delete_account_bytecode{
     let memory: model.Memory* = Memory.init();
     let (bytecode) = alloc();
     let (return_data) = alloc();
-    assert [return_data] = 0;
-    assert [return_data + 1] = 10;
+    assert [return_data] = 10;
     let (destroy_contracts) = alloc();
     let (calldata) = alloc();
     assert [calldata] = '';
+    let (_, valid_jumpdests) = JumpdestBitmap.compute(0, bytecode);
     local call_context: model.CallContext* = new model.CallContext(
-        bytecode=bytecode, bytecode_len=0, calldata=calldata, calldata_len=1, value=0
+        bytecode=bytecode,
+        bytecode_len=0,
+        valid_jumpdests=valid_jumpdests,
+        calldata=calldata,
+        calldata_len=1,
+        value=0,
         );
     let stack = Stack.push(stack, Uint256(10, 0));
+    let (environment: felt*) = alloc();
+    assert [environment] = cast(call_context, felt);  // call_context
+    assert [environment + 1] = 0;  // gas_limit
+    assert [environment + 2] = 0;  // gas_price
+    assert [environment + 6] = 0;  // read only
+    assert [environment + 7] = 0;  // ret_offset
+    assert [environment + 8] = 1;  // ret_size
     let (sub_ctx: felt*) = alloc();
-    assert [sub_ctx] = cast(call_context, felt);  // call_context
+    assert [sub_ctx] = cast(environment, felt);  // environment
     assert [sub_ctx + 1] = 0;  // program_counter
     assert [sub_ctx + 2] = 0;  // stopped
-    assert [sub_ctx + 3] = cast(return_data + 1, felt);  // return_data
+    assert [sub_ctx + 3] = cast(return_data, felt);  // return_data
     assert [sub_ctx + 4] = 1;  // return_data_len
     assert [sub_ctx + 5] = cast(stack, felt);  // stack
     assert [sub_ctx + 6] = cast(memory, felt);  // memory
     assert [sub_ctx + 7] = 0;  // gas_used
-    assert [sub_ctx + 8] = 0;  // gas_limit
-    assert [sub_ctx + 9] = 0;  // intrinsic_gas_cost
-    assert [sub_ctx + 13] = 0;  // sub_context
-    assert [sub_ctx + 14] = 0;  // destroy_contracts_len
-    assert [sub_ctx + 15] = cast(destroy_contracts, felt);  // destroy_contracts
-    assert [sub_ctx + 16] = 0;  // read only
+    assert [sub_ctx + 8] = 0;  // sub_context
+    assert [sub_ctx + 9] = FALSE;  // reverted
 
     // Simulate contract creation
     let (evm_contract_address, starknet_contract_address) = ContractAccount.deploy(0);
@@ -596,8 +834,8 @@ func test__exec_selfdestruct__should_delete_account_bytecode{
         starknet_contract_address=starknet_contract_address,
         evm_contract_address=evm_contract_address,
     );
-    assert [sub_ctx + 10] = starknet_contract_address;  // starknet_contract_address
-    assert [sub_ctx + 11] = evm_contract_address;  // evm_contract_address
+    assert [environment + 3] = starknet_contract_address;  // starknet_contract_address
+    assert [environment + 4] = evm_contract_address;  // evm_contract_address
 
     // Fill contract bytecode
     let (bytecode) = alloc();
@@ -612,7 +850,18 @@ func test__exec_selfdestruct__should_delete_account_bytecode{
     let ctx = TestHelpers.init_context_with_stack_and_sub_ctx(
         0, bytecode, stack, cast(sub_ctx, model.ExecutionContext*)
     );
-    assert [sub_ctx + 12] = cast(ctx, felt);  // calling_context
+    assert [environment + 5] = cast(ctx, felt);  // calling_context
+    let journal = Journal.open(ctx.cold.journal);
+    tempvar cold = new model.ColdState(
+        destroy_contracts_len=0,
+        destroy_contracts=destroy_contracts,
+        storage_cache=ctx.cold.storage_cache,
+        registry_cache=ctx.cold.registry_cache,
+        access_set=ctx.cold.access_set,
+        keccak_segment=ctx.cold.keccak_segment,
+        journal=journal,
+        );
+    assert [sub_ctx + 10] = cast(cold, felt);  // cold
 
     let sub_ctx_object: model.ExecutionContext* = cast(sub_ctx, model.ExecutionContext*);
 
@@ -621,6 +870,12 @@ func test__exec_selfdestruct__should_delete_account_bytecode{
         sub_ctx_object
     );
 
+    // The balance goes to the starknet account of the unregistered recipient
+    let recipient = ContractAccount.compute_starknet_address(10);
+    let transfer = sub_ctx_object.cold.journal.head;
+    assert transfer.kind = Journal.TRANSFER;
+    assert transfer.key = recipient;
+
     // Simulate run
     let ctx = CallHelper.finalize_calling_context(sub_ctx_object);
     let ctx = SelfDestructHelper.finalize(ctx);
@@ -637,3 +892,17 @@ func test__exec_selfdestruct__should_delete_account_bytecode{
     assert evm_contract_byte_len = 0;
     return ();
 }
+
+@view
+func test__compute_create_address__should_hash_the_rlp_encoding_of_sender_and_nonce{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(sender: felt, nonce: felt) -> (address: felt) {
+    alloc_locals;
+    let (keccak_ptr: felt*) = alloc();
+    local keccak_ptr_start: felt* = keccak_ptr;
+    with keccak_ptr {
+        let address = ContractAccount.compute_create_address(sender, nonce);
+        finalize_keccak(keccak_ptr_start=keccak_ptr_start, keccak_ptr_end=keccak_ptr);
+    }
+    return (address=address);
+}
@@ -1,9 +1,33 @@
 import pytest
 import pytest_asyncio
+import rlp
+from Crypto.Hash import keccak
 from starkware.starknet.testing.contract import StarknetContract
 from starkware.starknet.testing.starknet import Starknet
 
 
+def keccak256(data: bytes) -> bytes:
+    return keccak.new(data=data, digest_bits=256).digest()
+
+
+def create_address(sender: int, nonce: int) -> int:
+    return int.from_bytes(
+        keccak256(rlp.encode([sender.to_bytes(20, "big"), nonce]))[12:], "big"
+    )
+
+
+def create2_address(sender: int, salt: int, init_code: bytes) -> int:
+    return int.from_bytes(
+        keccak256(
+            b"\xff"
+            + sender.to_bytes(20, "big")
+            + salt.to_bytes(32, "big")
+            + keccak256(init_code)
+        )[12:],
+        "big",
+    )
+
+
 @pytest_asyncio.fixture(scope="module")
 async def system_operations(starknet: Starknet):
     return await starknet.deploy(
@@ -56,20 +80,86 @@ class TestSystemOperations:
             contract_account_class.class_hash, account_registry.contract_address
         ).call()
 
+    async def test_call_should_undo_the_storage_changes_of_a_reverted_sub_context(
+        self, system_operations, contract_account_class, account_registry
+    ):
+        await system_operations.test__exec_call__should_undo_the_storage_changes_of_a_reverted_sub_context(
+            contract_account_class.class_hash, account_registry.contract_address
+        ).call()
+
+    async def test_call_should_write_the_returned_data_truncated_to_ret_size(
+        self, system_operations, contract_account_class, account_registry
+    ):
+        await system_operations.test__exec_call__should_write_the_returned_data_truncated_to_ret_size(
+            contract_account_class.class_hash, account_registry.contract_address
+        ).call()
+
+    @pytest.mark.parametrize(
+        "value,transfers_value,deploy,gas_used",
+        [
+            (1, 1, 0, 2600 + 9000 + 25000),
+            (0, 1, 0, 2600),
+            (1, 0, 0, 2600 + 9000),
+            (1, 1, 1, 2600 + 9000),
+        ],
+        ids=["call_empty", "call_empty_no_value", "callcode_empty", "call_deployed"],
+    )
+    async def test_prepare_args_should_charge_the_value_sent_to_an_empty_account(
+        self,
+        system_operations,
+        contract_account_class,
+        account_registry,
+        eth,
+        value,
+        transfers_value,
+        deploy,
+        gas_used,
+    ):
+        result = await system_operations.test__prepare_args__should_charge_the_value_sent_to_an_empty_account(
+            eth.contract_address,
+            contract_account_class.class_hash,
+            account_registry.contract_address,
+            0xDEAD,
+            value,
+            transfers_value,
+            deploy,
+        ).call()
+        assert result.result.gas_used == gas_used
+
     async def test_create(
         self, system_operations, contract_account_class, account_registry
     ):
         await system_operations.test__exec_create__should_return_a_new_context_with_bytecode_from_memory_at_empty_address(
             contract_account_class.class_hash,
             account_registry.contract_address,
+            create_address(sender=0, nonce=0),
         ).call()
 
+    @pytest.mark.parametrize(
+        "nonce", [0, 1, 0x7F, 0x80, 0xFF, 0x100, 0xFFFF, 2**64 - 1]
+    )
+    @pytest.mark.parametrize("sender", [0, 0xD8DA6BF26964AF9D7EED9E03E53415D37AA96045])
+    async def test_compute_create_address(self, system_operations, sender, nonce):
+        result = await system_operations.test__compute_create_address__should_hash_the_rlp_encoding_of_sender_and_nonce(
+            sender, nonce
+        ).call()
+        assert result.result.address == create_address(sender, nonce)
+
     async def test_create2(
         self, system_operations, contract_account_class, account_registry
     ):
         await system_operations.test__exec_create2__should_return_a_new_context_with_bytecode_from_memory_at_empty_address(
             contract_account_class.class_hash,
             account_registry.contract_address,
+            create2_address(sender=0, salt=5, init_code=bytes.fromhex("44556677")),
+        ).call()
+
+    async def test_create2_undone_by_a_reverting_calling_context(
+        self, system_operations, contract_account_class, account_registry
+    ):
+        await system_operations.test__exec_create2__should_undo_the_creation_when_the_calling_context_reverts(
+            contract_account_class.class_hash,
+            account_registry.contract_address,
         ).call()
 
     async def test_selfdestruct(
@@ -0,0 +1,76 @@
+import re
+
+import pytest
+import pytest_asyncio
+from starkware.starknet.testing.starknet import Starknet
+
+from tests.utils.reporting import traceit
+
+# Test vectors of EIP-152, all hashing "abc"
+H = "48c9bdf267e6096a3ba7ca8485ae67bb2bf894fe72f36e3cf1361d5f3af54fa5d182e6ad7f520e511f6c3e2b8c68059b6bbd41fbabd9831f79217e1319cde05b"
+M = "6162630000000000000000000000000000000000000000000000000000000000" + "00" * 96
+T = "03000000000000000000000000000000"
+
+
+def blake2f_input(rounds, f="01"):
+    return list(bytes.fromhex(rounds + H + M + T + f))
+
+
+@pytest_asyncio.fixture(scope="module")
+async def blake2f(starknet: Starknet):
+    return await starknet.deploy(
+        source="./tests/unit/src/kakarot/precompiles/test_blake2f.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+    )
+
+
+@pytest.mark.asyncio
+class TestBlake2f:
+    @pytest.mark.parametrize(
+        "calldata,expected",
+        [
+            (
+                blake2f_input("00000000"),
+                "08c9bcf367e6096a3ba7ca8485ae67bb2bf894fe72f36e3cf1361d5f3af54fa5d282e6ad7f520e511f6c3e2b8c68059b9442be0454267ce079217e1319cde05b",
+            ),
+            (
+                blake2f_input("0000000c"),
+                "ba80a53f981c4d0d6a2797b69f12f6e94c212f14685ac4b74b12bb6fdbffa2d17d87c5392aab792dc252d5de4533cc9518d38aa8dbf1925ab92386edd4009923",
+            ),
+            (
+                blake2f_input("0000000c", f="00"),
+                "75ab69d3190a562c51aef8d88f1c2775876944407270c42c9844252c26d2875298743e7f6d5ea2f2d3e8d226039cd31b4e426ac4f2d3d666a610c2116fde4735",
+            ),
+            (
+                blake2f_input("00000001"),
+                "b63a380cb2897d521994a85234ee2c181b5f844d2c624c002677e9703449d2fba551b3a8333bcdf5f2f7e08993d53923de3d64fcc68c034e717b9293fed7a421",
+            ),
+        ],
+        ids=["vector_4", "vector_5", "vector_6", "vector_7"],
+    )
+    async def test_should_compress(self, blake2f, calldata, expected):
+        rounds = int.from_bytes(bytes(calldata[:4]), "big")
+
+        with traceit.context(f"blake2f_{rounds}_rounds"):
+            result = (await blake2f.test__blake2f_impl(calldata).call()).result
+
+        assert result.output == list(bytes.fromhex(expected))
+        assert result.gas_used == rounds
+
+    @pytest.mark.parametrize(
+        "calldata",
+        [[], blake2f_input("0000000c")[:-1], blake2f_input("0000000c") + [0]],
+        ids=["vector_0", "vector_1", "vector_2"],
+    )
+    async def test_should_fail_when_input_length_is_invalid(self, blake2f, calldata):
+        with pytest.raises(Exception) as e:
+            await blake2f.test__blake2f_impl(calldata).call()
+        message = re.search(r"Error message: (.*)", e.value.message)[1]
+        assert message == "Kakarot: blake2f invalid input length"
+
+    async def test_should_fail_when_flag_is_invalid(self, blake2f):
+        with pytest.raises(Exception) as e:
+            await blake2f.test__blake2f_impl(blake2f_input("0000000c", f="02")).call()
+        message = re.search(r"Error message: (.*)", e.value.message)[1]
+        assert message == "Kakarot: blake2f invalid final block indicator flag"
@@ -28,9 +28,12 @@ func test__datacopy_impl{
     // Given # 1
     alloc_locals;
     // When
-    let result = PrecompileDataCopy.run(
-        PrecompileDataCopy.PRECOMPILE_ADDRESS, calldata_len, calldata
-    );
+    let (keccak_ptr: felt*) = alloc();
+    with keccak_ptr {
+        let result = PrecompileDataCopy.run(
+            PrecompileDataCopy.PRECOMPILE_ADDRESS, calldata_len, calldata
+        );
+    }
 
     TestHelpers.assert_array_equal(
         array_0_len=calldata_len,
@@ -84,7 +87,7 @@ func test__datacopy_via_staticcall{
     // Put the result alone on the stack
     let result = MemoryOperations.exec_pop(result);
     let stack = Stack.push(result.stack, Uint256(32, 0));
-    let result = ExecutionContext.update_stack(result, stack);
+    let result = ExecutionContext.apply_changes(result, stack, result.memory, 0, 0);
     let result = MemoryOperations.exec_mload(result);
     let (stack, stack_result) = Stack.peek(result.stack, 0);
 
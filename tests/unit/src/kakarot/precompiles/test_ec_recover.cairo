@@ -7,7 +7,10 @@ from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
 from starkware.cairo.common.math import unsigned_div_rem, assert_not_zero
 
+from starkware.cairo.common.cairo_keccak.keccak import finalize_keccak
+
 // Local dependencies
+from kakarot.execution_context import ExecutionContext
 from kakarot.precompiles.ec_recover import PrecompileEcRecover
 from utils.utils import Helpers
 from tests.unit.helpers.helpers import TestHelpers
@@ -19,7 +22,10 @@ func test_should_fail_when_input_len_is_not_128{
     alloc_locals;
     let (input) = alloc();
     let input_len = 0;
-    PrecompileEcRecover.run(PrecompileEcRecover.PRECOMPILE_ADDRESS, input_len, input);
+    let (keccak_ptr: felt*) = alloc();
+    with keccak_ptr {
+        PrecompileEcRecover.run(PrecompileEcRecover.PRECOMPILE_ADDRESS, input_len, input);
+    }
     return ();
 }
 
@@ -31,7 +37,10 @@ func test_should_fail_when_recovery_identifier_is_neither_27_nor_28{
     let (input) = alloc();
     let input_len = 128;
     TestHelpers.array_fill(input, input_len, 1);
-    PrecompileEcRecover.run(PrecompileEcRecover.PRECOMPILE_ADDRESS, input_len, input);
+    let (keccak_ptr: felt*) = alloc();
+    with keccak_ptr {
+        PrecompileEcRecover.run(PrecompileEcRecover.PRECOMPILE_ADDRESS, input_len, input);
+    }
     return ();
 }
 
@@ -50,9 +59,14 @@ func test_should_return_eth_address_in_bytes32{
     // fill r, s
     TestHelpers.array_fill(input + 64, 64, 1);
 
-    let (output_len, output, gas) = PrecompileEcRecover.run(
-        PrecompileEcRecover.PRECOMPILE_ADDRESS, input_len, input
-    );
+    let (keccak_ptr: felt*) = alloc();
+    local keccak_ptr_start: felt* = keccak_ptr;
+    with keccak_ptr {
+        let (output_len, output, gas) = PrecompileEcRecover.run(
+            PrecompileEcRecover.PRECOMPILE_ADDRESS, input_len, input
+        );
+        finalize_keccak(keccak_ptr_start=keccak_ptr_start, keccak_ptr_end=keccak_ptr);
+    }
     assert output_len = 32;
     let eth_address = Helpers.bytes32_to_uint256(output);
     assert_not_zero(eth_address.high);
@@ -203,9 +217,14 @@ func test_should_return_eth_address_for_playground_example{
     assert input[127] = 218;
     let input_len = 128;
 
-    let (output_len, output, gas) = PrecompileEcRecover.run(
-        PrecompileEcRecover.PRECOMPILE_ADDRESS, input_len, input
-    );
+    let (keccak_ptr: felt*) = alloc();
+    local keccak_ptr_start: felt* = keccak_ptr;
+    with keccak_ptr {
+        let (output_len, output, gas) = PrecompileEcRecover.run(
+            PrecompileEcRecover.PRECOMPILE_ADDRESS, input_len, input
+        );
+        finalize_keccak(keccak_ptr_start=keccak_ptr_start, keccak_ptr_end=keccak_ptr);
+    }
 
     assert output_len = 32;
 
@@ -243,3 +262,46 @@ func test_should_return_eth_address_for_playground_example{
     assert output[31] = 138;
     return ();
 }
+
+@view
+func test__ec_recover_impl{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(input_len: felt, input: felt*) -> (output_len: felt, output: felt*, gas_used: felt) {
+    alloc_locals;
+    let (keccak_ptr: felt*) = alloc();
+    local keccak_ptr_start: felt* = keccak_ptr;
+    with keccak_ptr {
+        let (output_len, output, gas_used) = PrecompileEcRecover.run(
+            PrecompileEcRecover.PRECOMPILE_ADDRESS, input_len, input
+        );
+        finalize_keccak(keccak_ptr_start=keccak_ptr_start, keccak_ptr_end=keccak_ptr);
+    }
+    return (output_len, output, gas_used);
+}
+
+@view
+func test__run_memoized_impl{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(input_len: felt, input: felt*) -> (output_len: felt, output: felt*, gas_used: felt) {
+    // Given
+    alloc_locals;
+    let keccak_segment = ExecutionContext.init_keccak_segment();
+
+    // When
+    let (keccak_segment, output_len, output, gas_used) = PrecompileEcRecover.run_memoized(
+        keccak_segment, input_len, input
+    );
+    local output: felt* = output;
+    local keccak_ptr: felt* = keccak_segment.keccak_ptr;
+    let (
+        keccak_segment, cached_output_len, cached_output, cached_gas_used
+    ) = PrecompileEcRecover.run_memoized(keccak_segment, input_len, input);
+
+    // Then
+    assert cached_output_len = output_len;
+    assert cached_output = output;
+    assert cached_gas_used = gas_used;
+    // The second call reuses the output without hashing anything
+    assert keccak_segment.keccak_ptr = keccak_ptr;
+    return (output_len, output, gas_used);
+}
@@ -1,9 +1,27 @@
+import random
 import re
 
 import pytest
 import pytest_asyncio
+from eth_keys import keys
 from starkware.starknet.testing.starknet import Starknet
 
+from tests.utils.reporting import traceit
+
+random.seed(0)
+
+GAS_COST_EC_RECOVER = 3000
+
+
+def ec_recover_input(msg_hash: bytes, private_key: keys.PrivateKey):
+    signature = private_key.sign_msg_hash(msg_hash)
+    return list(
+        msg_hash
+        + (27 + signature.v).to_bytes(32, "big")
+        + signature.r.to_bytes(32, "big")
+        + signature.s.to_bytes(32, "big")
+    )
+
 
 @pytest_asyncio.fixture(scope="module")
 async def ec_recover(starknet: Starknet):
@@ -39,3 +57,33 @@ class TestEcRecover:
 
     async def test_should_return_eth_address_for_playground_example(self, ec_recover):
         await ec_recover.test_should_return_eth_address_for_playground_example().call()
+
+    @pytest.mark.parametrize("seed", range(4))
+    async def test_should_recover_signer_address(self, ec_recover, seed):
+        private_key = keys.PrivateKey(random.randbytes(32))
+        msg_hash = random.randbytes(32)
+
+        with traceit.context("ec_recover"):
+            result = (
+                await ec_recover.test__ec_recover_impl(
+                    ec_recover_input(msg_hash, private_key)
+                ).call()
+            ).result
+
+        address = private_key.public_key.to_canonical_address()
+        assert result.output == [0] * 12 + list(address)
+        assert result.gas_used == GAS_COST_EC_RECOVER
+
+    async def test_should_reuse_output_of_same_input(self, ec_recover):
+        private_key = keys.PrivateKey(random.randbytes(32))
+        msg_hash = random.randbytes(32)
+
+        result = (
+            await ec_recover.test__run_memoized_impl(
+                ec_recover_input(msg_hash, private_key)
+            ).call()
+        ).result
+
+        address = private_key.public_key.to_canonical_address()
+        assert result.output == [0] * 12 + list(address)
+        assert result.gas_used == GAS_COST_EC_RECOVER
@@ -45,9 +45,12 @@ func test__ecadd_impl{
     let expected_y = Helpers.bigint_to_felt(expected_point.y);
 
     // When
-    let (output_len, output: felt*, gas_cost) = PrecompileEcAdd.run(
-        PrecompileEcAdd.PRECOMPILE_ADDRESS, calldata_len, calldata
-    );
+    let (keccak_ptr: felt*) = alloc();
+    with keccak_ptr {
+        let (output_len, output: felt*, gas_cost) = PrecompileEcAdd.run(
+            PrecompileEcAdd.PRECOMPILE_ADDRESS, calldata_len, calldata
+        );
+    }
     let output_x = Helpers.load_word(ECPOINT_BYTES_LEN, output);
     let output_y = Helpers.load_word(ECPOINT_BYTES_LEN, output + ECPOINT_BYTES_LEN);
 
@@ -0,0 +1,81 @@
+import random
+import re
+
+import pytest
+import pytest_asyncio
+from starkware.starknet.testing.starknet import Starknet
+
+from tests.utils.alt_bn128 import G1, P, R, encode_g1, mul
+from tests.utils.reporting import traceit
+
+random.seed(0)
+
+GAS_COST_EC_MUL = 6000
+
+
+def ecmul_input(point, k):
+    return list(encode_g1(point) + k.to_bytes(32, "big"))
+
+
+@pytest_asyncio.fixture(scope="module")
+async def ecmul(starknet: Starknet):
+    return await starknet.deploy(
+        source="./tests/unit/src/kakarot/precompiles/test_ecmul.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+    )
+
+
+@pytest.mark.asyncio
+class TestEcMul:
+    @pytest.mark.parametrize(
+        "point,k",
+        [
+            (G1, 2),
+            (G1, random.randrange(R)),
+            (mul(G1, random.randrange(R)), random.randrange(R)),
+            (mul(G1, random.randrange(R)), R + random.randrange(2**255 - R)),
+            (G1, R - 1),
+            (G1, 0),
+            (G1, R),
+            (None, random.randrange(R)),
+        ],
+        ids=[
+            "double",
+            "generator",
+            "random_point",
+            "scalar_above_order",
+            "minus_generator",
+            "scalar_zero",
+            "scalar_order",
+            "point_at_infinity",
+        ],
+    )
+    async def test_should_multiply_point(self, ecmul, point, k):
+        with traceit.context("ecmul"):
+            result = (await ecmul.test__ecmul_impl(ecmul_input(point, k)).call()).result
+
+        assert result.output == list(encode_g1(mul(point, k)))
+        assert result.gas_used == GAS_COST_EC_MUL
+
+    async def test_should_pad_short_input_with_zeros(self, ecmul):
+        k = random.randrange(2**248) << 8
+        calldata = ecmul_input(G1, k)[:-1]
+
+        result = (await ecmul.test__ecmul_impl(calldata).call()).result
+
+        assert result.output == list(encode_g1(mul(G1, k)))
+
+    @pytest.mark.parametrize(
+        "x,y",
+        [(1, 3), (1 + P, 2), (1, 2 + P)],
+        ids=["not_on_curve", "x_not_reduced", "y_not_reduced"],
+    )
+    async def test_should_fail_when_point_is_invalid(self, ecmul, x, y):
+        calldata = list(x.to_bytes(32, "big") + y.to_bytes(32, "big") + bytes(32))
+        calldata[-1] = 1
+
+        with pytest.raises(Exception) as e:
+            await ecmul.test__ecmul_impl(calldata).call()
+        message = re.search(r"Error message: (.*)", e.value.message)[1]
+        assert message == "Kakarot: ecmul invalid point"
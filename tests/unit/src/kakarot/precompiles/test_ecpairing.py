@@ -0,0 +1,128 @@
+import dataclasses
+import random
+import re
+
+import pytest
+import pytest_asyncio
+from starkware.starknet.testing.starknet import Starknet
+
+from tests.utils.alt_bn128 import (
+    G1,
+    G2,
+    P,
+    R,
+    encode_g1,
+    encode_g2,
+    mul,
+    neg,
+    twist_point,
+)
+from tests.utils.reporting import traceit
+
+random.seed(0)
+
+GAS_COST_BASE = 45000
+GAS_COST_PER_PAIR = 34000
+
+
+def ecpairing_input(pairs):
+    return list(b"".join(encode_g1(p) + encode_g2(q) for p, q in pairs))
+
+
+def bilinear_pairs(n):
+    """
+    Return n pairs (a_i * G1, b_i * G2) such that the sum of the a_i * b_i is 0 modulo r.
+    """
+    scalars = [(random.randrange(1, R), random.randrange(1, R)) for _ in range(n - 1)]
+    a_last = -sum(a * b for a, b in scalars) % R
+    pairs = [(mul(G1, a), mul(G2, b)) for a, b in scalars]
+    return pairs + [(mul(G1, a_last), G2)]
+
+
+@pytest_asyncio.fixture(scope="module")
+async def ecpairing(starknet: Starknet):
+    return await starknet.deploy(
+        source="./tests/unit/src/kakarot/precompiles/test_ecpairing.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+    )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def max_steps(starknet: Starknet):
+    """
+    A pairing check runs a few million steps, more than the default call limit.
+    """
+    general_config = starknet.state.general_config
+    starknet.state.general_config = dataclasses.replace(
+        general_config, invoke_tx_max_n_steps=2**24
+    )
+    yield
+    starknet.state.general_config = general_config
+
+
+@pytest.mark.asyncio
+class TestEcPairing:
+    async def test_should_reject_single_pair(self, ecpairing):
+        calldata = ecpairing_input([(G1, G2)])
+
+        with traceit.context("ecpairing_1_pair"):
+            result = (await ecpairing.test__ecpairing_impl(calldata).call()).result
+
+        assert result.output == [0] * 32
+        assert result.gas_used == GAS_COST_BASE + GAS_COST_PER_PAIR
+
+    @pytest.mark.parametrize("n", [2, 3], ids=["2_pairs", "3_pairs"])
+    async def test_should_accept_bilinear_pairs(self, ecpairing, n):
+        calldata = ecpairing_input(bilinear_pairs(n))
+
+        with traceit.context(f"ecpairing_{n}_pairs"):
+            result = (await ecpairing.test__ecpairing_impl(calldata).call()).result
+
+        assert result.output == [0] * 31 + [1]
+        assert result.gas_used == GAS_COST_BASE + GAS_COST_PER_PAIR * n
+
+    async def test_should_reject_unbalanced_pairs(self, ecpairing):
+        a, b = random.randrange(1, R), random.randrange(1, R)
+        pairs = [(mul(G1, a), mul(G2, b)), (neg(mul(G1, a * b + 1)), G2)]
+
+        result = (await ecpairing.test__ecpairing_impl(ecpairing_input(pairs)).call()).result
+
+        assert result.output == [0] * 32
+
+    @pytest.mark.parametrize(
+        "pairs",
+        [[], [(None, G2)], [(G1, None)], [(None, G2), (G1, None)]],
+        ids=["empty", "g1_infinity", "g2_infinity", "both_infinity"],
+    )
+    async def test_should_skip_points_at_infinity(self, ecpairing, pairs):
+        calldata = ecpairing_input(pairs)
+
+        result = (await ecpairing.test__ecpairing_impl(calldata).call()).result
+
+        assert result.output == [0] * 31 + [1]
+        assert result.gas_used == GAS_COST_BASE + GAS_COST_PER_PAIR * len(pairs)
+
+    async def test_should_fail_when_input_length_is_invalid(self, ecpairing):
+        calldata = ecpairing_input([(G1, G2)])[:-1]
+
+        with pytest.raises(Exception) as e:
+            await ecpairing.test__ecpairing_impl(calldata).call()
+        message = re.search(r"Error message: (.*)", e.value.message)[1]
+        assert message == "Kakarot: ecpairing input length is not a multiple of 192"
+
+    @pytest.mark.parametrize(
+        "calldata",
+        [
+            list((1).to_bytes(32, "big") + (3).to_bytes(32, "big") + encode_g2(G2)),
+            list((1 + P).to_bytes(32, "big") + (2).to_bytes(32, "big") + encode_g2(G2)),
+            list(encode_g1(G1) + encode_g2((G2[0], G2[0]))),
+            list(encode_g1(G1) + encode_g2(twist_point((1, 0)))),
+        ],
+        ids=["g1_not_on_curve", "g1_not_reduced", "g2_not_on_twist", "g2_not_in_subgroup"],
+    )
+    async def test_should_fail_when_point_is_invalid(self, ecpairing, calldata):
+        with pytest.raises(Exception) as e:
+            await ecpairing.test__ecpairing_impl(calldata).call()
+        message = re.search(r"Error message: (.*)", e.value.message)[1]
+        assert message == "Kakarot: ecpairing invalid point"
@@ -0,0 +1,28 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+
+// Local dependencies
+from kakarot.precompiles.modexp import PrecompileModExp
+
+@view
+func test__modexp_impl{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(calldata_len: felt, calldata: felt*) -> (output_len: felt, output: felt*, gas_used: felt) {
+    // Given
+    alloc_locals;
+
+    // When
+    let (keccak_ptr: felt*) = alloc();
+    with keccak_ptr {
+        let result = PrecompileModExp.run(
+            PrecompileModExp.PRECOMPILE_ADDRESS, calldata_len, calldata
+        );
+    }
+
+    return (result.output_len, result.output, result.gas_used);
+}
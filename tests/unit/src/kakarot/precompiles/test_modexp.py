@@ -0,0 +1,130 @@
+import random
+import re
+
+import pytest
+import pytest_asyncio
+from starkware.starknet.testing.starknet import Starknet
+
+from tests.utils.reporting import traceit
+
+random.seed(0)
+
+# RSA-2048 like modulus: 256 bytes with the top bit set
+RSA_2048_MODULUS = random.getrandbits(2048) | (1 << 2047) | 1
+SECP256K1_P = 2**256 - 2**32 - 977
+
+
+def modexp_input(base, exponent, modulus, base_len, exp_len, mod_len):
+    return list(
+        base_len.to_bytes(32, "big")
+        + exp_len.to_bytes(32, "big")
+        + mod_len.to_bytes(32, "big")
+        + base.to_bytes(base_len, "big")
+        + exponent.to_bytes(exp_len, "big")
+        + modulus.to_bytes(mod_len, "big")
+    )
+
+
+def modexp_gas(base_len, exp_len, mod_len, exponent):
+    words = (max(base_len, mod_len) + 7) // 8
+    tail_len = max(exp_len - 32, 0)
+    head = exponent >> (8 * tail_len)
+    adjusted_exp_len = 8 * tail_len + max(head.bit_length() - 1, 0)
+    return max(200, words**2 * max(adjusted_exp_len, 1) // 3)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def modexp(starknet: Starknet):
+    return await starknet.deploy(
+        source="./tests/unit/src/kakarot/precompiles/test_modexp.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+    )
+
+
+@pytest.mark.asyncio
+class TestModExp:
+    @pytest.mark.parametrize(
+        "base,exponent,modulus,base_len,exp_len,mod_len",
+        [
+            (3, SECP256K1_P - 2, SECP256K1_P, 1, 32, 32),
+            (
+                random.randrange(RSA_2048_MODULUS),
+                65537,
+                RSA_2048_MODULUS,
+                256,
+                3,
+                256,
+            ),
+            (random.randrange(RSA_2048_MODULUS), 3, RSA_2048_MODULUS, 256, 1, 256),
+            (
+                random.getrandbits(256),
+                random.getrandbits(256),
+                random.getrandbits(256),
+                32,
+                32,
+                32,
+            ),
+            (random.getrandbits(64), random.getrandbits(320), 2**61 - 1, 8, 40, 8),
+            (random.getrandbits(2400), 5, random.getrandbits(160), 300, 1, 20),
+            (random.getrandbits(64), 7, random.getrandbits(100), 8, 1, 64),
+            (random.getrandbits(256), 0, random.getrandbits(256), 32, 32, 32),
+            (random.getrandbits(256), 3, 1, 32, 1, 32),
+            (random.getrandbits(256), 3, 0, 32, 1, 32),
+            (random.getrandbits(256), 3, 0, 32, 1, 0),
+            (0, 3, random.getrandbits(256), 0, 1, 32),
+        ],
+        ids=[
+            "fermat_secp256k1",
+            "rsa2048_e65537",
+            "rsa2048_e3",
+            "uint256",
+            "long_exponent",
+            "base_longer_than_modulus",
+            "modulus_with_leading_zeros",
+            "exponent_zero",
+            "modulus_one",
+            "modulus_zero",
+            "modulus_empty",
+            "base_empty",
+        ],
+    )
+    async def test_should_compute_modexp(
+        self, modexp, base, exponent, modulus, base_len, exp_len, mod_len
+    ):
+        calldata = modexp_input(base, exponent, modulus, base_len, exp_len, mod_len)
+
+        with traceit.context("modexp"):
+            result = (await modexp.test__modexp_impl(calldata).call()).result
+
+        expected = pow(base, exponent, modulus) if modulus != 0 else 0
+        assert result.output == list(expected.to_bytes(mod_len, "big"))
+        assert result.gas_used == modexp_gas(base_len, exp_len, mod_len, exponent)
+
+    @pytest.mark.parametrize("calldata_len", [0, 50, 96, 120])
+    async def test_should_pad_short_input_with_zeros(self, modexp, calldata_len):
+        base, exponent, modulus = 0xFF, 0xFFFF, 2**255 - 19
+        calldata = modexp_input(base, exponent, modulus, 1, 2, 32)[:calldata_len]
+        padded = calldata + [0] * (96 + 1 + 2 + 32 - calldata_len)
+        base_len, exp_len, mod_len = (
+            int.from_bytes(bytes(padded[i : i + 32]), "big") for i in (0, 32, 64)
+        )
+        data = padded[96:]
+        base = int.from_bytes(bytes(data[:base_len]), "big")
+        exponent = int.from_bytes(bytes(data[base_len : base_len + exp_len]), "big")
+        modulus = int.from_bytes(bytes(data[base_len + exp_len :][:mod_len]), "big")
+
+        result = (await modexp.test__modexp_impl(calldata).call()).result
+
+        expected = pow(base, exponent, modulus) if modulus != 0 else 0
+        assert result.output == list(expected.to_bytes(mod_len, "big"))
+        assert result.gas_used == modexp_gas(base_len, exp_len, mod_len, exponent)
+
+    async def test_should_fail_when_length_is_too_large(self, modexp):
+        calldata = modexp_input(0, 0, 0, 0, 0, 0)
+        calldata[32:64] = list((2**128).to_bytes(32, "big"))
+
+        with pytest.raises(Exception) as e:
+            await modexp.test__modexp_impl(calldata).call()
+        message = re.search(r"Error message: (.*)", e.value.message)[1]
+        assert message == "Kakarot: modexp length is too large"
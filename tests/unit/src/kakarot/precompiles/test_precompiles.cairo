@@ -22,16 +22,50 @@ from tests.unit.helpers.helpers import TestHelpers
 func test__precompiles_should_throw_on_out_of_bounds{
     syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
 }(address: felt) {
+    // Given
+    alloc_locals;
+    let (bytecode) = alloc();
+    let calling_context = TestHelpers.init_context(0, bytecode);
+
     // When
     let result = Precompiles.run(
         address=address,
+        gas_limit=Constants.TRANSACTION_GAS_LIMIT,
         calldata_len=0,
         calldata=cast(0, felt*),
         value=0,
-        calling_context=cast(0, model.ExecutionContext*),
-        return_data_len=0,
-        return_data=cast(0, felt*),
+        calling_context=calling_context,
+        ret_offset=0,
+        ret_size=0,
     );
 
     return ();
 }
+
+@view
+func test__run__should_stop_the_precompile_sub_context{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(address: felt, gas_limit: felt, calldata_len: felt, calldata: felt*) -> (
+    reverted: felt, gas_used: felt, return_data_len: felt
+) {
+    // Given
+    alloc_locals;
+    let (bytecode) = alloc();
+    let calling_context = TestHelpers.init_context(0, bytecode);
+
+    // When
+    let sub_ctx = Precompiles.run(
+        address=address,
+        gas_limit=gas_limit,
+        calldata_len=calldata_len,
+        calldata=calldata,
+        value=0,
+        calling_context=calling_context,
+        ret_offset=0,
+        ret_size=0,
+    );
+
+    // Then
+    assert sub_ctx.stopped = TRUE;
+    return (sub_ctx.reverted, sub_ctx.gas_used, sub_ctx.return_data_len);
+}
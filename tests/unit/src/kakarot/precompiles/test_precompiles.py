@@ -31,3 +31,48 @@ class TestPrecompiles:
 
             message = re.search(r"Error message: (.*)", e.value.message)[1]
             assert message == "Kakarot: NotImplementedPrecompile " + str(address)
+
+        @pytest.mark.parametrize(
+            "address,gas_limit,calldata,reverted,gas_used",
+            [
+                (0x9, 12, list((12).to_bytes(4, "big")) + [0] * 209, 0, 12),
+                (0x9, 11, list((12).to_bytes(4, "big")) + [0] * 209, 1, 11),
+                (
+                    0x9,
+                    100_000,
+                    list((2**32 - 1).to_bytes(4, "big")) + [0] * 209,
+                    1,
+                    100_000,
+                ),
+                (
+                    0x5,
+                    100_000,
+                    list(
+                        (1).to_bytes(32, "big")
+                        + (2**32).to_bytes(32, "big")
+                        + (1).to_bytes(32, "big")
+                    ),
+                    1,
+                    100_000,
+                ),
+            ],
+            ids=[
+                "blake2f_enough_gas",
+                "blake2f_out_of_gas",
+                "blake2f_max_rounds",
+                "modexp_long_exponent",
+            ],
+        )
+        async def test_precompiles_should_check_the_gas_limit(
+            self, precompiles, address, gas_limit, calldata, reverted, gas_used
+        ):
+            result = (
+                await precompiles.test__run__should_stop_the_precompile_sub_context(
+                    address=address, gas_limit=gas_limit, calldata=calldata
+                ).call()
+            ).result
+
+            assert result.reverted == reverted
+            assert result.gas_used == gas_used
+            if reverted:
+                assert result.return_data_len == 0
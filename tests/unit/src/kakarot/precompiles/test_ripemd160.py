@@ -5,6 +5,8 @@ import pytest_asyncio
 from Crypto.Hash import RIPEMD160
 from starkware.starknet.testing.starknet import Starknet
 
+from tests.utils.reporting import traceit
+
 
 @pytest_asyncio.fixture(scope="module")
 async def ripemd160(
@@ -40,3 +42,15 @@ class TestRIPEMD160:
             0
         ]
         assert expected_result_byte_array == precompile_hash
+
+    @pytest.mark.parametrize("blocks_len", [1, 2, 4])
+    async def test_ripemd160_steps_per_block(self, ripemd160, blocks_len):
+        # The longest message fitting in blocks_len 64-byte blocks once padded
+        message_bytes = bytes(random.randint(0, 255) for _ in range(64 * blocks_len - 9))
+
+        with traceit.context(f"ripemd160_{blocks_len}_blocks"):
+            precompile_hash = (
+                await ripemd160.test__ripemd160(list(message_bytes)).call()
+            ).result[0]
+
+        assert precompile_hash == [0] * 12 + list(RIPEMD160.new(message_bytes).digest())
@@ -0,0 +1,39 @@
+import hashlib
+import random
+
+import pytest
+import pytest_asyncio
+from starkware.starknet.testing.starknet import Starknet
+
+from tests.utils.reporting import traceit
+
+random.seed(0)
+
+GAS_COST_SHA256 = 60
+GAS_COST_SHA256_WORD = 12
+
+
+@pytest_asyncio.fixture(scope="module")
+async def sha256(starknet: Starknet):
+    return await starknet.deploy(
+        source="./tests/unit/src/kakarot/precompiles/test_sha256.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+    )
+
+
+@pytest.mark.asyncio
+class TestSHA256:
+    @pytest.mark.parametrize(
+        "msg_len",
+        # Around the block boundaries, and enough blocks to fill more than one batch
+        [0, 1, 3, 4, 55, 56, 63, 64, 65, 119, 120, 500],
+    )
+    async def test_should_return_correct_hash(self, sha256, msg_len):
+        message = random.randbytes(msg_len)
+
+        with traceit.context("sha256"):
+            result = (await sha256.test__sha256_impl(list(message)).call()).result
+
+        assert result.output == list(hashlib.sha256(message).digest())
+        assert result.gas_used == GAS_COST_SHA256 + GAS_COST_SHA256_WORD * ((msg_len + 31) // 32)
@@ -0,0 +1,124 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bool import FALSE, TRUE
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.uint256 import Uint256
+
+// Local dependencies
+from kakarot.access_set import AccessSet
+from kakarot.constants import Constants
+from kakarot.journal import Journal
+from kakarot.model import model
+from kakarot.registry_cache import RegistryCache
+from kakarot.storage_cache import StorageCache
+
+@external
+func test__add_address__should_be_warm_the_second_time{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    let access_set = AccessSet.init();
+
+    // When
+    let (access_set, is_warm_first) = AccessSet.add_address(access_set, 0xabde1);
+    let (access_set, is_warm_second) = AccessSet.add_address(access_set, 0xabde1);
+    let (access_set, is_precompile_warm) = AccessSet.add_address(
+        access_set, Constants.LAST_PRECOMPILE_ADDRESS
+    );
+
+    // Then
+    assert is_warm_first = FALSE;
+    assert is_warm_second = TRUE;
+    assert is_precompile_warm = TRUE;
+    AccessSet.finalize(access_set);
+    return ();
+}
+
+@external
+func test__add_access_list__should_warm_addresses_and_storage_keys{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    let access_set = AccessSet.init();
+    let (access_list) = alloc();
+    assert access_list[0] = 0xabde1;
+    assert access_list[1] = 2;
+    assert access_list[2] = 1;
+    assert access_list[3] = 0;
+    assert access_list[4] = 2;
+    assert access_list[5] = 0;
+    assert access_list[6] = 0xc0ffee;
+    assert access_list[7] = 0;
+
+    // When
+    let access_set = AccessSet.add_access_list(access_set, 8, access_list);
+
+    // Then
+    let (access_set, is_address_warm) = AccessSet.add_address(access_set, 0xabde1);
+    let (access_set, _, is_key_warm) = AccessSet.add_storage_key(
+        access_set, 0xabde1, Uint256(2, 0)
+    );
+    let (access_set, is_other_address_warm) = AccessSet.add_address(access_set, 0xc0ffee);
+    let (access_set, _, is_other_key_warm) = AccessSet.add_storage_key(
+        access_set, 0xabde1, Uint256(3, 0)
+    );
+    assert is_address_warm = TRUE;
+    assert is_key_warm = TRUE;
+    assert is_other_address_warm = TRUE;
+    assert is_other_key_warm = FALSE;
+    return ();
+}
+
+@external
+func test__access_list_cost__should_charge_the_addresses_and_storage_keys{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    let (access_list) = alloc();
+    assert access_list[0] = 0xabde1;
+    assert access_list[1] = 2;
+    assert access_list[2] = 1;
+    assert access_list[3] = 0;
+    assert access_list[4] = 2;
+    assert access_list[5] = 0;
+    assert access_list[6] = 0xc0ffee;
+    assert access_list[7] = 0;
+
+    // When
+    let cost = AccessSet.access_list_cost(8, access_list);
+
+    // Then
+    assert cost = 2 * 2400 + 2 * 1900;
+    return ();
+}
+
+@external
+func test__revert__should_make_the_accessed_storage_keys_cold_again{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    let storage_cache = StorageCache.init();
+    let registry_cache = RegistryCache.init();
+    let access_set = AccessSet.init();
+    let journal = Journal.open(Journal.init());
+    let (access_set, slot_key, _) = AccessSet.add_storage_key(access_set, 0xabde1, Uint256(1, 0));
+    let journal = Journal.record_access(journal, slot_key);
+
+    // When
+    let (storage_cache, registry_cache, access_set) = Journal.revert(
+        journal, storage_cache, registry_cache, access_set
+    );
+
+    // Then
+    let (access_set, _, is_warm) = AccessSet.add_storage_key(access_set, 0xabde1, Uint256(1, 0));
+    assert is_warm = FALSE;
+    return ();
+}
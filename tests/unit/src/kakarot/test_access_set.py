@@ -0,0 +1,32 @@
+import pytest
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture
+async def access_set(starknet):
+    return await starknet.deploy(
+        source="./tests/unit/src/kakarot/test_access_set.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+    )
+
+
+@pytest.mark.asyncio
+class TestAccessSet:
+    async def test_add_address_should_be_warm_the_second_time(self, access_set):
+        await access_set.test__add_address__should_be_warm_the_second_time().call()
+
+    async def test_add_access_list_should_warm_addresses_and_storage_keys(
+        self, access_set
+    ):
+        await access_set.test__add_access_list__should_warm_addresses_and_storage_keys().call()
+
+    async def test_access_list_cost_should_charge_the_addresses_and_storage_keys(
+        self, access_set
+    ):
+        await access_set.test__access_list_cost__should_charge_the_addresses_and_storage_keys().call()
+
+    async def test_revert_should_make_the_accessed_storage_keys_cold_again(
+        self, access_set
+    ):
+        await access_set.test__revert__should_make_the_accessed_storage_keys_cold_again().call()
@@ -12,6 +12,7 @@ from starkware.cairo.common.uint256 import Uint256
 from utils.utils import Helpers
 from kakarot.constants import Constants
 from kakarot.model import model
+from kakarot.jumpdest_bitmap import JumpdestBitmap
 from kakarot.execution_context import ExecutionContext
 
 @external
@@ -27,22 +28,28 @@ func test__init__should_return_an_empty_execution_context{
     assert [calldata] = '';
 
     // When
+    let (_, valid_jumpdests) = JumpdestBitmap.compute(bytecode_len, bytecode);
     local call_context: model.CallContext* = new model.CallContext(
-        bytecode=bytecode, bytecode_len=bytecode_len, calldata=calldata, calldata_len=1, value=0
+        bytecode=bytecode,
+        bytecode_len=bytecode_len,
+        valid_jumpdests=valid_jumpdests,
+        calldata=calldata,
+        calldata_len=1,
+        value=0,
         );
     let result: model.ExecutionContext* = ExecutionContext.init(call_context);
 
     // Then
-    assert result.call_context.bytecode = bytecode;
-    assert result.call_context.bytecode_len = 1;
-    assert result.call_context.calldata = calldata;
+    assert result.environment.call_context.bytecode = bytecode;
+    assert result.environment.call_context.bytecode_len = 1;
+    assert result.environment.call_context.calldata = calldata;
     assert result.program_counter = 0;
     assert result.stopped = FALSE;
     assert result.stack.len_16bytes = 0;
     assert result.memory.bytes_len = 0;
     assert result.gas_used = 0;
-    assert result.gas_limit = Constants.TRANSACTION_GAS_LIMIT;  // TODO: Add support for gas limit
-    assert result.gas_price = 0;
+    assert result.environment.gas_limit = Constants.TRANSACTION_GAS_LIMIT;  // TODO: Add support for gas limit
+    assert result.environment.gas_price = 0;
     return ();
 }
 
@@ -64,8 +71,14 @@ func test__update_program_counter__should_set_pc_to_given_value{
     assert [calldata] = '';
 
     // When
+    let (_, valid_jumpdests) = JumpdestBitmap.compute(bytecode_len, bytecode);
     local call_context: model.CallContext* = new model.CallContext(
-        bytecode=bytecode, bytecode_len=bytecode_len, calldata=calldata, calldata_len=1, value=0
+        bytecode=bytecode,
+        bytecode_len=bytecode_len,
+        valid_jumpdests=valid_jumpdests,
+        calldata=calldata,
+        calldata_len=1,
+        value=0,
         );
     let ctx: model.ExecutionContext* = ExecutionContext.init(call_context);
     let result = ExecutionContext.update_program_counter(ctx, 3);
@@ -93,8 +106,14 @@ func test__update_program_counter__should_fail__when_given_value_not_in_code_ran
     assert [calldata] = '';
 
     // When & Then
+    let (_, valid_jumpdests) = JumpdestBitmap.compute(bytecode_len, bytecode);
     local call_context: model.CallContext* = new model.CallContext(
-        bytecode=bytecode, bytecode_len=bytecode_len, calldata=calldata, calldata_len=1, value=0
+        bytecode=bytecode,
+        bytecode_len=bytecode_len,
+        valid_jumpdests=valid_jumpdests,
+        calldata=calldata,
+        calldata_len=1,
+        value=0,
         );
     let ctx: model.ExecutionContext* = ExecutionContext.init(call_context);
     let result = ExecutionContext.update_program_counter(ctx, 6);
@@ -119,10 +138,82 @@ func test__update_program_counter__should_fail__when_given_destination_that_is_n
     assert [calldata] = '';
 
     // When & Then
+    let (_, valid_jumpdests) = JumpdestBitmap.compute(bytecode_len, bytecode);
     local call_context: model.CallContext* = new model.CallContext(
-        bytecode=bytecode, bytecode_len=bytecode_len, calldata=calldata, calldata_len=1, value=0
+        bytecode=bytecode,
+        bytecode_len=bytecode_len,
+        valid_jumpdests=valid_jumpdests,
+        calldata=calldata,
+        calldata_len=1,
+        value=0,
         );
     let ctx: model.ExecutionContext* = ExecutionContext.init(call_context);
     let result = ExecutionContext.update_program_counter(ctx, 2);
     return ();
 }
+
+@external
+func test__update_program_counter__should_fail__when_given_destination_in_push_data{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    let (bytecode) = alloc();
+    assert bytecode[0] = 0x60;
+    assert bytecode[1] = 0x5b;
+    assert bytecode[2] = 0x5b;
+    local bytecode_len = 3;
+    let (calldata) = alloc();
+    assert [calldata] = '';
+    let (_, valid_jumpdests) = JumpdestBitmap.compute(bytecode_len, bytecode);
+    local call_context: model.CallContext* = new model.CallContext(
+        bytecode=bytecode,
+        bytecode_len=bytecode_len,
+        valid_jumpdests=valid_jumpdests,
+        calldata=calldata,
+        calldata_len=1,
+        value=0,
+        );
+    let ctx: model.ExecutionContext* = ExecutionContext.init(call_context);
+    let result = ExecutionContext.update_program_counter(ctx, 2);
+    assert result.program_counter = 2;
+
+    // When & Then
+    let result = ExecutionContext.update_program_counter(ctx, 1);
+    return ();
+}
+
+@external
+func test__out_of_gas__should_stop_and_revert_consuming_all_gas{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    let (bytecode) = alloc();
+    assert [bytecode] = 00;
+    tempvar bytecode_len = 1;
+    let (calldata) = alloc();
+    assert [calldata] = '';
+    let (_, valid_jumpdests) = JumpdestBitmap.compute(bytecode_len, bytecode);
+    local call_context: model.CallContext* = new model.CallContext(
+        bytecode=bytecode,
+        bytecode_len=bytecode_len,
+        valid_jumpdests=valid_jumpdests,
+        calldata=calldata,
+        calldata_len=1,
+        value=0,
+        );
+    let ctx: model.ExecutionContext* = ExecutionContext.init(call_context);
+    let ctx = ExecutionContext.apply_changes(ctx, ctx.stack, ctx.memory, 0, 42);
+    let ctx = ExecutionContext.update_return_data(ctx, 1, calldata);
+
+    // When
+    let result = ExecutionContext.out_of_gas(ctx);
+
+    // Then
+    assert result.stopped = TRUE;
+    assert result.reverted = TRUE;
+    assert result.return_data_len = 0;
+    assert result.gas_used = Constants.TRANSACTION_GAS_LIMIT;
+    return ();
+}
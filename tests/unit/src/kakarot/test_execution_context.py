@@ -19,6 +19,7 @@ class TestExecutionContext:
     async def test_everything_context(self, execution_context):
         await execution_context.test__init__should_return_an_empty_execution_context().call()
         await execution_context.test__update_program_counter__should_set_pc_to_given_value().call()
+        await execution_context.test__out_of_gas__should_stop_and_revert_consuming_all_gas().call()
         with pytest.raises(Exception) as e:
             await execution_context.test__update_program_counter__should_fail__when_given_value_not_in_code_range().call()
         message = re.search(r"Error message: (.*)", e.value.message)[1]  # type: ignore
@@ -28,3 +29,8 @@ class TestExecutionContext:
             await execution_context.test__update_program_counter__should_fail__when_given_destination_that_is_not_JUMPDEST().call()
         message = re.search(r"Error message: (.*)", e.value.message)[1]  # type: ignore
         assert message == "Kakarot: JUMPed to pc offset is not JUMPDEST"
+
+        with pytest.raises(Exception) as e:
+            await execution_context.test__update_program_counter__should_fail__when_given_destination_in_push_data().call()
+        message = re.search(r"Error message: (.*)", e.value.message)[1]  # type: ignore
+        assert message == "Kakarot: JUMPed to pc offset is not JUMPDEST"
@@ -6,11 +6,15 @@
 from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.bool import TRUE, FALSE
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.uint256 import Uint256
 
 // Local dependencies
 from utils.utils import Helpers
+from kakarot.constants import Constants
+from kakarot.execution_context import ExecutionContext
 from kakarot.model import model
 from kakarot.instructions import EVMInstructions
+from kakarot.stack import Stack
 from tests.unit.helpers.helpers import TestHelpers
 
 @external
@@ -36,3 +40,88 @@ func test__not_implemented_opcode{
 
     return ();
 }
+
+@external
+func test__run_until_stopped__should_execute_opcodes_until_stop{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    alloc_locals;
+    // Given PUSH1 0x01 PUSH1 0x02 ADD STOP PUSH1 0x03
+    let (bytecode) = alloc();
+    assert bytecode[0] = 0x60;
+    assert bytecode[1] = 0x01;
+    assert bytecode[2] = 0x60;
+    assert bytecode[3] = 0x02;
+    assert bytecode[4] = 0x01;
+    assert bytecode[5] = 0x00;
+    assert bytecode[6] = 0x60;
+    assert bytecode[7] = 0x03;
+    let ctx: model.ExecutionContext* = TestHelpers.init_context(8, bytecode);
+
+    // When
+    let ctx = EVMInstructions.run_until_stopped(ctx);
+
+    // Then
+    assert ctx.stopped = TRUE;
+    assert ctx.program_counter = 6;
+    assert ctx.stack.len_16bytes = 2;
+    let (stack, result) = Stack.peek(ctx.stack, 0);
+    assert result = Uint256(3, 0);
+
+    return ();
+}
+
+@external
+func test__run_until_stopped__should_fail_when_running_out_of_gas{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    alloc_locals;
+    // Given JUMPDEST PUSH1 0x00 JUMP, looping forever
+    let (bytecode) = alloc();
+    assert bytecode[0] = 0x5b;
+    assert bytecode[1] = 0x60;
+    assert bytecode[2] = 0x00;
+    assert bytecode[3] = 0x56;
+    let ctx: model.ExecutionContext* = TestHelpers.init_context(4, bytecode);
+    let ctx = ExecutionContext.apply_changes(
+        ctx, ctx.stack, ctx.memory, 0, Constants.TRANSACTION_GAS_LIMIT - 20
+    );
+
+    // When
+    let ctx = EVMInstructions.run_until_stopped(ctx);
+
+    return ();
+}
+
+@view
+func test__decode_and_execute__should_halt_a_sub_context{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(bytecode_len: felt, bytecode: felt*, stack_len: felt, stack: felt*, read_only: felt) -> (
+    stopped: felt, reverted: felt, gas_used: felt, gas_limit: felt
+) {
+    // Given
+    alloc_locals;
+    let stack_ = TestHelpers.init_stack_with_values(stack_len, stack);
+    let ctx = TestHelpers.init_sub_context(bytecode_len, bytecode, stack_, read_only);
+
+    // When
+    let ctx = EVMInstructions.decode_and_execute(ctx);
+
+    // Then
+    return (ctx.stopped, ctx.reverted, ctx.gas_used, ctx.environment.gas_limit);
+}
+
+@external
+func test__decode_and_execute__should_fail_in_the_root_context{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(bytecode_len: felt, bytecode: felt*, stack_len: felt, stack: felt*) {
+    // Given
+    alloc_locals;
+    let stack_ = TestHelpers.init_stack_with_values(stack_len, stack);
+    let ctx = TestHelpers.init_context_with_stack(bytecode_len, bytecode, stack_);
+
+    // When
+    let ctx = EVMInstructions.decode_and_execute(ctx);
+
+    return ();
+}
@@ -27,3 +27,83 @@ class TestInstructions:
             await instructions.test__not_implemented_opcode().call()
         message = re.search(r"Error message: (.*)", e.value.message)[1]  # type: ignore
         assert message == "Kakarot: NotImplementedOpcode"
+
+    async def test__run_until_stopped(self, instructions):
+        await instructions.test__run_until_stopped__should_execute_opcodes_until_stop().call()
+
+    async def test__run_until_stopped__out_of_gas(self, instructions):
+        with pytest.raises(Exception) as e:
+            await instructions.test__run_until_stopped__should_fail_when_running_out_of_gas().call()
+        message = re.search(r"Error message: (.*)", e.value.message)[1]  # type: ignore
+        assert message == "Kakarot: OutOfGas"
+
+    @pytest.mark.parametrize(
+        "bytecode,stack,read_only",
+        [
+            ([0x01], [], 0),
+            ([0x01], [1], 0),
+            ([0x60, 0x01], [0] * 1024, 0),
+            ([0x0C], [], 0),
+            ([0xFE], [], 0),
+            ([0x56, 0x00], [1], 0),
+            ([0x56, 0x00], [10], 0),
+            ([0x55], [1, 2], 1),
+            ([0xA0], [0, 0], 1),
+            ([0xF1], [0, 0, 0, 0, 1, 0x1234, 1000], 1),
+            ([0xF0], [0, 0, 0], 1),
+            ([0xFF], [1], 1),
+        ],
+        ids=[
+            "stack_underflow_empty",
+            "stack_underflow",
+            "stack_overflow",
+            "unknown_opcode",
+            "invalid",
+            "jump_not_jumpdest",
+            "jump_out_of_range",
+            "static_sstore",
+            "static_log0",
+            "static_call_with_value",
+            "static_create",
+            "static_selfdestruct",
+        ],
+    )
+    async def test__decode_and_execute__should_halt_a_sub_context(
+        self, instructions, bytecode, stack, read_only
+    ):
+        result = (
+            await instructions.test__decode_and_execute__should_halt_a_sub_context(
+                bytecode=bytecode, stack=stack, read_only=read_only
+            ).call()
+        ).result
+
+        assert result.stopped == 1
+        assert result.reverted == 1
+        assert result.gas_used == result.gas_limit
+
+    @pytest.mark.parametrize(
+        "bytecode,stack,error",
+        [
+            ([0x01], [1], "Kakarot: StackUnderflow"),
+            ([0x60, 0x01], [0] * 1024, "Kakarot: StackOverflow"),
+            ([0x0C], [], "Kakarot: UnknownOpcode"),
+            ([0xFE], [], "Kakarot: 0xFE: Invalid Opcode"),
+            ([0x56, 0x00], [1], "Kakarot: JUMPed to pc offset is not JUMPDEST"),
+        ],
+        ids=[
+            "stack_underflow",
+            "stack_overflow",
+            "unknown_opcode",
+            "invalid",
+            "jump_not_jumpdest",
+        ],
+    )
+    async def test__decode_and_execute__should_fail_in_the_root_context(
+        self, instructions, bytecode, stack, error
+    ):
+        with pytest.raises(Exception) as e:
+            await instructions.test__decode_and_execute__should_fail_in_the_root_context(
+                bytecode=bytecode, stack=stack
+            ).call()
+        message = re.search(r"Error message: (.*)", e.value.message)[1]  # type: ignore
+        assert message == error
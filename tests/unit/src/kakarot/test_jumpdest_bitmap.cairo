@@ -0,0 +1,35 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+
+// Local dependencies
+from kakarot.jumpdest_bitmap import JumpdestBitmap
+
+@view
+func test__compute__should_return_valid_jumpdests{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(bytecode_len: felt, bytecode: felt*) -> (bitmap_len: felt, is_valid_len: felt, is_valid: felt*) {
+    alloc_locals;
+    // When
+    let (bitmap_len, bitmap) = JumpdestBitmap.compute(bytecode_len, bytecode);
+
+    // Then
+    let (local is_valid: felt*) = alloc();
+    check_all(bitmap, 0, bytecode_len, is_valid);
+    return (bitmap_len, bytecode_len, is_valid);
+}
+
+func check_all{range_check_ptr, bitwise_ptr: BitwiseBuiltin*}(
+    bitmap: felt*, pc: felt, bytecode_len: felt, output: felt*
+) {
+    if (pc == bytecode_len) {
+        return ();
+    }
+    let is_valid = JumpdestBitmap.is_valid(bitmap, pc);
+    assert [output] = is_valid;
+    return check_all(bitmap, pc + 1, bytecode_len, output + 1);
+}
@@ -0,0 +1,55 @@
+import pytest
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture(scope="module")
+async def jumpdest_bitmap(starknet):
+    return await starknet.deploy(
+        source="./tests/unit/src/kakarot/test_jumpdest_bitmap.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+    )
+
+
+def valid_jumpdests(bytecode):
+    valid = [0] * len(bytecode)
+    pc = 0
+    while pc < len(bytecode):
+        opcode = bytecode[pc]
+        if opcode == 0x5B:
+            valid[pc] = 1
+        pc += 1 + (opcode - 0x5F if 0x60 <= opcode <= 0x7F else 0)
+    return valid
+
+
+@pytest.mark.asyncio
+class TestJumpdestBitmap:
+    @pytest.mark.parametrize(
+        "bytecode",
+        [
+            [],
+            [0x5B],
+            [0x60, 0x5B, 0x5B],
+            [0x7F] + [0x5B] * 32 + [0x5B],
+            [0x00] * 127 + [0x5B, 0x5B],
+            [0x00] * 120 + [0x7F] + [0x5B] * 32,
+            [0x00] * 120 + [0x7F] + [0x5B] * 20,
+            ([0x5B, 0x61, 0x5B, 0x5B] * 100),
+        ],
+        ids=[
+            "empty",
+            "jumpdest",
+            "push_data",
+            "push32_data",
+            "chunk_boundary",
+            "push_over_chunk_boundary",
+            "truncated_push_over_chunk_boundary",
+            "many_chunks",
+        ],
+    )
+    async def test_should_return_valid_jumpdests(self, jumpdest_bitmap, bytecode):
+        result = await jumpdest_bitmap.test__compute__should_return_valid_jumpdests(
+            bytecode
+        ).call()
+        assert result.result.bitmap_len == (len(bytecode) + 127) // 128
+        assert result.result.is_valid == valid_jumpdests(bytecode)
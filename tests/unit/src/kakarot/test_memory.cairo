@@ -8,6 +8,7 @@ from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
 from starkware.cairo.common.bool import TRUE, FALSE
 from starkware.cairo.common.uint256 import Uint256, assert_uint256_eq
 from starkware.cairo.common.math import assert_nn
+from starkware.cairo.common.math_cmp import is_le
 
 // Local dependencies
 from utils.utils import Helpers
@@ -256,3 +257,102 @@ func test__expand_and_load__should_return_expanded_memory_and_element_and_cost{
     assert value = Uint256(0, 0);
     return ();
 }
+
+@external
+func test__store__should_track_memory_cost{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    let memory = Memory.init();
+
+    // When
+    let memory = Memory.store(self=memory, element=Uint256(1, 2), offset=64);
+    let memory = Memory.store(self=memory, element=Uint256(3, 4), offset=16);
+
+    // Then
+    assert memory.bytes_len = 96;
+    assert memory.cost = 3 * 3;
+    let (memory, cost) = Memory.expand(self=memory, length=32 * 29);
+    assert memory.bytes_len = 32 * 32;
+    assert cost = 32 * 32 / 512 + 3 * 32 - 3 * 3;
+    let (memory, value) = Memory._load(self=memory, offset=64);
+    assert value = Uint256(1, 2);
+    let (memory, value) = Memory._load(self=memory, offset=16);
+    assert value = Uint256(3, 4);
+    return ();
+}
+
+@external
+func test__copy__should_copy_bytes_within_the_memory{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(dst_offset: felt, src_offset: felt, size: felt) {
+    // Given
+    alloc_locals;
+    let memory = Memory.init();
+    let value = Uint256(0x2122232425262728292a2b2c2d2e2f30, 0x1112131415161718191a1b1c1d1e1f20);
+    let memory = Memory.store(self=memory, element=value, offset=0);
+    let (local expected: felt*) = alloc();
+    let memory = Memory._load_n(self=memory, element_len=size, element=expected, offset=src_offset);
+
+    // When
+    let (memory, cost) = Memory.copy(
+        self=memory, dst_offset=dst_offset, src_offset=src_offset, size=size
+    );
+
+    // Then
+    assert_nn(cost);
+    let (local result: felt*) = alloc();
+    let memory = Memory._load_n(self=memory, element_len=size, element=result, offset=dst_offset);
+    assert_array_eq(size, result, expected);
+    return ();
+}
+
+@external
+func test__load_chunks__should_load_bytes_as_16_bytes_chunks{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(offset: felt, size: felt) {
+    // Given
+    alloc_locals;
+    let memory = Memory.init();
+    let value = Uint256(0x2122232425262728292a2b2c2d2e2f30, 0x1112131415161718191a1b1c1d1e1f20);
+    let memory = Memory.store(self=memory, element=value, offset=0);
+    let memory = Memory.store(self=memory, element=value, offset=32);
+    let (local bytes: felt*) = alloc();
+    let memory = Memory._load_n(self=memory, element_len=size, element=bytes, offset=offset);
+
+    // When
+    let (local chunks: felt*) = alloc();
+    let (memory, cost) = Memory.load_chunks(self=memory, size=size, chunks=chunks, offset=offset);
+
+    // Then
+    assert_nn(cost);
+    assert_chunks_eq(size, chunks, bytes);
+    return ();
+}
+
+func assert_chunks_eq{range_check_ptr}(len: felt, chunks: felt*, bytes: felt*) {
+    alloc_locals;
+    if (len == 0) {
+        return ();
+    }
+    let is_last = is_le(len, 16);
+    if (is_last != FALSE) {
+        // The bytes beyond len are set to 0
+        let word = Helpers.load_word(len, bytes);
+        let shift = Helpers.pow256_rev(len);
+        assert [chunks] = word * shift;
+        return ();
+    }
+    let word = Helpers.load_word(16, bytes);
+    assert [chunks] = word;
+    return assert_chunks_eq(len - 16, chunks + 1, bytes + 16);
+}
+
+func assert_array_eq(len: felt, a: felt*, b: felt*) {
+    if (len == 0) {
+        return ();
+    }
+    assert [a] = [b];
+    return assert_array_eq(len - 1, a + 1, b + 1);
+}
@@ -42,3 +42,14 @@ class TestMemory:
         await memory.test__ensure_length__should_return_the_same_memory_and_no_cost().call()
         await memory.test__ensure_length__should_return_expanded_memory_and_cost().call()
         await memory.test__expand_and_load__should_return_expanded_memory_and_element_and_cost().call()
+        await memory.test__store__should_track_memory_cost().call()
+        await memory.test__copy__should_copy_bytes_within_the_memory(64, 0, 32).call()
+        await memory.test__copy__should_copy_bytes_within_the_memory(16, 0, 32).call()
+        await memory.test__copy__should_copy_bytes_within_the_memory(35, 3, 20).call()
+        await memory.test__copy__should_copy_bytes_within_the_memory(0, 5, 27).call()
+        await memory.test__load_chunks__should_load_bytes_as_16_bytes_chunks(0, 0).call()
+        await memory.test__load_chunks__should_load_bytes_as_16_bytes_chunks(0, 64).call()
+        await memory.test__load_chunks__should_load_bytes_as_16_bytes_chunks(16, 20).call()
+        await memory.test__load_chunks__should_load_bytes_as_16_bytes_chunks(3, 45).call()
+        await memory.test__load_chunks__should_load_bytes_as_16_bytes_chunks(5, 7).call()
+        await memory.test__load_chunks__should_load_bytes_as_16_bytes_chunks(50, 30).call()
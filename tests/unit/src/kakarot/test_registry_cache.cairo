@@ -0,0 +1,53 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+
+// Local dependencies
+from kakarot.model import model
+from kakarot.registry_cache import RegistryCache
+
+@external
+func test__set_account_entry__should_resolve_both_addresses_without_the_registry{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    let registry_cache = RegistryCache.init();
+
+    // When
+    let registry_cache = RegistryCache.set_account_entry(registry_cache, 0x57a7, 0xabde1);
+    let (registry_cache, starknet_contract_address) = RegistryCache.get_starknet_contract_address(
+        registry_cache, 0xabde1
+    );
+    let (registry_cache, evm_contract_address) = RegistryCache.get_evm_contract_address(
+        registry_cache, 0x57a7
+    );
+
+    // Then
+    assert starknet_contract_address = 0x57a7;
+    assert evm_contract_address = 0xabde1;
+    RegistryCache.finalize(registry_cache);
+    return ();
+}
+
+@external
+func test__set_account_entry__should_cache_unregistered_addresses{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    let registry_cache = RegistryCache.init();
+
+    // When
+    let registry_cache = RegistryCache.set_account_entry(registry_cache, 0, 0xabde1);
+    let (registry_cache, starknet_contract_address) = RegistryCache.get_starknet_contract_address(
+        registry_cache, 0xabde1
+    );
+
+    // Then
+    assert starknet_contract_address = 0;
+    return ();
+}
@@ -0,0 +1,24 @@
+import pytest
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture
+async def registry_cache(starknet):
+    return await starknet.deploy(
+        source="./tests/unit/src/kakarot/test_registry_cache.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+    )
+
+
+@pytest.mark.asyncio
+class TestRegistryCache:
+    async def test_set_account_entry_should_resolve_both_addresses_without_the_registry(
+        self, registry_cache
+    ):
+        await registry_cache.test__set_account_entry__should_resolve_both_addresses_without_the_registry().call()
+
+    async def test_set_account_entry_should_cache_unregistered_addresses(
+        self, registry_cache
+    ):
+        await registry_cache.test__set_account_entry__should_cache_unregistered_addresses().call()
@@ -7,6 +7,7 @@ from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
 from starkware.cairo.common.bool import TRUE, FALSE
 from starkware.cairo.common.uint256 import Uint256
+from starkware.cairo.common.dict import DictAccess
 
 // Local dependencies
 from utils.utils import Helpers
@@ -229,3 +230,73 @@ func test__swap__should_fail__when_index_2_is_underflow{
     let result = Stack.swap_i(stack, 2);
     return ();
 }
+
+@external
+func test__finalize__should_return_the_words_in_a_squashed_dict_layout{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    let stack: model.Stack* = Stack.init();
+    let stack: model.Stack* = Stack.push(stack, Uint256(1, 2));
+    let stack: model.Stack* = Stack.push(stack, Uint256(3, 4));
+    let stack: model.Stack* = Stack.push(stack, Uint256(5, 6));
+    let (stack, element) = Stack.pop(stack);
+
+    // When
+    let summary = Stack.finalize(stack);
+
+    // Then
+    assert summary.len_16bytes = 4;
+    assert summary.squashed_end - summary.squashed_start = 4 * DictAccess.SIZE;
+    assert summary.squashed_start[0] = DictAccess(key=0, prev_value=0, new_value=2);
+    assert summary.squashed_start[1] = DictAccess(key=1, prev_value=0, new_value=1);
+    assert summary.squashed_start[2] = DictAccess(key=2, prev_value=0, new_value=4);
+    assert summary.squashed_start[3] = DictAccess(key=3, prev_value=0, new_value=3);
+    return ();
+}
+
+@external
+func test__peek__should_fail__when_index_is_the_stack_size{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    let stack: model.Stack* = Stack.init();
+    let stack: model.Stack* = Stack.push(stack, Uint256(1, 0));
+
+    // When & Then
+    let (stack, result) = Stack.peek(stack, 1);
+    return ();
+}
+
+@external
+func test__push_pop__should_leave_an_empty_stack{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(n: felt) {
+    // Given
+    let stack: model.Stack* = Stack.init();
+
+    // When
+    let stack = push_words(stack, n);
+    let stack = pop_words(stack, n);
+    let summary = Stack.finalize(stack);
+
+    // Then
+    assert summary.len_16bytes = 0;
+    return ();
+}
+
+func push_words{range_check_ptr}(stack: model.Stack*, n: felt) -> model.Stack* {
+    if (n == 0) {
+        return stack;
+    }
+    let stack = Stack.push(stack, Uint256(n, n));
+    return push_words(stack, n - 1);
+}
+
+func pop_words{range_check_ptr}(stack: model.Stack*, n: felt) -> model.Stack* {
+    if (n == 0) {
+        return stack;
+    }
+    let (stack, _) = Stack.pop(stack);
+    return pop_words(stack, n - 1);
+}
@@ -1,8 +1,11 @@
+import logging
 import re
 
 import pytest
 import pytest_asyncio
 
+logger = logging.getLogger()
+
 
 @pytest_asyncio.fixture
 async def stack(starknet):
@@ -51,3 +54,26 @@ class TestStack:
             await stack.test__swap__should_fail__when_index_2_is_underflow().call()
         message = re.search(r"Error message: (.*)", e.value.message)[1]  # type: ignore
         assert message == "Kakarot: StackUnderflow"
+
+    async def test_peek_should_fail_when_index_is_the_stack_size(self, stack):
+        with pytest.raises(Exception) as e:
+            await stack.test__peek__should_fail__when_index_is_the_stack_size().call()
+        message = re.search(r"Error message: (.*)", e.value.message)[1]  # type: ignore
+        assert message == "Kakarot: StackUnderflow"
+
+    async def test_finalize_should_return_the_words_in_a_squashed_dict_layout(
+        self, stack
+    ):
+        await stack.test__finalize__should_return_the_words_in_a_squashed_dict_layout().call()
+
+    async def test_push_pop_should_use_the_same_steps_for_each_word(self, stack):
+        n_steps = {}
+        for n in (0, 512, 1024):
+            res = await stack.test__push_pop__should_leave_an_empty_stack(n).call()
+            n_steps[n] = res.call_info.execution_resources.n_steps
+
+        # No dict is squashed at finalization, so each pushed and popped word costs the same
+        assert n_steps[1024] - n_steps[512] == n_steps[512] - n_steps[0]
+        logger.info(
+            f"Stack push and pop: {(n_steps[512] - n_steps[0]) / 512} steps per word"
+        )
@@ -0,0 +1,77 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.uint256 import Uint256
+
+// Local dependencies
+from kakarot.model import model
+from kakarot.storage_cache import StorageCache
+
+@external
+func test__read__should_return_the_last_written_value{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    let storage_cache = StorageCache.init();
+    let key = Uint256(1, 2);
+
+    // When
+    let storage_cache = StorageCache.write(storage_cache, 0xabde1, key, Uint256(3, 0));
+    let storage_cache = StorageCache.write(storage_cache, 0xabde1, key, Uint256(4, 5));
+    let (storage_cache, value) = StorageCache.read(storage_cache, 0xabde1, key);
+
+    // Then
+    assert value = Uint256(4, 5);
+    return ();
+}
+
+@external
+func test__read__should_separate_slots_by_address_and_key{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    let storage_cache = StorageCache.init();
+    let storage_cache = StorageCache.write(storage_cache, 0xabde1, Uint256(1, 0), Uint256(1, 0));
+    let storage_cache = StorageCache.write(storage_cache, 0xabde2, Uint256(1, 0), Uint256(2, 0));
+    let storage_cache = StorageCache.write(storage_cache, 0xabde1, Uint256(0, 1), Uint256(3, 0));
+
+    // When
+    let (storage_cache, value_1) = StorageCache.read(storage_cache, 0xabde1, Uint256(1, 0));
+    let (storage_cache, value_2) = StorageCache.read(storage_cache, 0xabde2, Uint256(1, 0));
+    let (storage_cache, value_3) = StorageCache.read(storage_cache, 0xabde1, Uint256(0, 1));
+
+    // Then
+    assert value_1 = Uint256(1, 0);
+    assert value_2 = Uint256(2, 0);
+    assert value_3 = Uint256(3, 0);
+    return ();
+}
+
+@external
+func test__restore__should_put_back_the_replaced_value{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    let storage_cache = StorageCache.init();
+    let key = Uint256(1, 2);
+    let storage_cache = StorageCache.write(storage_cache, 0xabde1, key, Uint256(3, 0));
+
+    // When
+    let (storage_cache, slot_key, previous_slot) = StorageCache.replace(
+        storage_cache, 0xabde1, key, Uint256(4, 5)
+    );
+    let (storage_cache, replaced_value) = StorageCache.read(storage_cache, 0xabde1, key);
+    let storage_cache = StorageCache.restore(storage_cache, slot_key, previous_slot);
+    let (storage_cache, restored_value) = StorageCache.read(storage_cache, 0xabde1, key);
+
+    // Then
+    assert replaced_value = Uint256(4, 5);
+    assert restored_value = Uint256(3, 0);
+    return ();
+}
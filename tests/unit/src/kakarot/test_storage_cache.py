@@ -0,0 +1,23 @@
+import pytest
+import pytest_asyncio
+
+
+@pytest_asyncio.fixture
+async def storage_cache(starknet):
+    return await starknet.deploy(
+        source="./tests/unit/src/kakarot/test_storage_cache.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+    )
+
+
+@pytest.mark.asyncio
+class TestStorageCache:
+    async def test_read_should_return_the_last_written_value(self, storage_cache):
+        await storage_cache.test__read__should_return_the_last_written_value().call()
+
+    async def test_read_should_separate_slots_by_address_and_key(self, storage_cache):
+        await storage_cache.test__read__should_separate_slots_by_address_and_key().call()
+
+    async def test_restore_should_put_back_the_replaced_value(self, storage_cache):
+        await storage_cache.test__restore__should_put_back_the_replaced_value().call()
@@ -0,0 +1,31 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+
+// Local dependencies
+from utils.bigint import BigInt
+
+@view
+func test__mulmod{range_check_ptr}(
+    a_len: felt, a: felt*, b_len: felt, b: felt*, m_len: felt, m: felt*
+) -> (result_len: felt, result: felt*) {
+    // Given
+    alloc_locals;
+    let (a_limbs_len, a_limbs) = BigInt.from_bytes(a_len, a);
+    let (b_limbs_len, b_limbs) = BigInt.from_bytes(b_len, b);
+    let (m_limbs_len, m_limbs) = BigInt.from_bytes(m_len, m);
+    let m_limbs_len = BigInt.significant_len(m_limbs_len, m_limbs);
+
+    // When
+    let result_limbs = BigInt.mulmod(
+        a_limbs_len, a_limbs, b_limbs_len, b_limbs, m_limbs_len, m_limbs
+    );
+
+    // Then
+    let (result) = alloc();
+    BigInt.to_bytes(m_limbs_len, result_limbs, m_len, result);
+    return (m_len, result);
+}
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+import pytest_asyncio
+
+random.seed(0)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def bigint(starknet):
+    return await starknet.deploy(
+        source="./tests/unit/src/utils/test_bigint.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+    )
+
+
+@pytest.mark.asyncio
+class TestBigInt:
+    @pytest.mark.parametrize(
+        "a_len,b_len,m_len",
+        [(32, 32, 32), (14, 14, 14), (15, 13, 28), (0, 5, 7), (300, 1, 20), (256, 256, 256)],
+    )
+    async def test__mulmod(self, bigint, a_len, b_len, m_len):
+        a = random.getrandbits(8 * a_len)
+        b = random.getrandbits(8 * b_len)
+        m = random.getrandbits(8 * m_len) | 1
+
+        result = (
+            await bigint.test__mulmod(
+                list(a.to_bytes(a_len, "big")),
+                list(b.to_bytes(b_len, "big")),
+                list(m.to_bytes(m_len, "big")),
+            ).call()
+        ).result.result
+
+        assert result == list((a * b % m).to_bytes(m_len, "big"))
+
+    @pytest.mark.parametrize(
+        "m",
+        [1, 3, 2**112 - 1, 2**112, 2**112 + 1, 2**223 + 2**111, 2**336 - 1],
+        ids=["one", "three", "limb_max", "limb_base", "limb_base_plus_one", "half_top", "max"],
+    )
+    async def test__mulmod_should_reduce_by_modulus(self, bigint, m):
+        m_len = (m.bit_length() + 7) // 8
+        a = m - 1
+        b = 2**256 - 1
+
+        result = (
+            await bigint.test__mulmod(
+                list(a.to_bytes(m_len, "big")),
+                list(b.to_bytes(32, "big")),
+                list(m.to_bytes(m_len, "big")),
+            ).call()
+        ).result.result
+
+        assert result == list((a * b % m).to_bytes(m_len, "big"))
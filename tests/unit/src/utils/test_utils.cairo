@@ -44,3 +44,24 @@ func test__bytes_i_to_uint256{
 
     return ();
 }
+
+@external
+func test__bytes16_to_bytes8_little_endian{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    alloc_locals;
+
+    let (chunks) = alloc();
+    assert chunks[0] = 0x000102030405060708090a0b0c0d0e0f;
+    assert chunks[1] = 0x10111213140000000000000000000000;
+    let (dest) = alloc();
+
+    Helpers.bytes16_to_bytes8_little_endian(2, chunks, dest);
+
+    assert dest[0] = 0x0706050403020100;
+    assert dest[1] = 0x0f0e0d0c0b0a0908;
+    assert dest[2] = 0x0000001413121110;
+    assert dest[3] = 0;
+
+    return ();
+}
@@ -17,3 +17,6 @@ async def stack(starknet):
 class TestStack:
     async def test__bytes_i_to_uint256(self, stack):
         await stack.test__bytes_i_to_uint256().call()
+
+    async def test__bytes16_to_bytes8_little_endian(self, stack):
+        await stack.test__bytes16_to_bytes8_little_endian().call()
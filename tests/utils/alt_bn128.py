@@ -0,0 +1,139 @@
+"""
+Minimal affine arithmetic on the alt_bn128 curve and its twist, used to build test vectors.
+"""
+from typing import Optional, Tuple
+
+P = 0x30644E72E131A029B85045B68181585D97816A916871CA8D3C208C16D87CFD47
+R = 0x30644E72E131A029B85045B68181585D2833E84879B9709143E1F593F0000001
+
+G1 = (1, 2)
+G2 = (
+    (
+        0x1800DEEF121F1E76426A00665E5C4479674322D4F75EDADD46DEBD5CD992F6ED,
+        0x198E9393920D483A7260BFB731FB5D25F1AA493335A9E71297E485B7AEF312C2,
+    ),
+    (
+        0x12C85EA5DB8C6DEB4AAB71808DCB408FE3D1E7690C43D37B4CE6CC0166FA7DAA,
+        0x090689D0585FF075EC9E99AD690C3395BC4B313370B38EF355ACDADCD122975B,
+    ),
+)
+# The constant of the twist y ** 2 = x ** 3 + 3 / (9 + u)
+B2 = (
+    0x2B149D40CEB8AAAE81BE18991BE06AC3B5B4C5E559DBEFA33267E6DC24A138E5,
+    0x009713B03AF0FED4CD2CAFADEED8FDF4A74FA084E52D1852E4A2BD0685C315D2,
+)
+
+
+def fq2_add(x, y):
+    return ((x[0] + y[0]) % P, (x[1] + y[1]) % P)
+
+
+def fq2_sub(x, y):
+    return ((x[0] - y[0]) % P, (x[1] - y[1]) % P)
+
+
+def fq2_mul(x, y):
+    return ((x[0] * y[0] - x[1] * y[1]) % P, (x[0] * y[1] + x[1] * y[0]) % P)
+
+
+def fq2_inv(x):
+    norm_inv = pow(x[0] * x[0] + x[1] * x[1], -1, P)
+    return (x[0] * norm_inv % P, -x[1] * norm_inv % P)
+
+
+def fq2_pow(x, e):
+    result = (1, 0)
+    while e:
+        if e & 1:
+            result = fq2_mul(result, x)
+        x = fq2_mul(x, x)
+        e >>= 1
+    return result
+
+
+def fq2_sqrt(a):
+    """
+    Square root in Fq2 for p = 3 mod 4, see Adj and Rodriguez-Henriquez, Algorithm 9.
+    Return None if a is not a square.
+    """
+    a1 = fq2_pow(a, (P - 3) // 4)
+    alpha = fq2_mul(fq2_mul(a1, a1), a)
+    if fq2_mul(fq2_pow(alpha, P), alpha) == (P - 1, 0):
+        return None
+    x0 = fq2_mul(a1, a)
+    if alpha == (P - 1, 0):
+        return fq2_mul((0, 1), x0)
+    return fq2_mul(fq2_pow(fq2_add((1, 0), alpha), (P - 1) // 2), x0)
+
+
+FQ_OPS = (
+    lambda x, y: (x + y) % P,
+    lambda x, y: (x - y) % P,
+    lambda x, y: x * y % P,
+    lambda x: pow(x, -1, P),
+    lambda k: k,
+)
+FQ2_OPS = (fq2_add, fq2_sub, fq2_mul, fq2_inv, lambda k: (k, 0))
+
+
+def add(p: Optional[Tuple], q: Optional[Tuple]) -> Optional[Tuple]:
+    """
+    Add two affine points, None being the point at infinity.
+    """
+    if p is None:
+        return q
+    if q is None:
+        return p
+    f_add, f_sub, f_mul, f_inv, f_const = FQ2_OPS if isinstance(p[0], tuple) else FQ_OPS
+    if p[0] == q[0]:
+        if f_add(p[1], q[1]) == f_const(0):
+            return None
+        x_squared = f_mul(p[0], p[0])
+        slope = f_mul(f_mul(f_const(3), x_squared), f_inv(f_mul(f_const(2), p[1])))
+    else:
+        slope = f_mul(f_sub(q[1], p[1]), f_inv(f_sub(q[0], p[0])))
+    x = f_sub(f_sub(f_mul(slope, slope), p[0]), q[0])
+    y = f_sub(f_mul(slope, f_sub(p[0], x)), p[1])
+    return (x, y)
+
+
+def mul(p: Optional[Tuple], k: int) -> Optional[Tuple]:
+    result = None
+    while k:
+        if k & 1:
+            result = add(result, p)
+        p = add(p, p)
+        k >>= 1
+    return result
+
+
+def neg(p: Optional[Tuple]) -> Optional[Tuple]:
+    if p is None:
+        return None
+    if isinstance(p[0], tuple):
+        return (p[0], fq2_sub((0, 0), p[1]))
+    return (p[0], -p[1] % P)
+
+
+def encode_g1(p: Optional[Tuple]) -> bytes:
+    if p is None:
+        return bytes(64)
+    return p[0].to_bytes(32, "big") + p[1].to_bytes(32, "big")
+
+
+def encode_g2(q: Optional[Tuple]) -> bytes:
+    """
+    Encode a twist point as in EIP-197, imaginary parts first.
+    """
+    if q is None:
+        return bytes(128)
+    (x_re, x_im), (y_re, y_im) = q
+    return b"".join(v.to_bytes(32, "big") for v in (x_im, x_re, y_im, y_re))
+
+
+def twist_point(x) -> Optional[Tuple]:
+    """
+    Return a point of the twist of abscissa x, not necessarily in G2, None if there is none.
+    """
+    y = fq2_sqrt(fq2_add(fq2_mul(fq2_mul(x, x), x), B2))
+    return None if y is None else (x, y)